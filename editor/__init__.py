@@ -4,7 +4,14 @@ NES Open Tournament Golf - Editor Package
 A Pygame-based editor for modifying course terrain, attributes, and greens.
 """
 
-from .application import EditorApplication
-from .main import main
+import time
+
+# Reference point for golf-editor --profile-startup, taken before the imports below.
+# The entry point (editor.main:main) runs this package first, so the imports
+# must stay after it for the profile to include them.
+IMPORT_START = time.perf_counter()
+
+from .application import EditorApplication  # noqa: E402 - timed by IMPORT_START
+from .main import main  # noqa: E402 - timed by IMPORT_START
 
 __all__ = ["EditorApplication", "main"]
@@ -4,27 +4,33 @@ NES Open Tournament Golf - Editor Application
 Main application class that orchestrates all editor components.
 """
 
+import time
 from pathlib import Path
 
 import pygame
 from pygame import Rect
 
 from golf.core.compressor import load_compression_tables
+from golf.core.palettes import PALETTES
 from golf.formats.hole_data import HoleData
 
 from .controllers.better_forest_fill import BetterForestFiller
 from .controllers.editor_state import EditorState, GridMode
 from .controllers.event_handler import EventHandler
+from .controllers.frame_scheduler import PANELS, FrameScheduler
 from .controllers.highlight_state import HighlightState
 from .controllers.stamp_library import StampLibrary
 from .controllers.transform_logic import TransformLogic
 from .controllers.view_state import ViewState
 from .core.constants import *
 from .core.pygame_rendering import Sprite, Tileset
+from .core.startup import DeferredLoad, StartupProfile, load_cached
 from .resources import get_resource_path
 from .rendering.font_cache import get_font
+from .rendering.greens_cache import GreensSurfaceCache
 from .rendering.greens_renderer import GreensRenderer
 from .rendering.render_context import RenderContext
+from .rendering.terrain_chunks import TerrainChunkCache
 from .rendering.terrain_renderer import TerrainRenderer
 from .tools.add_row_tool import AddRowTool
 from .tools.carpet_paint_tool import CarpetPaintTool
@@ -50,10 +56,34 @@ from .ui.stamp_browser import StampBrowser
 from .ui.toolbar import Toolbar, ToolbarCallbacks
 
 
+# Posted by background loads when they finish, so the idle loop redraws
+DEFERRED_LOAD_EVENT = pygame.event.custom_type()
+
+
 class EditorApplication:
     """Main editor application."""
 
-    def __init__(self, terrain_chr: str, greens_chr: str):
+    def __init__(
+        self,
+        terrain_chr: str,
+        greens_chr: str,
+        startup_profile: StartupProfile | None = None,
+    ):
+        """
+        Create the window and editor components.
+
+        Data only some tools need (the neighbor validator, stamps and fringe
+        tables) is loaded after the first frame or on first use.
+
+        Args:
+            terrain_chr: Terrain CHR file
+            greens_chr: Greens CHR file
+            startup_profile: Records startup phase timings, printed after the
+                first frame (None to skip)
+        """
+        self.startup_profile = startup_profile
+        self._mark_startup("imports")
+
         pygame.init()
 
         self.screen_width = 1280
@@ -62,6 +92,7 @@ class EditorApplication:
             (self.screen_width, self.screen_height), pygame.RESIZABLE
         )
         pygame.display.set_caption("NES Open Golf Course Editor")
+        self._mark_startup("window")
 
         self.font = get_font("monospace", 14)
         self.font_small = get_font("monospace", 12)
@@ -73,6 +104,13 @@ class EditorApplication:
         self.terrain_tileset = Tileset(terrain_chr)
         self.greens_tileset = Tileset(greens_chr)
 
+        # Composited terrain strips, redrawn only where terrain changes
+        self.terrain_chunks = TerrainChunkCache(self.terrain_tileset)
+
+        # Greens overlay and tiles, redrawn only when the greens change
+        self.greens_cache = GreensSurfaceCache()
+        self._mark_startup("tilesets")
+
         # Load sprites
         self.sprites: dict[str, Sprite | None] = {}
         sprite_files = {
@@ -93,26 +131,21 @@ class EditorApplication:
                 print(f"Warning: Failed to load sprite {sprite_name}: {e}")
                 self.sprites[sprite_name] = None
 
+        self._mark_startup("sprites")
+
         # Load compression tables for transform drag feature
         tables_path = str(get_resource_path("data/tables/compression_tables.json"))
         self.compression_tables = load_compression_tables(tables_path)
         self.transform_logic = TransformLogic(self.compression_tables)
+        self._mark_startup("compression tables")
 
-        # Load terrain neighbor validator
-        try:
-            from golf.core.neighbor_validator import TerrainNeighborValidator
-
-            neighbors_path = str(get_resource_path("data/tables/terrain_neighbors.json"))
-            self.terrain_neighbor_validator = TerrainNeighborValidator(neighbors_path)
-        except FileNotFoundError:
-            print(
-                "Warning: terrain_neighbors.json not found, neighbor validation disabled"
-            )
-            self.terrain_neighbor_validator = None
-        except Exception as e:
-            print(f"Warning: Failed to load neighbor validator: {e}")
-            self.terrain_neighbor_validator = None
+        # Terrain neighbor validator, loaded in the background after the
+        # first frame (see _on_first_frame)
+        self.neighbor_validation = DeferredLoad(self._load_neighbor_validation)
 
+        # Canvas scale whose neighboring zoom levels have tile atlases
+        # building in the background (see _warm_tile_atlases)
+        self._warmed_scale: int | None = None
 
         # Load Forest Filler algorithm
         self.forest_filler = BetterForestFiller()
@@ -174,9 +207,8 @@ class EditorApplication:
         self.tool_picker.register_tool("add_row", "Add Row", "➕", is_action=True)
         self.tool_picker.register_tool("remove_row", "Remove Row", "➖", is_action=True)
 
-        # Create stamp library and browser
+        # Create stamp library (stamps load when the browser is first shown) and browser
         self.stamp_library = StampLibrary()
-        self.stamp_library.load_stamps()
 
         self.stamp_browser = StampBrowser(
             picker_rect,
@@ -258,10 +290,83 @@ class EditorApplication:
         self.running = True
         self.clock = pygame.time.Clock()
 
+        # Tracks which panels need repainting
+        self.frame_scheduler = FrameScheduler()
+
         # Update button states
         self._update_mode_buttons()
         self._update_flag_buttons()
         self._update_palette_buttons()
+        self._mark_startup("editor components")
+
+    def _mark_startup(self, phase: str):
+        """End a startup phase when profiling startup."""
+        if self.startup_profile is not None:
+            self.startup_profile.mark(phase)
+
+    def _load_neighbor_validation(self):
+        """
+        Load the terrain neighbor validator (from the startup cache when current).
+
+        Returns:
+            Tuple of (TerrainNeighborValidator, LiveInvalidTiles), or None if
+            the neighbor data could not be loaded
+        """
+        try:
+            from golf.core import neighbor_validator
+            from golf.core.neighbor_validator import (
+                LiveInvalidTiles,
+                TerrainNeighborValidator,
+            )
+
+            neighbors_path = get_resource_path("data/tables/terrain_neighbors.json")
+            validator = load_cached(
+                "terrain_neighbors",
+                [neighbors_path, neighbor_validator.__file__],
+                lambda: TerrainNeighborValidator(str(neighbors_path)),
+            )
+            return validator, LiveInvalidTiles(validator)
+        except FileNotFoundError:
+            print(
+                "Warning: terrain_neighbors.json not found, neighbor validation disabled"
+            )
+        except Exception as e:
+            print(f"Warning: Failed to load neighbor validator: {e}")
+        return None
+
+    @property
+    def terrain_neighbor_validator(self):
+        """Terrain neighbor validator (loaded now if needed), or None if unavailable."""
+        validation = self.neighbor_validation.get()
+        return validation[0] if validation else None
+
+    def _on_first_frame(self):
+        """Start background loading once the window shows something."""
+        load_start = time.perf_counter()
+
+        def on_validator_ready():
+            if self.startup_profile is not None:
+                elapsed_ms = (time.perf_counter() - load_start) * 1000
+                print(f"  {'neighbor validator':<24} {elapsed_ms:8.1f} ms (background)")
+            pygame.event.post(pygame.event.Event(DEFERRED_LOAD_EVENT))
+
+        if self.startup_profile is not None:
+            self.startup_profile.mark("first frame")
+            print(self.startup_profile.report("Time to first frame"))
+
+        self.neighbor_validation.start(on_validator_ready)
+        self._warm_tile_atlases()
+
+    def _warm_tile_atlases(self):
+        """Build tile atlases for the current and adjacent zoom levels in the background."""
+        scale = self.state.canvas_scale
+        if scale == self._warmed_scale:
+            return
+        self._warmed_scale = scale
+
+        scales = [scale - 1, scale, scale + 1]
+        self.terrain_tileset.warm(range(len(PALETTES)), scales)
+        self.greens_tileset.warm([GREENS_PALETTE_NUM], scales)
 
     def _set_mode(self, mode: str):
         """Set editing mode."""
@@ -356,15 +461,19 @@ class EditorApplication:
 
     def get_invalid_terrain_tiles(self):
         """Get invalid terrain tiles (cached, recomputes only when needed)."""
-        if self.terrain_neighbor_validator is None:
+        # Nothing to show until the background load finishes (it posts
+        # DEFERRED_LOAD_EVENT, which redraws)
+        if not self.neighbor_validation.ready:
+            return set()
+        validation = self.neighbor_validation.get()
+        if validation is None:
             return set()
 
         if self.cached_invalid_terrain_tiles is None:
-            # Cache miss - recompute
-            self.cached_invalid_terrain_tiles = (
-                self.terrain_neighbor_validator.get_invalid_tiles(
-                    self.hole_data.terrain
-                )
+            # Cache miss - re-check only the cells that changed
+            live_invalid_tiles = validation[1]
+            self.cached_invalid_terrain_tiles = live_invalid_tiles.update(
+                self.hole_data.terrain
             )
 
         return self.cached_invalid_terrain_tiles
@@ -540,26 +649,107 @@ class EditorApplication:
 
     def run(self):
         """Main loop."""
+        first_frame = True
         while self.running:
             events = pygame.event.get()
+            if not events and self._is_idle():
+                # Nothing to draw or animate: sleep until something happens
+                event = pygame.event.wait(IDLE_WAIT_MS)
+                events = [event] if event.type != pygame.NOEVENT else []
+
             self.running = self.event_handler.handle_events(events)
+            self.frame_scheduler.note_events(events)
 
             # Update active tool (for time-based behavior like key repeat)
             active_tool = self.tool_manager.get_active_tool()
             if active_tool and hasattr(active_tool, 'update'):
                 result = active_tool.update(self.event_handler.tool_context)
                 self._process_tool_result(result)
+                if result.needs_render:
+                    self.frame_scheduler.mark_all()
+
+            # Overlays (metadata dialog, etc.) cover every panel
+            if events and active_tool and hasattr(active_tool, "render_overlay"):
+                self.frame_scheduler.mark_all()
 
             self._render()
+            if first_frame:
+                self._on_first_frame()
+                first_frame = False
+            else:
+                self._warm_tile_atlases()
             self.clock.tick(60)
 
         pygame.quit()
 
+    def _is_idle(self) -> bool:
+        """Whether the loop can block for events (nothing pending, no keys or buttons held)."""
+        return (
+            not self.frame_scheduler.has_dirty
+            and not any(pygame.key.get_pressed())
+            and not any(pygame.mouse.get_pressed())
+        )
+
+    def _get_panel_rects(self) -> dict[str, Rect]:
+        """Get the screen area of each panel."""
+        side_height = self.screen_height - TOOLBAR_HEIGHT - STATUS_HEIGHT
+        return {
+            "sidebar": Rect(0, TOOLBAR_HEIGHT, PICKER_WIDTH, side_height),
+            "tool_picker": Rect(
+                self.screen_width - TOOL_PICKER_WIDTH,
+                TOOLBAR_HEIGHT,
+                TOOL_PICKER_WIDTH,
+                side_height,
+            ),
+            "canvas": self._get_canvas_rect(),
+            "toolbar": Rect(0, 0, self.screen_width, TOOLBAR_HEIGHT),
+            "status": Rect(
+                0, self.screen_height - STATUS_HEIGHT, self.screen_width, STATUS_HEIGHT
+            ),
+        }
+
     def _render(self):
-        """Render the editor."""
-        self.screen.fill(COLOR_BG)
+        """Render the panels that changed since the last frame."""
+        panel_rects = self._get_panel_rects()
+        self.frame_scheduler.set_panel_rects(panel_rects)
+        dirty = self.frame_scheduler.take_dirty()
+        if not dirty:
+            return
 
-        # Left sidebar - stamp browser or tile picker
+        if len(dirty) == len(PANELS):
+            self.screen.fill(COLOR_BG)
+        for panel in dirty:
+            # Each panel is clipped to its own area so it can be redrawn alone
+            rect = panel_rects[panel]
+            self.screen.fill(COLOR_BG, rect)
+            self.screen.set_clip(rect)
+            self._render_panel(panel)
+            self.screen.set_clip(None)
+
+        if len(dirty) == len(PANELS):
+            # Tool overlays (metadata dialog, etc.)
+            active_tool = self.tool_manager.get_active_tool()
+            if active_tool and hasattr(active_tool, "render_overlay"):
+                active_tool.render_overlay(self.screen)
+            pygame.display.flip()
+        else:
+            pygame.display.update([panel_rects[panel] for panel in dirty])
+
+    def _render_panel(self, panel: str):
+        """Draw one panel."""
+        if panel == "sidebar":
+            self._render_sidebar()
+        elif panel == "tool_picker":
+            self.tool_picker.render(self.screen, self.font)
+        elif panel == "canvas":
+            self._render_canvas()
+        elif panel == "toolbar":
+            self._render_toolbar()
+        elif panel == "status":
+            self._render_status()
+
+    def _render_sidebar(self):
+        """Render the left sidebar - stamp browser or tile picker."""
         active_tool = self.tool_manager.get_active_tool_name()
         if active_tool == "stamp":
             # Show stamp browser when stamp tool is active
@@ -574,26 +764,6 @@ class EditorApplication:
                 )
                 self.terrain_picker.render(self.screen, palette_for_picker)
 
-        # Tool picker (right sidebar)
-        self.tool_picker.render(self.screen, self.font)
-
-        # Canvas
-        self._render_canvas()
-
-        # Toolbar after Canvas so scrolling the Canvas
-        # won't cause it to clip into the Toolbar
-        self._render_toolbar()
-
-        # Status bar
-        self._render_status()
-
-        # Tool overlays (metadata dialog, etc.)
-        active_tool = self.tool_manager.get_active_tool()
-        if active_tool and hasattr(active_tool, "render_overlay"):
-            active_tool.render_overlay(self.screen)
-
-        pygame.display.flip()
-
     def _render_toolbar(self):
         """Render toolbar with buttons and palette selector."""
         self.toolbar.render(self.screen, self.font, self.font_small)
@@ -661,6 +831,7 @@ class EditorApplication:
                 self.state.grid_mode,
                 self.state.selected_flag_index,
                 self.state,  # Add state for clipboard/paste preview access
+                greens_cache=self.greens_cache,
             )
             GreensRenderer.render(
                 self.screen,
@@ -677,6 +848,8 @@ class EditorApplication:
                 self.state.grid_mode,
                 self.state.selected_flag_index,
                 self.state,  # Add state for clipboard/paste preview access
+                self.terrain_chunks,
+                self.greens_cache,
             )
             TerrainRenderer.render(
                 self.screen,
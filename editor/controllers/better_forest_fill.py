@@ -146,90 +146,160 @@ class ForestFillRegion:
         return tile in self.cells
 
 
-class CellConstraints:
-    """
-    Tracks achievable exertions for a single cell.
+# Bitset encoding used by the solver.
+#
+# A cell's tile domain is a 7-bit mask over its family's tiles (bit i is
+# FAMILY_TILES[family][i]); the exertions it can still achieve toward a
+# neighbor form a mask over EXERTION_VALUES. The tables below turn the
+# set operations of arc consistency into integer ANDs and lookups.
+EXERTION_VALUES = ((0,), (1,), (0, 0), (0, 1), (1, 0), (1, 1))
+EXERTION_BIT: dict[tuple[int, ...], int] = {
+    exertion: 1 << i for i, exertion in enumerate(EXERTION_VALUES)
+}
+
+# Edge constraint meaning "exert zero, at the cell family's bit-width"
+ZERO_EDGE = -1
 
-    For each direction, maintains the set of exertion tuples that are still
-    achievable given current constraints. Arc consistency narrows these sets
-    until stable.
-    """
+
+class _FamilyTables:
+    """Bitset lookup tables for one family."""
 
     def __init__(self, family: int):
-        self.family = family
-        # Initialize with all exertions achievable by family tiles
-        self.achievable: dict[int, set[tuple[int, ...]]] = {
-            d: set() for d in DIRECTIONS
-        }
-        for tile in FAMILY_TILES[family]:
-            ex = TILE_EXERTIONS[tile]
+        tiles = FAMILY_TILES[family]
+        # Exertion bit of each family tile in each direction
+        tile_bits = [
+            [EXERTION_BIT[TILE_EXERTIONS[tile][d]] for d in DIRECTIONS]
+            for tile in tiles
+        ]
+
+        # Everything the family can exert in each direction
+        self.achievable = [0] * 4
+        for bits in tile_bits:
             for d in DIRECTIONS:
-                self.achievable[d].add(ex[d])
+                self.achievable[d] |= bits[d]
+
+        # [direction][exertion mask] -> tiles whose exertion is in the mask
+        self.tiles_allowing = [
+            [
+                sum(1 << i for i, bits in enumerate(tile_bits) if bits[d] & mask)
+                for mask in range(1 << len(EXERTION_VALUES))
+            ]
+            for d in DIRECTIONS
+        ]
+
+        # [direction][tile mask] -> exertion mask of those tiles
+        self.exertions_of = [[0] * (1 << len(tiles)) for _ in DIRECTIONS]
+        for tile_mask in range(1 << len(tiles)):
+            for i, bits in enumerate(tile_bits):
+                if tile_mask >> i & 1:
+                    for d in DIRECTIONS:
+                        self.exertions_of[d][tile_mask] |= bits[d]
+
+        # [tile mask] -> tile with the most 1-bits, tie-broken exactly like
+        # max() over a set of the tiles
+        self.best_tile: list[int | None] = [None]
+        for tile_mask in range(1, 1 << len(tiles)):
+            valid = set()
+            for i, tile in enumerate(tiles):
+                if tile_mask >> i & 1:
+                    valid.add(tile)
+            self.best_tile.append(max(valid, key=count_ones))
+
+        # Zero exertion at the family's bit-width, per direction
+        self.zero_bits = [
+            EXERTION_BIT[get_zero_exertion(family, d)] for d in DIRECTIONS
+        ]
+
+    def valid_tiles(self, achievable: list[int], k: int) -> int:
+        """Tile mask of the cell whose edges start at achievable[k]."""
+        tiles_allowing = self.tiles_allowing
+        return (
+            tiles_allowing[UP][achievable[k]]
+            & tiles_allowing[RIGHT][achievable[k + 1]]
+            & tiles_allowing[DOWN][achievable[k + 2]]
+            & tiles_allowing[LEFT][achievable[k + 3]]
+        )
 
-        # Cache valid tiles (tiles consistent with current achievable sets)
-        self._valid_tiles: set[int] | None = None
 
-    def constrain_direction(self, direction: int, allowed: set[tuple[int, ...]]) -> bool:
-        """
-        Restrict achievable exertions in a direction to intersection with allowed.
+FAMILY_TABLES = {family: _FamilyTables(family) for family in FAMILY_TILES}
 
-        Returns True if any change was made.
-        """
-        old = self.achievable[direction]
-        new = old & allowed
-        if new != old:
-            self.achievable[direction] = new
-            self._valid_tiles = None  # Invalidate cache
-            return True
-        return False
-
-    def constrain_to_single(self, direction: int, value: tuple[int, ...]) -> bool:
-        """Constrain a direction to exactly one value."""
-        return self.constrain_direction(direction, {value})
-
-    def get_valid_tiles(self) -> set[int]:
-        """Get tiles from family that satisfy all current constraints."""
-        if self._valid_tiles is not None:
-            return self._valid_tiles
-
-        valid = set()
-        for tile in FAMILY_TILES[self.family]:
-            ex = TILE_EXERTIONS[tile]
-            if all(ex[d] in self.achievable[d] for d in DIRECTIONS):
-                valid.add(tile)
-
-        self._valid_tiles = valid
-        return valid
-
-    def recompute_achievable_from_valid_tiles(self) -> set[int]:
-        """
-        Recompute achievable sets based on valid tiles only.
 
-        Returns set of directions that changed.
-        """
-        valid = self.get_valid_tiles()
-        if not valid:
-            return set()
+class _RegionLayout:
+    """
+    A region's cells and what each of their edges borders.
 
-        changed_directions = set()
-        for d in DIRECTIONS:
-            new_achievable = {TILE_EXERTIONS[t][d] for t in valid}
-            if new_achievable != self.achievable[d]:
-                self.achievable[d] = new_achievable
-                changed_directions.add(d)
+    None of this depends on the orientation, so it is computed once and
+    shared by every orientation tried for the region. Cells to fill are
+    numbered in the iteration order of their set; edge k = 4 * cell + direction.
+    """
 
-        return changed_directions
+    def __init__(self, region: ForestFillRegion, terrain: list[list[int]]):
+        terrain_height = len(terrain) if terrain else 0
+        terrain_width = len(terrain[0]) if terrain and terrain[0] else 0
 
-    def is_empty(self) -> bool:
-        """Check if no valid tiles remain."""
-        return len(self.get_valid_tiles()) == 0
+        # Separate pre-assigned forest cells from cells to fill
+        self.pre_assigned: dict[tuple[int, int], int] = {}
+        self.cells_to_fill: set[tuple[int, int]] = set()
+        for cell in region.cells:
+            row, col = cell
+            if terrain and 0 <= row < terrain_height and 0 <= col < terrain_width:
+                existing_tile = terrain[row][col]
+                if existing_tile in TILE_EXERTIONS:
+                    self.pre_assigned[cell] = existing_tile
+                else:
+                    self.cells_to_fill.add(cell)
+            else:
+                self.cells_to_fill.add(cell)
 
-    def select_best_tile(self) -> int | None:
-        """Select tile with maximum 1-bits (prefers fill tiles)."""
-        valid = self.get_valid_tiles()
-        if not valid:
-            return None
-        return max(valid, key=count_ones)
+        self.cells = list(self.cells_to_fill)
+        self.index = {cell: i for i, cell in enumerate(self.cells)}
+
+        # Per edge: the neighboring cell to fill (or -1), and otherwise the
+        # exertion bit the neighbor requires, ZERO_EDGE, or 0 for screen
+        # edges, which have no constraint
+        self.neighbors = [-1] * (4 * len(self.cells))
+        self.required = [0] * (4 * len(self.cells))
+        for i, (row, col) in enumerate(self.cells):
+            for direction, (dr, dc) in DIRECTION_DELTAS.items():
+                k = 4 * i + direction
+                neighbor = (row + dr, col + dc)
+                nr, nc = neighbor
+                if neighbor in self.index:
+                    self.neighbors[k] = self.index[neighbor]
+                elif neighbor in self.pre_assigned:
+                    neighbor_tile = self.pre_assigned[neighbor]
+                    exertion = TILE_EXERTIONS[neighbor_tile][OPPOSITE[direction]]
+                    self.required[k] = EXERTION_BIT[exertion]
+                elif 0 <= nr < terrain_height and 0 <= nc < terrain_width:
+                    neighbor_tile = terrain[nr][nc]
+                    if neighbor_tile in TILE_EXERTIONS:
+                        # External forest neighbor: must match its exertion
+                        exertion = TILE_EXERTIONS[neighbor_tile][OPPOSITE[direction]]
+                        self.required[k] = EXERTION_BIT[exertion]
+                    else:
+                        # Non-forest neighbor: must exert zero
+                        self.required[k] = ZERO_EDGE
+
+
+class _OrientationFill:
+    """The result of filling a region with one orientation."""
+
+    def __init__(
+        self,
+        orientation: int,
+        assigned: dict[tuple[int, int], int],
+        failures: int,
+        inner_border_count: int,
+    ):
+        self.orientation = orientation
+        self.assigned = assigned
+        self.failures = failures
+        self.inner_border_count = inner_border_count
+        self.fill_count = sum(1 for tile in assigned.values() if tile in FOREST_FILL)
+
+    def rank(self) -> tuple[int, int, int]:
+        """Sort key: fewer failures > fewer INNER_BORDERs > more fill tiles."""
+        return (self.failures, self.inner_border_count, -self.fill_count)
 
 
 class BetterForestFiller:
@@ -304,378 +374,66 @@ class BetterForestFiller:
 
         return regions
 
-    def _classify_edges(
-        self,
-        cells_to_fill: set[tuple[int, int]],
-        pre_assigned: dict[tuple[int, int], int],
-        inner_border_cells: set[tuple[int, int]],
-        terrain_height: int,
-        terrain_width: int,
-    ) -> tuple[
-        dict[tuple[int, int], set[int]],  # external_edges
-        dict[tuple[int, int], set[int]],  # screen_edges
-        dict[tuple[int, int], set[int]],  # pre_assigned_edges
-        dict[tuple[int, int], set[int]],  # inner_border_edges
-        dict[tuple[int, int], set[int]],  # internal_edges
-    ]:
-        """Classify each cell's edges by what they border."""
-        external_edges: dict[tuple[int, int], set[int]] = {}
-        screen_edges: dict[tuple[int, int], set[int]] = {}
-        pre_assigned_edges: dict[tuple[int, int], set[int]] = {}
-        inner_border_edges: dict[tuple[int, int], set[int]] = {}
-        internal_edges: dict[tuple[int, int], set[int]] = {}
-
-        for cell in cells_to_fill:
-            external_edges[cell] = set()
-            screen_edges[cell] = set()
-            pre_assigned_edges[cell] = set()
-            inner_border_edges[cell] = set()
-            internal_edges[cell] = set()
-            row, col = cell
-
-            for direction, (dr, dc) in DIRECTION_DELTAS.items():
-                neighbor = (row + dr, col + dc)
-                nr, nc = neighbor
-
-                if neighbor in cells_to_fill:
-                    internal_edges[cell].add(direction)
-                elif neighbor in inner_border_cells:
-                    inner_border_edges[cell].add(direction)
-                elif neighbor in pre_assigned:
-                    pre_assigned_edges[cell].add(direction)
-                else:
-                    external_edges[cell].add(direction)
-                    if nr < 0 or nr >= terrain_height or nc < 0 or nc >= terrain_width:
-                        screen_edges[cell].add(direction)
-
-        return external_edges, screen_edges, pre_assigned_edges, inner_border_edges, internal_edges
-
-    def _initialize_constraints(
-        self,
-        cells_to_fill: set[tuple[int, int]],
-        cell_families: dict[tuple[int, int], int],
-        pre_assigned: dict[tuple[int, int], int],
-        external_edges: dict[tuple[int, int], set[int]],
-        screen_edges: dict[tuple[int, int], set[int]],
-        pre_assigned_edges: dict[tuple[int, int], set[int]],
-        inner_border_edges: dict[tuple[int, int], set[int]],
-        terrain: list[list[int]],
-        terrain_height: int,
-        terrain_width: int,
-    ) -> dict[tuple[int, int], CellConstraints]:
-        """Initialize constraint objects for each cell."""
-        constraints: dict[tuple[int, int], CellConstraints] = {}
-
-        for cell in cells_to_fill:
-            family = cell_families[cell]
-            constraints[cell] = CellConstraints(family)
-            row, col = cell
-
-            # Constrain external non-screen edges
-            for direction in external_edges[cell]:
-                if direction in screen_edges[cell]:
-                    continue  # Screen edges have no constraint
-
-                dr, dc = DIRECTION_DELTAS[direction]
-                nr, nc = row + dr, col + dc
-
-                if terrain and 0 <= nr < terrain_height and 0 <= nc < terrain_width:
-                    neighbor_tile = terrain[nr][nc]
-                    if neighbor_tile in TILE_EXERTIONS:
-                        # External forest neighbor: must match its exertion
-                        opposite = OPPOSITE[direction]
-                        required = TILE_EXERTIONS[neighbor_tile][opposite]
-                        constraints[cell].constrain_to_single(direction, required)
-                    else:
-                        # Non-forest neighbor: must exert zero
-                        zero = get_zero_exertion(family, direction)
-                        constraints[cell].constrain_to_single(direction, zero)
-                else:
-                    # Out of terrain bounds (shouldn't happen if not screen edge)
-                    zero = get_zero_exertion(family, direction)
-                    constraints[cell].constrain_to_single(direction, zero)
-
-            # Constrain edges adjacent to pre-assigned cells
-            for direction in pre_assigned_edges[cell]:
-                dr, dc = DIRECTION_DELTAS[direction]
-                neighbor = (row + dr, col + dc)
-                neighbor_tile = pre_assigned[neighbor]
-                opposite = OPPOSITE[direction]
-                required = TILE_EXERTIONS[neighbor_tile][opposite]
-                constraints[cell].constrain_to_single(direction, required)
-
-            # Constrain edges adjacent to INNER_BORDER cells
-            # INNER_BORDER is compatible with any zero exertion regardless of bit-width
-            for direction in inner_border_edges[cell]:
-                # Find all zero-exerting values this cell can achieve in this direction
-                zero_exertions = {
-                    ex for ex in constraints[cell].achievable[direction]
-                    if is_all_zeros(ex)
-                }
-                if zero_exertions:
-                    constraints[cell].constrain_direction(direction, zero_exertions)
-                else:
-                    # No zero option available - constrain to expected zero anyway
-                    # (will likely become empty and need INNER_BORDER)
-                    zero = get_zero_exertion(family, direction)
-                    constraints[cell].constrain_to_single(direction, zero)
-
-        return constraints
-
-    def _propagate_arc_consistency(
-        self,
-        cells_to_fill: set[tuple[int, int]],
-        constraints: dict[tuple[int, int], CellConstraints],
-        internal_edges: dict[tuple[int, int], set[int]],
-    ) -> None:
-        """
-        Propagate constraints until arc consistent.
-
-        Uses a worklist algorithm: when a cell's achievable set narrows,
-        its neighbors are re-examined.
-        """
-        # Initialize worklist with all internal edge pairs
-        # Each item is (cell, direction) meaning "check cell's constraint toward that direction"
-        worklist: deque[tuple[tuple[int, int], int]] = deque()
-        in_worklist: set[tuple[tuple[int, int], int]] = set()
-
-        for cell in cells_to_fill:
-            for direction in internal_edges[cell]:
-                item = (cell, direction)
-                worklist.append(item)
-                in_worklist.add(item)
-
-        max_iterations = len(cells_to_fill) * 50 + 500
-        iterations = 0
-
-        while worklist and iterations < max_iterations:
-            iterations += 1
-            cell, direction = worklist.popleft()
-            in_worklist.discard((cell, direction))
-
-            row, col = cell
-            dr, dc = DIRECTION_DELTAS[direction]
-            neighbor = (row + dr, col + dc)
-
-            if neighbor not in constraints:
-                continue
-
-            opposite = OPPOSITE[direction]
-            cell_constraints = constraints[cell]
-            neighbor_constraints = constraints[neighbor]
-
-            # Get what each can currently achieve toward the other
-            cell_can = cell_constraints.achievable[direction]
-            neighbor_can = neighbor_constraints.achievable[opposite]
-
-            # They must match - compute intersection
-            common = cell_can & neighbor_can
-
-            if not common:
-                # No valid matching possible - constraint failure
-                # Leave as-is; will be detected later
-                continue
-
-            # Narrow both sides to common values
-            cell_changed = cell_constraints.constrain_direction(direction, common)
-            neighbor_changed = neighbor_constraints.constrain_direction(opposite, common)
-
-            # If a cell's achievable set changed, recompute valid tiles and
-            # potentially narrow other edges, then add ALL edges (including
-            # the one we just processed from the neighbor's perspective)
-            if cell_changed:
-                other_changed = cell_constraints.recompute_achievable_from_valid_tiles()
-                # Add all changed internal edges to worklist
-                for d in other_changed:
-                    if d in internal_edges[cell]:
-                        item = (cell, d)
-                        if item not in in_worklist:
-                            worklist.append(item)
-                            in_worklist.add(item)
-                # Also re-check edges FROM neighbors TO this cell, since our
-                # achievable set changed and neighbors might need to re-narrow
-                for d in internal_edges[cell]:
-                    dr2, dc2 = DIRECTION_DELTAS[d]
-                    nb = (row + dr2, col + dc2)
-                    if nb in constraints:
-                        opp = OPPOSITE[d]
-                        item = (nb, opp)
-                        if item not in in_worklist:
-                            worklist.append(item)
-                            in_worklist.add(item)
-
-            if neighbor_changed:
-                other_changed = neighbor_constraints.recompute_achievable_from_valid_tiles()
-                nr, nc = neighbor
-                for d in other_changed:
-                    if d in internal_edges.get(neighbor, set()):
-                        item = (neighbor, d)
-                        if item not in in_worklist:
-                            worklist.append(item)
-                            in_worklist.add(item)
-                # Also re-check edges FROM this cell and other neighbors TO neighbor
-                for d in internal_edges.get(neighbor, set()):
-                    dr2, dc2 = DIRECTION_DELTAS[d]
-                    nb = (nr + dr2, nc + dc2)
-                    if nb in constraints:
-                        opp = OPPOSITE[d]
-                        item = (nb, opp)
-                        if item not in in_worklist:
-                            worklist.append(item)
-                            in_worklist.add(item)
-
     def _fill_with_orientation(
-        self,
-        region: ForestFillRegion,
-        orientation: int,
-        terrain: list[list[int]],
-    ) -> tuple[dict[tuple[int, int], int], int, int]:
-        """
-        Fill a region using arc consistency constraint propagation.
-
-        Returns:
-            (tile_assignments, failure_count, inner_border_count)
-        """
-        terrain_height = len(terrain) if terrain else 0
-        terrain_width = len(terrain[0]) if terrain and terrain[0] else 0
-
-        # Separate pre-assigned forest cells from cells to fill
-        pre_assigned: dict[tuple[int, int], int] = {}
-        cells_to_fill: set[tuple[int, int]] = set()
-
-        for cell in region.cells:
-            row, col = cell
-            if terrain and 0 <= row < terrain_height and 0 <= col < terrain_width:
-                existing_tile = terrain[row][col]
-                if existing_tile in TILE_EXERTIONS:
-                    pre_assigned[cell] = existing_tile
-                else:
-                    cells_to_fill.add(cell)
-            else:
-                cells_to_fill.add(cell)
-
-        if not cells_to_fill:
-            return dict(pre_assigned), 0, 0
+        self, layout: _RegionLayout, orientation: int
+    ) -> _OrientationFill:
+        """Fill a region using arc consistency constraint propagation."""
+        pre_assigned = layout.pre_assigned
+        if not layout.cells:
+            return _OrientationFill(orientation, dict(pre_assigned), 0, 0)
 
         # Assign families based on position
-        cell_families = {
-            cell: get_family_for_position(cell[0], cell[1], orientation)
-            for cell in cells_to_fill
-        }
+        tables = [
+            FAMILY_TABLES[get_family_for_position(row, col, orientation)]
+            for row, col in layout.cells
+        ]
 
         # Count pre-assigned tiles in wrong family (orientation mismatch)
-        family_mismatches = sum(
-            1 for cell, tile in pre_assigned.items()
-            if TILE_FAMILY[tile] != get_family_for_position(cell[0], cell[1], orientation)
-        )
+        family_mismatches = 0
+        for (row, col), tile in pre_assigned.items():
+            if TILE_FAMILY[tile] != get_family_for_position(row, col, orientation):
+                family_mismatches += 1
 
         # Iteratively solve with INNER_BORDER fallback
         inner_border_cells: set[tuple[int, int]] = set()
-        max_inner_border_iterations = len(cells_to_fill) + 1
-
-        for _ in range(max_inner_border_iterations):
+        achievable: list[int] | None = None
+        for _ in range(len(layout.cells) + 1):
             # Remove cells assigned to INNER_BORDER from cells_to_fill
-            current_cells = cells_to_fill - inner_border_cells
-
+            current_cells = layout.cells_to_fill - inner_border_cells
             if not current_cells:
                 break
 
-            # Classify edges
-            (
-                external_edges,
-                screen_edges,
-                pre_assigned_edges,
-                inner_border_edges,
-                internal_edges,
-            ) = self._classify_edges(
-                current_cells,
-                pre_assigned,
-                inner_border_cells,
-                terrain_height,
-                terrain_width,
-            )
-
-            # Initialize constraints
-            constraints = self._initialize_constraints(
-                current_cells,
-                cell_families,
-                pre_assigned,
-                external_edges,
-                screen_edges,
-                pre_assigned_edges,
-                inner_border_edges,
-                terrain,
-                terrain_height,
-                terrain_width,
+            achievable = self._propagate(
+                layout, tables, current_cells, inner_border_cells
             )
 
-            # After initial constraints, recompute achievable sets for all cells.
-            # This ensures constraints on one edge (e.g., from pre-assigned neighbor)
-            # propagate to other edges of the same cell before arc consistency starts.
-            for cell in current_cells:
-                constraints[cell].recompute_achievable_from_valid_tiles()
-
-            # Propagate arc consistency
-            self._propagate_arc_consistency(current_cells, constraints, internal_edges)
-
             # Find cells with no valid tiles
-            new_inner_border = False
+            empty = []
             for cell in current_cells:
-                if constraints[cell].is_empty():
-                    inner_border_cells.add(cell)
-                    new_inner_border = True
-
-            if not new_inner_border:
-                # All cells have valid tiles, we're done
+                i = layout.index[cell]
+                if not tables[i].valid_tiles(achievable, 4 * i):
+                    empty.append(cell)
+            if not empty:
+                # All cells have valid tiles: this propagation is final
                 break
+            inner_border_cells.update(empty)
+            achievable = None
 
         # Final assignment
-        assigned: dict[tuple[int, int], int] = {}
-
-        # Assign INNER_BORDER to cells that needed it
-        for cell in inner_border_cells:
-            assigned[cell] = INNER_BORDER
+        assigned = {cell: INNER_BORDER for cell in inner_border_cells}
 
-        # Assign best tiles to remaining cells
-        final_cells = cells_to_fill - inner_border_cells
+        final_cells = layout.cells_to_fill - inner_border_cells
         if final_cells:
-            # Re-run constraint initialization and propagation one more time
-            # with inner_border_cells finalized
-            (
-                external_edges,
-                screen_edges,
-                pre_assigned_edges,
-                inner_border_edges,
-                internal_edges,
-            ) = self._classify_edges(
-                final_cells,
-                pre_assigned,
-                inner_border_cells,
-                terrain_height,
-                terrain_width,
-            )
-
-            constraints = self._initialize_constraints(
-                final_cells,
-                cell_families,
-                pre_assigned,
-                external_edges,
-                screen_edges,
-                pre_assigned_edges,
-                inner_border_edges,
-                terrain,
-                terrain_height,
-                terrain_width,
-            )
-
-            # Recompute achievable sets after initial constraints
-            for cell in final_cells:
-                constraints[cell].recompute_achievable_from_valid_tiles()
-
-            self._propagate_arc_consistency(final_cells, constraints, internal_edges)
+            if achievable is None:
+                # Ran out of iterations: propagate once more with the
+                # INNER_BORDER cells finalized
+                achievable = self._propagate(
+                    layout, tables, final_cells, inner_border_cells
+                )
 
             for cell in final_cells:
-                tile = constraints[cell].select_best_tile()
+                i = layout.index[cell]
+                tile = tables[i].best_tile[tables[i].valid_tiles(achievable, 4 * i)]
                 if tile is not None:
                     assigned[cell] = tile
                 else:
@@ -683,143 +441,170 @@ class BetterForestFiller:
                     assigned[cell] = INNER_BORDER
                     inner_border_cells.add(cell)
 
-        # Count edge failures
-        edge_failures = self._count_edge_failures(
-            cells_to_fill,
-            assigned,
-            cell_families,
-            pre_assigned,
-            inner_border_cells,
-            terrain,
-            terrain_height,
-            terrain_width,
-        )
+        edge_failures = self._count_edge_failures(layout, tables, assigned)
 
         # Merge pre-assigned cells
         assigned.update(pre_assigned)
 
         total_failures = family_mismatches + edge_failures
-        return assigned, total_failures, len(inner_border_cells)
+        return _OrientationFill(
+            orientation, assigned, total_failures, len(inner_border_cells)
+        )
 
-    def _count_edge_failures(
+    @staticmethod
+    def _settle(tables: _FamilyTables, achievable: list[int], i: int) -> list[int]:
+        """
+        Narrow a cell's achievable exertions to those of its valid tiles.
+
+        Returns the directions that changed.
+        """
+        k = 4 * i
+        valid = tables.valid_tiles(achievable, k)
+        if not valid:
+            return []
+
+        changed = []
+        for d in DIRECTIONS:
+            new_achievable = tables.exertions_of[d][valid]
+            if new_achievable != achievable[k + d]:
+                achievable[k + d] = new_achievable
+                changed.append(d)
+        return changed
+
+    def _propagate(
         self,
-        cells_to_fill: set[tuple[int, int]],
-        assigned: dict[tuple[int, int], int],
-        cell_families: dict[tuple[int, int], int],
-        pre_assigned: dict[tuple[int, int], int],
+        layout: _RegionLayout,
+        tables: list[_FamilyTables],
+        current_cells: set[tuple[int, int]],
         inner_border_cells: set[tuple[int, int]],
-        terrain: list[list[int]],
-        terrain_height: int,
-        terrain_width: int,
-    ) -> int:
-        """Count edges that don't properly match."""
-        failures = 0
-        checked_pairs: set[tuple[tuple[int, int], tuple[int, int]]] = set()
+    ) -> list[int]:
+        """
+        Constrain every current cell's edges and propagate until arc consistent.
 
-        for cell in cells_to_fill:
-            tile = assigned.get(cell)
-            if tile is None:
-                continue
+        Uses a worklist algorithm: when a cell's achievable set narrows,
+        its neighbors are re-examined. Edges toward INNER_BORDER cells must
+        exert zero.
 
-            row, col = cell
-            family = cell_families[cell]
+        Returns:
+            Achievable exertion mask of every edge (index 4 * cell + direction)
+        """
+        neighbors = layout.neighbors
+        required = layout.required
+        achievable = [0] * len(neighbors)
+        # Internal edges between current cells (-1 for other edges)
+        links = [-1] * len(neighbors)
+
+        order = [layout.index[cell] for cell in current_cells]
+        inner_border = {layout.index[cell] for cell in inner_border_cells}
+        for i in order:
+            cell_tables = tables[i]
+            for d in DIRECTIONS:
+                k = 4 * i + d
+                allowed = cell_tables.achievable[d]
+                j = neighbors[k]
+                if j >= 0:
+                    if j in inner_border:
+                        allowed &= cell_tables.zero_bits[d]
+                    else:
+                        links[k] = j
+                elif required[k] == ZERO_EDGE:
+                    allowed &= cell_tables.zero_bits[d]
+                elif required[k]:
+                    allowed &= required[k]
+                achievable[k] = allowed
+
+            # Let constraints on one edge (e.g., from a pre-assigned neighbor)
+            # narrow the cell's other edges before propagation starts
+            self._settle(cell_tables, achievable, i)
+
+        # Each item is edge k = 4 * cell + direction, meaning "check the
+        # cell's constraint toward that direction"
+        worklist: deque[int] = deque()
+        queued = bytearray(len(neighbors))
+        for i in order:
+            for k in range(4 * i, 4 * i + 4):
+                if links[k] >= 0:
+                    worklist.append(k)
+                    queued[k] = 1
+
+        max_iterations = len(order) * 50 + 500
+        iterations = 0
 
-            # Get exertions (INNER_BORDER exerts all zeros)
-            if tile == INNER_BORDER:
-                tile_ex = tuple(get_zero_exertion(family, d) for d in DIRECTIONS)
-            else:
-                tile_ex = TILE_EXERTIONS[tile]
+        while worklist and iterations < max_iterations:
+            iterations += 1
+            k = worklist.popleft()
+            queued[k] = 0
 
-            for direction, (dr, dc) in DIRECTION_DELTAS.items():
-                nr, nc = row + dr, col + dc
-                neighbor = (nr, nc)
-
-                # Check external edges (non-screen must be zero)
-                if neighbor not in cells_to_fill and neighbor not in pre_assigned:
-                    if nr < 0 or nr >= terrain_height or nc < 0 or nc >= terrain_width:
-                        continue  # Screen edge, no constraint
-
-                    # Check what the external tile expects
-                    if terrain and 0 <= nr < terrain_height and 0 <= nc < terrain_width:
-                        neighbor_tile = terrain[nr][nc]
-                        if neighbor_tile in TILE_EXERTIONS:
-                            opposite = OPPOSITE[direction]
-                            expected = TILE_EXERTIONS[neighbor_tile][opposite]
-                            if tile_ex[direction] != expected:
-                                failures += 1
-                        else:
-                            # Non-forest neighbor, must be zero
-                            zero = get_zero_exertion(family, direction)
-                            if tile_ex[direction] != zero:
-                                failures += 1
-                    continue
+            i, direction = divmod(k, 4)
+            j = links[k]
+            neighbor_k = 4 * j + OPPOSITE[direction]
 
-                # Check pre-assigned edges
-                if neighbor in pre_assigned:
-                    neighbor_tile = pre_assigned[neighbor]
-                    opposite = OPPOSITE[direction]
-                    expected = TILE_EXERTIONS[neighbor_tile][opposite]
-                    if tile_ex[direction] != expected:
-                        failures += 1
-                    continue
+            # They must match - compute intersection
+            common = achievable[k] & achievable[neighbor_k]
+            if not common:
+                # No valid matching possible - leave as-is; detected later
+                continue
 
-                # Check internal edges (avoid double-counting)
-                if neighbor in cells_to_fill:
-                    pair = (min(cell, neighbor), max(cell, neighbor))
-                    if pair in checked_pairs:
-                        continue
-                    checked_pairs.add(pair)
+            # Narrow both sides to common values
+            cell_changed = common != achievable[k]
+            achievable[k] = common
+            neighbor_changed = common != achievable[neighbor_k]
+            achievable[neighbor_k] = common
+
+            # A narrowed cell may narrow its other edges; re-check those
+            # and every edge from its neighbors toward it
+            for changed, cell in ((cell_changed, i), (neighbor_changed, j)):
+                if not changed:
+                    continue
+                for d in self._settle(tables[cell], achievable, cell):
+                    item = 4 * cell + d
+                    if links[item] >= 0 and not queued[item]:
+                        worklist.append(item)
+                        queued[item] = 1
+                for d in DIRECTIONS:
+                    nb = links[4 * cell + d]
+                    if nb >= 0:
+                        item = 4 * nb + OPPOSITE[d]
+                        if not queued[item]:
+                            worklist.append(item)
+                            queued[item] = 1
 
-                    neighbor_tile = assigned.get(neighbor)
-                    if neighbor_tile is None:
-                        continue
+        return achievable
 
-                    opposite = OPPOSITE[direction]
-                    neighbor_family = cell_families[neighbor]
+    @staticmethod
+    def _count_edge_failures(
+        layout: _RegionLayout,
+        tables: list[_FamilyTables],
+        assigned: dict[tuple[int, int], int],
+    ) -> int:
+        """Count edges that don't properly match."""
 
-                    if neighbor_tile == INNER_BORDER:
-                        neighbor_ex = get_zero_exertion(neighbor_family, opposite)
-                    else:
-                        neighbor_ex = TILE_EXERTIONS[neighbor_tile][opposite]
+        def exertion_bit(i: int, d: int) -> int:
+            # INNER_BORDER exerts all zeros
+            tile = assigned[layout.cells[i]]
+            if tile == INNER_BORDER:
+                return tables[i].zero_bits[d]
+            return EXERTION_BIT[TILE_EXERTIONS[tile][d]]
 
-                    if tile_ex[direction] != neighbor_ex:
+        failures = 0
+        for i in range(len(layout.cells)):
+            for d in DIRECTIONS:
+                k = 4 * i + d
+                j = layout.neighbors[k]
+                if j >= 0:
+                    # Internal edge (checked from one side only)
+                    if j > i and exertion_bit(i, d) != exertion_bit(j, OPPOSITE[d]):
                         failures += 1
+                    continue
 
-        return failures
-
-    def _select_best_orientation(
-        self,
-        region: ForestFillRegion,
-        terrain: list[list[int]],
-    ) -> int:
-        """Try all orientations, pick best by: fewest failures, fewest INNER_BORDERs, most fills."""
-        best_orientation = 0xA0
-        best_failures = float('inf')
-        best_inner_count = float('inf')
-        best_fill_count = -1
-
-        for orientation in [0xA0, 0xA1, 0xA2, 0xA3]:
-            result, failures, inner_count = self._fill_with_orientation(
-                region, orientation, terrain
-            )
-            fill_count = sum(1 for t in result.values() if t in FOREST_FILL)
-
-            # Priority: fewer failures > fewer INNER_BORDERs > more fill tiles
-            if (
-                failures < best_failures
-                or (failures == best_failures and inner_count < best_inner_count)
-                or (
-                    failures == best_failures
-                    and inner_count == best_inner_count
-                    and fill_count > best_fill_count
-                )
-            ):
-                best_failures = failures
-                best_inner_count = inner_count
-                best_fill_count = fill_count
-                best_orientation = orientation
+                expected = layout.required[k]
+                if expected == ZERO_EDGE:
+                    expected = tables[i].zero_bits[d]
+                # Screen edges have no constraint
+                if expected and exertion_bit(i, d) != expected:
+                    failures += 1
 
-        return best_orientation
+        return failures
 
     def fill_region(
         self,
@@ -830,6 +615,10 @@ class BetterForestFiller:
         """
         Fill a region with forest tiles.
 
+        Without a forced orientation, every orientation is tried and the one
+        with the fewest failures, then fewest INNER_BORDERs, then most fill
+        tiles wins.
+
         Args:
             terrain: 2D grid of tile IDs
             region: Region to fill
@@ -838,11 +627,12 @@ class BetterForestFiller:
         Returns:
             Mapping from (row, col) to tile ID
         """
-        if orientation is None:
-            orientation = self._select_best_orientation(region, terrain)
+        layout = _RegionLayout(region, terrain)
+        if orientation is not None:
+            return self._fill_with_orientation(layout, orientation).assigned
 
-        result, _, _ = self._fill_with_orientation(region, orientation, terrain)
-        return result
+        fills = [self._fill_with_orientation(layout, o) for o in FAMILY_TILES]
+        return min(fills, key=_OrientationFill.rank).assigned
 
     @staticmethod
     def is_placeholder(tile_value: int) -> bool:
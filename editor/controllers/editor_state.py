@@ -60,7 +60,7 @@ class EditorState:
         self.paste_preview_active: bool = False
 
         # Undo/redo support
-        self.undo_manager: UndoManager = UndoManager(max_undo_levels=50)
+        self.undo_manager: UndoManager = UndoManager()
 
     # Property accessors for per-mode canvas state
     @property
@@ -339,31 +339,16 @@ class EventHandler:
 
     def _undo(self):
         """Undo last action."""
-        if self.state.undo_manager.can_undo():
-            previous_state = self.state.undo_manager.undo(self.hole_data)
-            if previous_state:
-                self._restore_hole_data(previous_state)
-                # Invalidate terrain validation cache
-                if self.on_terrain_modified:
-                    self.on_terrain_modified()
+        if self.state.undo_manager.undo(self.hole_data) is not None:
+            self.hole_data.modified = True  # Restoring counts as modification
+            # Invalidate terrain validation cache
+            if self.on_terrain_modified:
+                self.on_terrain_modified()
 
     def _redo(self):
         """Redo last undone action."""
-        if self.state.undo_manager.can_redo():
-            next_state = self.state.undo_manager.redo(self.hole_data)
-            if next_state:
-                self._restore_hole_data(next_state)
-                # Invalidate terrain validation cache
-                if self.on_terrain_modified:
-                    self.on_terrain_modified()
-
-    def _restore_hole_data(self, snapshot: HoleData):
-        """Restore hole data from snapshot."""
-        self.hole_data.terrain = snapshot.terrain
-        self.hole_data.terrain_height = snapshot.terrain_height
-        self.hole_data.attributes = snapshot.attributes
-        self.hole_data.greens = snapshot.greens
-        self.hole_data.green_x = snapshot.green_x
-        self.hole_data.green_y = snapshot.green_y
-        self.hole_data.metadata = snapshot.metadata
-        self.hole_data.modified = True  # Restoring counts as modification
+        if self.state.undo_manager.redo(self.hole_data) is not None:
+            self.hole_data.modified = True  # Restoring counts as modification
+            # Invalidate terrain validation cache
+            if self.on_terrain_modified:
+                self.on_terrain_modified()
@@ -0,0 +1,82 @@
+"""
+NES Open Tournament Golf - Frame Scheduler
+
+Tracks which editor panels need repainting, so a frame redraws and pushes
+only the regions that changed, and nothing at all while the editor is idle.
+"""
+
+import pygame
+from pygame import Rect
+
+# Editor panels, in draw order
+PANELS = ("sidebar", "tool_picker", "canvas", "toolbar", "status")
+
+# Panels that change when the mouse hovers another panel
+# (the status bar shows hover info; picker hover highlights canvas tiles)
+HOVER_DEPENDENTS = {
+    "sidebar": ("canvas", "status"),
+    "canvas": ("status",),
+}
+
+
+class FrameScheduler:
+    """Collects dirty panels from events and hands them to the renderer."""
+
+    def __init__(self):
+        self.panel_rects: dict[str, Rect] = {}
+        self._dirty: set[str] = set(PANELS)
+        self._last_mouse_pos: tuple[int, int] | None = None
+
+    @property
+    def has_dirty(self) -> bool:
+        """Whether any panel is waiting to be redrawn."""
+        return bool(self._dirty)
+
+    def set_panel_rects(self, panel_rects: dict[str, Rect]):
+        """Update panel screen areas (call when the layout may have changed)."""
+        self.panel_rects = panel_rects
+
+    def mark(self, *panels: str):
+        """Mark panels as needing a redraw."""
+        self._dirty.update(panels)
+
+    def mark_all(self):
+        """Mark the whole window as needing a redraw."""
+        self._dirty.update(PANELS)
+
+    def mark_at(self, pos: tuple[int, int]):
+        """Mark the panel under a screen position, and the panels that follow its hover."""
+        for panel, rect in self.panel_rects.items():
+            if rect.collidepoint(pos):
+                self.mark(panel, *HOVER_DEPENDENTS.get(panel, ()))
+
+    def note_events(self, events: list[pygame.event.Event]):
+        """
+        Mark the panels affected by a frame's events.
+
+        Plain mouse movement dirties the panels under the old and new cursor
+        positions; anything else (keys, clicks, drags, window events) may
+        change any panel and dirties them all.
+
+        Args:
+            events: Events handled this frame
+        """
+        for event in events:
+            if event.type == pygame.MOUSEMOTION and not any(getattr(event, "buttons", ())):
+                if self._last_mouse_pos is not None:
+                    self.mark_at(self._last_mouse_pos)
+                self.mark_at(event.pos)
+                self._last_mouse_pos = event.pos
+            else:
+                self.mark_all()
+
+    def take_dirty(self) -> list[str]:
+        """
+        Get the panels to redraw this frame (in draw order) and reset.
+
+        Returns:
+            Dirty panel names, empty if nothing needs drawing
+        """
+        dirty = [panel for panel in PANELS if panel in self._dirty]
+        self._dirty.clear()
+        return dirty
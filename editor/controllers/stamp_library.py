@@ -27,8 +27,21 @@ class StampLibrary:
         # Ensure user directory exists
         self.user_path.mkdir(parents=True, exist_ok=True)
 
+        self.loaded = False
+
+        # Incremented whenever stamps are loaded, saved or deleted, so views
+        # can tell when to redraw
+        self.version = 0
+
+    def ensure_loaded(self):
+        """Load stamps if they have not been loaded yet."""
+        if not self.loaded:
+            self.load_stamps()
+
     def load_stamps(self):
         """Load all stamps from built-in and user directories."""
+        self.loaded = True
+        self.version += 1
         self.stamps.clear()
         self.categories.clear()
         self.category_tree.clear()
@@ -84,6 +97,7 @@ class StampLibrary:
         Returns:
             List of StampData objects in the category
         """
+        self.ensure_loaded()
         stamp_ids = self.categories.get(category, [])
         return [self.stamps[stamp_id] for stamp_id in stamp_ids if stamp_id in self.stamps]
 
@@ -98,6 +112,7 @@ class StampLibrary:
         Returns:
             List of StampData objects
         """
+        self.ensure_loaded()
         node = self.category_tree.get_node(category_path)
         if not node:
             return []
@@ -111,6 +126,7 @@ class StampLibrary:
 
     def get_all_categories(self) -> list[str]:
         """Get list of all categories."""
+        self.ensure_loaded()
         return sorted(self.categories.keys())
 
     def get_stamp(self, stamp_id: str) -> StampData | None:
@@ -123,6 +139,7 @@ class StampLibrary:
         Returns:
             StampData or None if not found
         """
+        self.ensure_loaded()
         return self.stamps.get(stamp_id)
 
     def save_stamp(self, stamp: StampData, category: str | None = None) -> Path:
@@ -136,6 +153,8 @@ class StampLibrary:
         Returns:
             Path where stamp was saved
         """
+        self.ensure_loaded()
+
         # Use stamp's category if not specified
         if category is None:
             category = stamp.metadata.category
@@ -159,6 +178,7 @@ class StampLibrary:
 
         # Add to library
         self.stamps[stamp.metadata.id] = stamp
+        self.version += 1
         if category not in self.categories:
             self.categories[category] = []
         if stamp.metadata.id not in self.categories[category]:
@@ -176,6 +196,7 @@ class StampLibrary:
         Returns:
             True if deleted, False if not found or is built-in
         """
+        self.ensure_loaded()
         stamp = self.stamps.get(stamp_id)
         if not stamp:
             return False
@@ -191,6 +212,7 @@ class StampLibrary:
 
                     # Remove from library
                     del self.stamps[stamp_id]
+                    self.version += 1
                     for category_stamps in self.categories.values():
                         if stamp_id in category_stamps:
                             category_stamps.remove(stamp_id)
@@ -203,6 +225,7 @@ class StampLibrary:
 
     def get_stamp_count(self) -> int:
         """Get total number of stamps in library."""
+        self.ensure_loaded()
         return len(self.stamps)
 
     @staticmethod
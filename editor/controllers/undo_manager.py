@@ -2,33 +2,266 @@
 NES Open Tournament Golf - Undo Manager
 
 Manages undo/redo history for hole data modifications.
+
+History is stored as deltas (changed cells with old/new values, replaced
+row ranges, changed fields) rather than full copies of the hole, so undo
+and redo cost O(changed cells) and many more levels fit in memory.
 """
 
 import copy
+from collections import deque
 
 from golf.formats.hole_data import HoleData
 
+# Grids stored cell by cell (rows may also be inserted or removed)
+GRID_FIELDS = ("terrain", "attributes", "greens")
+
+# Plain value fields restored by undo (document content only: filepath and
+# modified describe where and whether the document was saved)
+SCALAR_FIELDS = ("terrain_height", "green_x", "green_y")
+
+# Approximate memory cost of history entries, used for the memory budget
+CELL_COST = 120  # One changed cell: tuple plus its ints
+ROW_COST = 72  # List header of a replaced row, plus 8 bytes per cell
+ENTRY_COST = 400  # Delta object and bookkeeping
+
+
+class GridDelta:
+    """Changes to one grid: individual cells, or one replaced range of rows."""
+
+    def __init__(
+        self,
+        cells: list[tuple[int, int, int, int]],
+        start: int = 0,
+        old_rows: list[list[int]] | None = None,
+        new_rows: list[list[int]] | None = None,
+    ):
+        """
+        Args:
+            cells: (row, col, old, new) for each changed cell
+            start: First row of the replaced range (when rows changed)
+            old_rows: Rows before the change (None if only cells changed)
+            new_rows: Rows after the change (None if only cells changed)
+        """
+        self.cells = cells
+        self.start = start
+        self.old_rows = old_rows
+        self.new_rows = new_rows
+
+    @classmethod
+    def compute(cls, old: list[list[int]], new: list[list[int]]) -> "GridDelta | None":
+        """
+        Diff two grids.
+
+        Args:
+            old: Grid before the change
+            new: Grid after the change
+
+        Returns:
+            GridDelta turning old into new, or None if they are equal
+        """
+        if len(old) == len(new):
+            cells = []
+            for row_idx, (old_row, new_row) in enumerate(zip(old, new)):
+                if old_row == new_row:
+                    continue
+                if len(old_row) != len(new_row):
+                    break
+                cells.extend(
+                    (row_idx, col_idx, a, b)
+                    for col_idx, (a, b) in enumerate(zip(old_row, new_row))
+                    if a != b
+                )
+            else:
+                return cls(cells) if cells else None
+
+        # Rows were inserted or removed: keep the range between the common
+        # leading and trailing rows
+        prefix = 0
+        limit = min(len(old), len(new))
+        while prefix < limit and old[prefix] == new[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and old[-1 - suffix] == new[-1 - suffix]:
+            suffix += 1
+        return cls(
+            [],
+            prefix,
+            [row[:] for row in old[prefix : len(old) - suffix]],
+            [row[:] for row in new[prefix : len(new) - suffix]],
+        )
+
+    @property
+    def cost(self) -> int:
+        """Approximate memory use in bytes."""
+        rows = (self.old_rows or []) + (self.new_rows or [])
+        return len(self.cells) * CELL_COST + sum(ROW_COST + 8 * len(row) for row in rows)
+
+    def apply(self, grid: list[list[int]], reverse: bool = False):
+        """
+        Apply the change to a grid in place.
+
+        Args:
+            grid: Grid to modify
+            reverse: Undo the change instead of making it
+        """
+        if self.old_rows is not None and self.new_rows is not None:
+            remove, insert = (self.new_rows, self.old_rows) if reverse else (
+                self.old_rows,
+                self.new_rows,
+            )
+            grid[self.start : self.start + len(remove)] = [row[:] for row in insert]
+        elif reverse:
+            for row, col, old, _ in self.cells:
+                grid[row][col] = old
+        else:
+            for row, col, _, new in self.cells:
+                grid[row][col] = new
+
+
+class HoleDelta:
+    """Everything that changed in a hole between two states."""
+
+    def __init__(self, grids: dict[str, GridDelta], fields: dict[str, tuple]):
+        """
+        Args:
+            grids: Grid field name -> GridDelta
+            fields: Field name -> (old, new) for scalar fields and metadata
+        """
+        self.grids = grids
+        self.fields = fields
+        self.cost = ENTRY_COST + sum(delta.cost for delta in grids.values())
+        if "metadata" in fields:
+            self.cost += 2 * len(repr(fields["metadata"][0]))
+
+    @classmethod
+    def compute(cls, old: HoleData, new: HoleData) -> "HoleDelta":
+        """
+        Diff two hole states.
+
+        Args:
+            old: State before the change
+            new: State after the change
+
+        Returns:
+            HoleDelta turning old into new (empty if they are equal)
+        """
+        grids = {}
+        for name in GRID_FIELDS:
+            delta = GridDelta.compute(getattr(old, name), getattr(new, name))
+            if delta is not None:
+                grids[name] = delta
+
+        fields = {
+            name: (getattr(old, name), getattr(new, name))
+            for name in SCALAR_FIELDS
+            if getattr(old, name) != getattr(new, name)
+        }
+        if old.metadata != new.metadata:
+            fields["metadata"] = (copy.deepcopy(old.metadata), copy.deepcopy(new.metadata))
+        return cls(grids, fields)
+
+    def __bool__(self) -> bool:
+        return bool(self.grids or self.fields)
+
+    def apply(self, hole_data: HoleData, reverse: bool = False):
+        """
+        Apply the change to hole data in place.
+
+        Args:
+            hole_data: Hole data to modify
+            reverse: Undo the change instead of making it
+        """
+        for name, delta in self.grids.items():
+            delta.apply(getattr(hole_data, name), reverse)
+        for name, (old, new) in self.fields.items():
+            value = old if reverse else new
+            if name == "metadata":
+                value = copy.deepcopy(value)
+            setattr(hole_data, name, value)
+
+
+def _copy_hole(hole_data: HoleData) -> HoleData:
+    """Private copy of the fields tracked by undo."""
+    snapshot = HoleData()
+    for name in GRID_FIELDS:
+        setattr(snapshot, name, [row[:] for row in getattr(hole_data, name)])
+    for name in SCALAR_FIELDS:
+        setattr(snapshot, name, getattr(hole_data, name))
+    snapshot.metadata = copy.deepcopy(hole_data.metadata)
+    return snapshot
+
 
 class UndoManager:
-    """Manages undo/redo stacks for hole data modifications."""
+    """
+    Manages undo/redo history for hole data modifications.
 
-    def __init__(self, max_undo_levels: int = 50):
+    Tools call push_state() before changing the hole. The manager keeps one
+    private copy of the last recorded state; at the next push, undo or redo
+    it diffs the live hole against that copy, so each undo level holds only
+    what changed. The oldest levels are dropped once the history exceeds
+    memory_budget bytes (estimated) or max_undo_levels entries.
+    """
+
+    def __init__(self, max_undo_levels: int = 10000, memory_budget: int = 32 * 1024 * 1024):
         """
         Initialize undo manager.
 
         Args:
-            max_undo_levels: Maximum number of undo levels to keep (default: 50)
+            max_undo_levels: Maximum number of undo levels to keep (default: 10000)
+            memory_budget: Approximate bytes of history to keep (default: 32 MB)
         """
-        self.undo_stack: list[HoleData] = []
-        self.redo_stack: list[HoleData] = []
+        # Each undo entry changes the state before it into the one after it;
+        # None marks the latest push, whose changes are still being made
+        self.undo_stack: deque[HoleDelta | None] = deque()
+        self.redo_stack: list[HoleDelta] = []
         self.max_undo_levels = max_undo_levels
+        self.memory_budget = memory_budget
         self._current_data: HoleData | None = None
+        self._recorded: HoleData | None = None  # State at the last push/undo/redo
+        self._history_cost = 0
+
+    @property
+    def history_cost(self) -> int:
+        """Approximate memory used by undo and redo history, in bytes."""
+        return self._history_cost
 
     def set_initial_state(self, hole_data: HoleData):
         """Set the initial state (called when loading a file)."""
-        self.undo_stack.clear()
-        self.redo_stack.clear()
+        self.clear()
         self._current_data = hole_data
+        self._recorded = _copy_hole(hole_data)
+
+    def _sync(self, hole_data: HoleData) -> HoleDelta:
+        """Diff hole data against the recorded state, and record it."""
+        if self._recorded is None:
+            self._recorded = _copy_hole(hole_data)
+            return HoleDelta({}, {})
+        delta = HoleDelta.compute(self._recorded, hole_data)
+        delta.apply(self._recorded)
+        return delta
+
+    def _store(self, delta: HoleDelta):
+        """Add a finished entry to the top of the undo stack."""
+        if self.undo_stack and self.undo_stack[-1] is None:
+            self.undo_stack[-1] = delta
+        else:
+            self.undo_stack.append(delta)
+        self._history_cost += delta.cost
+
+    def _trim(self):
+        """Drop the oldest undo levels until the history fits its limits."""
+        while len(self.undo_stack) > 1 and (
+            len(self.undo_stack) > self.max_undo_levels
+            or self._history_cost > self.memory_budget
+        ):
+            dropped = self.undo_stack.popleft()
+            if dropped is not None:
+                self._history_cost -= dropped.cost
+
+    def _clear_redo(self):
+        self._history_cost -= sum(delta.cost for delta in self.redo_stack)
+        self.redo_stack.clear()
 
     def push_state(self, hole_data: HoleData):
         """
@@ -38,17 +271,19 @@ class UndoManager:
         Args:
             hole_data: Current hole data to save
         """
-        # Create deep copy of current state
-        snapshot = self._create_snapshot(hole_data)
-        self.undo_stack.append(snapshot)
+        # Finish the previous entry with everything changed since its push
+        # (changes after an undo/redo get an entry of their own)
+        delta = self._sync(hole_data)
+        if self.undo_stack and (delta or self.undo_stack[-1] is None):
+            self._store(delta)
 
-        # Limit stack size
-        if len(self.undo_stack) > self.max_undo_levels:
-            self.undo_stack.pop(0)
+        # Open an entry for the changes about to be made
+        self.undo_stack.append(None)
 
         # Clear redo stack on new action
-        self.redo_stack.clear()
+        self._clear_redo()
 
+        self._trim()
         self._current_data = hole_data
 
     def can_undo(self) -> bool:
@@ -61,70 +296,68 @@ class UndoManager:
 
     def undo(self, current_data: HoleData) -> HoleData | None:
         """
-        Undo last action.
+        Undo last action, modifying current_data in place.
 
         Args:
-            current_data: Current hole data to save to redo stack
+            current_data: Current hole data
 
         Returns:
-            Previous state, or None if no undo available
+            current_data restored to the previous state, or None if no undo available
         """
         if not self.can_undo():
             return None
 
-        # Save current state to redo stack
-        current_snapshot = self._create_snapshot(current_data)
-        self.redo_stack.append(current_snapshot)
+        # Changes made since the last record become (or finish) the top entry
+        delta = self._sync(current_data)
+        if delta or self.undo_stack[-1] is None:
+            self._store(delta)
 
-        # Pop previous state from undo stack
-        previous_state = self.undo_stack.pop()
-        return previous_state
+        # Revert the top entry and make it redoable
+        entry = self.undo_stack.pop()
+        assert entry is not None and self._recorded is not None
+        entry.apply(current_data, reverse=True)
+        entry.apply(self._recorded, reverse=True)
+        self.redo_stack.append(entry)
+
+        self._trim()
+        self._current_data = current_data
+        return current_data
 
     def redo(self, current_data: HoleData) -> HoleData | None:
         """
-        Redo last undone action.
+        Redo last undone action, modifying current_data in place.
 
         Args:
-            current_data: Current hole data to save to undo stack
+            current_data: Current hole data
 
         Returns:
-            Next state, or None if no redo available
+            current_data advanced to the next state, or None if no redo available
         """
         if not self.can_redo():
             return None
 
-        # Save current state to undo stack
-        current_snapshot = self._create_snapshot(current_data)
-        self.undo_stack.append(current_snapshot)
-
-        # Pop next state from redo stack
-        next_state = self.redo_stack.pop()
-        return next_state
-
-    def _create_snapshot(self, hole_data: HoleData) -> HoleData:
-        """
-        Create a deep copy snapshot of hole data.
+        # Changes made since the undo are a new action, which ends redo
+        delta = self._sync(current_data)
+        if delta:
+            self._store(delta)
+            self._clear_redo()
+            self._trim()
+            return None
 
-        Args:
-            hole_data: Hole data to snapshot
+        entry = self.redo_stack.pop()
+        assert self._recorded is not None
+        entry.apply(current_data)
+        entry.apply(self._recorded)
+        self.undo_stack.append(entry)
 
-        Returns:
-            Deep copy of hole data
-        """
-        snapshot = HoleData()
-        snapshot.terrain = copy.deepcopy(hole_data.terrain)
-        snapshot.terrain_height = hole_data.terrain_height  # Preserve terrain height
-        snapshot.attributes = copy.deepcopy(hole_data.attributes)
-        snapshot.greens = copy.deepcopy(hole_data.greens)
-        snapshot.green_x = hole_data.green_x
-        snapshot.green_y = hole_data.green_y
-        snapshot.metadata = copy.deepcopy(hole_data.metadata)
-        snapshot.filepath = hole_data.filepath
-        snapshot.modified = hole_data.modified
-        return snapshot
+        self._trim()
+        self._current_data = current_data
+        return current_data
 
     def clear(self):
         """Clear all undo/redo history."""
         self.undo_stack.clear()
         self.redo_stack.clear()
         self._current_data = None
+        self._recorded = None
+        self._history_cost = 0
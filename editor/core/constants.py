@@ -26,6 +26,9 @@ STATUS_HEIGHT = 30
 CANVAS_OFFSET_X = PICKER_WIDTH
 CANVAS_OFFSET_Y = TOOLBAR_HEIGHT
 
+# Longest the main loop sleeps waiting for events while idle (ms)
+IDLE_WAIT_MS = 500
+
 # Colors
 COLOR_BG = (48, 48, 48)
 COLOR_TOOLBAR = (32, 32, 32)
@@ -6,11 +6,14 @@ tileset backgrounds and sprites. Uses shared tile decoding from golf.core.
 """
 
 import json
+import threading
+from collections.abc import Iterable
 
+import numpy as np
 import pygame
 from pygame import Surface
 
-from golf.core.chr_tile import BYTES_PER_TILE, TILE_SIZE, decode_tile
+from golf.core.chr_tile import TILE_SIZE, TilesetData, build_rgb_atlas, decode_tiles
 from golf.core.palettes import GREENS_PALETTE, PALETTES
 
 from .constants import (
@@ -21,6 +24,26 @@ from .constants import (
 
 _placeholder_cache: dict[int, Surface] = {}
 
+# Tiles per row of a tileset atlas surface
+ATLAS_COLUMNS = 16
+
+
+def pixels_to_surface(rgb: np.ndarray, scale: int = 1) -> Surface:
+    """
+    Make a surface from an (8, 8, 3) RGB tile, enlarged by pixel repetition.
+
+    Args:
+        rgb: Tile pixels indexed [y, x]
+        scale: Integer scale factor
+
+    Returns:
+        New surface of size (8 * scale, 8 * scale)
+    """
+    if scale > 1:
+        rgb = rgb.repeat(scale, axis=0).repeat(scale, axis=1)
+    return pygame.surfarray.make_surface(rgb.swapaxes(0, 1))
+
+
 def render_placeholder_tile(size: int) -> Surface:
     """Render the placeholder tile (0x100) with a distinctive pattern."""
     if size in _placeholder_cache:
@@ -43,22 +66,112 @@ def render_placeholder_tile(size: int) -> Surface:
 
 
 class Tileset:
-    """Loads and renders NES CHR tile data using pygame."""
+    """
+    Loads and renders NES CHR tile data using pygame.
 
-    def __init__(self, chr_path: str):
-        with open(chr_path, "rb") as f:
-            self.data = f.read()
+    Tiles are served as subsurfaces of one atlas surface per (palette,
+    scale), built in a few array operations. warm() builds atlases ahead of
+    time on a background thread, so a new zoom level never stalls a frame.
+    """
 
-        self.num_tiles = len(self.data) // BYTES_PER_TILE
+    def __init__(self, chr_path: str):
+        self.tileset_data = TilesetData(chr_path)
+        self.data = self.tileset_data.data
+        self.num_tiles = self.tileset_data.num_tiles
         self._cache: dict[tuple[int, int, int], Surface] = {}
+        self._atlases: dict[tuple[int, int], Surface] = {}
+        self._atlas_lock = threading.Lock()
 
     def decode_tile(self, tile_idx: int) -> list[list[int]]:
         """
         Decode a single 8x8 tile into 2-bit pixel values.
 
-        Uses shared decode_tile function from golf.core.chr_tile.
+        Uses the shared TilesetData from golf.core.chr_tile.
+        """
+        return self.tileset_data.decode_tile(tile_idx)
+
+    @staticmethod
+    def _palette(palette_idx: int) -> list[tuple[int, int, int]]:
+        if palette_idx == GREENS_PALETTE_NUM:
+            return GREENS_PALETTE
+        return PALETTES[palette_idx] if palette_idx < len(PALETTES) else PALETTES[1]
+
+    def _build_atlas(self, palette_idx: int, scale: int) -> Surface:
+        """Render every tile with a palette into one surface, ATLAS_COLUMNS tiles wide."""
+        rgb = self.tileset_data.rgb_atlas(self._palette(palette_idx))
+        rows = -(-len(rgb) // ATLAS_COLUMNS)
+        padded = np.zeros((rows * ATLAS_COLUMNS, TILE_SIZE, TILE_SIZE, 3), dtype=np.uint8)
+        padded[: len(rgb)] = rgb
+
+        # (tile row, tile col, y, x, rgb) -> (y, x, rgb) over the whole sheet
+        sheet = (
+            padded.reshape(rows, ATLAS_COLUMNS, TILE_SIZE, TILE_SIZE, 3)
+            .transpose(0, 2, 1, 3, 4)
+            .reshape(rows * TILE_SIZE, ATLAS_COLUMNS * TILE_SIZE, 3)
+        )
+        atlas = pygame.surfarray.make_surface(sheet.swapaxes(0, 1))
+        if scale > 1:
+            atlas = pygame.transform.scale(
+                atlas, (atlas.get_width() * scale, atlas.get_height() * scale)
+            )
+        return atlas.convert()
+
+    def atlas(self, palette_idx: int, scale: int) -> Surface:
         """
-        return decode_tile(self.data, tile_idx)
+        Get the atlas surface for a palette and scale, building it if needed.
+
+        Args:
+            palette_idx: Terrain palette index, or GREENS_PALETTE_NUM
+            scale: Integer scale factor
+
+        Returns:
+            Surface with tile i at column i % ATLAS_COLUMNS, row i // ATLAS_COLUMNS
+        """
+        key = (palette_idx, scale)
+        atlas = self._atlases.get(key)
+        if atlas is None:
+            # A background warm() may be building this one already
+            with self._atlas_lock:
+                atlas = self._atlases.get(key)
+                if atlas is None:
+                    atlas = self._build_atlas(palette_idx, scale)
+                    self._atlases[key] = atlas
+        return atlas
+
+    def warm(self, palette_indices: Iterable[int], scales: Iterable[int]):
+        """
+        Build missing atlases on a background thread.
+
+        Args:
+            palette_indices: Palettes to build atlases for
+            scales: Scales to build atlases for
+        """
+        keys = [
+            (palette_idx, scale)
+            for scale in scales
+            for palette_idx in palette_indices
+            if scale >= 1 and (palette_idx, scale) not in self._atlases
+        ]
+        if not keys:
+            return
+
+        def work():
+            for palette_idx, scale in keys:
+                self.atlas(palette_idx, scale)
+
+        threading.Thread(target=work, daemon=True).start()
+
+    def _tile_from_atlas(self, tile_idx: int, palette_idx: int, scale: int) -> Surface:
+        """Get a tile's surface as a view into its atlas."""
+        size = TILE_SIZE * scale
+        if not 0 <= tile_idx < self.num_tiles:
+            surf = Surface((size, size)).convert()
+            surf.fill(self._palette(palette_idx)[0])
+            return surf
+        column, row = tile_idx % ATLAS_COLUMNS, tile_idx // ATLAS_COLUMNS
+        return self.atlas(palette_idx, scale).subsurface(
+            (column * size, row * size, size, size)
+        )
 
     def render_tile(self, tile_idx: int, palette_idx: int, scale: int = 1) -> Surface:
         """Render a tile to a Pygame surface with given palette."""
@@ -66,19 +179,10 @@ class Tileset:
         if cache_key in self._cache:
             return self._cache[cache_key]
 
-        palette = PALETTES[palette_idx] if palette_idx < len(PALETTES) else PALETTES[1]
-        pixels = self.decode_tile(tile_idx)
+        if palette_idx == GREENS_PALETTE_NUM or palette_idx >= len(PALETTES):
+            palette_idx = 1
+        surf = self._tile_from_atlas(tile_idx, palette_idx, scale)
 
-        surf = Surface((TILE_SIZE * scale, TILE_SIZE * scale))
-        for y in range(8):
-            for x in range(8):
-                color = palette[pixels[y][x]]
-                if scale == 1:
-                    surf.set_at((x, y), color)
-                else:
-                    pygame.draw.rect(surf, color, (x * scale, y * scale, scale, scale))
-
-        surf = surf.convert()
         self._cache[cache_key] = surf
         return surf
 
@@ -89,20 +193,10 @@ class Tileset:
             return self._cache[cache_key]
 
         if tile_idx == 0x100:
-            surf = render_placeholder_tile(TILE_SIZE * scale)
+            surf = render_placeholder_tile(TILE_SIZE * scale).convert()
         else:
-            pixels = self.decode_tile(tile_idx)
-
-            surf = Surface((TILE_SIZE * scale, TILE_SIZE * scale))
-            for y in range(8):
-                for x in range(8):
-                    color = GREENS_PALETTE[pixels[y][x]]
-                    if scale == 1:
-                        surf.set_at((x, y), color)
-                    else:
-                        pygame.draw.rect(surf, color, (x * scale, y * scale, scale, scale))
-
-        surf = surf.convert()
+            surf = self._tile_from_atlas(tile_idx, GREENS_PALETTE_NUM, scale)
+
         self._cache[cache_key] = surf
         return surf
 
@@ -135,18 +229,24 @@ class Sprite:
         # Parse sprite entries (OAM-style: tile index + offsets)
         self.sprites = data.get("sprites", [{"tile": 0, "x": 0, "y": 0}])
 
+        # Decode all tiles once; color 0 is drawn black (the transparent colorkey)
+        self.pixels = decode_tiles(self.tiles)
+        self.rgb_atlas = build_rgb_atlas(
+            self.pixels, [(0, 0, 0)] + (self.palette[1:] + [(0, 0, 0)] * 3)[:3]
+        )
+
         self._cache: dict[tuple[int, int], Surface] = {}
 
     def decode_tile(self, tile_idx: int) -> list[list[int]]:
         """
         Decode a single 8x8 tile into 2-bit pixel values.
 
-        Uses shared decode_tile function from golf.core.chr_tile.
+        Uses shared tile decoding from golf.core.chr_tile.
         """
         if tile_idx >= len(self.tiles):
             return [[0] * 8 for _ in range(8)]
 
-        return decode_tile(self.tiles[tile_idx], 0)
+        return self.pixels[tile_idx].tolist()
 
     def render_tile(self, tile_idx: int, scale: int = 1) -> Surface:
         """Render a sprite tile to a Pygame surface."""
@@ -154,23 +254,14 @@ class Sprite:
         if cache_key in self._cache:
             return self._cache[cache_key]
 
-        pixels = self.decode_tile(tile_idx)
+        if tile_idx < len(self.tiles):
+            rgb = self.rgb_atlas[tile_idx]
+        else:
+            rgb = np.zeros((TILE_SIZE, TILE_SIZE, 3), dtype=np.uint8)
 
-        surf = Surface((TILE_SIZE * scale, TILE_SIZE * scale))
+        surf = pixels_to_surface(rgb, scale)
         surf.set_colorkey((0, 0, 0))  # Make color 0 (black) transparent
 
-        for y in range(8):
-            for x in range(8):
-                color_idx = pixels[y][x]
-                if color_idx > 0:  # Skip transparent pixels
-                    color = self.palette[color_idx]
-                    if scale == 1:
-                        surf.set_at((x, y), color)
-                    else:
-                        pygame.draw.rect(
-                            surf, color, (x * scale, y * scale, scale, scale)
-                        )
-
         self._cache[cache_key] = surf
         return surf
 
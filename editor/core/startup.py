@@ -0,0 +1,155 @@
+"""
+NES Open Tournament Golf - Editor Startup Helpers
+
+Deferred loading, an on-disk cache of parsed data tables, and startup
+timing for golf-editor --profile-startup.
+"""
+
+import pickle
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import cast
+
+from golf.formats.atomic_file import atomic_write
+
+# Bump when the layout of cached objects changes
+CACHE_FORMAT_VERSION = 1
+
+# Parsed tables are cached here, next to the user stamp directory's config
+CACHE_DIR = Path.home() / ".cache" / "golf-editor"
+
+
+def load_cached[T](
+    name: str,
+    sources: list[str | Path],
+    build: Callable[[], T],
+    cache_dir: str | Path | None = None,
+) -> T:
+    """
+    Build an object from source files, or load it from the startup cache.
+
+    The cached copy is used while every source file keeps the modification
+    time and size it had when the object was built. Any cache problem falls
+    back to building (the cache is only an optimization).
+
+    Args:
+        name: Cache entry name (file name without extension)
+        sources: Files the object is built from, including the code that
+            builds it, so editing either invalidates the entry
+        build: Function building the object
+        cache_dir: Cache directory. If None, uses CACHE_DIR.
+
+    Returns:
+        The object
+    """
+    cache_path = Path(cache_dir or CACHE_DIR) / f"{name}.pickle"
+    stamp: list[object] = [CACHE_FORMAT_VERSION]
+    for source in sources:
+        stat = Path(source).stat()
+        stamp.append((str(source), stat.st_mtime_ns, stat.st_size))
+
+    try:
+        with open(cache_path, "rb") as f:
+            cached_stamp, value = pickle.load(f)
+        if cached_stamp == stamp:
+            return value
+    except Exception:
+        # Missing, truncated or incompatible cache: rebuild below
+        pass
+
+    value = build()
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_write(cache_path, "wb") as f:
+            pickle.dump((stamp, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
+    return value
+
+
+class DeferredLoad[T]:
+    """A value loaded on first use, or ahead of time on a background thread."""
+
+    def __init__(self, load: Callable[[], T]):
+        """
+        Args:
+            load: Function producing the value (called at most once)
+        """
+        self._load = load
+        self._lock = threading.Lock()
+        self._value: T | None = None
+        self._done = False
+
+    @property
+    def ready(self) -> bool:
+        """Whether the value has been loaded."""
+        return self._done
+
+    def get(self) -> T:
+        """Get the value, loading it now if needed (waits for a background load)."""
+        if not self._done:
+            with self._lock:
+                if not self._done:
+                    self._value = self._load()
+                    self._done = True
+        # Loaded by now, so the value is a T (None only if load() returned it)
+        return cast(T, self._value)
+
+    def start(self, on_ready: Callable[[], None] | None = None):
+        """
+        Load the value on a background thread.
+
+        Args:
+            on_ready: Called on that thread once the value is loaded
+        """
+
+        def work():
+            self.get()
+            if on_ready:
+                on_ready()
+
+        threading.Thread(target=work, daemon=True).start()
+
+
+class StartupProfile:
+    """Records how long each startup phase takes."""
+
+    def __init__(self, start: float | None = None):
+        """
+        Args:
+            start: time.perf_counter() value startup is measured from
+                (default: now)
+        """
+        self.start = time.perf_counter() if start is None else start
+        self._last = self.start
+        self.phases: list[tuple[str, float]] = []  # (name, seconds)
+
+    def mark(self, phase: str):
+        """End a phase: record the time since the previous mark."""
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last))
+        self._last = now
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds from the start to the last mark."""
+        return self._last - self.start
+
+    def report(self, title: str) -> str:
+        """
+        Format the recorded phases.
+
+        Args:
+            title: Heading, followed by the total time
+
+        Returns:
+            Multi-line report
+        """
+        lines = [f"{title}: {self.elapsed * 1000:.1f} ms"]
+        for phase, seconds in self.phases:
+            lines.append(f"  {phase:<24} {seconds * 1000:8.1f} ms")
+        return "\n".join(lines)
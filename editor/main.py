@@ -4,14 +4,16 @@ NES Open Tournament Golf - Editor Main
 Command-line entry point for the editor application.
 
 Usage:
-    golf-editor [terrain_chr greens_chr] [hole.json]
+    golf-editor [--profile-startup] [terrain_chr greens_chr] [hole.json]
 
 Defaults to data/chr-ram.bin and data/green-ram.bin if CHR files not specified.
 """
 
 import sys
 
+from . import IMPORT_START
 from .application import EditorApplication
+from .core.startup import StartupProfile
 from .resources import get_resource_path
 
 
@@ -71,13 +73,16 @@ def parse_arguments():
 
 def show_usage():
     """Display usage information."""
-    print("Usage: golf-editor [terrain_chr greens_chr] [hole.json]")
+    print("Usage: golf-editor [--profile-startup] [terrain_chr greens_chr] [hole.json]")
     print("")
     print("Arguments:")
     print("  terrain_chr    Path to terrain CHR binary (default: data/chr-ram.bin)")
     print("  greens_chr     Path to greens CHR binary (default: data/green-ram.bin)")
     print("  hole.json      Optional hole file to load on startup")
     print("")
+    print("Options:")
+    print("  --profile-startup  Print how long each startup phase takes")
+    print("")
     print("Examples:")
     print("  golf-editor")
     print("  golf-editor hole_01.json")
@@ -106,6 +111,11 @@ def validate_chr_file(path: str, label: str):
 
 def main():
     """Main entry point for the editor."""
+    startup_profile = None
+    if "--profile-startup" in sys.argv:
+        sys.argv.remove("--profile-startup")
+        startup_profile = StartupProfile(IMPORT_START)
+
     terrain_chr, greens_chr, hole_json = parse_arguments()
 
     # Validate files exist before starting pygame
@@ -115,10 +125,12 @@ def main():
         validate_chr_file(hole_json, "Hole JSON")
 
     # Create and run application
-    app = EditorApplication(terrain_chr, greens_chr)
+    app = EditorApplication(terrain_chr, greens_chr, startup_profile)
 
     if hole_json:
         app.load_hole(hole_json)
+        if startup_profile is not None:
+            startup_profile.mark("load hole")
 
     app.run()
 
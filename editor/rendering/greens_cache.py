@@ -0,0 +1,120 @@
+"""
+NES Open Tournament Golf - Greens Surface Cache
+
+Keeps the surfaces drawn from a hole's greens: the putting green overlay
+shown on the terrain view and the composited tiles of the greens view.
+Both are redrawn only when the greens change.
+"""
+
+import numpy as np
+import pygame
+from pygame import Surface
+
+from editor.core.constants import GREEN_OVERLAY_COLOR, TILE_SIZE
+from editor.core.pygame_rendering import Tileset
+from golf.rendering.green_overlay import green_overlay_mask, mask_bounds
+
+
+class GreensSurfaceCache:
+    """
+    Greens overlay mask and surfaces, per zoom level.
+
+    The cache remembers the greens rows its surfaces were drawn from and
+    drops every surface when they differ, so any edit (tools, undo,
+    loading another hole) is picked up on the next frame.
+    """
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._greens: list[list[int]] | None = None
+        self._mask: np.ndarray | None = None
+        self._bounds: tuple[int, int, int, int] | None = None
+        self._overlays: dict[int, Surface] = {}
+        self._tiles: dict[tuple[Tileset, int], Surface] = {}
+
+    def _sync(self, greens: list[list[int]]) -> np.ndarray:
+        """Drop everything drawn from different greens and return their overlay mask."""
+        if greens == self._greens and self._mask is not None:
+            return self._mask
+        self._greens = [row[:] for row in greens]
+        mask = self._mask = green_overlay_mask(greens)
+        self._bounds = mask_bounds(mask)
+        self._overlays.clear()
+        self._tiles.clear()
+        return mask
+
+    def overlay_bounds(
+        self, greens: list[list[int]]
+    ) -> tuple[int, int, int, int] | None:
+        """
+        Get the bounding box of the putting surface.
+
+        Args:
+            greens: Greens tile values
+
+        Returns:
+            (min_x, min_y, max_x, max_y) in greens cells with exclusive
+            maximums, or None if no tile is on the green
+        """
+        self._sync(greens)
+        return self._bounds
+
+    def overlay_surface(self, greens: list[list[int]], scale: int) -> Surface:
+        """
+        Get the putting green overlay, a scale x scale block per cell on the green.
+
+        Args:
+            greens: Greens tile values
+            scale: Canvas zoom level
+
+        Returns:
+            Surface with per-pixel alpha, transparent off the green
+        """
+        mask = self._sync(greens)
+        surface = self._overlays.get(scale)
+        if surface is not None:
+            return surface
+
+        height, width = mask.shape
+        surface = Surface((width, height), pygame.SRCALPHA)
+        surface.fill(GREEN_OVERLAY_COLOR)
+        alpha = pygame.surfarray.pixels_alpha(surface)
+        alpha[:] = mask.T * 255
+        del alpha  # Unlock the surface
+
+        surface = pygame.transform.scale(surface, (width * scale, height * scale))
+        self._overlays[scale] = surface
+        return surface
+
+    def tiles_surface(
+        self, greens: list[list[int]], tileset: Tileset, scale: int
+    ) -> Surface:
+        """
+        Get the greens tiles composited onto one surface.
+
+        Args:
+            greens: Greens tile values
+            tileset: Greens tileset
+            scale: Canvas zoom level
+
+        Returns:
+            Surface with the tile for greens[row][col] at
+            (col * tile size, row * tile size)
+        """
+        self._sync(greens)
+        key = (tileset, scale)
+        surface = self._tiles.get(key)
+        if surface is not None:
+            return surface
+
+        tile_size = TILE_SIZE * scale
+        width = max((len(row) for row in greens), default=0)
+        surface = Surface((width * tile_size, len(greens) * tile_size)).convert()
+        blits = []
+        for row, tiles in enumerate(greens):
+            for col, tile_idx in enumerate(tiles):
+                tile_surf = tileset.render_tile_greens(tile_idx, scale)
+                blits.append((tile_surf, (col * tile_size, row * tile_size)))
+        surface.blits(blits, doreturn=False)
+        self._tiles[key] = surface
+        return surface
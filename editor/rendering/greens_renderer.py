@@ -63,25 +63,39 @@ class GreensRenderer:
         # Check if carpet paint tool is active (for dimming protected tiles)
         carpet_paint_active = highlight_state.carpet_paint_active
 
-        # Render greens tiles
-        for row_idx, row in enumerate(hole_data.greens):
-            for col_idx, tile_idx in enumerate(row):
-                x = canvas_rect.x + col_idx * tile_size - canvas_offset_x
-                y = canvas_rect.y + row_idx * tile_size - canvas_offset_y
-
-                if x + tile_size < canvas_rect.x or x > canvas_rect.right:
-                    continue
-                if y + tile_size < canvas_rect.y or y > canvas_rect.bottom:
-                    continue
-
-                tile_surf = tileset.render_tile_greens(tile_idx, canvas_scale)
-                screen.blit(tile_surf, (x, y))
-
-                # Apply dimming overlay for protected tiles when carpet paint is active
-                if carpet_paint_active and tile_idx in PROTECTED_TILES:
-                    dim_surf = pygame.Surface((tile_size, tile_size), pygame.SRCALPHA)
-                    dim_surf.fill((0, 0, 0, 128))  # 50% black overlay
-                    screen.blit(dim_surf, (x, y))
+        # Render greens tiles (composited once per greens change when cached)
+        greens_cache = render_ctx.greens_cache
+        if greens_cache is not None:
+            tiles_surf = greens_cache.tiles_surface(
+                hole_data.greens, tileset, canvas_scale
+            )
+            previous_clip = screen.get_clip()
+            screen.set_clip(canvas_rect.clip(previous_clip))
+            x = canvas_rect.x - canvas_offset_x
+            y = canvas_rect.y - canvas_offset_y
+            screen.blit(tiles_surf, (x, y))
+            screen.set_clip(previous_clip)
+
+        if greens_cache is None or carpet_paint_active:
+            for row_idx, row in enumerate(hole_data.greens):
+                for col_idx, tile_idx in enumerate(row):
+                    x = canvas_rect.x + col_idx * tile_size - canvas_offset_x
+                    y = canvas_rect.y + row_idx * tile_size - canvas_offset_y
+
+                    if x + tile_size < canvas_rect.x or x > canvas_rect.right:
+                        continue
+                    if y + tile_size < canvas_rect.y or y > canvas_rect.bottom:
+                        continue
+
+                    if greens_cache is None:
+                        tile_surf = tileset.render_tile_greens(tile_idx, canvas_scale)
+                        screen.blit(tile_surf, (x, y))
+
+                    # Apply dimming overlay for protected tiles when carpet paint is active
+                    if carpet_paint_active and tile_idx in PROTECTED_TILES:
+                        dim_surf = pygame.Surface((tile_size, tile_size), pygame.SRCALPHA)
+                        dim_surf.fill((0, 0, 0, 128))  # 50% black overlay
+                        screen.blit(dim_surf, (x, y))
 
         # Render shift-hover highlights (AFTER base tiles, BEFORE transform preview)
         if shift_hover_tile is not None:
@@ -10,6 +10,8 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from editor.controllers.editor_state import EditorState
+    from editor.rendering.greens_cache import GreensSurfaceCache
+    from editor.rendering.terrain_chunks import TerrainChunkCache
 
 from editor.controllers.editor_state import GridMode
 from editor.core.pygame_rendering import Sprite, Tileset
@@ -26,6 +28,8 @@ class RenderContext:
         grid_mode: GridMode = GridMode.TILE,
         selected_flag_index: int = 0,
         state: EditorState | None = None,
+        terrain_chunks: TerrainChunkCache | None = None,
+        greens_cache: GreensSurfaceCache | None = None,
     ):
         """
         Initialize render context.
@@ -37,6 +41,8 @@ class RenderContext:
             grid_mode: Grid display mode (OFF, TILE, or SUPERTILE)
             selected_flag_index: Which flag position to render (0-3)
             state: EditorState for clipboard/paste preview access
+            terrain_chunks: Composited terrain cache (tiles are drawn one by one without it)
+            greens_cache: Greens overlay and tile surfaces (drawn from scratch without it)
         """
         self.tileset = tileset
         self.sprites = sprites
@@ -44,3 +50,5 @@ class RenderContext:
         self.grid_mode = grid_mode
         self.selected_flag_index = selected_flag_index
         self.state = state
+        self.terrain_chunks = terrain_chunks
+        self.greens_cache = greens_cache
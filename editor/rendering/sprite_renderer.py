@@ -9,8 +9,9 @@ import pygame
 from pygame import Surface
 
 from editor.controllers.view_state import ViewState
-from editor.core.constants import COLOR_SELECTION, GREEN_OVERLAY_COLOR, HIGHLIGHT_PADDING
+from editor.core.constants import COLOR_SELECTION, HIGHLIGHT_PADDING
 from editor.core.pygame_rendering import Sprite
+from editor.rendering.greens_cache import GreensSurfaceCache
 from golf.formats.hole_data import HoleData
 
 
@@ -23,6 +24,7 @@ class SpriteRenderer:
         view_state: ViewState,
         hole_data: HoleData,
         highlighted_position: str | None = None,
+        greens_cache: GreensSurfaceCache | None = None,
     ):
         """
         Render the putting green overlay on terrain view.
@@ -32,10 +34,15 @@ class SpriteRenderer:
             view_state: Viewport camera and coordinate transformations
             hole_data: Hole data containing greens information
             highlighted_position: Position to highlight ("green", etc.)
+            greens_cache: Cached overlay surfaces (the overlay is drawn from
+                scratch without it)
         """
         if not hole_data.greens:
             return
 
+        if greens_cache is None:
+            greens_cache = GreensSurfaceCache()
+
         canvas_rect = view_state.canvas_rect
         canvas_scale = view_state.scale
         canvas_offset_x = view_state.offset_x
@@ -44,40 +51,20 @@ class SpriteRenderer:
         green_x = hole_data.green_x
         green_y = hole_data.green_y
 
-        # Track bounding box for highlighting
-        min_gx = float('inf')
-        min_gy = float('inf')
-        max_gx = float('-inf')
-        max_gy = float('-inf')
-        has_green_tiles = False
-
-        for gy, grow in enumerate(hole_data.greens):
-            for gx, gval in enumerate(grow):
-                if gval >= 0x30:
-                    # Track bounds for highlighting
-                    min_gx = min(min_gx, gx)
-                    min_gy = min(min_gy, gy)
-                    max_gx = max(max_gx, gx + 1)  # +1 for inclusive right edge
-                    max_gy = max(max_gy, gy + 1)  # +1 for inclusive bottom edge
-                    has_green_tiles = True
-
-                    # Calculate pixel position
-                    px = green_x + gx
-                    py = green_y + gy
-
-                    # Convert to screen coords
-                    screen_x = canvas_rect.x + px * canvas_scale - canvas_offset_x
-                    screen_y = canvas_rect.y + py * canvas_scale - canvas_offset_y
-
-                    if canvas_rect.collidepoint(screen_x, screen_y):
-                        pygame.draw.rect(
-                            screen,
-                            GREEN_OVERLAY_COLOR,
-                            (screen_x, screen_y, canvas_scale, canvas_scale),
-                        )
+        # One pixel of the overlay per greens cell, drawn at the green's position
+        overlay = greens_cache.overlay_surface(hole_data.greens, canvas_scale)
+        screen_x = canvas_rect.x + green_x * canvas_scale - canvas_offset_x
+        screen_y = canvas_rect.y + green_y * canvas_scale - canvas_offset_y
+        previous_clip = screen.get_clip()
+        screen.set_clip(canvas_rect.clip(previous_clip))
+        screen.blit(overlay, (screen_x, screen_y))
+        screen.set_clip(previous_clip)
 
         # Highlight green position if selected
-        if highlighted_position == "green" and has_green_tiles:
+        bounds = greens_cache.overlay_bounds(hole_data.greens)
+        if highlighted_position == "green" and bounds is not None:
+            min_gx, min_gy, max_gx, max_gy = bounds
+
             # Convert greens-relative coords to world coords
             min_x = green_x + min_gx - HIGHLIGHT_PADDING
             min_y = green_y + min_gy - HIGHLIGHT_PADDING
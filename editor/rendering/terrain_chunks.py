@@ -0,0 +1,154 @@
+"""
+NES Open Tournament Golf - Terrain Chunk Cache
+
+Keeps pre-composited terrain surfaces in horizontal strips of rows so the
+canvas is drawn with a few blits per frame instead of one per tile.
+"""
+
+from pygame import Rect, Surface
+
+from editor.core.constants import TERRAIN_WIDTH, TILE_SIZE
+from editor.core.pygame_rendering import Tileset, render_placeholder_tile
+from golf.formats.hole_data import HoleData
+
+# Terrain rows per chunk (even, so chunks hold whole attribute rows)
+CHUNK_ROWS = 8
+
+# Zoom levels whose chunks are kept; older ones are dropped
+MAX_CACHED_SCALES = 2
+
+
+class _Chunk:
+    """A composited strip of terrain and the data it was drawn from."""
+
+    def __init__(self, terrain: list[list[int]], attributes: list[list[int]], surface: Surface):
+        self.terrain = terrain
+        self.attributes = attributes
+        self.surface = surface
+
+
+class TerrainChunkCache:
+    """
+    Composited terrain surfaces, CHUNK_ROWS rows each, per zoom level.
+
+    Each chunk remembers the terrain and attribute rows it was drawn from
+    and is redrawn when they differ, so any edit (tools, undo, row
+    operations, loading) only re-composites the chunks it touched.
+    """
+
+    def __init__(self, tileset: Tileset):
+        """
+        Initialize an empty cache.
+
+        Args:
+            tileset: Terrain tileset used to draw chunks
+        """
+        self.tileset = tileset
+        self._chunks: dict[int, dict[int, _Chunk]] = {}
+
+    def clear(self):
+        """Drop every cached chunk."""
+        self._chunks.clear()
+
+    def _scale_chunks(self, scale: int) -> dict[int, _Chunk]:
+        """Chunks for one zoom level, evicting the least recently used levels."""
+        chunks = self._chunks.pop(scale, None)
+        if chunks is None:
+            chunks = {}
+        self._chunks[scale] = chunks
+        while len(self._chunks) > MAX_CACHED_SCALES:
+            del self._chunks[next(iter(self._chunks))]
+        return chunks
+
+    def get_chunk(self, hole_data: HoleData, chunk_idx: int, scale: int) -> Surface:
+        """
+        Get the composited surface for one chunk, redrawing it if stale.
+
+        Args:
+            hole_data: Hole being rendered
+            chunk_idx: Chunk index (rows chunk_idx * CHUNK_ROWS onward)
+            scale: Canvas zoom level
+
+        Returns:
+            Surface covering the chunk's visible rows at full terrain width
+        """
+        chunks = self._scale_chunks(scale)
+        start_row = chunk_idx * CHUNK_ROWS
+        end_row = min(start_row + CHUNK_ROWS, hole_data.get_terrain_height())
+        terrain = hole_data.terrain[start_row:end_row]
+        attributes = hole_data.attributes[start_row // 2 : (end_row + 1) // 2]
+
+        chunk = chunks.get(chunk_idx)
+        if chunk is None or chunk.terrain != terrain or chunk.attributes != attributes:
+            surface = self._compose(hole_data, start_row, end_row, scale)
+            chunk = _Chunk([row[:] for row in terrain], [row[:] for row in attributes], surface)
+            chunks[chunk_idx] = chunk
+        return chunk.surface
+
+    def _compose(self, hole_data: HoleData, start_row: int, end_row: int, scale: int) -> Surface:
+        """Draw rows start_row..end_row onto a new surface."""
+        tile_size = TILE_SIZE * scale
+        surface = Surface((TERRAIN_WIDTH * tile_size, (end_row - start_row) * tile_size)).convert()
+
+        blits = []
+        for row_idx in range(start_row, end_row):
+            y = (row_idx - start_row) * tile_size
+            for col_idx, tile_idx in enumerate(hole_data.terrain[row_idx][:TERRAIN_WIDTH]):
+                # Use special rendering for placeholder (0x100)
+                if tile_idx == 0x100:
+                    tile_surf = render_placeholder_tile(tile_size)
+                else:
+                    palette_idx = hole_data.get_attribute(row_idx, col_idx)
+                    tile_surf = self.tileset.render_tile(tile_idx, palette_idx, scale)
+                blits.append((tile_surf, (col_idx * tile_size, y)))
+        surface.blits(blits, doreturn=False)
+        return surface
+
+    def render(
+        self,
+        screen: Surface,
+        hole_data: HoleData,
+        canvas_rect: Rect,
+        offset_x: int,
+        offset_y: int,
+        scale: int,
+        start_col: int,
+        end_col: int,
+        start_row: int,
+        end_row: int,
+    ):
+        """
+        Blit the terrain tiles in rows start_row..end_row and columns
+        start_col..end_col to their canvas positions.
+
+        Args:
+            screen: Pygame surface to draw on
+            hole_data: Hole being rendered
+            canvas_rect: Canvas drawing area
+            offset_x: Canvas scroll offset X (pixels)
+            offset_y: Canvas scroll offset Y (pixels)
+            scale: Canvas zoom level
+            start_col: First column to draw
+            end_col: Column after the last one to draw
+            start_row: First row to draw
+            end_row: Row after the last one to draw
+        """
+        if start_row >= end_row or start_col >= end_col:
+            return
+
+        tile_size = TILE_SIZE * scale
+        x = canvas_rect.x + start_col * tile_size - offset_x
+        width = (end_col - start_col) * tile_size
+
+        for chunk_idx in range(start_row // CHUNK_ROWS, (end_row - 1) // CHUNK_ROWS + 1):
+            chunk_start = chunk_idx * CHUNK_ROWS
+            first = max(start_row, chunk_start)
+            last = min(end_row, chunk_start + CHUNK_ROWS)
+            area = Rect(
+                start_col * tile_size,
+                (first - chunk_start) * tile_size,
+                width,
+                (last - first) * tile_size,
+            )
+            y = canvas_rect.y + first * tile_size - offset_y
+            screen.blit(self.get_chunk(hole_data, chunk_idx, scale), (x, y), area)
@@ -69,20 +69,34 @@ class TerrainRenderer:
         start_row = max(0, int(canvas_offset_y // tile_size))
         end_row = min(visible_height, int((canvas_offset_y + canvas_rect.height) // tile_size) + 2)
 
-        for row_idx in range(start_row, end_row):
-            row = hole_data.terrain[row_idx]
-            for col_idx in range(start_col, end_col):
-                tile_idx = row[col_idx]
-                x = canvas_rect.x + col_idx * tile_size - canvas_offset_x
-                y = canvas_rect.y + row_idx * tile_size - canvas_offset_y
-
-                # Render tile - use special rendering for placeholder (0x100)
-                if tile_idx == 0x100:
-                    tile_surf = render_placeholder_tile(tile_size)
-                else:
-                    palette_idx = hole_data.get_attribute(row_idx, col_idx)
-                    tile_surf = tileset.render_tile(tile_idx, palette_idx, canvas_scale)
-                screen.blit(tile_surf, (x, y))
+        if render_ctx.terrain_chunks is not None:
+            render_ctx.terrain_chunks.render(
+                screen,
+                hole_data,
+                canvas_rect,
+                canvas_offset_x,
+                canvas_offset_y,
+                canvas_scale,
+                start_col,
+                end_col,
+                start_row,
+                end_row,
+            )
+        else:
+            for row_idx in range(start_row, end_row):
+                row = hole_data.terrain[row_idx]
+                for col_idx in range(start_col, end_col):
+                    tile_idx = row[col_idx]
+                    x = canvas_rect.x + col_idx * tile_size - canvas_offset_x
+                    y = canvas_rect.y + row_idx * tile_size - canvas_offset_y
+
+                    # Render tile - use special rendering for placeholder (0x100)
+                    if tile_idx == 0x100:
+                        tile_surf = render_placeholder_tile(tile_size)
+                    else:
+                        palette_idx = hole_data.get_attribute(row_idx, col_idx)
+                        tile_surf = tileset.render_tile(tile_idx, palette_idx, canvas_scale)
+                    screen.blit(tile_surf, (x, y))
 
         # Render shift-hover highlights (AFTER base tiles, BEFORE transform preview)
         if shift_hover_tile is not None:
@@ -124,7 +138,11 @@ class TerrainRenderer:
 
         # Render green overlay
         SpriteRenderer.render_green_overlay(
-            screen, view_state, hole_data, highlight_state.position_tool_selected
+            screen,
+            view_state,
+            hole_data,
+            highlight_state.position_tool_selected,
+            render_ctx.greens_cache,
         )
 
         # Render sprites
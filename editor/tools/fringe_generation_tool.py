@@ -55,10 +55,18 @@ class FringeGenerationTool:
     """
 
     def __init__(self):
-        """Initialize tool with fresh state and load fringe generation data."""
+        """Initialize tool with fresh state (fringe data loads on first use)."""
         self.state = FringeToolState()
-        self.generator = FringeGenerator()
-        self.generator.load_data()
+        self._generator: FringeGenerator | None = None
+
+    @property
+    def generator(self) -> FringeGenerator:
+        """Fringe generator, loading its data the first time it is needed."""
+        if self._generator is None:
+            generator = FringeGenerator()
+            generator.load_data()
+            self._generator = generator
+        return self._generator
 
     def handle_mouse_down(self, pos: tuple[int, int], button: int, modifiers: int, context: ToolContext) -> ToolResult:
         """Handle mouse click to start pathing."""
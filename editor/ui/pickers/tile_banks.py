@@ -2,15 +2,19 @@
 Bank classes for organizing tiles in tile picker panels.
 
 This module provides reusable tile organization components that handle
-layout, rendering, and hit detection for groups of tiles.
+layout, rendering, and hit detection for groups of tiles. Each bank is drawn
+once into an offscreen surface and redrawn only when the palette changes;
+a frame blits that surface and outlines the selected tile on top.
 """
 
+from abc import ABC, abstractmethod
 
 import pygame
 from pygame import Rect, Surface
 
 from editor.core.constants import (
     COLOR_GRID,
+    COLOR_PICKER_BG,
     COLOR_SELECTION,
     COLOR_TEXT,
     TILE_SIZE,
@@ -23,6 +27,16 @@ def range_to_list(min: int, max: int) -> list[int]:
     return list(range(min, max))
 
 
+def draw_tile_highlight(screen: Surface, x: int, y: int, tile_scale: int):
+    """Outline the tile drawn at (x, y) as selected."""
+    pygame.draw.rect(
+        screen,
+        COLOR_SELECTION,
+        (x - 1, y - 1, TILE_SIZE * tile_scale + 2, TILE_SIZE * tile_scale + 2),
+        2,
+    )
+
+
 class TileSubBank:
     """A labeled subgroup of tiles within a bank."""
 
@@ -61,6 +75,39 @@ class TileSubBank:
         # Total: spacing before + label + tiles
         return self.spacing_before + self.label_height + tiles_height
 
+    def render_tile(
+        self, tileset: Tileset, tile_idx: int, palette_idx: int, tile_scale: int
+    ) -> Surface:
+        """Render one tile (special handling for 0x100 placeholder)."""
+        if tile_idx == 0x100:
+            return render_placeholder_tile(TILE_SIZE * tile_scale)
+        return tileset.render_tile(tile_idx, palette_idx, tile_scale)
+
+    def tile_positions(
+        self, tiles_per_row: int, tile_scale: int, tile_spacing: int
+    ) -> list[tuple[int, int, int]]:
+        """
+        Get where each tile is drawn.
+
+        Args:
+            tiles_per_row: Number of tiles per row
+            tile_scale: Tile rendering scale
+            tile_spacing: Spacing between tiles
+
+        Returns:
+            (tile_idx, x, y) for each tile, relative to the subbank's top left
+        """
+        tile_size = TILE_SIZE * tile_scale + tile_spacing
+        tiles_y = self.spacing_before + self.label_height
+        return [
+            (
+                tile_idx,
+                (i % tiles_per_row) * tile_size,
+                tiles_y + (i // tiles_per_row) * tile_size,
+            )
+            for i, tile_idx in enumerate(self.tile_indices)
+        ]
+
     def render(
         self,
         screen: Surface,
@@ -94,49 +141,30 @@ class TileSubBank:
         Returns:
             Height consumed by this subbank
         """
-        current_y = y + self.spacing_before
-
         # 1. Render label text (left-aligned, smaller font)
         font = get_font("monospace", 10)
         text_surf = font.render(self.label, True, COLOR_GRID)  # Subtle gray color
-        screen.blit(text_surf, (x, current_y))
-
-        current_y += self.label_height
+        screen.blit(text_surf, (x, y + self.spacing_before))
 
         # 2. Render tiles in grid
         tile_size = TILE_SIZE * tile_scale + tile_spacing
 
-        for i, tile_idx in enumerate(self.tile_indices):
-            col = i % tiles_per_row
-            row = i // tiles_per_row
-
-            tile_x = x + col * tile_size
-            tile_y = current_y + row * tile_size
+        for tile_idx, local_x, local_y in self.tile_positions(
+            tiles_per_row, tile_scale, tile_spacing
+        ):
+            tile_x = x + local_x
+            tile_y = y + local_y
 
             # Skip if outside clip rect
             if tile_y + tile_size < clip_rect.y or tile_y > clip_rect.bottom:
                 continue
 
-            # Render tile (special handling for 0x100 placeholder)
-            if tile_idx == 0x100:
-                tile_surf = render_placeholder_tile(TILE_SIZE * tile_scale)
-            else:
-                tile_surf = tileset.render_tile(tile_idx, palette_idx, tile_scale)
+            tile_surf = self.render_tile(tileset, tile_idx, palette_idx, tile_scale)
             screen.blit(tile_surf, (tile_x, tile_y))
 
             # Selection highlight
             if tile_idx == selected_tile:
-                pygame.draw.rect(
-                    screen,
-                    COLOR_SELECTION,
-                    (
-                        tile_x - 1,
-                        tile_y - 1,
-                        TILE_SIZE * tile_scale + 2,
-                        TILE_SIZE * tile_scale + 2,
-                    ),
-                    2,
-                )
+                draw_tile_highlight(screen, tile_x, tile_y, tile_scale)
 
         return self.get_height(tiles_per_row, tile_scale, tile_spacing)
 
@@ -144,93 +172,30 @@ class TileSubBank:
 class TileSubBankGreens(TileSubBank):
     """TileSubBank variant that uses greens palette rendering."""
 
-    def render(
+    def render_tile(
         self,
-        screen: Surface,
-        x: int,
-        y: int,
-        width: int,
         tileset: Tileset,
+        tile_idx: int,
         palette_idx: int,  # Ignored for greens, kept for API compatibility
-        selected_tile: int | None,
-        tiles_per_row: int,
         tile_scale: int,
-        tile_spacing: int,
-        clip_rect: Rect,
-    ) -> int:
-        """
-        Render this subbank at the specified position using greens palette.
+    ) -> Surface:
+        """Render one tile using greens palette (0x100 is the placeholder)."""
+        if tile_idx == 0x100:
+            return render_placeholder_tile(TILE_SIZE * tile_scale)
+        return tileset.render_tile_greens(tile_idx, tile_scale)
 
-        Args:
-            screen: Pygame surface to draw on
-            x: Left edge x coordinate
-            y: Top edge y coordinate (includes spacing before)
-            width: Total width available
-            tileset: Tileset for rendering tiles
-            palette_idx: Palette index (ignored for greens, kept for API compatibility)
-            selected_tile: Currently selected tile value (for highlight)
-            tiles_per_row: Number of tiles per row
-            tile_scale: Tile rendering scale
-            tile_spacing: Spacing between tiles
-            clip_rect: Clipping rectangle for scrolling
-
-        Returns:
-            Height consumed by this subbank
-        """
-        current_y = y + self.spacing_before
-
-        # 1. Render label text (left-aligned, smaller font)
-        font = get_font("monospace", 10)
-        text_surf = font.render(self.label, True, COLOR_GRID)  # Subtle gray color
-        screen.blit(text_surf, (x, current_y))
-
-        current_y += self.label_height
 
-        # 2. Render tiles in grid
-        tile_size = TILE_SIZE * tile_scale + tile_spacing
-
-        for i, tile_idx in enumerate(self.tile_indices):
-            col = i % tiles_per_row
-            row = i // tiles_per_row
-
-            tile_x = x + col * tile_size
-            tile_y = current_y + row * tile_size
-
-            # Skip if outside clip rect
-            if tile_y + tile_size < clip_rect.y or tile_y > clip_rect.bottom:
-                continue
-
-            # Render tile using greens palette (special handling for 0x100 placeholder)
-            if tile_idx == 0x100:
-                tile_surf = render_placeholder_tile(TILE_SIZE * tile_scale)
-            else:
-                tile_surf = tileset.render_tile_greens(tile_idx, tile_scale)
-            screen.blit(tile_surf, (tile_x, tile_y))
-
-            # Selection highlight
-            if tile_idx == selected_tile:
-                pygame.draw.rect(
-                    screen,
-                    COLOR_SELECTION,
-                    (
-                        tile_x - 1,
-                        tile_y - 1,
-                        TILE_SIZE * tile_scale + 2,
-                        TILE_SIZE * tile_scale + 2,
-                    ),
-                    2,
-                )
-
-        return self.get_height(tiles_per_row, tile_scale, tile_spacing)
+class TileBank(ABC):
+    """
+    Base class for a labeled, bordered group of tiles in a tile picker.
 
-
-class SimpleTileBank:
-    """A labeled group of tiles without subbank subdivision."""
+    Subclasses lay out and draw the tiles; this class draws the label and
+    border and caches the whole bank as one surface.
+    """
 
     def __init__(
         self,
         label: str,
-        tile_indices: list[int],
         tiles_per_row: int,
         tile_scale: int,
         tile_spacing: int = 2,
@@ -238,48 +203,81 @@ class SimpleTileBank:
         """
         Args:
             label: Display name for this bank (e.g., "Rough", "Fringe")
-            tile_indices: List of tile index values for this bank
             tiles_per_row: Number of tiles per row (from parent picker)
             tile_scale: Tile rendering scale (from parent picker)
             tile_spacing: Spacing between tiles in pixels
         """
         self.label = label
-        self.tile_indices = tile_indices
         self.tiles_per_row = tiles_per_row
         self.tile_scale = tile_scale
         self.tile_spacing = tile_spacing
 
-        # Layout constants (same as GroupedTileBank for consistency)
+        # Layout constants
         self.label_height = 20  # Height of label header
         self.border_width = 1  # Border line thickness
         self.padding = 4  # Internal padding around tiles
 
+        # Offscreen rendering of the bank and what it was drawn with
+        self._surface: Surface | None = None
+        self._surface_key: tuple | None = None
+
+    @abstractmethod
     def get_height(self) -> int:
+        """Calculate total rendered height of this bank."""
+
+    @abstractmethod
+    def tile_positions(self) -> list[tuple[int, int, int]]:
         """
-        Calculate total rendered height of this bank.
+        Get where each tile is drawn.
 
         Returns:
-            Total height in pixels including label, tiles, borders, padding
+            (tile_idx, x, y) for each tile, relative to the bank's top left
         """
-        # Calculate grid dimensions
-        num_tiles = len(self.tile_indices)
-        num_rows = (num_tiles + self.tiles_per_row - 1) // self.tiles_per_row
 
-        tile_size = TILE_SIZE * self.tile_scale + self.tile_spacing
-        tiles_height = num_rows * tile_size
+    @abstractmethod
+    def _render_tiles(
+        self, surface: Surface, width: int, tileset: Tileset, palette_idx: int
+    ):
+        """Draw every tile onto the bank's offscreen surface."""
 
-        # Total: label + top padding + tiles + bottom padding + bottom border
-        return (
-            self.label_height
-            + self.padding
-            + tiles_height
-            + self.padding
-            + self.border_width
-        )
+    def get_surface(self, width: int, tileset: Tileset, palette_idx: int) -> Surface:
+        """
+        Get the bank drawn without highlights, redrawing it only if needed.
 
-    def get_tile_count(self) -> int:
-        """Return number of tiles in this bank."""
-        return len(self.tile_indices)
+        Args:
+            width: Total width of bank
+            tileset: Tileset for rendering tiles
+            palette_idx: Palette index for terrain rendering
+
+        Returns:
+            Surface of size (width, get_height())
+        """
+        key = (width, tileset, palette_idx, self.tiles_per_row, self.tile_scale)
+        if self._surface is not None and self._surface_key == key:
+            return self._surface
+
+        surface = Surface((width, self.get_height())).convert()
+        surface.fill(COLOR_PICKER_BG)
+
+        # 1. Draw label background
+        pygame.draw.rect(surface, COLOR_GRID, Rect(0, 0, width, self.label_height))
+
+        # 2. Render label text (centered)
+        font = get_font("monospace", 12)
+        text_surf = font.render(self.label, True, COLOR_TEXT)
+        text_x = (width - text_surf.get_width()) // 2
+        text_y = (self.label_height - text_surf.get_height()) // 2
+        surface.blit(text_surf, (text_x, text_y))
+
+        # 3. Draw bank border (around entire bank including label)
+        pygame.draw.rect(surface, COLOR_GRID, surface.get_rect(), self.border_width)
+
+        # 4. Render tiles
+        self._render_tiles(surface, width, tileset, palette_idx)
+
+        self._surface = surface
+        self._surface_key = key
+        return surface
 
     def render(
         self,
@@ -307,58 +305,94 @@ class SimpleTileBank:
             hovered_tile: Currently hovered tile value (for highlight)
             clip_rect: Clipping rectangle for scrolling
         """
-        # 1. Draw label background
-        label_rect = Rect(x, y, width, self.label_height)
-        pygame.draw.rect(screen, COLOR_GRID, label_rect)
+        surface = self.get_surface(width, tileset, palette_idx)
+        visible = clip_rect.clip(Rect(x, y, surface.get_width(), surface.get_height()))
+        if not visible.height:
+            return
+        screen.blit(surface, visible.topleft, visible.move(-x, -y))
+
+        # Selection highlight, clipped like the bank itself
+        previous_clip = screen.get_clip()
+        screen.set_clip(visible.clip(previous_clip))
+        for tile_idx, tile_x, tile_y in self.tile_positions():
+            if tile_idx == selected_tile:
+                draw_tile_highlight(screen, x + tile_x, y + tile_y, self.tile_scale)
+        screen.set_clip(previous_clip)
 
-        # 2. Render label text (centered)
-        font = get_font("monospace", 12)
-        text_surf = font.render(self.label, True, COLOR_TEXT)
-        text_x = x + (width - text_surf.get_width()) // 2
-        text_y = y + (self.label_height - text_surf.get_height()) // 2
-        screen.blit(text_surf, (text_x, text_y))
 
-        # 3. Draw bank border (around entire bank including label)
-        bank_height = self.get_height()
-        border_rect = Rect(x, y, width, bank_height)
-        pygame.draw.rect(screen, COLOR_GRID, border_rect, self.border_width)
+class SimpleTileBank(TileBank):
+    """A labeled group of tiles without subbank subdivision."""
+
+    def __init__(
+        self,
+        label: str,
+        tile_indices: list[int],
+        tiles_per_row: int,
+        tile_scale: int,
+        tile_spacing: int = 2,
+    ):
+        """
+        Args:
+            label: Display name for this bank (e.g., "Rough", "Fringe")
+            tile_indices: List of tile index values for this bank
+            tiles_per_row: Number of tiles per row (from parent picker)
+            tile_scale: Tile rendering scale (from parent picker)
+            tile_spacing: Spacing between tiles in pixels
+        """
+        super().__init__(label, tiles_per_row, tile_scale, tile_spacing)
+        self.tile_indices = tile_indices
+
+    def get_height(self) -> int:
+        """
+        Calculate total rendered height of this bank.
+
+        Returns:
+            Total height in pixels including label, tiles, borders, padding
+        """
+        # Calculate grid dimensions
+        num_tiles = len(self.tile_indices)
+        num_rows = (num_tiles + self.tiles_per_row - 1) // self.tiles_per_row
 
-        # 4. Render tiles in grid
-        tile_y_start = y + self.label_height + self.padding
-        tile_x_start = x + self.padding
         tile_size = TILE_SIZE * self.tile_scale + self.tile_spacing
+        tiles_height = num_rows * tile_size
 
-        for i, tile_idx in enumerate(self.tile_indices):
-            col = i % self.tiles_per_row
-            row = i // self.tiles_per_row
+        # Total: label + top padding + tiles + bottom padding + bottom border
+        return (
+            self.label_height
+            + self.padding
+            + tiles_height
+            + self.padding
+            + self.border_width
+        )
 
-            tile_x = tile_x_start + col * tile_size
-            tile_y = tile_y_start + row * tile_size
+    def get_tile_count(self) -> int:
+        """Return number of tiles in this bank."""
+        return len(self.tile_indices)
 
-            # Skip if outside clip rect
-            if tile_y + tile_size < clip_rect.y or tile_y > clip_rect.bottom:
-                continue
+    def render_tile(self, tileset: Tileset, tile_idx: int, palette_idx: int) -> Surface:
+        """Render one tile (special handling for 0x100 placeholder)."""
+        if tile_idx == 0x100:
+            return render_placeholder_tile(TILE_SIZE * self.tile_scale)
+        return tileset.render_tile(tile_idx, palette_idx, self.tile_scale)
 
-            # Render tile (special handling for 0x100 placeholder)
-            if tile_idx == 0x100:
-                tile_surf = render_placeholder_tile(TILE_SIZE * self.tile_scale)
-            else:
-                tile_surf = tileset.render_tile(tile_idx, palette_idx, self.tile_scale)
-            screen.blit(tile_surf, (tile_x, tile_y))
+    def tile_positions(self) -> list[tuple[int, int, int]]:
+        tile_size = TILE_SIZE * self.tile_scale + self.tile_spacing
+        tiles_y = self.label_height + self.padding
+        return [
+            (
+                tile_idx,
+                self.padding + (i % self.tiles_per_row) * tile_size,
+                tiles_y + (i // self.tiles_per_row) * tile_size,
+            )
+            for i, tile_idx in enumerate(self.tile_indices)
+        ]
 
-            # Selection highlight
-            if tile_idx == selected_tile:
-                pygame.draw.rect(
-                    screen,
-                    COLOR_SELECTION,
-                    (
-                        tile_x - 1,
-                        tile_y - 1,
-                        TILE_SIZE * self.tile_scale + 2,
-                        TILE_SIZE * self.tile_scale + 2,
-                    ),
-                    2,
-                )
+    def _render_tiles(
+        self, surface: Surface, width: int, tileset: Tileset, palette_idx: int
+    ):
+        for tile_idx, tile_x, tile_y in self.tile_positions():
+            tile_surf = self.render_tile(tileset, tile_idx, palette_idx)
+            surface.blit(tile_surf, (tile_x, tile_y))
 
     def get_tile_at_position(
         self,
@@ -400,87 +434,19 @@ class SimpleTileBank:
 class SimpleTileBankGreens(SimpleTileBank):
     """SimpleTileBank variant that uses greens palette rendering."""
 
-    def render(
+    def render_tile(
         self,
-        screen: Surface,
-        x: int,
-        y: int,
-        width: int,
         tileset: Tileset,
+        tile_idx: int,
         palette_idx: int,  # Ignored for greens, kept for API compatibility
-        selected_tile: int | None,
-        hovered_tile: int | None,
-        clip_rect: Rect,
-    ):
-        """
-        Render this bank at the specified position using greens palette.
-
-        Args:
-            screen: Pygame surface to draw on
-            x: Left edge x coordinate
-            y: Top edge y coordinate (includes label)
-            width: Total width of bank
-            tileset: Tileset for rendering tiles
-            palette_idx: Palette index (ignored for greens, kept for API compatibility)
-            selected_tile: Currently selected tile value (for highlight)
-            hovered_tile: Currently hovered tile value (for highlight)
-            clip_rect: Clipping rectangle for scrolling
-        """
-        # 1. Draw label background
-        label_rect = Rect(x, y, width, self.label_height)
-        pygame.draw.rect(screen, COLOR_GRID, label_rect)
-
-        # 2. Render label text (centered)
-        font = get_font("monospace", 12)
-        text_surf = font.render(self.label, True, COLOR_TEXT)
-        text_x = x + (width - text_surf.get_width()) // 2
-        text_y = y + (self.label_height - text_surf.get_height()) // 2
-        screen.blit(text_surf, (text_x, text_y))
-
-        # 3. Draw bank border (around entire bank including label)
-        bank_height = self.get_height()
-        border_rect = Rect(x, y, width, bank_height)
-        pygame.draw.rect(screen, COLOR_GRID, border_rect, self.border_width)
-
-        # 4. Render tiles in grid
-        tile_y_start = y + self.label_height + self.padding
-        tile_x_start = x + self.padding
-        tile_size = TILE_SIZE * self.tile_scale + self.tile_spacing
-
-        for i, tile_idx in enumerate(self.tile_indices):
-            col = i % self.tiles_per_row
-            row = i // self.tiles_per_row
-
-            tile_x = tile_x_start + col * tile_size
-            tile_y = tile_y_start + row * tile_size
-
-            # Skip if outside clip rect
-            if tile_y + tile_size < clip_rect.y or tile_y > clip_rect.bottom:
-                continue
-
-            # Render tile using greens palette (special handling for 0x100 placeholder)
-            if tile_idx == 0x100:
-                tile_surf = render_placeholder_tile(TILE_SIZE * self.tile_scale)
-            else:
-                tile_surf = tileset.render_tile_greens(tile_idx, self.tile_scale)
-            screen.blit(tile_surf, (tile_x, tile_y))
-
-            # Selection highlight
-            if tile_idx == selected_tile:
-                pygame.draw.rect(
-                    screen,
-                    COLOR_SELECTION,
-                    (
-                        tile_x - 1,
-                        tile_y - 1,
-                        TILE_SIZE * self.tile_scale + 2,
-                        TILE_SIZE * self.tile_scale + 2,
-                    ),
-                    2,
-                )
+    ) -> Surface:
+        """Render one tile using greens palette (0x100 is the placeholder)."""
+        if tile_idx == 0x100:
+            return render_placeholder_tile(TILE_SIZE * self.tile_scale)
+        return tileset.render_tile_greens(tile_idx, self.tile_scale)
 
 
-class GroupedTileBank:
+class GroupedTileBank(TileBank):
     """A labeled group of tiles within a tile picker, organized into subbanks."""
 
     def __init__(
@@ -499,16 +465,8 @@ class GroupedTileBank:
             tile_scale: Tile rendering scale (from parent picker)
             tile_spacing: Spacing between tiles in pixels
         """
-        self.label = label
+        super().__init__(label, tiles_per_row, tile_scale, tile_spacing)
         self.subbanks = subbanks
-        self.tiles_per_row = tiles_per_row
-        self.tile_scale = tile_scale
-        self.tile_spacing = tile_spacing
-
-        # Layout constants
-        self.label_height = 20  # Height of label header
-        self.border_width = 1  # Border line thickness
-        self.padding = 4  # Internal padding around tiles
 
     def get_height(self) -> int:
         """
@@ -536,67 +494,37 @@ class GroupedTileBank:
         """Return number of tiles in this bank."""
         return sum(len(subbank.tile_indices) for subbank in self.subbanks)
 
-    def render(
-        self,
-        screen: Surface,
-        x: int,
-        y: int,
-        width: int,
-        tileset: Tileset,
-        palette_idx: int,
-        selected_tile: int | None,
-        hovered_tile: int | None,
-        clip_rect: Rect,
-    ):
-        """
-        Render this bank at the specified position.
-
-        Args:
-            screen: Pygame surface to draw on
-            x: Left edge x coordinate
-            y: Top edge y coordinate (includes label)
-            width: Total width of bank
-            tileset: Tileset for rendering tiles
-            palette_idx: Palette index for terrain rendering
-            selected_tile: Currently selected tile value (for highlight)
-            hovered_tile: Currently hovered tile value (for highlight)
-            clip_rect: Clipping rectangle for scrolling
-        """
-        # 1. Draw label background
-        label_rect = Rect(x, y, width, self.label_height)
-        pygame.draw.rect(screen, COLOR_GRID, label_rect)
-
-        # 2. Render label text (centered)
-        font = get_font("monospace", 12)
-        text_surf = font.render(self.label, True, COLOR_TEXT)
-        text_x = x + (width - text_surf.get_width()) // 2
-        text_y = y + (self.label_height - text_surf.get_height()) // 2
-        screen.blit(text_surf, (text_x, text_y))
-
-        # 3. Draw bank border (around entire bank including label)
-        bank_height = self.get_height()
-        border_rect = Rect(x, y, width, bank_height)
-        pygame.draw.rect(screen, COLOR_GRID, border_rect, self.border_width)
-
-        # 4. Render subbanks
-        current_y = y + self.label_height + self.padding
-        subbank_x = x + self.padding
+    def tile_positions(self) -> list[tuple[int, int, int]]:
+        positions = []
+        subbank_y = self.label_height + self.padding
+        for subbank in self.subbanks:
+            for tile_idx, tile_x, tile_y in subbank.tile_positions(
+                self.tiles_per_row, self.tile_scale, self.tile_spacing
+            ):
+                positions.append((tile_idx, self.padding + tile_x, subbank_y + tile_y))
+            subbank_y += subbank.get_height(
+                self.tiles_per_row, self.tile_scale, self.tile_spacing
+            )
+        return positions
 
+    def _render_tiles(
+        self, surface: Surface, width: int, tileset: Tileset, palette_idx: int
+    ):
+        current_y = self.label_height + self.padding
         for subbank in self.subbanks:
-            height_consumed = subbank.render(
-                screen,
-                subbank_x,
+            current_y += subbank.render(
+                surface,
+                self.padding,
                 current_y,
                 width - 2 * self.padding,
                 tileset,
                 palette_idx,
-                selected_tile,
+                None,
                 self.tiles_per_row,
                 self.tile_scale,
                 self.tile_spacing,
-                clip_rect,
+                surface.get_rect(),
             )
-            current_y += height_consumed
 
     def get_tile_at_position(
         self,
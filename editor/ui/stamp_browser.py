@@ -1,7 +1,9 @@
 """
 Stamp browser panel for browsing and selecting stamp patterns.
 
-Replaces tile picker when Stamp tool is active.
+Replaces tile picker when Stamp tool is active. The stamp list is drawn in
+pages of offscreen surfaces, redrawn only when the category, palette or
+stamp library changes.
 """
 
 import pygame
@@ -20,6 +22,9 @@ from editor.core.constants import (
 from editor.data import StampData
 from editor.ui.category_tree_view import CategoryTreeView
 
+# Stamp list items drawn into each cached page surface
+STAMP_PAGE_ITEMS = 8
+
 
 class StampBrowser:
     """Stamp browser widget for selecting stamps from library."""
@@ -63,6 +68,11 @@ class StampBrowser:
         # Preview cache for performance
         self._preview_cache: dict[str, Surface] = {}
 
+        # Rendered stamp list pages (page number -> surface) and what they
+        # were drawn with
+        self._page_cache: dict[int, Surface] = {}
+        self._page_key: tuple | None = None
+
         # Layout constants
         self.tree_height = 200  # Height of category tree view
         self.item_height = 80  # Increased from 60 to accommodate previews
@@ -91,6 +101,9 @@ class StampBrowser:
 
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle input events. Returns True if handled."""
+        # Stamps load the first time the browser is used
+        self.stamp_library.ensure_loaded()
+
         # Delegate to category tree view first
         if self.category_tree_view.handle_event(event):
             return True
@@ -249,6 +262,8 @@ class StampBrowser:
             screen: Pygame surface
             palette_idx: Palette index to use for stamp previews (default: 0)
         """
+        self.stamp_library.ensure_loaded()
+
         # Background
         pygame.draw.rect(screen, COLOR_PICKER_BG, self.rect)
 
@@ -279,68 +294,138 @@ class StampBrowser:
             msg_surf = self.font.render("No stamps in this category", True, COLOR_TEXT)
             msg_rect = msg_surf.get_rect(center=list_rect.center)
             screen.blit(msg_surf, msg_rect)
-        else:
-            # Render each stamp item
-            for i, stamp in enumerate(stamps):
-                item_y = list_y_start + i * (self.item_height + self.item_padding) - self.scroll_y
-                item_rect = Rect(
-                    list_rect.x,
-                    item_y,
-                    list_rect.width,
-                    self.item_height,
+            return
+
+        item_pitch = self.item_height + self.item_padding
+        previous_clip = screen.get_clip()
+        screen.set_clip(list_rect.clip(previous_clip))
+
+        # Blit the cached pages in the scroll window
+        first_page = self.scroll_y // item_pitch // STAMP_PAGE_ITEMS
+        last_page = min(
+            (self.scroll_y + list_rect.height) // item_pitch // STAMP_PAGE_ITEMS,
+            (len(stamps) - 1) // STAMP_PAGE_ITEMS,
+        )
+        for page in range(first_page, last_page + 1):
+            page_y = list_y_start + page * STAMP_PAGE_ITEMS * item_pitch - self.scroll_y
+            page_surf = self._get_page(stamps, page, list_rect.width, palette_idx)
+            screen.blit(page_surf, (list_rect.x, page_y))
+
+        # Draw the selected and hovered items over the pages
+        for i, stamp in enumerate(stamps):
+            is_selected = stamp.metadata.id == self.selected_stamp_id
+            is_hovered = stamp.metadata.id == self.hovered_stamp_id
+            if is_selected or is_hovered:
+                item_y = list_y_start + i * item_pitch - self.scroll_y
+                item_rect = Rect(list_rect.x, item_y, list_rect.width, self.item_height)
+                self._render_item(
+                    screen, stamp, item_rect, palette_idx, is_selected, is_hovered
                 )
 
-                # Skip items outside visible area
-                if item_y + self.item_height < list_rect.y or item_y > list_rect.bottom:
-                    continue
+        screen.set_clip(previous_clip)
 
-                is_selected = stamp.metadata.id == self.selected_stamp_id
-                is_hovered = stamp.metadata.id == self.hovered_stamp_id
+    def _get_page(
+        self, stamps: list[StampData], page: int, width: int, palette_idx: int
+    ) -> Surface:
+        """
+        Get a page of the stamp list drawn without highlights, drawing it if needed.
 
-                # Item background
-                if is_selected:
-                    color = COLOR_BUTTON_ACTIVE
-                elif is_hovered:
-                    color = COLOR_BUTTON_HOVER
-                else:
-                    color = COLOR_BUTTON
+        Args:
+            stamps: Stamps in the current category
+            page: Page number (STAMP_PAGE_ITEMS stamps per page)
+            width: Width of the stamp list
+            palette_idx: Palette index to use for stamp previews
+
+        Returns:
+            Surface with the page's items, top item at y = 0
+        """
+        key = (self.current_category, palette_idx, width, self.stamp_library.version)
+        if key != self._page_key:
+            self._page_cache.clear()
+            if self._page_key and self._page_key[3] != key[3]:
+                # Saved stamps can replace a stamp under the same ID
+                self._preview_cache.clear()
+            self._page_key = key
+
+        page_surf = self._page_cache.get(page)
+        if page_surf is not None:
+            return page_surf
+
+        item_pitch = self.item_height + self.item_padding
+        page_stamps = stamps[page * STAMP_PAGE_ITEMS : (page + 1) * STAMP_PAGE_ITEMS]
+        page_surf = Surface((width, len(page_stamps) * item_pitch)).convert()
+        page_surf.fill(COLOR_PICKER_BG)
+        for i, stamp in enumerate(page_stamps):
+            item_rect = Rect(0, i * item_pitch, width, self.item_height)
+            self._render_item(page_surf, stamp, item_rect, palette_idx, False, False)
+
+        self._page_cache[page] = page_surf
+        return page_surf
+
+    def _render_item(
+        self,
+        screen: Surface,
+        stamp: StampData,
+        item_rect: Rect,
+        palette_idx: int,
+        is_selected: bool,
+        is_hovered: bool,
+    ):
+        """
+        Render one stamp list item.
 
-                pygame.draw.rect(screen, color, item_rect)
+        Args:
+            screen: Pygame surface
+            stamp: Stamp to render
+            item_rect: Item area
+            palette_idx: Palette index to use for the stamp preview
+            is_selected: Whether the stamp is selected
+            is_hovered: Whether the mouse is over the stamp
+        """
+        # Item background
+        if is_selected:
+            color = COLOR_BUTTON_ACTIVE
+        elif is_hovered:
+            color = COLOR_BUTTON_HOVER
+        else:
+            color = COLOR_BUTTON
 
-                # Item border
-                border_color = COLOR_SELECTION if is_selected else COLOR_GRID
-                border_width = 2 if is_selected else 1
-                pygame.draw.rect(screen, border_color, item_rect, border_width)
+        pygame.draw.rect(screen, color, item_rect)
 
-                # Preview box (left side)
-                preview_rect = Rect(
-                    item_rect.left + 5,
-                    item_rect.centery - self.preview_box_size // 2,
-                    self.preview_box_size,
-                    self.preview_box_size,
-                )
-                self._render_stamp_preview(screen, stamp, preview_rect, palette_idx)
+        # Item border
+        border_color = COLOR_SELECTION if is_selected else COLOR_GRID
+        border_width = 2 if is_selected else 1
+        pygame.draw.rect(screen, border_color, item_rect, border_width)
 
-                # Text area (right side of preview)
-                text_x_start = preview_rect.right + 10
+        # Preview box (left side)
+        preview_rect = Rect(
+            item_rect.left + 5,
+            item_rect.centery - self.preview_box_size // 2,
+            self.preview_box_size,
+            self.preview_box_size,
+        )
+        self._render_stamp_preview(screen, stamp, preview_rect, palette_idx)
 
-                # Stamp name/ID
-                display_name = stamp.get_display_name()
-                name_surf = self.font.render(display_name, True, COLOR_TEXT)
-                name_rect = name_surf.get_rect(
-                    left=text_x_start,
-                    centery=item_rect.centery - 10,
-                )
-                screen.blit(name_surf, name_rect)
-
-                # Stamp dimensions
-                size_text = f"{stamp.width}×{stamp.height}"
-                size_surf = self.font.render(size_text, True, COLOR_TEXT)
-                size_rect = size_surf.get_rect(
-                    left=text_x_start,
-                    centery=item_rect.centery + 10,
-                )
-                screen.blit(size_surf, size_rect)
+        # Text area (right side of preview)
+        text_x_start = preview_rect.right + 10
+
+        # Stamp name/ID
+        display_name = stamp.get_display_name()
+        name_surf = self.font.render(display_name, True, COLOR_TEXT)
+        name_rect = name_surf.get_rect(
+            left=text_x_start,
+            centery=item_rect.centery - 10,
+        )
+        screen.blit(name_surf, name_rect)
+
+        # Stamp dimensions
+        size_text = f"{stamp.width}×{stamp.height}"
+        size_surf = self.font.render(size_text, True, COLOR_TEXT)
+        size_rect = size_surf.get_rect(
+            left=text_x_start,
+            centery=item_rect.centery + 10,
+        )
+        screen.blit(size_surf, size_rect)
 
     def resize(self, rect: Rect):
         """Update browser rectangle (e.g., on window resize)."""
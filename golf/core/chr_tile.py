@@ -5,12 +5,63 @@ Unified NES CHR format tile decoding functionality used by all tools.
 This eliminates duplication between the editor, visualizer, and other tools.
 """
 
+import numpy as np
 
 # CHR format constants
 TILE_SIZE = 8  # 8x8 pixels per tile
 BYTES_PER_TILE = 16  # 16 bytes per tile (8 bytes per bitplane)
 
 
+def decode_chr_bank(chr_data: bytes) -> np.ndarray:
+    """
+    Decode every tile of a CHR bank into 2-bit pixel values at once.
+
+    Args:
+        chr_data: CHR data (any trailing partial tile is ignored)
+
+    Returns:
+        uint8 array of shape (num_tiles, 8, 8) with values 0-3
+    """
+    num_tiles = len(chr_data) // BYTES_PER_TILE
+    planes = np.frombuffer(chr_data, dtype=np.uint8, count=num_tiles * BYTES_PER_TILE)
+
+    # (tile, plane, row) -> (tile, plane, row, col), MSB is the leftmost pixel
+    bits = np.unpackbits(planes.reshape(num_tiles, 2, TILE_SIZE, 1), axis=3)
+    return bits[:, 0] | (bits[:, 1] << 1)
+
+
+def decode_tiles(tiles: list[bytes]) -> np.ndarray:
+    """
+    Decode a list of separate 16-byte tiles (e.g. a sprite's tiles).
+
+    Args:
+        tiles: Raw tiles; any shorter than 16 bytes decode as blank
+
+    Returns:
+        uint8 array of shape (len(tiles), 8, 8) with values 0-3
+    """
+    return decode_chr_bank(
+        b"".join(
+            tile[:BYTES_PER_TILE] if len(tile) >= BYTES_PER_TILE else bytes(BYTES_PER_TILE)
+            for tile in tiles
+        )
+    )
+
+
+def build_rgb_atlas(tiles: np.ndarray, palette: list[tuple[int, ...]]) -> np.ndarray:
+    """
+    Apply a palette to decoded tiles.
+
+    Args:
+        tiles: Decoded tiles from decode_chr_bank(), shape (N, 8, 8)
+        palette: Four RGB (or RGBA) colors, indexed by pixel value
+
+    Returns:
+        uint8 array of shape (N, 8, 8, 3), or (N, 8, 8, 4) for RGBA colors
+    """
+    return np.asarray(palette, dtype=np.uint8)[tiles]
+
+
 def decode_tile(tile_data: bytes, tile_idx: int = 0) -> list[list[int]]:
     """
     Decode a single 8x8 NES CHR tile into 2-bit pixel values.
@@ -32,26 +83,7 @@ def decode_tile(tile_data: bytes, tile_idx: int = 0) -> list[list[int]]:
     if offset + BYTES_PER_TILE > len(tile_data):
         return [[0] * 8 for _ in range(8)]
 
-    # Extract the two bitplanes
-    plane0 = tile_data[offset : offset + 8]  # Low bit plane
-    plane1 = tile_data[offset + 8 : offset + 16]  # High bit plane
-
-    # Decode pixel by pixel
-    pixels = []
-    for row in range(8):
-        row_pixels = []
-        for col in range(8):
-            # Extract bit from each plane (MSB first, left to right)
-            bit_mask = 0x80 >> col
-            low_bit = 1 if (plane0[row] & bit_mask) else 0
-            high_bit = 1 if (plane1[row] & bit_mask) else 0
-
-            # Combine into 2-bit value (0-3)
-            pixel = low_bit | (high_bit << 1)
-            row_pixels.append(pixel)
-        pixels.append(row_pixels)
-
-    return pixels
+    return decode_chr_bank(tile_data[offset : offset + BYTES_PER_TILE])[0].tolist()
 
 
 class TilesetData:
@@ -74,6 +106,10 @@ class TilesetData:
 
         self.num_tiles = len(self.data) // BYTES_PER_TILE
 
+        # Every tile decoded up front: shape (num_tiles, 8, 8)
+        self.tiles = decode_chr_bank(self.data)
+        self._atlases: dict[tuple, np.ndarray] = {}
+
     def decode_tile(self, tile_idx: int) -> list[list[int]]:
         """
         Decode a single tile from the loaded CHR data.
@@ -84,7 +120,26 @@ class TilesetData:
         Returns:
             8x8 array of pixel values (0-3)
         """
-        return decode_tile(self.data, tile_idx)
+        if not 0 <= tile_idx < self.num_tiles:
+            return [[0] * 8 for _ in range(8)]
+        return self.tiles[tile_idx].tolist()
+
+    def rgb_atlas(self, palette: list[tuple[int, int, int]]) -> np.ndarray:
+        """
+        Get every tile rendered with a palette (built once per palette).
+
+        Args:
+            palette: Four RGB colors, indexed by pixel value
+
+        Returns:
+            uint8 array of shape (num_tiles, 8, 8, 3)
+        """
+        key = tuple(map(tuple, palette))
+        atlas = self._atlases.get(key)
+        if atlas is None:
+            atlas = build_rgb_atlas(self.tiles, palette)
+            self._atlases[key] = atlas
+        return atlas
 
     def get_tile_data(self, tile_idx: int) -> bytes:
         """
@@ -0,0 +1,141 @@
+"""
+NES Open Tournament Golf - Compression Cache
+
+Content-addressed, on-disk cache of per-hole compression output, so that
+rebuilding a ROM after editing one hole only recompresses that hole.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+from ..formats.atomic_file import atomic_write
+from ..formats.hole_data import HoleData
+from .compressor import compression_tables_version
+
+# Bump when the compressors change in a way that alters their output
+CACHE_FORMAT_VERSION = 2
+
+# Default cache file name, stored inside each course directory
+CACHE_FILENAME = ".compression_cache.json"
+
+# Least recently used entries beyond this are dropped on save
+MAX_CACHE_ENTRIES = 256
+
+
+class CompressionCache:
+    """
+    Maps a hash of a hole's terrain, attributes and greens to its compressed bytes.
+
+    Keys also cover the compression tables and the encoder mode, so entries
+    never need explicit invalidation: changed inputs simply miss.
+    """
+
+    def __init__(self, cache_path: str | Path, tables_path: str | None = None):
+        """
+        Load cache from disk (a missing or unreadable file starts empty).
+
+        Args:
+            cache_path: Path to the cache JSON file
+            tables_path: Path to compression_tables.json. If None, uses default.
+        """
+        self.cache_path = Path(cache_path)
+        self.tables_version = compression_tables_version(tables_path)
+        self.entries: dict[str, dict] = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+
+        try:
+            with open(self.cache_path) as f:
+                data = json.load(f)
+            if data.get("format") == CACHE_FORMAT_VERSION:
+                self.entries = data.get("entries", {})
+        except (OSError, ValueError):
+            pass
+
+    @classmethod
+    def for_course_dir(cls, course_dir: str | Path) -> "CompressionCache":
+        """Create the default cache for a course directory."""
+        return cls(Path(course_dir) / CACHE_FILENAME)
+
+    def key_for(self, hole_data: HoleData, optimal: bool = False) -> str | None:
+        """
+        Compute the cache key for a hole.
+
+        Args:
+            hole_data: Hole to compress
+            optimal: Whether the optimal encoder is used
+
+        Returns:
+            Hex digest, or None if the hole holds values that are not bytes
+            (left uncached so the compressors report the error)
+        """
+        terrain = hole_data.terrain[: hole_data.terrain_height]
+        digest = hashlib.sha256(
+            f"{self.tables_version}:{int(optimal)}:"
+            f"{len(terrain)}:{len(hole_data.attributes)}:{len(hole_data.greens)}".encode()
+        )
+        try:
+            for rows in (terrain, hole_data.attributes, hole_data.greens):
+                for row in rows:
+                    digest.update(len(row).to_bytes(1, "little"))
+                    digest.update(bytes(row))
+        except (ValueError, OverflowError, TypeError):
+            return None
+        return digest.hexdigest()
+
+    def get(self, key: str | None) -> dict | None:
+        """
+        Look up cached compression output.
+
+        Args:
+            key: Key from key_for()
+
+        Returns:
+            Dict with "terrain", "attributes" and "greens" bytes plus any
+            extra integer fields stored with put(), or None on a miss
+        """
+        if key is None or key not in self.entries:
+            self.misses += 1
+            return None
+
+        # Move to the end so it is kept longest (least recently used order)
+        entry = self.entries[key] = self.entries.pop(key)
+        self._dirty = True
+        self.hits += 1
+
+        return {
+            name: bytes.fromhex(value) if isinstance(value, str) else value
+            for name, value in entry.items()
+        }
+
+    def put(self, key: str | None, entry: dict):
+        """
+        Store compression output.
+
+        Args:
+            key: Key from key_for() (None is ignored)
+            entry: Dict of bytes and integer values to cache
+        """
+        if key is None:
+            return
+        self.entries.pop(key, None)
+        self.entries[key] = {
+            name: value.hex() if isinstance(value, bytes) else value
+            for name, value in entry.items()
+        }
+        self._dirty = True
+
+    def save(self):
+        """Write the cache to disk if it changed, keeping the newest entries."""
+        if not self._dirty:
+            return
+
+        keys = list(self.entries)
+        for key in keys[:-MAX_CACHE_ENTRIES]:
+            del self.entries[key]
+
+        with atomic_write(self.cache_path) as f:
+            json.dump({"format": CACHE_FORMAT_VERSION, "entries": self.entries}, f)
+        self._dirty = False
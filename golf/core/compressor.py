@@ -5,9 +5,17 @@ Implements terrain and greens data compression using the reverse of the game's
 decompression algorithm. See golf/core/compression.md for algorithm details.
 """
 
+import hashlib
 import json
 from pathlib import Path
 
+import numpy as np
+
+from .vertical_fill import mark_vertical_fills
+
+# Longest run a single repeat code ($01-$1F) can encode
+MAX_REPEAT = 31
+
 
 def _get_default_tables_path() -> Path:
     """Get default path to compression_tables.json."""
@@ -66,12 +74,28 @@ def load_compression_tables(tables_path: str | None = None) -> dict:
     return tables
 
 
+def compression_tables_version(tables_path: str | None = None) -> str:
+    """Fingerprint the compression tables file.
+
+    Used to invalidate cached compression output when the tables change.
+
+    Args:
+        tables_path: Path to compression_tables.json. If None, uses default path.
+
+    Returns:
+        Hex digest of the tables file contents
+    """
+    path = _get_default_tables_path() if tables_path is None else Path(tables_path)
+    return hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+
+
 def detect_vertical_fills(
     rows: list[list[int]], vert_table: list[int]
 ) -> list[list[int]]:
     """First pass: detect and mark vertical fills with 0x00.
 
     Replaces tiles with their corresponding vert_table value from the row above.
+    List-of-lists wrapper around mark_vertical_fills().
 
     Args:
         rows: 2D list of tile values
@@ -80,25 +104,11 @@ def detect_vertical_fills(
     Returns:
         2D list with matching tiles replaced by 0x00
     """
-    # Deep copy to avoid modifying input
-    result = [row[:] for row in rows]
-
-    # Process rows starting from row 1 (row 0 has no row above)
-    for row_idx in range(1, len(result)):
-        for col_idx in range(len(result[row_idx])):
-            tile_above = rows[row_idx - 1][col_idx]
-            current_tile = result[row_idx][col_idx]
+    if not rows:
+        return []
 
-            # Bounds check before table access
-            if tile_above < len(vert_table):
-                expected_tile = vert_table[tile_above]
-
-                # Replace with 0x00 to signal vertical fill during compression.
-                # The decompressor will re-expand these by looking up from tile_above.
-                if current_tile == expected_tile:
-                    result[row_idx][col_idx] = 0x00
-
-    return result
+    grid = np.asarray(rows, dtype=np.uint8)
+    return mark_vertical_fills(grid, vert_table).tolist()
 
 
 def match_dict_sequence(
@@ -106,6 +116,9 @@ def match_dict_sequence(
 ) -> tuple[str, int] | None:
     """Try to match dictionary sequence at current position (greedy longest-match).
 
+    Reference implementation; the compressors use the equivalent precompiled
+    DictionaryTrie.
+
     Args:
         byte_stream: Flattened byte array to compress
         position: Current position in stream
@@ -148,7 +161,6 @@ def generate_repeat_code(
     Returns:
         (repeat_code, match_length) where code is 1-31, or None if no match
     """
-    MAX_REPEAT = 31
     count = 0
     current = prev_byte
 
@@ -175,6 +187,241 @@ def generate_repeat_code(
     return None
 
 
+# Trie node key marking the end of a dictionary sequence (bytes are 0-255)
+_TERMINAL = -1
+
+
+class DictionaryTrie:
+    """Byte-level trie over dictionary expansions for greedy longest-match lookup.
+
+    Built once from reverse_dict_lookup. A match is a single forward walk from
+    the current stream position, with no per-entry slicing or hex formatting.
+    """
+
+    def __init__(self, reverse_lookup: dict[str, list[str]]):
+        """Compile the trie.
+
+        Args:
+            reverse_lookup: Dict mapping hex sequences to code strings
+                (pre-sorted longest-first)
+        """
+        self.root: dict = {}
+        for priority, (hex_sequence, code_list) in enumerate(reverse_lookup.items()):
+            node = self.root
+            for byte in bytes.fromhex(hex_sequence):
+                node = node.setdefault(byte, {})
+            # Earlier entries win, exactly as when scanning reverse_lookup in order
+            node.setdefault(_TERMINAL, (priority, code_list[0], int(code_list[0], 16)))
+
+    def match(self, byte_stream: list[int], position: int) -> tuple[str, int] | None:
+        """Find the dictionary sequence to use at the current position.
+
+        Returns the same result as match_dict_sequence() with the reverse_lookup
+        this trie was built from: of all entries matching at `position`, the
+        one listed first (the longest, since the lookup is sorted longest-first).
+
+        Args:
+            byte_stream: Flattened byte array to compress
+            position: Current position in stream
+
+        Returns:
+            (code_string, match_length) if match found, None otherwise
+        """
+        node = self.root
+        best = node.get(_TERMINAL)
+        best_length = 0
+        end = len(byte_stream)
+        idx = position
+
+        while idx < end:
+            node = node.get(byte_stream[idx])
+            if node is None:
+                break
+            idx += 1
+
+            terminal = node.get(_TERMINAL)
+            if terminal is not None and (best is None or terminal[0] < best[0]):
+                best = terminal
+                best_length = idx - position
+
+        if best is None:
+            return None
+        return (best[1], best_length)
+
+    def all_matches(
+        self, options: list[tuple[int, ...]], position: int
+    ) -> list[tuple[int, int, int]]:
+        """Find every dictionary sequence that fits the stream at the current position.
+
+        Args:
+            options: Bytes allowed at each stream position
+            position: Current position in stream
+
+        Returns:
+            List of (code_byte, match_length, last_byte), shortest first
+        """
+        matches = []
+        frontier = [self.root]
+        end = len(options)
+        idx = position
+
+        while frontier and idx < end:
+            next_frontier = []
+            for node in frontier:
+                for byte in options[idx]:
+                    child = node.get(byte)
+                    if child is None:
+                        continue
+                    next_frontier.append(child)
+
+                    terminal = child.get(_TERMINAL)
+                    if terminal is not None:
+                        matches.append((terminal[2], idx + 1 - position, byte))
+            frontier = next_frontier
+            idx += 1
+
+        return matches
+
+
+def _is_literal(byte: int) -> bool:
+    """Whether the decoder reads a byte as a literal (0x00 or $20-$DF)."""
+    return byte == 0x00 or 0x20 <= byte < 0xE0
+
+
+def encode_optimal(
+    byte_stream: list[int],
+    horiz_table: list[int],
+    dict_trie: DictionaryTrie,
+    tiles: list[int] | None = None,
+) -> bytes:
+    """Second pass: shortest possible encoding of a marked byte stream.
+
+    A vertically predicted cell (0x00 in byte_stream) decodes to the same tile
+    whether it is written as the 0x00 marker or as its tile, so with `tiles`
+    given the encoder may pick either. The choice matters: the tile can let a
+    repeat or dictionary run continue through the cell, and it becomes the
+    previous byte that the next repeat code starts from.
+
+    When the decoder has produced the first i bytes, its whole state is i and
+    the byte it wrote last, which is one of the (at most two) bytes allowed at
+    position i - 1. Every code costs one byte, so the shortest encoding is a
+    shortest path over these states, solved here by dynamic programming from
+    the end of the stream. Only encodings that decode to the same tiles are
+    considered.
+
+    Ties prefer dictionary codes, then repeat codes, then literals, longest
+    first, mirroring the greedy encoder; between marker and tile the marker
+    is preferred.
+
+    Args:
+        byte_stream: Flattened byte array with vertical fills marked as 0x00
+        horiz_table: Horizontal transition table
+        dict_trie: Compiled dictionary for the same table set
+        tiles: Flattened tiles before marking. If None, vertical fills are
+            always written as markers.
+
+    Returns:
+        Compressed byte array
+
+    Raises:
+        ValueError: If some byte can only be written as an invalid literal
+    """
+    n = len(byte_stream)
+    if not n:
+        return b""
+    table_len = len(horiz_table)
+
+    # options[i]: bytes the expanded stream may hold at position i, marker first
+    if tiles is None:
+        options = [(byte,) for byte in byte_stream]
+    else:
+        options = [
+            (0x00, tile) if byte == 0x00 and tile != 0x00 else (byte,)
+            for byte, tile in zip(byte_stream, tiles)
+        ]
+
+    # cost[j][k]: fewest codes that finish the stream from position j when the
+    # previous byte is options[j - 1][k] (position 0 has the one state "no
+    # previous byte"); choice[j][k] is the (code, length, next k) achieving it
+    unreachable = n + 1
+    cost = [[unreachable]] + [[unreachable] * len(opts) for opts in options]
+    cost[n] = [0] * len(options[n - 1])
+    choice: list[list[tuple[int, int, int]]] = [
+        [(0, 0, 0)] * len(states) for states in cost
+    ]
+
+    for i in range(n - 1, -1, -1):
+        # Dictionary codes and literals don't depend on the previous byte
+        best = unreachable
+        pick = (0, 0, 0)
+
+        # Dictionary codes (all_matches is shortest first; keep the longest tie)
+        for code_byte, length, last in dict_trie.all_matches(options, i):
+            end = options[i + length - 1].index(last)
+            if cost[i + length][end] <= best:
+                best = cost[i + length][end]
+                pick = (code_byte, length, end)
+
+        literal_best = unreachable
+        literal_pick = (0, 0, 0)
+        for k, literal in enumerate(options[i]):
+            if _is_literal(literal) and cost[i + 1][k] < literal_best:
+                literal_best = cost[i + 1][k]
+                literal_pick = (literal, 1, k)
+
+        # Repeat codes follow the transition chain from the previous byte. At
+        # position 0 the decoder has no previous byte and writes 0x00 for the
+        # first step.
+        previous = options[i - 1] if i else (None,)
+        for state, prev in enumerate(previous):
+            state_best = best
+            state_pick = pick
+
+            run_best = unreachable
+            run_pick = (0, 0, 0)
+            current = prev
+            for length in range(1, min(MAX_REPEAT, n - i) + 1):
+                if current is None:
+                    current = 0
+                else:
+                    current = horiz_table[current] if current < table_len else 0
+                allowed = options[i + length - 1]
+                if current not in allowed:
+                    break
+                end = allowed.index(current)
+                if cost[i + length][end] <= run_best:
+                    run_best = cost[i + length][end]
+                    run_pick = (length, length, end)
+            if run_best < state_best:
+                state_best = run_best
+                state_pick = run_pick
+
+            if literal_best < state_best:
+                state_best = literal_best
+                state_pick = literal_pick
+
+            cost[i][state] = state_best + 1
+            choice[i][state] = state_pick
+
+    if cost[0][0] > n:
+        bad = next(
+            i for i, opts in enumerate(options) if not any(map(_is_literal, opts))
+        )
+        raise ValueError(
+            f"Byte 0x{byte_stream[bad]:02X} at position {bad} cannot be encoded"
+        )
+
+    output = []
+    pos = 0
+    state = 0
+    while pos < n:
+        code, length, state = choice[pos][state]
+        output.append(code)
+        pos += length
+
+    return bytes(output)
+
+
 class TerrainCompressor:
     """Compresses terrain data using greedy longest-match algorithm."""
 
@@ -191,24 +438,27 @@ class TerrainCompressor:
         self.vert_table = terrain["vertical_table"]
         self.dict_codes = terrain["dictionary_codes"]
         self.reverse_lookup = terrain["reverse_dict_lookup"]
+        self.dict_trie = DictionaryTrie(self.reverse_lookup)
         self.row_width = 22
 
-    def compress(self, rows: list[list[int]]) -> bytes:
+    def compress(self, rows: list[list[int]], optimal: bool = False) -> bytes:
         """Compress terrain rows to bytes.
 
         Args:
             rows: 2D array of terrain tiles (22 wide, variable height)
+            optimal: Use the shortest-path encoder instead of greedy matching
 
         Returns:
             Compressed byte array
         """
-        # Pass 1: Vertical fill detection
-        marked_rows = detect_vertical_fills(rows, self.vert_table)
+        # Pass 1: Vertical fill detection, flattened to a byte stream
+        grid = np.asarray(rows, dtype=np.uint8).reshape(-1, self.row_width)
+        byte_stream = mark_vertical_fills(grid, self.vert_table).ravel().tolist()
 
-        # Flatten to byte stream
-        byte_stream = []
-        for row in marked_rows:
-            byte_stream.extend(row)
+        if optimal:
+            return encode_optimal(
+                byte_stream, self.horiz_table, self.dict_trie, grid.ravel().tolist()
+            )
 
         # Pass 2: Greedy encoding
         output = []
@@ -217,7 +467,7 @@ class TerrainCompressor:
 
         while pos < len(byte_stream):
             # Try dictionary match first (longest-first greedy)
-            dict_match = match_dict_sequence(byte_stream, pos, self.reverse_lookup)
+            dict_match = self.dict_trie.match(byte_stream, pos)
             if dict_match:
                 code_str, length = dict_match
                 code_byte = int(code_str, 16)  # Convert "0xE0" to 0xE0
@@ -294,26 +544,27 @@ class GreensCompressor:
         self.vert_table = greens["vertical_table"]
         self.dict_codes = greens["dictionary_codes"]
         self.reverse_lookup = greens["reverse_dict_lookup"]
+        self.dict_trie = DictionaryTrie(self.reverse_lookup)
         self.row_width = 24
 
-    def compress(self, rows: list[list[int]]) -> bytes:
+    def compress(self, rows: list[list[int]], optimal: bool = False) -> bytes:
         """Compress 24×24 greens grid to bytes.
 
         Args:
             rows: 2D array of greens tiles (must be 24x24)
+            optimal: Use the shortest-path encoder instead of greedy matching
 
         Returns:
             Compressed byte array
         """
-        # Pass 1: Vertical fill detection
-        marked_rows = detect_vertical_fills(rows, self.vert_table)
-
-        # print(marked_rows)
+        # Pass 1: Vertical fill detection, flattened to a byte stream
+        grid = np.asarray(rows, dtype=np.uint8).reshape(-1, self.row_width)
+        byte_stream = mark_vertical_fills(grid, self.vert_table).ravel().tolist()
 
-        # Flatten to byte stream
-        byte_stream = []
-        for row in marked_rows:
-            byte_stream.extend(row)
+        if optimal:
+            return encode_optimal(
+                byte_stream, self.horiz_table, self.dict_trie, grid.ravel().tolist()
+            )
 
         # Pass 2: Greedy encoding
         output = []
@@ -322,7 +573,7 @@ class GreensCompressor:
 
         while pos < len(byte_stream):
             # Try dictionary match first (longest-first greedy)
-            dict_match = match_dict_sequence(byte_stream, pos, self.reverse_lookup)
+            dict_match = self.dict_trie.match(byte_stream, pos)
             if dict_match:
                 code_str, length = dict_match
                 code_byte = int(code_str, 16)
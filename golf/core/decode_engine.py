@@ -0,0 +1,274 @@
+"""
+NES Open Tournament Golf - Table-Driven Decode Engine
+
+Precompiled form of the terrain/greens decompression tables. Every horizontal
+transition chain is expanded once, when the tables are loaded, so that a repeat
+or dictionary code becomes a single bytes copy onto the output buffer instead
+of one table lookup per output byte.
+
+The instrumented methods implement the same algorithm one byte at a time and
+report every step to a DecompressionStats collector. They are only used when
+statistics are requested, keeping the hot path free of per-byte checks.
+"""
+
+import sys
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .vertical_fill import apply_vertical_fills, vert_lookup_array, vert_powers
+
+if TYPE_CHECKING:
+    from .decompressor import DecompressionStats
+
+# Repeat codes $01-$1F encode run lengths of 1-31
+MAX_REPEAT = 0x1F
+
+# Dictionary codes occupy $E0-$FF
+DICT_CODE_START = 0xE0
+
+# Vertical fill depths precomputed up front (longer columns extend on demand)
+VERT_POWERS_DEPTH = 64
+
+
+def _follow_transitions(start: int, count: int, horiz_table: list[int]) -> bytes:
+    """
+    Follow horizontal transitions from a starting byte.
+
+    Mirrors the game's decoder: a byte outside the table produces 0x00, and
+    the chain continues from 0x00.
+
+    Args:
+        start: Byte to start transitions from (not included in output)
+        count: Number of transitions to apply
+        horiz_table: Horizontal transition table
+
+    Returns:
+        The `count` bytes produced by the transitions
+    """
+    out = bytearray(count)
+    current = start
+    table_len = len(horiz_table)
+    for i in range(count):
+        current = horiz_table[current] if current < table_len else 0
+        out[i] = current
+    return bytes(out)
+
+
+class DecodeEngine:
+    """
+    Compiled decompression tables for one table set (terrain or greens).
+
+    Attributes:
+        runs: runs[prev][n] is the n-byte expansion of repeat code n after prev
+        dict_expansions: Full expansion of each dictionary code, indexed by code - $E0
+        vert_lookup: 256-entry uint8 lookup for the vertical fill pass
+        vert_powers: vert_lookup applied 0..VERT_POWERS_DEPTH times
+    """
+
+    def __init__(
+        self, horiz_table: list[int], vert_table: list[int], dict_table: list[int]
+    ):
+        """
+        Compile decompression tables.
+
+        Args:
+            horiz_table: Horizontal transition table
+            vert_table: Vertical continuation table
+            dict_table: Flat dictionary table (first_byte, repeat_count) pairs
+        """
+        # Keep copies so matches() can detect tables replaced or edited in place
+        self.horiz_table = list(horiz_table)
+        self.vert_table = list(vert_table)
+        self.dict_table = list(dict_table)
+
+        # Every (start byte, run length) pair: one chain per start byte, sliced
+        # into all 32 prefixes so lookups never allocate during decoding
+        self.runs: list[list[bytes]] = []
+        for prev in range(256):
+            chain = _follow_transitions(prev, MAX_REPEAT, self.horiz_table)
+            self.runs.append([chain[:n] for n in range(MAX_REPEAT + 1)])
+
+        # A repeat code at the very start of a stream has no previous byte; the
+        # game writes 0x00 for the first step and continues the chain from there
+        self.leading_runs: list[bytes] = [b""] + [
+            b"\x00" + self.runs[0][n - 1] for n in range(1, MAX_REPEAT + 1)
+        ]
+
+        self.dict_expansions: list[bytes] = []
+        for idx in range(0, len(self.dict_table) - 1, 2):
+            first_byte = self.dict_table[idx]
+            repeat_count = self.dict_table[idx + 1]
+            self.dict_expansions.append(
+                bytes([first_byte])
+                + _follow_transitions(first_byte, repeat_count, self.horiz_table)
+            )
+
+        self.vert_lookup = vert_lookup_array(self.vert_table)
+        self.vert_powers = vert_powers(self.vert_lookup, VERT_POWERS_DEPTH)
+
+    def matches(
+        self, horiz_table: list[int], vert_table: list[int], dict_table: list[int]
+    ) -> bool:
+        """Check whether this engine was compiled from the given tables."""
+        return (
+            self.horiz_table == horiz_table
+            and self.vert_table == vert_table
+            and self.dict_table == dict_table
+        )
+
+    def expand(self, compressed: bytes | memoryview, limit: int | None = None) -> bytearray:
+        """
+        First pass: expand repeat and dictionary codes.
+
+        Args:
+            compressed: Compressed data
+            limit: Stop reading input once this many bytes have been produced
+
+        Returns:
+            Expanded byte stream, with 0x00 marking vertical fills
+        """
+        if limit is None:
+            limit = sys.maxsize
+
+        buf = bytearray()
+        append = buf.append
+        runs = self.runs
+        dict_expansions = self.dict_expansions
+
+        for byte in compressed:
+            if len(buf) >= limit:
+                break
+
+            if byte >= DICT_CODE_START:
+                buf += dict_expansions[byte - DICT_CODE_START]
+            elif byte >= 0x20 or byte == 0x00:
+                # Literal terrain value or vertical fill marker
+                append(byte)
+            elif buf:
+                buf += runs[buf[-1]][byte]
+            else:
+                buf += self.leading_runs[byte]
+
+        return buf
+
+    def expand_instrumented(
+        self,
+        compressed: bytes | memoryview,
+        stats: "DecompressionStats",
+        limit: int | None = None,
+    ) -> bytearray:
+        """
+        First pass with statistics: same output as expand(), one byte at a time.
+
+        Args:
+            compressed: Compressed data
+            stats: DecompressionStats instance to record into
+            limit: Stop reading input once this many bytes have been produced
+
+        Returns:
+            Expanded byte stream, with 0x00 marking vertical fills
+        """
+        horiz_table = self.horiz_table
+        output = bytearray()
+
+        for byte in compressed:
+            if limit is not None and len(output) >= limit:
+                break
+
+            if byte >= DICT_CODE_START:
+                dict_idx = (byte - DICT_CODE_START) * 2
+                first_byte = self.dict_table[dict_idx]
+                repeat_count = self.dict_table[dict_idx + 1]
+
+                output.append(first_byte)
+                stats.record_dict_expansion(byte, first_byte, repeat_count)
+
+                for _ in range(repeat_count):
+                    prev = output[-1]
+                    if prev < len(horiz_table):
+                        next_byte = horiz_table[prev]
+                        output.append(next_byte)
+                        stats.record_horiz_transition(prev, next_byte)
+                    else:
+                        output.append(0)
+
+            elif byte == 0x00 or byte >= 0x20:
+                output.append(byte)
+
+            else:
+                repeat_count = byte
+                for _ in range(repeat_count):
+                    if output:
+                        prev = output[-1]
+                        if prev < len(horiz_table):
+                            next_byte = horiz_table[prev]
+                            output.append(next_byte)
+                            stats.record_repeat_code(repeat_count, prev, next_byte)
+                        else:
+                            output.append(0)
+                    else:
+                        output.append(0)
+
+        return output
+
+    def fill_vertical_instrumented(
+        self, buf: bytearray, row_width: int, stats: "DecompressionStats"
+    ):
+        """
+        Second pass with statistics: same result as apply_vertical_fills().
+
+        Args:
+            buf: Row-major tile buffer, modified in place
+            row_width: Width of each row in tiles
+            stats: DecompressionStats instance to record into
+        """
+        vert_table = self.vert_table
+        for idx in range(row_width, len(buf)):
+            if buf[idx] == 0:
+                above = buf[idx - row_width]
+                if above < len(vert_table):
+                    new_byte = vert_table[above]
+                    buf[idx] = new_byte
+                    stats.record_vert_fill(above, new_byte)
+
+    def decode(
+        self,
+        compressed: bytes | memoryview,
+        row_width: int,
+        limit: int | None = None,
+        stats: "DecompressionStats | None" = None,
+    ) -> list[list[int]]:
+        """
+        Decode compressed data into rows.
+
+        Args:
+            compressed: Compressed data
+            row_width: Width of each row in tiles
+            limit: Maximum number of tiles to produce (output is truncated to it)
+            stats: Optional DecompressionStats instance to collect statistics
+
+        Returns:
+            2D array of tile values, one row per list
+        """
+        if stats is None:
+            buf = self.expand(compressed, limit)
+        else:
+            buf = self.expand_instrumented(compressed, stats, limit)
+
+        if limit is not None:
+            del buf[limit:]
+
+        # Pad the final row with vertical fill markers
+        remainder = len(buf) % row_width
+        if remainder:
+            buf.extend(bytes(row_width - remainder))
+
+        if stats is not None:
+            self.fill_vertical_instrumented(buf, row_width, stats)
+
+        grid = np.frombuffer(buf, dtype=np.uint8).reshape(-1, row_width)
+        if stats is None:
+            grid = apply_vertical_fills(grid, self.vert_lookup, self.vert_powers)
+
+        return grid.tolist()
@@ -7,7 +7,8 @@ and BCD conversion utilities.
 
 from typing import Any
 
-from .palettes import GREENS_TOTAL_TILES, TERRAIN_ROW_WIDTH
+from .decode_engine import DecodeEngine
+from .palettes import GREENS_TOTAL_TILES, GREENS_WIDTH, TERRAIN_ROW_WIDTH
 from .rom_reader import (
     TABLE_DICTIONARY,
     TABLE_HORIZ_TRANSITION,
@@ -240,6 +241,7 @@ class TerrainDecompressor:
             rom: RomReader instance (can be None for testing with manually set tables)
         """
         self.rom = rom
+        self._engine: DecodeEngine | None = None
 
         # Load decompression tables from fixed bank (only if rom is provided)
         if rom is not None:
@@ -251,15 +253,24 @@ class TerrainDecompressor:
 
             prg = rom.cpu_to_prg_fixed(TABLE_DICTIONARY)
             self.dict_table = list(rom.read_prg(prg, 64))
+
+            self._engine = DecodeEngine(
+                self.horiz_table, self.vert_table, self.dict_table
+            )
         else:
             # Initialize empty tables for testing (will be populated manually)
             self.horiz_table = []
             self.vert_table = []
             self.dict_table = []
 
+    @property
+    def engine(self) -> DecodeEngine:
+        """Compiled decode tables, rebuilt if the tables were replaced or edited."""
+        return _current_engine(self)
+
     def decompress(
         self,
-        compressed: bytes,
+        compressed: bytes | memoryview,
         row_width: int = TERRAIN_ROW_WIDTH,
         stats: DecompressionStats | None = None,
     ) -> list[list[int]]:
@@ -274,88 +285,7 @@ class TerrainDecompressor:
         Returns:
             2D array of tile values, one row per list
         """
-        # First pass: RLE + dictionary expansion
-        output = []
-        src_idx = 0
-
-        while src_idx < len(compressed):
-            byte = compressed[src_idx]
-            src_idx += 1
-
-            if byte >= 0xE0:
-                # Dictionary code: expands to 2+ bytes
-                dict_idx = (byte - 0xE0) * 2
-                first_byte = self.dict_table[dict_idx]
-                repeat_count = self.dict_table[dict_idx + 1]
-
-                output.append(first_byte)
-
-                # Record dictionary code usage
-                if stats:
-                    stats.record_dict_expansion(byte, first_byte, repeat_count)
-
-                # Apply horizontal transition for repeat_count iterations
-                for _ in range(repeat_count):
-                    prev = output[-1]
-                    if prev < len(self.horiz_table):
-                        next_byte = self.horiz_table[prev]
-                        output.append(next_byte)
-
-                        # Record horizontal transition
-                        if stats:
-                            stats.record_horiz_transition(prev, next_byte)
-                    else:
-                        output.append(0)
-
-            elif byte == 0x00:
-                # Zero: written directly (row terminator or special)
-                output.append(0)
-
-            elif byte < 0x20:
-                # Repeat count: apply horizontal transition
-                repeat_count = byte
-                for _ in range(repeat_count):
-                    if len(output) > 0:
-                        prev = output[-1]
-                        if prev < len(self.horiz_table):
-                            next_byte = self.horiz_table[prev]
-                            output.append(next_byte)
-
-                            # Record repeat code transition
-                            if stats:
-                                stats.record_repeat_code(repeat_count, prev, next_byte)
-                        else:
-                            output.append(0)
-                    else:
-                        output.append(0)
-
-            else:
-                # Literal terrain value ($20-$DF)
-                output.append(byte)
-
-        # Convert to rows
-        rows = []
-        for i in range(0, len(output), row_width):
-            row = output[i : i + row_width]
-            # Pad if necessary
-            while len(row) < row_width:
-                row.append(0)
-            rows.append(row)
-
-        # Second pass: vertical fill (0 = derive from row above)
-        for row_idx in range(1, len(rows)):
-            for col_idx in range(row_width):
-                if rows[row_idx][col_idx] == 0:
-                    above = rows[row_idx - 1][col_idx]
-                    if above < len(self.vert_table):
-                        new_byte = self.vert_table[above]
-                        rows[row_idx][col_idx] = new_byte
-
-                        # Record vertical fill
-                        if stats:
-                            stats.record_vert_fill(above, new_byte)
-
-        return rows
+        return self.engine.decode(compressed, row_width, stats=stats)
 
 
 class GreensDecompressor:
@@ -371,6 +301,7 @@ class GreensDecompressor:
         """
         self.rom = rom
         self.bank = bank
+        self._engine: DecodeEngine | None = None
 
         # Greens decompression tables are at $8000, $80C0, $8180 in the switched bank
         if rom is not None:
@@ -382,19 +313,29 @@ class GreensDecompressor:
 
             prg = rom.cpu_to_prg_switched(0x8180, bank)
             self.dict_table = list(rom.read_prg(prg, 64))
+
+            self._engine = DecodeEngine(
+                self.horiz_table, self.vert_table, self.dict_table
+            )
         else:
             # Initialize empty tables for testing (will be populated manually)
             self.horiz_table = []
             self.vert_table = []
             self.dict_table = []
 
+    @property
+    def engine(self) -> DecodeEngine:
+        """Compiled decode tables, rebuilt if the tables were replaced or edited."""
+        return _current_engine(self)
+
     def decompress(
-        self, compressed: bytes, stats: DecompressionStats | None = None
+        self, compressed: bytes | memoryview, stats: DecompressionStats | None = None
     ) -> list[list[int]]:
         """
         Decompress greens data.
 
-        Row width is 24 for greens.
+        Row width is 24 for greens. In the game the routine runs until the
+        output buffer is full, so input past 576 tiles is ignored.
 
         Args:
             compressed: Compressed greens data
@@ -403,90 +344,32 @@ class GreensDecompressor:
         Returns:
             2D array of tile values, one row per list
         """
-        row_width = 24
-
-        # First pass: RLE + dictionary expansion
-        output = []
-        src_idx = 0
-
-        while src_idx < len(compressed) and len(output) < GREENS_TOTAL_TILES:
-            byte = compressed[src_idx]
-            src_idx += 1
-
-            if byte >= 0xE0:
-                dict_idx = (byte - 0xE0) * 2
-                first_byte = self.dict_table[dict_idx]
-                repeat_count = self.dict_table[dict_idx + 1]
-
-                output.append(first_byte)
-
-                # Record dictionary code usage
-                if stats:
-                    stats.record_dict_expansion(byte, first_byte, repeat_count)
-
-                for _ in range(repeat_count):
-                    prev = output[-1]
-                    if prev < len(self.horiz_table):
-                        next_byte = self.horiz_table[prev]
-                        output.append(next_byte)
-
-                        # Record horizontal transition
-                        if stats:
-                            stats.record_horiz_transition(prev, next_byte)
-                    else:
-                        output.append(0)
-
-            elif byte == 0x00:
-                output.append(0)
-
-            elif byte < 0x20:
-                repeat_count = byte
-                for _ in range(repeat_count):
-                    if len(output) > 0:
-                        prev = output[-1]
-                        if prev < len(self.horiz_table):
-                            next_byte = self.horiz_table[prev]
-                            output.append(next_byte)
-
-                            # Record repeat code transition
-                            if stats:
-                                stats.record_repeat_code(repeat_count, prev, next_byte)
-                        else:
-                            output.append(0)
-                    else:
-                        output.append(0)
-
-            else:
-                output.append(byte)
-
-        # Truncate output to exactly 576 tiles if we overshot during decompression
-        output = output[:GREENS_TOTAL_TILES]
-
-        # Convert to rows
-        rows = []
-        for i in range(0, len(output), row_width):
-            row = output[i : i + row_width]
-            while len(row) < row_width:
-                row.append(0)
-            rows.append(row)
-
-        # Second pass: vertical fill
-        for row_idx in range(1, len(rows)):
-            for col_idx in range(row_width):
-                if rows[row_idx][col_idx] == 0:
-                    above = rows[row_idx - 1][col_idx]
-                    if above < len(self.vert_table):
-                        new_byte = self.vert_table[above]
-                        rows[row_idx][col_idx] = new_byte
-
-                        # Record vertical fill
-                        if stats:
-                            stats.record_vert_fill(above, new_byte)
-
-        return rows
-
-
-def unpack_attributes(attr_bytes: bytes, num_rows: int) -> list[list[int]]:
+        return self.engine.decode(
+            compressed, GREENS_WIDTH, limit=GREENS_TOTAL_TILES, stats=stats
+        )
+
+
+def _current_engine(
+    decompressor: "TerrainDecompressor | GreensDecompressor",
+) -> DecodeEngine:
+    """
+    Return a decompressor's compiled engine, recompiling if its tables changed.
+
+    Tests (and tools) may assign or fill the table lists after construction,
+    so the engine is validated against the live tables before each use.
+    """
+    engine = decompressor._engine
+    if engine is None or not engine.matches(
+        decompressor.horiz_table, decompressor.vert_table, decompressor.dict_table
+    ):
+        engine = DecodeEngine(
+            decompressor.horiz_table, decompressor.vert_table, decompressor.dict_table
+        )
+        decompressor._engine = engine
+    return engine
+
+
+def unpack_attributes(attr_bytes: bytes | memoryview, num_rows: int) -> list[list[int]]:
     """
     Unpack NES attribute bytes into 2D palette index array.
 
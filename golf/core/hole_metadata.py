@@ -0,0 +1,263 @@
+"""
+NES Open Tournament Golf - Hole Metadata Tables
+
+Decodes the per-hole metadata tables in the fixed bank (par, distance,
+tee, green, flag offsets, data pointers) for all 54 holes in one pass,
+into one numpy array per field, and writes them back the same way.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from ..formats.hole_data import HoleData
+from .rom_reader import (
+    FIXED_BANK_PRG_START,
+    TABLE_DISTANCE_1,
+    TABLE_DISTANCE_10,
+    TABLE_DISTANCE_100,
+    TABLE_FLAG_X_OFFSET,
+    TABLE_FLAG_Y_OFFSET,
+    TABLE_GREEN_X,
+    TABLE_GREEN_Y,
+    TABLE_GREENS_PTR,
+    TABLE_HANDICAP,
+    TABLE_PAR,
+    TABLE_SCROLL_LIMIT,
+    TABLE_TEE_X,
+    TABLE_TEE_Y,
+    TABLE_TERRAIN_END_PTR,
+    TABLE_TERRAIN_START_PTR,
+    TOTAL_HOLES,
+)
+
+# Flag positions stored per hole
+FLAGS_PER_HOLE = 4
+
+# Byte-per-hole tables written back by write_to(): (field, table address)
+_BYTE_TABLES = [
+    ("par", TABLE_PAR),
+    ("handicap", TABLE_HANDICAP),
+    ("scroll_limit", TABLE_SCROLL_LIMIT),
+    ("green_x", TABLE_GREEN_X),
+    ("green_y", TABLE_GREEN_Y),
+    ("tee_x", TABLE_TEE_X),
+]
+
+
+def _fixed_offset(prg_start: int, cpu_addr: int) -> int:
+    """File offset of a fixed bank CPU address."""
+    return prg_start + FIXED_BANK_PRG_START + (cpu_addr - 0xC000)
+
+
+def _read_table(rom_data, prg_start: int, cpu_addr: int, count: int, dtype: str):
+    """Copy a table out of the ROM buffer as an array."""
+    return np.frombuffer(
+        rom_data, dtype=dtype, count=count, offset=_fixed_offset(prg_start, cpu_addr)
+    ).copy()
+
+
+def _write_table(rom_data: bytearray, prg_start: int, cpu_addr: int, values, dtype: str):
+    """Store an array into the ROM buffer as a table."""
+    data = np.asarray(values)
+    if data.size and (data.min() < 0 or data.max() > np.iinfo(dtype).max):
+        raise ValueError(f"Value out of range for table ${cpu_addr:04X}")
+    raw = data.astype(dtype).tobytes()
+    offset = _fixed_offset(prg_start, cpu_addr)
+    rom_data[offset : offset + len(raw)] = raw
+
+
+def decode_bcd(values: np.ndarray) -> np.ndarray:
+    """
+    Decode an array of BCD bytes to integers (vectorized bcd_to_int digit).
+
+    Args:
+        values: Array of BCD-encoded bytes
+
+    Returns:
+        Array of decoded values (0-99)
+    """
+    values = values.astype(np.int32)
+    return (values >> 4) * 10 + (values & 0x0F)
+
+
+def encode_distance_bcd(distances: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Encode distances as (hundreds, tens, ones) BCD byte arrays (vectorized int_to_bcd).
+
+    Args:
+        distances: Array of distances (0-999)
+
+    Returns:
+        Tuple of (hundreds_bcd, tens_bcd, ones_bcd) arrays
+
+    Raises:
+        ValueError: If any distance is not in range 0-999
+    """
+    distances = np.asarray(distances, dtype=np.int32)
+    if distances.size and (distances.min() < 0 or distances.max() > 999):
+        bad = distances[(distances < 0) | (distances > 999)][0]
+        raise ValueError(f"Distance must be 0-999, got {bad}")
+    return distances // 100, (distances // 10) % 10, distances % 10
+
+
+@dataclass
+class HoleMetadataTable:
+    """
+    Metadata for all 54 holes, one array per field (indexed by absolute hole).
+
+    Pointer columns are read for convenience but never written back by
+    write_to(); the ROM writer lays them out with the bank data.
+    """
+
+    par: np.ndarray
+    handicap: np.ndarray
+    distance: np.ndarray
+    scroll_limit: np.ndarray
+    green_x: np.ndarray
+    green_y: np.ndarray
+    tee_x: np.ndarray
+    tee_y: np.ndarray
+    flag_x_offset: np.ndarray  # Shape (54, 4)
+    flag_y_offset: np.ndarray  # Shape (54, 4)
+    terrain_start_ptr: np.ndarray
+    terrain_end_ptr: np.ndarray
+    greens_ptr: np.ndarray
+
+    @classmethod
+    def from_buffer(cls, rom_data, prg_start: int) -> "HoleMetadataTable":
+        """
+        Decode every metadata table from a ROM image.
+
+        Args:
+            rom_data: Whole iNES file contents (bytes, bytearray or memoryview)
+            prg_start: File offset of PRG data
+
+        Returns:
+            HoleMetadataTable for all 54 holes
+        """
+
+        def table(cpu_addr, count=TOTAL_HOLES, dtype="u1"):
+            return _read_table(rom_data, prg_start, cpu_addr, count, dtype)
+
+        distance = (
+            decode_bcd(table(TABLE_DISTANCE_100)) * 100
+            + decode_bcd(table(TABLE_DISTANCE_10)) * 10
+            + decode_bcd(table(TABLE_DISTANCE_1))
+        )
+        flag_count = TOTAL_HOLES * FLAGS_PER_HOLE
+
+        return cls(
+            par=table(TABLE_PAR),
+            handicap=table(TABLE_HANDICAP),
+            distance=distance,
+            scroll_limit=table(TABLE_SCROLL_LIMIT),
+            green_x=table(TABLE_GREEN_X),
+            green_y=table(TABLE_GREEN_Y),
+            tee_x=table(TABLE_TEE_X),
+            tee_y=table(TABLE_TEE_Y, dtype="<u2"),
+            flag_x_offset=table(TABLE_FLAG_X_OFFSET, flag_count).reshape(
+                TOTAL_HOLES, FLAGS_PER_HOLE
+            ),
+            flag_y_offset=table(TABLE_FLAG_Y_OFFSET, flag_count).reshape(
+                TOTAL_HOLES, FLAGS_PER_HOLE
+            ),
+            terrain_start_ptr=table(TABLE_TERRAIN_START_PTR, dtype="<u2"),
+            terrain_end_ptr=table(TABLE_TERRAIN_END_PTR, dtype="<u2"),
+            greens_ptr=table(TABLE_GREENS_PTR, dtype="<u2"),
+        )
+
+    @classmethod
+    def from_rom(cls, rom) -> "HoleMetadataTable":
+        """
+        Decode every metadata table from a RomReader.
+
+        Args:
+            rom: RomReader instance
+
+        Returns:
+            HoleMetadataTable for all 54 holes
+        """
+        return cls.from_buffer(rom.data, rom.prg_start)
+
+    def write_to(self, rom_data: bytearray, prg_start: int):
+        """
+        Write every metadata table back into a ROM image in one pass.
+
+        Args:
+            rom_data: Whole iNES file contents (modified in place)
+            prg_start: File offset of PRG data
+
+        Raises:
+            ValueError: If a value does not fit its table
+        """
+        for field, cpu_addr in _BYTE_TABLES:
+            _write_table(rom_data, prg_start, cpu_addr, getattr(self, field), "u1")
+
+        _write_table(rom_data, prg_start, TABLE_TEE_Y, self.tee_y, "<u2")
+        _write_table(rom_data, prg_start, TABLE_FLAG_X_OFFSET, self.flag_x_offset, "u1")
+        _write_table(rom_data, prg_start, TABLE_FLAG_Y_OFFSET, self.flag_y_offset, "u1")
+
+        hundreds, tens, ones = encode_distance_bcd(self.distance)
+        _write_table(rom_data, prg_start, TABLE_DISTANCE_100, hundreds, "u1")
+        _write_table(rom_data, prg_start, TABLE_DISTANCE_10, tens, "u1")
+        _write_table(rom_data, prg_start, TABLE_DISTANCE_1, ones, "u1")
+
+    def hole_json(self, hole_idx: int) -> dict:
+        """
+        Get one hole's metadata in hole JSON layout.
+
+        Args:
+            hole_idx: Absolute hole index (0-53)
+
+        Returns:
+            Dict with "par", "distance", "handicap", "scroll_limit", "green",
+            "tee" and "flag_positions"
+        """
+        return {
+            "par": int(self.par[hole_idx]),
+            "distance": int(self.distance[hole_idx]),
+            "handicap": int(self.handicap[hole_idx]),
+            "scroll_limit": int(self.scroll_limit[hole_idx]),
+            "green": {"x": int(self.green_x[hole_idx]), "y": int(self.green_y[hole_idx])},
+            "tee": {"x": int(self.tee_x[hole_idx]), "y": int(self.tee_y[hole_idx])},
+            "flag_positions": [
+                {"x_offset": int(x), "y_offset": int(y)}
+                for x, y in zip(self.flag_x_offset[hole_idx], self.flag_y_offset[hole_idx])
+            ],
+        }
+
+    def set_hole(self, hole_idx: int, hole_data: HoleData):
+        """
+        Update one hole's metadata from HoleData (defaults match HoleData.save()).
+
+        Args:
+            hole_idx: Absolute hole index (0-53)
+            hole_data: HoleData object
+        """
+        metadata = hole_data.metadata
+        tee = metadata.get("tee", {"x": 0, "y": 0})
+
+        self.par[hole_idx] = _checked(metadata.get("par", 4), 0xFF)
+        self.handicap[hole_idx] = _checked(metadata.get("handicap", 1), 0xFF)
+        self.distance[hole_idx] = metadata.get("distance", 400)
+        self.scroll_limit[hole_idx] = _checked(metadata.get("scroll_limit", 32), 0xFF)
+        self.green_x[hole_idx] = _checked(hole_data.green_x, 0xFF)
+        self.green_y[hole_idx] = _checked(hole_data.green_y, 0xFF)
+        self.tee_x[hole_idx] = _checked(tee["x"], 0xFF)
+        self.tee_y[hole_idx] = _checked(tee["y"], 0xFFFF)
+
+        # Missing flag positions are written as zero offsets
+        flag_positions = metadata.get("flag_positions", [])[:FLAGS_PER_HOLE]
+        self.flag_x_offset[hole_idx] = 0
+        self.flag_y_offset[hole_idx] = 0
+        for i, flag in enumerate(flag_positions):
+            self.flag_x_offset[hole_idx, i] = _checked(flag.get("x_offset", 0), 0xFF)
+            self.flag_y_offset[hole_idx, i] = _checked(flag.get("y_offset", 0), 0xFF)
+
+
+def _checked(value: int, maximum: int) -> int:
+    """Reject values that do not fit their table entry."""
+    if not 0 <= value <= maximum:
+        raise ValueError(f"Value {value} out of range 0-{maximum}")
+    return value
@@ -8,6 +8,22 @@ in the original course data.
 import json
 from pathlib import Path
 
+import numpy as np
+
+# Directions in table order, and the (row, col) step to the neighbor
+DIRECTIONS = ("up", "down", "left", "right")
+DIRECTION_STEPS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+# Table slots: tiles 0x00-0xFF, the editor placeholder 0x100, then one
+# shared slot for any other value
+TABLE_SIZE = 0x102
+OTHER_SLOT = TABLE_SIZE - 1
+
+
+def _slot(value: int) -> int:
+    """Table index for a tile value."""
+    return value if 0 <= value < OTHER_SLOT else OTHER_SLOT
+
 
 class TerrainNeighborValidator:
     """
@@ -17,24 +33,28 @@ class TerrainNeighborValidator:
     helping catch common mistakes where multi-tile sprites aren't properly aligned.
     """
 
+    # Neighbor data file in data/tables/ used when no path is given
+    DEFAULT_FILENAME = "terrain_neighbors.json"
+
     def __init__(self, neighbors_path: str | Path | None = None):
         """
         Load neighbor data from JSON file.
 
         Args:
-            neighbors_path: Path to terrain_neighbors.json. If None, uses default location.
+            neighbors_path: Path to the neighbors JSON file. If None, uses
+                data/tables/DEFAULT_FILENAME.
 
         Raises:
             FileNotFoundError: If neighbors file cannot be found.
             json.JSONDecodeError: If neighbors file is invalid JSON.
         """
         if neighbors_path is None:
-            # Default location: data/tables/terrain_neighbors.json
+            # Default location: data/tables/
             neighbors_path = (
                 Path(__file__).parent.parent.parent
                 / "data"
                 / "tables"
-                / "terrain_neighbors.json"
+                / self.DEFAULT_FILENAME
             )
         else:
             neighbors_path = Path(neighbors_path)
@@ -95,6 +115,30 @@ class TerrainNeighborValidator:
                     },
                 }
 
+        self._compile_tables()
+
+    def _compile_tables(self):
+        """
+        Build dense per-direction adjacency tables from the neighbor sets.
+
+        _allowed_bits[d][tile] is a bitset of valid neighbors (bit n set if
+        neighbor n is valid), and _allowed[d, tile, neighbor] is the same
+        data as a boolean array for whole-grid checks. Unknown tiles allow
+        every neighbor.
+        """
+        every = (1 << TABLE_SIZE) - 1
+        self._allowed_bits: list[list[int]] = [[every] * TABLE_SIZE for _ in DIRECTIONS]
+        self._allowed = np.ones((len(DIRECTIONS), TABLE_SIZE, TABLE_SIZE), dtype=bool)
+
+        for tile, directions in self.neighbors.items():
+            if _slot(tile) == OTHER_SLOT:
+                continue
+            for d, direction in enumerate(DIRECTIONS):
+                valid = [n for n in directions[direction] if _slot(n) != OTHER_SLOT]
+                self._allowed_bits[d][tile] = sum(1 << n for n in valid)
+                self._allowed[d, tile] = False
+                self._allowed[d, tile, valid] = True
+
     def is_valid_neighbor(self, tile: int, neighbor: int, direction: str) -> bool:
         """
         Check if a neighbor tile is valid for a given tile in a given direction.
@@ -108,12 +152,9 @@ class TerrainNeighborValidator:
             True if the neighbor relationship is valid or the tile is unknown.
             False if the relationship is explicitly invalid.
         """
-        # If tile not in our data, treat as valid (permissive for experimentation)
-        if tile not in self.neighbors:
-            return True
-
-        # Check if neighbor exists in valid set for this direction
-        return neighbor in self.neighbors[tile][direction]
+        # Tiles not in our data allow every neighbor (permissive for experimentation)
+        bits = self._allowed_bits[DIRECTIONS.index(direction)][_slot(tile)]
+        return bool((bits >> _slot(neighbor)) & 1)
 
     def get_neighbor_frequency(self, tile: int, neighbor: int, direction: str) -> int:
         """
@@ -131,6 +172,29 @@ class TerrainNeighborValidator:
             return 0
         return self.neighbor_frequencies[tile][direction].get(neighbor, 0)
 
+    def is_valid_tile(self, terrain: list[list[int]], row: int, col: int) -> bool:
+        """
+        Check one terrain tile against its four neighbors.
+
+        Args:
+            terrain: 2D list of terrain tile indices (rows of columns)
+            row: Tile row
+            col: Tile column
+
+        Returns:
+            True if every in-bounds neighbor is valid for the tile
+        """
+        tile = _slot(terrain[row][col])
+        height = len(terrain)
+        width = len(terrain[0])
+        for bits, (d_row, d_col) in zip(self._allowed_bits, DIRECTION_STEPS):
+            n_row = row + d_row
+            n_col = col + d_col
+            if 0 <= n_row < height and 0 <= n_col < width:
+                if not (bits[tile] >> _slot(terrain[n_row][n_col])) & 1:
+                    return False
+        return True
+
     def get_invalid_tiles(self, terrain: list[list[int]]) -> set[tuple[int, int]]:
         """
         Find all tiles with invalid neighbors in the given terrain.
@@ -141,44 +205,174 @@ class TerrainNeighborValidator:
         Returns:
             Set of (row, col) tuples for tiles with invalid neighbors
         """
-        invalid = set()
+        if not terrain or not terrain[0]:
+            return set()
 
-        if not terrain:
-            return invalid
+        rows, cols = np.nonzero(self.invalid_mask(np.array(terrain, dtype=np.int64)))
+        return set(zip(rows.tolist(), cols.tolist()))
 
+    def invalid_mask(self, grids: np.ndarray, present: np.ndarray | None = None) -> np.ndarray:
+        """
+        Flag tiles with invalid neighbors across whole grids at once.
+
+        Args:
+            grids: Integer array of tile values, shape (..., rows, cols); any
+                leading dimensions are independent grids (e.g. all holes of
+                a course, padded to a common height)
+            present: Boolean array of the same shape marking real tiles;
+                padding is neither checked nor treated as a neighbor
+
+        Returns:
+            Boolean array of the same shape, True where a tile has an
+            invalid neighbor
+        """
+        grids = np.where((grids >= 0) & (grids < OTHER_SLOT), grids, OTHER_SLOT)
+        if present is None:
+            present = np.ones(grids.shape, dtype=bool)
+        up, down, left, right = self._allowed
+
+        invalid = np.zeros(grids.shape, dtype=bool)
+        invalid[..., 1:, :] |= ~up[grids[..., 1:, :], grids[..., :-1, :]] & present[..., :-1, :]
+        invalid[..., :-1, :] |= ~down[grids[..., :-1, :], grids[..., 1:, :]] & present[..., 1:, :]
+        invalid[..., 1:] |= ~left[grids[..., 1:], grids[..., :-1]] & present[..., :-1]
+        invalid[..., :-1] |= ~right[grids[..., :-1], grids[..., 1:]] & present[..., 1:]
+        return invalid & present
+
+    def update_invalid_tiles(
+        self,
+        terrain: list[list[int]],
+        invalid: set[tuple[int, int]],
+        changed_cells,
+    ):
+        """
+        Re-check changed tiles and their 4-neighborhoods, updating invalid in place.
+
+        Args:
+            terrain: 2D list of terrain tile indices (same shape as when
+                invalid was computed)
+            invalid: Set of invalid (row, col) tiles to update
+            changed_cells: Iterable of (row, col) tiles whose value changed
+        """
         height = len(terrain)
         width = len(terrain[0]) if terrain else 0
 
-        for row in range(height):
-            for col in range(width):
-                tile = terrain[row][col]
-
-                # Check up neighbor
-                if row > 0:
-                    neighbor = terrain[row - 1][col]
-                    if not self.is_valid_neighbor(tile, neighbor, "up"):
-                        invalid.add((row, col))
-                        continue
-
-                # Check down neighbor
-                if row < height - 1:
-                    neighbor = terrain[row + 1][col]
-                    if not self.is_valid_neighbor(tile, neighbor, "down"):
-                        invalid.add((row, col))
-                        continue
-
-                # Check left neighbor
-                if col > 0:
-                    neighbor = terrain[row][col - 1]
-                    if not self.is_valid_neighbor(tile, neighbor, "left"):
-                        invalid.add((row, col))
-                        continue
-
-                # Check right neighbor
-                if col < width - 1:
-                    neighbor = terrain[row][col + 1]
-                    if not self.is_valid_neighbor(tile, neighbor, "right"):
-                        invalid.add((row, col))
-                        continue
-
-        return invalid
+        to_check = set()
+        for row, col in changed_cells:
+            to_check.add((row, col))
+            for d_row, d_col in DIRECTION_STEPS:
+                to_check.add((row + d_row, col + d_col))
+
+        for row, col in to_check:
+            if not (0 <= row < height and 0 <= col < width):
+                continue
+            if self.is_valid_tile(terrain, row, col):
+                invalid.discard((row, col))
+            else:
+                invalid.add((row, col))
+
+
+class LiveInvalidTiles:
+    """
+    A set of invalid terrain tiles kept up to date as the terrain is edited.
+
+    Each update() finds the changed cells (or is told them) and re-checks
+    only those and their neighbors; the whole grid is re-checked when its
+    shape changes.
+    """
+
+    def __init__(self, validator: TerrainNeighborValidator):
+        """
+        Args:
+            validator: Validator providing the neighbor tables
+        """
+        self.validator = validator
+        self.invalid: set[tuple[int, int]] = set()
+        self._terrain: list[list[int]] | None = None  # Copy of the last checked terrain
+
+    def reset(self):
+        """Forget the tracked terrain (the next update checks the whole grid)."""
+        self._terrain = None
+        self.invalid = set()
+
+    def update(
+        self,
+        terrain: list[list[int]],
+        changed_cells=None,
+    ) -> set[tuple[int, int]]:
+        """
+        Bring the invalid set up to date with the terrain.
+
+        Args:
+            terrain: Current terrain grid
+            changed_cells: (row, col) tiles changed since the last update, or
+                None to find them by comparing with the last checked terrain
+
+        Returns:
+            The live set of invalid (row, col) tiles
+        """
+        previous = self._terrain
+        if (
+            previous is None
+            or len(previous) != len(terrain)
+            or any(len(old) != len(new) for old, new in zip(previous, terrain))
+        ):
+            self.invalid = self.validator.get_invalid_tiles(terrain)
+            self._terrain = [row[:] for row in terrain]
+            return self.invalid
+
+        if changed_cells is None:
+            changed_cells = [
+                (row_idx, col_idx)
+                for row_idx, (old_row, new_row) in enumerate(zip(previous, terrain))
+                if old_row != new_row
+                for col_idx, (a, b) in enumerate(zip(old_row, new_row))
+                if a != b
+            ]
+
+        changed_cells = list(changed_cells)
+        for row, col in changed_cells:
+            previous[row][col] = terrain[row][col]
+        self.validator.update_invalid_tiles(terrain, self.invalid, changed_cells)
+        return self.invalid
+
+
+def greens_neighbor_class(value: int) -> int:
+    """
+    Get the value a greens neighbor is recorded as in greens_neighbors.json.
+
+    Fringe tiles ($48-$6F, $74-$83) are recorded as themselves, rough
+    (below $30, $70-$73, $84-$87) as $00 and putting surface as $30.
+
+    Args:
+        value: Greens tile value
+
+    Returns:
+        Recorded neighbor value
+    """
+    if 0x48 <= value <= 0x6F or 0x74 <= value <= 0x83:
+        return value
+    if value < 0x30 or 0x70 <= value <= 0x73 or 0x84 <= value <= 0x87:
+        return 0x00
+    return 0x30
+
+
+class GreensNeighborValidator(TerrainNeighborValidator):
+    """
+    Validates putting green fringe tiles against greens_neighbors.json.
+
+    Only fringe tiles have neighbor data; their non-fringe neighbors are
+    compared by class (rough or putting surface), as the data was recorded.
+    """
+
+    DEFAULT_FILENAME = "greens_neighbors.json"
+
+    def _compile_tables(self):
+        """Build the tables, then look neighbors up by their recorded class."""
+        super()._compile_tables()
+        classes = [_slot(greens_neighbor_class(value)) for value in range(TABLE_SIZE)]
+        self._allowed = self._allowed[:, :, classes]
+        for d in range(len(DIRECTIONS)):
+            for tile in self.neighbors:
+                if _slot(tile) != OTHER_SLOT:
+                    valid = np.flatnonzero(self._allowed[d, tile]).tolist()
+                    self._allowed_bits[d][tile] = sum(1 << n for n in valid)
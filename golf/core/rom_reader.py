@@ -5,6 +5,9 @@ ROM file reading and address translation for NES Open Tournament Golf.
 Handles iNES ROM format and CPU address mapping for both fixed and switched banks.
 """
 
+import mmap
+import struct
+
 # ROM layout constants
 INES_HEADER_SIZE = 0x10
 PRG_BANK_SIZE = 0x4000  # 16KB banks
@@ -57,6 +60,9 @@ class RomReader:
         """
         Load a NES ROM file.
 
+        The file is memory-mapped read-only; reads return zero-copy views
+        into the mapping, so opening many ROMs costs no up-front copying.
+
         Args:
             rom_path: Path to iNES ROM file
 
@@ -64,10 +70,16 @@ class RomReader:
             ValueError: If file is not a valid iNES ROM
         """
         with open(rom_path, "rb") as f:
-            self.data = f.read()
+            try:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                raise ValueError("Not a valid iNES ROM file") from None
+        self.data = memoryview(self._mmap)
 
         # Verify iNES header
         if self.data[:4] != b"NES\x1a":
+            self.close()
             raise ValueError("Not a valid iNES ROM file")
 
         self.prg_banks = self.data[4]
@@ -77,7 +89,24 @@ class RomReader:
 
         print(f"ROM loaded: {self.prg_banks} PRG banks ({self.prg_size // 1024}KB)")
 
-    def read_prg(self, prg_offset: int, length: int = 1) -> bytes:
+    def close(self):
+        """
+        Unmap the ROM file.
+
+        Views returned by earlier reads must no longer be in use.
+        """
+        if self._mmap.closed:
+            return
+        self.data.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "RomReader":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def read_prg(self, prg_offset: int, length: int = 1) -> memoryview:
         """
         Read bytes from PRG ROM at absolute PRG offset.
 
@@ -86,14 +115,14 @@ class RomReader:
             length: Number of bytes to read
 
         Returns:
-            Requested bytes
+            Read-only, zero-copy view of the requested bytes
         """
         file_offset = self.prg_start + prg_offset
         return self.data[file_offset : file_offset + length]
 
     def read_prg_byte(self, prg_offset: int) -> int:
         """Read a single byte from PRG ROM."""
-        return self.read_prg(prg_offset, 1)[0]
+        return self.data[self.prg_start + prg_offset]
 
     def read_prg_word(self, prg_offset: int) -> int:
         """
@@ -105,8 +134,38 @@ class RomReader:
         Returns:
             16-bit value
         """
-        data = self.read_prg(prg_offset, 2)
-        return data[0] | (data[1] << 8)
+        return struct.unpack_from("<H", self.data, self.prg_start + prg_offset)[0]
+
+    def read_bank(self, bank: int) -> memoryview:
+        """
+        Get a whole 16KB PRG bank.
+
+        Args:
+            bank: Bank number
+
+        Returns:
+            Read-only, zero-copy view of the bank
+        """
+        return self.read_prg(bank * PRG_BANK_SIZE, PRG_BANK_SIZE)
+
+    def read_fixed_table(
+        self, cpu_addr: int, count: int = TOTAL_HOLES, word: bool = False
+    ) -> tuple[int, ...]:
+        """
+        Read a whole table from the fixed bank in one call.
+
+        Args:
+            cpu_addr: CPU address of the table (e.g. TABLE_PAR)
+            count: Number of entries (54 for per-hole tables, 216 for flag offsets)
+            word: Entries are 16-bit little-endian words (pointer tables, TABLE_TEE_Y)
+
+        Returns:
+            Tuple of entry values
+        """
+        fmt = f"<{count}{'H' if word else 'B'}"
+        return struct.unpack_from(
+            fmt, self.data, self.prg_start + self.cpu_to_prg_fixed(cpu_addr)
+        )
 
     def cpu_to_prg_fixed(self, cpu_addr: int) -> int:
         """
@@ -143,7 +202,7 @@ class RomReader:
             raise ValueError(f"Address ${cpu_addr:04X} not in switchable bank range")
         return (bank * PRG_BANK_SIZE) + (cpu_addr - 0x8000)
 
-    def read_fixed(self, cpu_addr: int, length: int = 1) -> bytes:
+    def read_fixed(self, cpu_addr: int, length: int = 1) -> memoryview:
         """
         Read from fixed bank using CPU address.
 
@@ -152,13 +211,13 @@ class RomReader:
             length: Number of bytes to read
 
         Returns:
-            Requested bytes
+            Read-only, zero-copy view of the requested bytes
         """
         return self.read_prg(self.cpu_to_prg_fixed(cpu_addr), length)
 
     def read_fixed_byte(self, cpu_addr: int) -> int:
         """Read a single byte from fixed bank."""
-        return self.read_fixed(cpu_addr, 1)[0]
+        return self.read_prg_byte(self.cpu_to_prg_fixed(cpu_addr))
 
     def read_fixed_word(self, cpu_addr: int) -> int:
         """
@@ -170,10 +229,9 @@ class RomReader:
         Returns:
             16-bit value
         """
-        data = self.read_fixed(cpu_addr, 2)
-        return data[0] | (data[1] << 8)
+        return self.read_prg_word(self.cpu_to_prg_fixed(cpu_addr))
 
-    def read_switched(self, cpu_addr: int, bank: int, length: int = 1) -> bytes:
+    def read_switched(self, cpu_addr: int, bank: int, length: int = 1) -> memoryview:
         """
         Read from switched bank using CPU address.
 
@@ -183,6 +241,6 @@ class RomReader:
             length: Number of bytes to read
 
         Returns:
-            Requested bytes
+            Read-only, zero-copy view of the requested bytes
         """
         return self.read_prg(self.cpu_to_prg_switched(cpu_addr, bank), length)
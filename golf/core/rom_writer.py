@@ -5,10 +5,13 @@ Writes course data from JSON files back to ROM.
 Handles compression, pointer management, and bank allocation.
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+from .compression_cache import CompressionCache
 from .compressor import GreensCompressor, TerrainCompressor
-from .packing import int_to_bcd, pack_attributes
+from .hole_metadata import HoleMetadataTable
+from .packing import pack_attributes
 from .rom_reader import (
     COURSES,
     FIXED_BANK_PRG_START,
@@ -16,21 +19,9 @@ from .rom_reader import (
     INES_HEADER_SIZE,
     PRG_BANK_SIZE,
     TABLE_COURSE_BANK_TERRAIN,
-    TABLE_DISTANCE_1,
-    TABLE_DISTANCE_10,
-    TABLE_DISTANCE_100,
-    TABLE_FLAG_X_OFFSET,
-    TABLE_FLAG_Y_OFFSET,
-    TABLE_GREEN_X,
-    TABLE_GREEN_Y,
     TABLE_GREENS_PTR,
-    TABLE_HANDICAP,
-    TABLE_PAR,
-    TABLE_SCROLL_LIMIT,
     TABLE_TERRAIN_END_PTR,
     TABLE_TERRAIN_START_PTR,
-    TABLE_TEE_X,
-    TABLE_TEE_Y,
 )
 from ..formats.hole_data import HoleData
 
@@ -41,6 +32,67 @@ class BankOverflowError(Exception):
     pass
 
 
+def compress_hole(
+    terrain_compressor: TerrainCompressor,
+    greens_compressor: GreensCompressor,
+    hole_data: HoleData,
+    optimal: bool = False,
+) -> dict:
+    """
+    Compress one hole's terrain and greens and pack its attributes.
+
+    Args:
+        terrain_compressor: Compressor for terrain rows
+        greens_compressor: Compressor for the greens grid
+        hole_data: HoleData object
+        optimal: Use the shortest-path encoder instead of greedy
+
+    Returns:
+        Dict with "terrain", "attributes" and "greens" bytes, and in optimal
+        mode the greedy sizes "terrain_greedy_size" and "greens_greedy_size"
+    """
+    terrain_rows = hole_data.terrain[: hole_data.terrain_height]
+
+    # Compress terrain
+    terrain_compressed = terrain_compressor.compress(terrain_rows, optimal=optimal)
+
+    # Pack attributes
+    attr_packed = pack_attributes(hole_data.attributes)
+
+    # Compress greens
+    greens_compressed = greens_compressor.compress(hole_data.greens, optimal=optimal)
+
+    result: dict[str, bytes | int] = {
+        "terrain": terrain_compressed,
+        "attributes": attr_packed,
+        "greens": greens_compressed,
+    }
+
+    # Greedy sizes, for reporting what the optimal encoder saved
+    if optimal:
+        result["terrain_greedy_size"] = len(terrain_compressor.compress(terrain_rows))
+        result["greens_greedy_size"] = len(greens_compressor.compress(hole_data.greens))
+
+    return result
+
+
+# Compressors owned by a pool worker process (built once per worker)
+_worker_compressors: tuple[TerrainCompressor, GreensCompressor] | None = None
+
+
+def _init_compression_worker():
+    """Process pool initializer: load compression tables once per worker."""
+    global _worker_compressors
+    _worker_compressors = (TerrainCompressor(), GreensCompressor())
+
+
+def _compress_in_worker(hole_data: HoleData, optimal: bool) -> dict:
+    """Compress a hole with the calling worker's compressors."""
+    assert _worker_compressors is not None
+    terrain_compressor, greens_compressor = _worker_compressors
+    return compress_hole(terrain_compressor, greens_compressor, hole_data, optimal)
+
+
 class RomWriter:
     """
     Writes course data to NES ROM file with automatic pointer management.
@@ -48,13 +100,21 @@ class RomWriter:
     Strategy: Create modified ROM copy with defragmented banks.
     """
 
-    def __init__(self, rom_path: str, output_path: str):
+    def __init__(
+        self,
+        rom_path: str,
+        output_path: str,
+        optimal: bool = False,
+        cache: CompressionCache | None = None,
+    ):
         """
         Load ROM for writing.
 
         Args:
             rom_path: Source ROM file (read-only)
             output_path: Output ROM file path (will be created/overwritten)
+            optimal: Use the shortest-path encoder instead of greedy compression
+            cache: Optional per-hole compression cache (caller saves it)
 
         Raises:
             ValueError: If ROM is not valid iNES format
@@ -68,6 +128,8 @@ class RomWriter:
             raise ValueError("Not a valid iNES ROM file")
 
         self.output_path = output_path
+        self.optimal = optimal
+        self.cache = cache
         self.prg_banks = self.rom_data[4]
         self.prg_start = INES_HEADER_SIZE
 
@@ -90,72 +152,117 @@ class RomWriter:
             ValueError: If hole_data_list doesn't have exactly 18 holes
             BankOverflowError: If compressed data doesn't fit in bank
         """
-        if len(hole_data_list) != HOLES_PER_COURSE:
-            raise ValueError(
-                f"Expected {HOLES_PER_COURSE} holes, got {len(hole_data_list)}"
-            )
+        return self.write_courses({course_idx: hole_data_list})[0]
+
+    def write_courses(
+        self, courses: dict[int, list[HoleData]], jobs: int = 1
+    ) -> list[dict]:
+        """
+        Write several courses to ROM in one pass.
+
+        All holes are compressed up front (in parallel when jobs > 1), each
+        course's terrain bank is laid out, and the shared greens bank is
+        rewritten once for all of them.
+
+        Args:
+            courses: Mapping of course index (0=Japan, 1=US, 2=UK) to its 18 holes
+            jobs: Number of worker processes for compression (1 = in-process)
 
-        course = COURSES[course_idx]
-        hole_offset = course_idx * HOLES_PER_COURSE  # Absolute hole index
+        Returns:
+            Statistics dictionary per course, in course index order
 
-        # Read terrain bank from course metadata
-        terrain_bank = self.read_fixed_byte(TABLE_COURSE_BANK_TERRAIN + course_idx)
+        Raises:
+            ValueError: If a course doesn't have exactly 18 holes
+            BankOverflowError: If compressed data doesn't fit in bank
+        """
+        for hole_data_list in courses.values():
+            if len(hole_data_list) != HOLES_PER_COURSE:
+                raise ValueError(
+                    f"Expected {HOLES_PER_COURSE} holes, got {len(hole_data_list)}"
+                )
+
+        course_indices = sorted(courses)
         greens_bank = 3  # Greens always in bank 3
 
-        print(
-            f"Writing {course['display_name']} course "
-            f"(terrain bank {terrain_bank}, greens bank {greens_bank})..."
-        )
+        # Compress all terrain and greens data (reusing cached holes)
+        all_holes = [hole for idx in course_indices for hole in courses[idx]]
+        all_compressed = self._compress_holes(all_holes, jobs)
+
+        compressed_by_course = {}
+        for n, course_idx in enumerate(course_indices):
+            hole_data_list = courses[course_idx]
+            chunk = all_compressed[n * HOLES_PER_COURSE : (n + 1) * HOLES_PER_COURSE]
+            compressed_by_course[course_idx] = [
+                {**d, "hole_data": hole_data}
+                for d, hole_data in zip(chunk, hole_data_list)
+            ]
 
-        # Compress all terrain and greens data
-        compressed_data = []
-        for hole_idx, hole_data in enumerate(hole_data_list):
-            # Compress terrain
-            terrain_compressed = self.terrain_compressor.compress(
-                hole_data.terrain[: hole_data.terrain_height]
+        # Write greens bank once (preserve courses not being written)
+        greens_by_hole = {
+            course_idx * HOLES_PER_COURSE + i: d["greens"]
+            for course_idx, compressed_data in compressed_by_course.items()
+            for i, d in enumerate(compressed_data)
+        }
+        all_greens_pointers = self._write_greens_bank(greens_bank, greens_by_hole)
+
+        all_stats = []
+        for course_idx in course_indices:
+            course = COURSES[course_idx]
+            hole_offset = course_idx * HOLES_PER_COURSE  # Absolute hole index
+            hole_data_list = courses[course_idx]
+            compressed_data = compressed_by_course[course_idx]
+
+            # Read terrain bank from course metadata
+            terrain_bank = self.read_fixed_byte(
+                TABLE_COURSE_BANK_TERRAIN + course_idx
             )
 
-            # Pack attributes
-            attr_packed = pack_attributes(hole_data.attributes)
+            print(
+                f"Writing {course['display_name']} course "
+                f"(terrain bank {terrain_bank}, greens bank {greens_bank})..."
+            )
 
-            # Compress greens
-            greens_compressed = self.greens_compressor.compress(hole_data.greens)
+            # Write terrain bank (defragmented)
+            terrain_pointers = self._write_terrain_bank(
+                terrain_bank, compressed_data, hole_offset
+            )
+            greens_pointers = all_greens_pointers[
+                hole_offset : hole_offset + HOLES_PER_COURSE
+            ]
 
-            compressed_data.append(
-                {
-                    "terrain": terrain_compressed,
-                    "attributes": attr_packed,
-                    "greens": greens_compressed,
-                    "hole_data": hole_data,
-                }
+            # Update pointer tables
+            for i, (terrain_ptr, greens_ptr) in enumerate(
+                zip(terrain_pointers, greens_pointers)
+            ):
+                abs_hole_idx = hole_offset + i
+                self._write_pointer(
+                    TABLE_TERRAIN_START_PTR, abs_hole_idx, terrain_ptr["start"]
+                )
+                self._write_pointer(
+                    TABLE_TERRAIN_END_PTR, abs_hole_idx, terrain_ptr["end"]
+                )
+                self._write_pointer(TABLE_GREENS_PTR, abs_hole_idx, greens_ptr)
+
+            # Update metadata for each hole
+            self._update_metadata(
+                {hole_offset + i: hole_data for i, hole_data in enumerate(hole_data_list)}
             )
 
-        # Write terrain bank (defragmented)
-        terrain_pointers = self._write_terrain_bank(
-            terrain_bank, compressed_data, hole_offset
-        )
+            all_stats.append(self._course_stats(course, compressed_data))
 
-        # Write greens bank (preserve other courses)
-        greens_pointers = self._write_greens_bank(
-            greens_bank, compressed_data, hole_offset
-        )
+        return all_stats
 
-        # Update pointer tables
-        for i, (terrain_ptr, greens_ptr) in enumerate(
-            zip(terrain_pointers, greens_pointers)
-        ):
-            abs_hole_idx = hole_offset + i
-            self._write_pointer(
-                TABLE_TERRAIN_START_PTR, abs_hole_idx, terrain_ptr["start"]
-            )
-            self._write_pointer(TABLE_TERRAIN_END_PTR, abs_hole_idx, terrain_ptr["end"])
-            self._write_pointer(TABLE_GREENS_PTR, abs_hole_idx, greens_ptr)
+    def _course_stats(self, course: dict, compressed_data: list[dict]) -> dict:
+        """
+        Build the statistics dictionary for one written course.
 
-        # Update metadata for each hole
-        for i, hole_data in enumerate(hole_data_list):
-            abs_hole_idx = hole_offset + i
-            self._update_metadata(abs_hole_idx, hole_data)
+        Args:
+            course: Entry from COURSES
+            compressed_data: List of compressed data dicts for its 18 holes
 
+        Returns:
+            Statistics dictionary with compression info
+        """
         # Calculate statistics
         total_terrain_bytes = sum(
             len(d["terrain"]) + len(d["attributes"]) for d in compressed_data
@@ -164,8 +271,10 @@ class RomWriter:
 
         stats = {
             "course": course["display_name"],
+            "cached_holes": sum(1 for d in compressed_data if d["cached"]),
             "terrain_bank_usage": total_terrain_bytes,
             "greens_bytes": total_greens_bytes,
+            "optimal": self.optimal,
             "holes": [
                 {
                     "hole": i + 1,
@@ -176,8 +285,104 @@ class RomWriter:
             ],
         }
 
+        if self.optimal:
+            for hole_stats, d in zip(stats["holes"], compressed_data):
+                hole_stats["terrain_bytes_saved"] = d["terrain_greedy_size"] - len(
+                    d["terrain"]
+                )
+                hole_stats["greens_bytes_saved"] = d["greens_greedy_size"] - len(
+                    d["greens"]
+                )
+
         return stats
 
+    def _compress_holes(self, hole_data_list: list[HoleData], jobs: int = 1) -> list[dict]:
+        """
+        Compress many holes, in worker processes when jobs > 1.
+
+        Cached holes are taken from the cache in this process; only the rest
+        are sent to workers.
+
+        Args:
+            hole_data_list: Holes to compress
+            jobs: Number of worker processes (1 = in-process)
+
+        Returns:
+            One _compress_hole() result per hole, in order
+        """
+        if jobs <= 1:
+            return [self._compress_hole(hole_data) for hole_data in hole_data_list]
+
+        results: dict[int, dict] = {}  # Hole index -> result
+        keys: list[str | None] = [None] * len(hole_data_list)
+        pending = []
+        for i, hole_data in enumerate(hole_data_list):
+            if self.cache is not None:
+                keys[i] = self.cache.key_for(hole_data, self.optimal)
+                cached = self.cache.get(keys[i])
+                if cached is not None:
+                    results[i] = {**cached, "cached": True}
+                    continue
+            pending.append(i)
+
+        if len(pending) > 1:
+            with ProcessPoolExecutor(
+                max_workers=min(jobs, len(pending)),
+                initializer=_init_compression_worker,
+            ) as executor:
+                compressed = list(
+                    executor.map(
+                        _compress_in_worker,
+                        [hole_data_list[i] for i in pending],
+                        [self.optimal] * len(pending),
+                    )
+                )
+        else:
+            compressed = [
+                compress_hole(
+                    self.terrain_compressor,
+                    self.greens_compressor,
+                    hole_data_list[i],
+                    self.optimal,
+                )
+                for i in pending
+            ]
+
+        for i, result in zip(pending, compressed):
+            if self.cache is not None:
+                self.cache.put(keys[i], result)
+            results[i] = {**result, "cached": False}
+
+        return [results[i] for i in range(len(hole_data_list))]
+
+    def _compress_hole(self, hole_data: HoleData) -> dict:
+        """
+        Compress one hole, consulting the cache if there is one.
+
+        Args:
+            hole_data: HoleData object
+
+        Returns:
+            Dict with "terrain", "attributes" and "greens" bytes, "cached"
+            (whether it came from the cache), and in optimal mode the greedy
+            sizes "terrain_greedy_size" and "greens_greedy_size"
+        """
+        key = None
+        if self.cache is not None:
+            key = self.cache.key_for(hole_data, self.optimal)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return {**cached, "cached": True}
+
+        result = compress_hole(
+            self.terrain_compressor, self.greens_compressor, hole_data, self.optimal
+        )
+
+        if self.cache is not None:
+            self.cache.put(key, result)
+
+        return {**result, "cached": False}
+
     def _write_terrain_bank(
         self, bank: int, compressed_data: list[dict], hole_offset: int
     ) -> list[dict]:
@@ -233,22 +438,19 @@ class RomWriter:
 
         return pointers
 
-    def _write_greens_bank(
-        self, bank: int, compressed_data: list[dict], hole_offset: int
-    ) -> list[int]:
+    def _write_greens_bank(self, bank: int, new_greens: dict[int, bytes]) -> list[int]:
         """
-        Write greens data for 18 holes in bank 3.
+        Write greens data for all 54 holes in bank 3.
 
-        Preserves other courses' greens data. Defragments only the section
-        for this course.
+        Preserves greens data of holes not in new_greens, and defragments
+        the whole bank.
 
         Args:
             bank: Bank number (always 3)
-            compressed_data: List of compressed data dicts
-            hole_offset: Absolute hole index offset (0, 18, or 36)
+            new_greens: Mapping of absolute hole index to compressed greens
 
         Returns:
-            List of greens CPU addresses
+            List of greens CPU addresses for all 54 holes
 
         Raises:
             BankOverflowError: If data doesn't fit in bank
@@ -295,10 +497,9 @@ class RomWriter:
         # Prepare all greens data (preserving other courses)
         all_greens_data = []
         for hole_idx in range(54):
-            if hole_offset <= hole_idx < hole_offset + HOLES_PER_COURSE:
-                # This course - use new compressed data
-                data_idx = hole_idx - hole_offset
-                all_greens_data.append(compressed_data[data_idx]["greens"])
+            if hole_idx in new_greens:
+                # Course being written - use new compressed data
+                all_greens_data.append(new_greens[hole_idx])
             else:
                 # Other course - use preserved data
                 all_greens_data.append(all_existing_greens[hole_idx])
@@ -336,59 +537,19 @@ class RomWriter:
         for hole_idx, ptr in enumerate(all_ptrs):
             self._write_pointer(TABLE_GREENS_PTR, hole_idx, ptr)
 
-        # Return pointers for this course only
-        return all_ptrs[hole_offset : hole_offset + HOLES_PER_COURSE]
+        return all_ptrs
 
-    def _update_metadata(self, hole_idx: int, hole_data: HoleData):
+    def _update_metadata(self, hole_data_by_index: dict[int, HoleData]):
         """
-        Update metadata tables for a hole.
+        Update metadata tables for several holes in one pass.
 
         Args:
-            hole_idx: Absolute hole index (0-53)
-            hole_data: HoleData object
+            hole_data_by_index: Mapping of absolute hole index (0-53) to HoleData
         """
-        metadata = hole_data.metadata
-
-        # Write par
-        self.write_fixed_byte(TABLE_PAR + hole_idx, metadata.get("par", 4))
-
-        # Write handicap
-        self.write_fixed_byte(TABLE_HANDICAP + hole_idx, metadata.get("handicap", 1))
-
-        # Write distance (BCD encoded)
-        distance = metadata.get("distance", 400)
-        dist_100, dist_10, dist_1 = int_to_bcd(distance)
-        self.write_fixed_byte(TABLE_DISTANCE_100 + hole_idx, dist_100)
-        self.write_fixed_byte(TABLE_DISTANCE_10 + hole_idx, dist_10)
-        self.write_fixed_byte(TABLE_DISTANCE_1 + hole_idx, dist_1)
-
-        # Write scroll limit
-        self.write_fixed_byte(
-            TABLE_SCROLL_LIMIT + hole_idx, metadata.get("scroll_limit", 32)
-        )
-
-        # Write green position
-        self.write_fixed_byte(TABLE_GREEN_X + hole_idx, hole_data.green_x)
-        self.write_fixed_byte(TABLE_GREEN_Y + hole_idx, hole_data.green_y)
-
-        # Write tee position
-        tee = metadata.get("tee", {"x": 0, "y": 0})
-        self.write_fixed_byte(TABLE_TEE_X + hole_idx, tee["x"])
-        self.write_fixed_word(TABLE_TEE_Y + hole_idx * 2, tee["y"])
-
-        # Write flag positions (4 per hole)
-        flag_positions = metadata.get("flag_positions", [])
-        for i in range(4):
-            if i < len(flag_positions):
-                flag = flag_positions[i]
-                y_offset = flag.get("y_offset", 0)
-                x_offset = flag.get("x_offset", 0)
-            else:
-                y_offset = 0
-                x_offset = 0
-
-            self.write_fixed_byte(TABLE_FLAG_Y_OFFSET + hole_idx * 4 + i, y_offset)
-            self.write_fixed_byte(TABLE_FLAG_X_OFFSET + hole_idx * 4 + i, x_offset)
+        metadata = HoleMetadataTable.from_buffer(self.rom_data, self.prg_start)
+        for hole_idx, hole_data in hole_data_by_index.items():
+            metadata.set_hole(hole_idx, hole_data)
+        metadata.write_to(self.rom_data, self.prg_start)
 
     def _write_pointer(self, table_addr: int, hole_idx: int, cpu_addr: int):
         """
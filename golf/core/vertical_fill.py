@@ -0,0 +1,110 @@
+"""
+NES Open Tournament Golf - Vectorized Vertical Fill
+
+Both directions of the vertical fill transform on 2-D uint8 tile arrays.
+
+The game marks a tile with 0x00 when it equals vert_table[tile_above]; the
+decoder's second pass restores each marked tile from the (already restored)
+tile above it. The encoder direction is independent per cell. The decoder
+direction cascades down each column, so a marked tile `k` rows below the
+nearest unmarked tile is vert_table applied `k` times to that tile, which is
+a single lookup into a table of vert_table powers.
+"""
+
+import numpy as np
+
+
+def vert_lookup_array(vert_table: list[int]) -> np.ndarray:
+    """
+    Build a 256-entry decoder lookup from a vertical continuation table.
+
+    Bytes outside the table map to 0x00, matching the game, which leaves a
+    fill marker untouched when the tile above is out of range.
+
+    Args:
+        vert_table: Vertical continuation table
+
+    Returns:
+        uint8 array of shape (256,)
+    """
+    lookup = np.zeros(256, dtype=np.uint8)
+    table = np.asarray(vert_table[:256], dtype=np.uint8)
+    lookup[: len(table)] = table
+    return lookup
+
+
+def vert_powers(vert_lookup: np.ndarray, max_depth: int) -> np.ndarray:
+    """
+    Tabulate repeated application of a vertical lookup.
+
+    Args:
+        vert_lookup: 256-entry decoder lookup from vert_lookup_array()
+        max_depth: Largest number of applications needed
+
+    Returns:
+        uint8 array of shape (max_depth + 1, 256) where row k is vert_lookup
+        applied k times (row 0 is the identity)
+    """
+    powers = np.empty((max_depth + 1, 256), dtype=np.uint8)
+    powers[0] = np.arange(256, dtype=np.uint8)
+    for depth in range(1, max_depth + 1):
+        powers[depth] = vert_lookup[powers[depth - 1]]
+    return powers
+
+
+def mark_vertical_fills(grid: np.ndarray, vert_table: list[int]) -> np.ndarray:
+    """
+    Encoder direction: replace tiles predicted by the row above with 0x00.
+
+    Args:
+        grid: 2-D uint8 array of tiles
+        vert_table: Vertical continuation table
+
+    Returns:
+        New array with predicted tiles set to 0x00 (row 0 is never changed)
+    """
+    # -1 never matches a tile, so tiles above the table's range are left alone
+    expected = np.full(256, -1, dtype=np.int16)
+    table = np.asarray(vert_table[:256], dtype=np.int16)
+    expected[: len(table)] = table
+
+    marked = grid.copy()
+    if grid.shape[0] > 1:
+        predicted = grid[1:] == expected[grid[:-1]]
+        marked[1:][predicted] = 0
+    return marked
+
+
+def apply_vertical_fills(
+    grid: np.ndarray, vert_lookup: np.ndarray, powers: np.ndarray | None = None
+) -> np.ndarray:
+    """
+    Decoder direction: restore 0x00 markers from the tile above, cascading down.
+
+    Args:
+        grid: 2-D uint8 array of tiles, 0x00 marking vertical fills
+        vert_lookup: 256-entry decoder lookup from vert_lookup_array()
+        powers: Optional precomputed vert_powers() table; extended if too short
+
+    Returns:
+        New array with every marker below row 0 filled in
+    """
+    height = grid.shape[0]
+    if height < 2:
+        return grid.copy()
+
+    # Row index of the nearest source tile at or above each cell. Every tile in
+    # row 0 is a source, since markers there have nothing above to fill from.
+    row_numbers = np.arange(height)[:, None]
+    is_source = grid != 0
+    is_source[0] = True
+    source_row = np.maximum.accumulate(np.where(is_source, row_numbers, 0), axis=0)
+
+    depth = row_numbers - source_row
+    source_tile = np.take_along_axis(grid, source_row, axis=0)
+
+    max_depth = int(depth.max())
+    if powers is None or len(powers) <= max_depth:
+        powers = vert_powers(vert_lookup, max_depth)
+
+    return powers[depth, source_tile]
@@ -2,5 +2,6 @@
 Data format utilities.
 
 This package contains utilities for working with hole data files,
-hex string parsing/formatting, and JSON serialization.
+hex string parsing/formatting, JSON serialization, and atomic
+file writes.
 """
@@ -0,0 +1,48 @@
+"""
+NES Open Tournament Golf - Atomic File Writes
+
+Writes files through a uniquely named temporary file in the same directory,
+moved over the target only once it is complete, so an interrupted run never
+leaves a truncated file behind and concurrent writers never share a
+temporary file.
+"""
+
+import os
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any
+
+
+@contextmanager
+def atomic_write(path: str | Path, mode: str = "w") -> Iterator[IO[Any]]:
+    """
+    Open a file for writing that replaces path when the block completes.
+
+    If the block raises, path is left unchanged and the temporary file is
+    removed.
+
+    Args:
+        path: File to write
+        mode: "w" for text or "wb" for binary
+
+    Yields:
+        The temporary file, open for writing
+
+    Example:
+        >>> with atomic_write("cache.json") as f:
+        ...     json.dump(data, f)
+    """
+    path = Path(path)
+    with tempfile.NamedTemporaryFile(
+        mode, dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False
+    ) as f:
+        try:
+            yield f
+            f.close()
+            os.replace(f.name, path)
+        except BaseException:
+            f.close()
+            Path(f.name).unlink(missing_ok=True)
+            raise
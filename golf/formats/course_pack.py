@@ -0,0 +1,381 @@
+"""
+NES Open Tournament Golf - Packed Course Format
+
+A single binary file holding all holes of a course: a small JSON header
+with each hole's metadata, followed by every terrain, attribute and
+greens grid as raw uint8 bytes. Grids are read with zero parsing as numpy
+views over one buffer.
+
+Layout:
+    8 bytes   magic "GOLFPACK"
+    2 bytes   format version (little-endian)
+    4 bytes   header length N (little-endian)
+    N bytes   UTF-8 JSON header
+    ...       grid data
+
+The header is {"course": <course.json contents or null>, "holes": [...],
+"sources": [...]}. Each hole entry is the hole JSON with every grid's
+"rows" replaced by {"offset", "shape", "encoding"} describing where its
+bytes live, so conversion back to JSON is lossless. "sources" lists the
+name, size and modification time of each file the pack was built from
+(null for packs built in memory), so a stale pack can be detected.
+"""
+
+import json as std_json
+import struct
+from pathlib import Path
+
+import numpy as np
+
+from . import compact_json as json
+from . import hex_utils
+from .hole_data import HoleData
+
+PACK_MAGIC = b"GOLFPACK"
+PACK_VERSION = 1
+PACK_FILENAME = "course.pack"
+
+_PREAMBLE = struct.Struct("<8sHI")
+
+# Grid sections of a hole JSON, and how their rows are written there
+GRID_ENCODINGS = {"terrain": "hex", "attributes": "int", "greens": "hex"}
+
+
+def _grid_to_bytes(rows: list, encoding: str) -> tuple[bytes, list[int]]:
+    """
+    Convert a JSON grid's rows to raw bytes.
+
+    Raises:
+        ValueError: If the rows are ragged, hold values outside 0-255, or
+            (for hex rows) are not in canonical "01 A3" form
+    """
+    if encoding == "hex":
+        grid = [hex_utils.parse_hex_row(row) for row in rows]
+        if [hex_utils.format_hex_row(row) for row in grid] != rows:
+            raise ValueError("Hex rows are not in canonical form")
+    else:
+        grid = rows
+
+    if len({len(row) for row in grid}) > 1:
+        raise ValueError("Grid rows have different lengths")
+
+    array = np.array(grid, dtype=np.int64).reshape(len(grid), -1 if grid else 0)
+    if array.size and (array.min() < 0 or array.max() > 0xFF):
+        raise ValueError("Grid values must be 0-255")
+
+    return array.astype(np.uint8).tobytes(), list(array.shape)
+
+
+def pack_course(
+    holes: list[dict],
+    course_meta: dict | None = None,
+    sources: list[dict] | None = None,
+) -> bytes:
+    """
+    Pack hole JSON documents into a course file.
+
+    Args:
+        holes: Hole JSON documents (as loaded from hole_XX.json)
+        course_meta: Contents of course.json, if any
+        sources: Stamps of the files the documents were read from (see
+            source_stamps()), if any
+
+    Returns:
+        Packed course bytes
+
+    Raises:
+        ValueError: If a grid cannot be stored losslessly
+    """
+    blob = bytearray()
+    header_holes = []
+
+    for hole in holes:
+        entry = dict(hole)
+        for name, encoding in GRID_ENCODINGS.items():
+            if name not in hole:
+                continue
+            data, shape = _grid_to_bytes(hole[name]["rows"], encoding)
+            entry[name] = {
+                **hole[name],
+                "rows": {"offset": len(blob), "shape": shape, "encoding": encoding},
+            }
+            blob += data
+        header_holes.append(entry)
+
+    header = std_json.dumps(
+        {"course": course_meta, "holes": header_holes, "sources": sources},
+        separators=(",", ":"),
+    ).encode()
+
+    return _PREAMBLE.pack(PACK_MAGIC, PACK_VERSION, len(header)) + header + blob
+
+
+class CoursePack:
+    """
+    Read-only view of a packed course file.
+
+    Grids are numpy arrays backed directly by the file's bytes.
+    """
+
+    def __init__(self, data: bytes):
+        """
+        Parse a packed course.
+
+        Args:
+            data: Packed course bytes (from pack_course() or a .pack file)
+
+        Raises:
+            ValueError: If data is not a packed course of a supported version
+        """
+        if len(data) < _PREAMBLE.size:
+            raise ValueError("Not a packed course file")
+        magic, version, header_len = _PREAMBLE.unpack_from(data)
+        if magic != PACK_MAGIC:
+            raise ValueError("Not a packed course file")
+        if version != PACK_VERSION:
+            raise ValueError(f"Unsupported packed course version {version}")
+
+        header_end = _PREAMBLE.size + header_len
+        header = std_json.loads(bytes(memoryview(data)[_PREAMBLE.size : header_end]))
+
+        self.course: dict | None = header["course"]
+        self.holes: list[dict] = header["holes"]
+        self.sources: list[dict] | None = header.get("sources")
+        self._blob = memoryview(data)[header_end:]
+
+    @classmethod
+    def open(cls, path: str | Path) -> "CoursePack":
+        """Read a packed course file with a single read() call."""
+        with open(path, "rb") as f:
+            return cls(f.read())
+
+    def __len__(self) -> int:
+        return len(self.holes)
+
+    def grid(self, hole_idx: int, name: str) -> np.ndarray:
+        """
+        Get one grid as a read-only array (no copy).
+
+        Args:
+            hole_idx: Index of the hole in the pack (0-based)
+            name: "terrain", "attributes" or "greens"
+
+        Returns:
+            uint8 array of shape (rows, columns)
+        """
+        desc = self.holes[hole_idx][name]["rows"]
+        rows, cols = desc["shape"]
+        return np.frombuffer(
+            self._blob, dtype=np.uint8, count=rows * cols, offset=desc["offset"]
+        ).reshape(rows, cols)
+
+    def hole_json(self, hole_idx: int) -> dict:
+        """
+        Rebuild a hole's original JSON document.
+
+        Args:
+            hole_idx: Index of the hole in the pack (0-based)
+
+        Returns:
+            Hole JSON document, identical to the one that was packed
+        """
+        hole = dict(self.holes[hole_idx])
+        for name in GRID_ENCODINGS:
+            if name not in hole:
+                continue
+            grid = self.grid(hole_idx, name).tolist()
+            if hole[name]["rows"]["encoding"] == "hex":
+                grid = hex_utils.format_hex_rows(grid)
+            hole[name] = {**hole[name], "rows": grid}
+        return hole
+
+    def hole_data(self, hole_idx: int) -> HoleData:
+        """
+        Build a HoleData for one hole without going through hex strings.
+
+        Args:
+            hole_idx: Index of the hole in the pack (0-based)
+
+        Returns:
+            HoleData equivalent to HoleData.load() of the hole's JSON file
+        """
+        entry = self.holes[hole_idx]
+        hole_data = HoleData()
+        hole_data.terrain = self.grid(hole_idx, "terrain").tolist()
+        hole_data.terrain_height = entry["terrain"]["height"]
+        hole_data.attributes = self.grid(hole_idx, "attributes").tolist()
+        hole_data.greens = self.grid(hole_idx, "greens").tolist()
+        hole_data.green_x = entry["green"]["x"]
+        hole_data.green_y = entry["green"]["y"]
+        hole_data.metadata = {
+            "hole": entry.get("hole", 1),
+            "par": entry.get("par", 4),
+            "distance": entry.get("distance", 400),
+            "handicap": entry.get("handicap", 1),
+            "scroll_limit": entry.get("scroll_limit", 32),
+            "tee": entry.get("tee", {"x": 0, "y": 0}),
+            "flag_positions": entry.get("flag_positions", []),
+            "_debug": entry.get("_debug", {}),
+        }
+        return hole_data
+
+
+def _hole_files(course_dir: Path) -> list[Path]:
+    return sorted(course_dir.glob("hole_*.json"))
+
+
+def source_stamps(course_dir: str | Path) -> list[dict]:
+    """
+    Describe the files a course pack is built from.
+
+    Args:
+        course_dir: Course directory
+
+    Returns:
+        {"name", "size", "mtime_ns"} of each hole_XX.json file, in order,
+        then of course.json if it exists
+    """
+    course_dir = Path(course_dir)
+    paths = _hole_files(course_dir)
+    if (course_dir / "course.json").exists():
+        paths.append(course_dir / "course.json")
+
+    stamps = []
+    for path in paths:
+        stat = path.stat()
+        stamps.append(
+            {"name": path.name, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        )
+    return stamps
+
+
+def _read_sources(pack_path: Path) -> list[dict] | None:
+    """Read only the source stamps from a pack's header (None if unreadable)."""
+    try:
+        with open(pack_path, "rb") as f:
+            magic, version, header_len = _PREAMBLE.unpack(f.read(_PREAMBLE.size))
+            if magic != PACK_MAGIC or version != PACK_VERSION:
+                return None
+            return std_json.loads(f.read(header_len)).get("sources")
+    except (OSError, struct.error, ValueError, AttributeError):
+        return None
+
+
+def pack_course_dir(course_dir: str | Path, pack_path: str | Path | None = None) -> Path:
+    """
+    Pack a course directory's hole_XX.json files (and course.json).
+
+    Args:
+        course_dir: Course directory
+        pack_path: Output file (default: <course_dir>/course.pack)
+
+    Returns:
+        Path of the written pack
+
+    Raises:
+        FileNotFoundError: If the directory has no hole files
+        ValueError: If a grid cannot be stored losslessly
+    """
+    course_dir = Path(course_dir)
+    hole_files = _hole_files(course_dir)
+    if not hole_files:
+        raise FileNotFoundError(f"No hole files in {course_dir}")
+
+    # Stamped before reading, so an edit made while packing leaves it stale
+    sources = source_stamps(course_dir)
+
+    holes = []
+    for hole_file in hole_files:
+        with open(hole_file) as f:
+            holes.append(json.load(f))
+
+    course_meta = None
+    if (course_dir / "course.json").exists():
+        with open(course_dir / "course.json") as f:
+            course_meta = json.load(f)
+
+    pack_path = Path(pack_path) if pack_path else course_dir / PACK_FILENAME
+    pack_path.write_bytes(pack_course(holes, course_meta, sources))
+    return pack_path
+
+
+def unpack_course_file(pack_path: str | Path, course_dir: str | Path) -> list[Path]:
+    """
+    Write a packed course back out as hole_XX.json files (and course.json).
+
+    Args:
+        pack_path: Packed course file
+        course_dir: Output directory
+
+    Returns:
+        Paths of the written hole files
+    """
+    pack = CoursePack.open(pack_path)
+    course_dir = Path(course_dir)
+    course_dir.mkdir(parents=True, exist_ok=True)
+
+    if pack.course is not None:
+        with open(course_dir / "course.json", "w") as f:
+            json.dump(pack.course, f, indent=2)
+
+    paths = []
+    for hole_idx in range(len(pack)):
+        hole = pack.hole_json(hole_idx)
+        path = course_dir / f"hole_{hole.get('hole', hole_idx + 1):02d}.json"
+        with open(path, "w") as f:
+            json.dump(hole, f, indent=2)
+        paths.append(path)
+    return paths
+
+
+def current_pack_path(course_dir: str | Path) -> Path | None:
+    """
+    Get a course's pack file if it is up to date.
+
+    A pack is up to date if the hole JSON files and course.json are exactly
+    the files it was built from, with the same sizes and modification
+    times. A pack with no hole JSON files beside it is the course itself
+    and is always used.
+
+    Args:
+        course_dir: Course directory
+
+    Returns:
+        Path of the pack, or None if there is none or it is stale
+    """
+    course_dir = Path(course_dir)
+    pack_path = course_dir / PACK_FILENAME
+    if not pack_path.exists():
+        return None
+    if not _hole_files(course_dir):
+        return pack_path
+    if _read_sources(pack_path) == source_stamps(course_dir):
+        return pack_path
+    return None
+
+
+def load_course_holes(course_dir: str | Path) -> list[HoleData]:
+    """
+    Load every hole of a course, from its pack when that is up to date.
+
+    The pack is used if it was built from the current hole JSON files and
+    course.json (see current_pack_path()); otherwise the JSON files are
+    loaded.
+
+    Args:
+        course_dir: Course directory
+
+    Returns:
+        HoleData objects in hole file order
+    """
+    pack_path = current_pack_path(course_dir)
+    if pack_path is not None:
+        pack = CoursePack.open(pack_path)
+        return [pack.hole_data(i) for i in range(len(pack))]
+
+    holes = []
+    for hole_file in _hole_files(Path(course_dir)):
+        hole_data = HoleData()
+        hole_data.load(str(hole_file))
+        holes.append(hole_data)
+    return holes
@@ -0,0 +1,46 @@
+"""
+Putting green overlay mask.
+
+Finds the greens cells on the putting surface (tile value at least
+GREEN_TILE_THRESHOLD) and their bounding box. Shared by the PIL renderer
+and the editor's terrain view.
+"""
+
+import numpy as np
+
+from ..core.palettes import GREEN_TILE_THRESHOLD
+
+
+def green_overlay_mask(greens: list[list[int]]) -> np.ndarray:
+    """
+    Mark the greens cells that are on the putting surface.
+
+    Args:
+        greens: Greens tile values as lists of rows (rows may differ in length)
+
+    Returns:
+        Boolean array of shape (rows, longest row), indexed [y, x]
+    """
+    width = max((len(row) for row in greens), default=0)
+    mask = np.zeros((len(greens), width), dtype=bool)
+    for y, row in enumerate(greens):
+        mask[y, : len(row)] = np.asarray(row) >= GREEN_TILE_THRESHOLD
+    return mask
+
+
+def mask_bounds(mask: np.ndarray) -> tuple[int, int, int, int] | None:
+    """
+    Get the bounding box of the marked cells.
+
+    Args:
+        mask: Boolean array indexed [y, x]
+
+    Returns:
+        (min_x, min_y, max_x, max_y) with exclusive maximums, or None if no
+        cell is marked
+    """
+    cols = np.flatnonzero(mask.any(axis=0))
+    rows = np.flatnonzero(mask.any(axis=1))
+    if not len(cols):
+        return None
+    return int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1
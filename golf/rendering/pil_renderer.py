@@ -7,16 +7,41 @@ Used by the visualize tool to create static images.
 
 from typing import Any
 
+import numpy as np
+
 try:
     from PIL import Image
 except ImportError:
     raise ImportError("Pillow library required. Install with: pip install Pillow")
 
 from ..core.chr_tile import TILE_SIZE, TilesetData
-from ..core.palettes import GREEN_OVERLAY_COLOR, GREEN_TILE_THRESHOLD, PALETTES
+from ..core.palettes import GREEN_OVERLAY_COLOR, PALETTES
+from .green_overlay import green_overlay_mask
 from .pil_sprite import PILSprite
 
 
+def _terrain_atlases(tileset: TilesetData) -> np.ndarray:
+    """
+    RGB tiles for every terrain palette, indexed [palette, tile].
+
+    One extra tile past the end of the CHR data renders as the palette's
+    color 0, matching how out-of-range tiles decode.
+
+    Args:
+        tileset: TilesetData instance with CHR tile data
+
+    Returns:
+        uint8 array of shape (len(PALETTES), num_tiles + 1, 8, 8, 3)
+    """
+    atlases = np.zeros(
+        (len(PALETTES), tileset.num_tiles + 1, TILE_SIZE, TILE_SIZE, 3), dtype=np.uint8
+    )
+    for palette_idx, palette in enumerate(PALETTES):
+        atlases[palette_idx, : tileset.num_tiles] = tileset.rgb_atlas(palette)
+        atlases[palette_idx, tileset.num_tiles] = palette[0]
+    return atlases
+
+
 def render_hole_to_image(
     hole_data: dict[str, Any],
     tileset: TilesetData,
@@ -60,41 +85,31 @@ def render_hole_to_image(
     # Create image
     img_width = terrain_width * TILE_SIZE
     img_height = terrain_height * TILE_SIZE
-    img = Image.new("RGB", (img_width, img_height))
-    pixels = img.load()
-    assert pixels is not None
-
-    # Render each tile
-    for tile_row in range(terrain_height):
-        for tile_col in range(terrain_width):
-            # Get tile index
-            tile_idx = terrain_tiles[tile_row][tile_col]
-
-            # Get palette index from attributes
-            # Attributes are per-supertile (2x2 tiles)
-            # Attribute data already has HUD column removed, so direct mapping
-            attr_row = tile_row // 2
-            attr_col = tile_col // 2
-
-            if attr_row < len(attr_rows) and attr_col < len(attr_rows[attr_row]):
-                palette_idx = attr_rows[attr_row][attr_col]
-            else:
-                palette_idx = 1  # Default to fairway/rough
 
-            palette = PALETTES[palette_idx]
-
-            # Decode tile
-            tile_pixels = tileset.decode_tile(tile_idx)
-
-            # Draw tile
-            base_x = tile_col * TILE_SIZE
-            base_y = tile_row * TILE_SIZE
-
-            for py in range(8):
-                for px in range(8):
-                    color_idx = tile_pixels[py][px]
-                    color = palette[color_idx]
-                    pixels[base_x + px, base_y + py] = color
+    # Tile index per cell (rows beyond the visible height are not drawn)
+    tile_grid = np.array(
+        [row[:terrain_width] for row in terrain_tiles[:terrain_height]], dtype=np.int64
+    ).reshape(terrain_height, terrain_width)
+    tile_grid[tile_grid >= tileset.num_tiles] = tileset.num_tiles  # Blank tile
+
+    # Palette index per cell from attributes
+    # Attributes are per-supertile (2x2 tiles)
+    # Attribute data already has HUD column removed, so direct mapping
+    attr_grid = np.ones(
+        ((terrain_height + 1) // 2, (terrain_width + 1) // 2), dtype=np.int64
+    )  # Default to fairway/rough
+    for attr_row, row in enumerate(attr_rows[: attr_grid.shape[0]]):
+        row = row[: attr_grid.shape[1]]
+        attr_grid[attr_row, : len(row)] = row
+    palette_grid = attr_grid.repeat(2, axis=0).repeat(2, axis=1)[
+        :terrain_height, :terrain_width
+    ]
+
+    # Look up every cell's 8x8 RGB tile, then lay the tiles out as one frame
+    cells = _terrain_atlases(tileset)[palette_grid, tile_grid]
+    frame = np.ascontiguousarray(
+        cells.transpose(0, 2, 1, 3, 4).reshape(img_height, img_width, 3)
+    )
 
     # Render putting green overlay
     if "greens" in hole_data and "green" in hole_data:
@@ -114,13 +129,12 @@ def render_hole_to_image(
             greens_data.append(row)
 
         # Overlay green pixels where value >= GREEN_TILE_THRESHOLD
-        for gy, grow in enumerate(greens_data):
-            for gx, gval in enumerate(grow):
-                if gval >= GREEN_TILE_THRESHOLD:
-                    px = green_x + gx
-                    py = green_y + gy
-                    if 0 <= px < img_width and 0 <= py < img_height:
-                        pixels[px, py] = GREEN_OVERLAY_COLOR
+        gy, gx = np.nonzero(green_overlay_mask(greens_data))
+        py, px = gy + green_y, gx + green_x
+        inside = (py >= 0) & (py < img_height) & (px >= 0) & (px < img_width)
+        frame[py[inside], px[inside]] = GREEN_OVERLAY_COLOR
+
+    img = Image.fromarray(frame)
 
     # Render sprites if requested
     if render_sprites and sprites:
@@ -7,12 +7,14 @@ Mirrors the pygame sprite system but uses PIL for rendering.
 
 import json
 
+import numpy as np
+
 try:
     from PIL import Image
 except ImportError:
     raise ImportError("Pillow library required. Install with: pip install Pillow")
 
-from ..core.chr_tile import TILE_SIZE, decode_tile
+from ..core.chr_tile import TILE_SIZE, build_rgb_atlas, decode_tiles
 from ..core.palettes import SPRITE_OFFSET_Y
 
 
@@ -45,18 +47,26 @@ class PILSprite:
         # IMPORTANT: These offsets are from the original NES ROM and must be preserved exactly
         self.sprites = data.get("sprites", [{"tile": 0, "x": 0, "y": 0}])
 
+        # Decode all tiles once into an RGBA atlas; color index 0 is transparent
+        self.pixels = decode_tiles(self.tiles)
+        self.rgba_atlas = build_rgb_atlas(
+            self.pixels,
+            [(0, 0, 0, 0)]
+            + [(r, g, b, 255) for r, g, b in (self.palette[1:] + [(0, 0, 0)] * 3)[:3]],
+        )
+
         self._cache: dict[tuple[int, int], Image.Image] = {}
 
     def decode_tile(self, tile_idx: int) -> list[list[int]]:
         """
         Decode a single 8x8 tile into 2-bit pixel values.
 
-        Uses shared decode_tile function from golf.core.chr_tile.
+        Uses shared tile decoding from golf.core.chr_tile.
         """
         if tile_idx >= len(self.tiles):
             return [[0] * 8 for _ in range(8)]
 
-        return decode_tile(self.tiles[tile_idx], 0)
+        return self.pixels[tile_idx].tolist()
 
     def render_tile(self, tile_idx: int, scale: int = 1) -> Image.Image:
         """Render a sprite tile to a PIL RGBA image with transparency."""
@@ -64,31 +74,16 @@ class PILSprite:
         if cache_key in self._cache:
             return self._cache[cache_key]
 
-        pixels = self.decode_tile(tile_idx)
-
-        # Create RGBA image (with alpha channel for transparency)
-        img = Image.new("RGBA", (TILE_SIZE * scale, TILE_SIZE * scale), (0, 0, 0, 0))
-        img_pixels = img.load()
-        assert img_pixels is not None
-
-        for y in range(8):
-            for x in range(8):
-                color_idx = pixels[y][x]
-                if color_idx == 0:
-                    # Color index 0 is transparent
-                    color = (0, 0, 0, 0)
-                else:
-                    # Non-transparent pixels get full alpha
-                    r, g, b = self.palette[color_idx]
-                    color = (r, g, b, 255)
-
-                # Apply scaling by filling scale x scale region
-                if scale == 1:
-                    img_pixels[x, y] = color
-                else:
-                    for sy in range(scale):
-                        for sx in range(scale):
-                            img_pixels[x * scale + sx, y * scale + sy] = color
+        if tile_idx < len(self.tiles):
+            rgba = self.rgba_atlas[tile_idx]
+        else:
+            rgba = np.zeros((TILE_SIZE, TILE_SIZE, 4), dtype=np.uint8)
+
+        # Apply scaling by repeating each pixel scale x scale times
+        if scale > 1:
+            rgba = rgba.repeat(scale, axis=0).repeat(scale, axis=1)
+
+        img = Image.fromarray(np.ascontiguousarray(rgba))
 
         self._cache[cache_key] = img
         return img
@@ -1,10 +1,13 @@
-"""Shared pytest fixtures for compression tests."""
+"""Shared pytest fixtures for compression and rendering tests."""
 
 import json
+import os
 from pathlib import Path
 
+import pygame
 import pytest
 
+from editor.core.pygame_rendering import Tileset
 from golf.core.decompressor import GreensDecompressor, TerrainDecompressor
 from golf.formats.hole_data import HoleData
 
@@ -54,6 +57,22 @@ def mock_minimal_greens_tables(mock_minimal_tables):
     return mock_minimal_tables["greens"]
 
 
+@pytest.fixture(scope="session")
+def display():
+    """Initialize pygame with an offscreen display, once for the whole run."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((640, 700))
+    yield
+    pygame.quit()
+
+
+@pytest.fixture
+def tileset(display):
+    """Load the terrain tileset as pygame surfaces."""
+    return Tileset(str(Path(__file__).parent.parent / "data" / "chr-ram.bin"))
+
+
 @pytest.fixture
 def hole_04_data():
     """Load hole 4 (simple 30-row hole)."""
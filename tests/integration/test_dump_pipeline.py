@@ -0,0 +1,72 @@
+"""
+Integration tests for the parallel golf-dump pipeline.
+
+Tests that dumping with worker processes produces the same files and
+statistics as a serial dump.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from golf.core.decode_engine import DecodeEngine
+from golf.core.decompressor import DecompressionStats
+from golf.core.rom_reader import COURSES, RomReader
+from tools.dump import dump_all_courses, dump_course
+
+
+@pytest.fixture
+def rom_path():
+    """Path to test ROM file."""
+    return str(Path(__file__).parent.parent.parent / "nes_open_us.nes")
+
+
+def test_parallel_dump_matches_serial(rom_path, tmp_path):
+    """Pooled decoding writes identical hole files and merged statistics."""
+    rom = RomReader(rom_path)
+
+    serial_dir = tmp_path / "serial"
+    serial_terrain = DecompressionStats()
+    serial_greens = DecompressionStats()
+    for course_idx in range(len(COURSES)):
+        terrain_stats, greens_stats = dump_course(rom, course_idx, serial_dir)
+        serial_terrain.merge(terrain_stats)
+        serial_greens.merge(greens_stats)
+
+    parallel_dir = tmp_path / "parallel"
+    parallel_terrain, parallel_greens = dump_all_courses(
+        rom, rom_path, parallel_dir, jobs=2
+    )
+
+    serial_files = sorted(p.relative_to(serial_dir) for p in serial_dir.rglob("*.json"))
+    parallel_files = sorted(
+        p.relative_to(parallel_dir) for p in parallel_dir.rglob("*.json")
+    )
+    assert parallel_files == serial_files
+    for rel_path in serial_files:
+        assert (parallel_dir / rel_path).read_text() == (serial_dir / rel_path).read_text()
+
+    assert parallel_terrain.to_dict() == serial_terrain.to_dict()
+    assert parallel_greens.to_dict() == serial_greens.to_dict()
+
+
+def test_dump_without_stats_skips_instrumented_decode(
+    rom_path, tmp_path, monkeypatch
+):
+    """Without statistics holes decode on the fast path, to the same files."""
+    rom = RomReader(rom_path)
+    dump_course(rom, 0, tmp_path / "with_stats")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("instrumented decode used")
+
+    monkeypatch.setattr(DecodeEngine, "expand_instrumented", fail)
+    terrain_stats, greens_stats = dump_course(
+        rom, 0, tmp_path / "no_stats", collect_stats=False
+    )
+
+    assert terrain_stats.to_dict() == DecompressionStats().to_dict()
+    assert greens_stats.to_dict() == DecompressionStats().to_dict()
+    for path in sorted((tmp_path / "with_stats").rglob("*.json")):
+        rel_path = path.relative_to(tmp_path / "with_stats")
+        assert (tmp_path / "no_stats" / rel_path).read_text() == path.read_text()
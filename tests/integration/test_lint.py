@@ -0,0 +1,56 @@
+"""
+Integration tests for the course linter.
+
+Tests that the shipped courses are clean and that bad tiles are reported
+in the hole and section they were placed in.
+"""
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from golf.core.neighbor_validator import (
+    GreensNeighborValidator,
+    TerrainNeighborValidator,
+)
+from tools.corpus import find_course_dirs
+from tools.lint import lint_course
+
+COURSES_DIR = Path(__file__).parent.parent.parent / "courses"
+
+
+@pytest.fixture(scope="module")
+def validators():
+    return TerrainNeighborValidator(), GreensNeighborValidator()
+
+
+def test_shipped_courses_are_clean(validators):
+    """No hole of the extracted courses has an invalid neighbor."""
+    for course_dir in find_course_dirs([str(COURSES_DIR)]):
+        for result in lint_course(course_dir, *validators):
+            assert result["terrain"] == [] and result["greens"] == []
+
+
+def test_reports_injected_tiles(validators, tmp_path):
+    """Tiles with impossible neighbors are found in the right hole and grid."""
+    course_dir = tmp_path / "japan"
+    shutil.copytree(COURSES_DIR / "japan", course_dir)
+
+    hole_path = course_dir / "hole_02.json"
+    hole = json.loads(hole_path.read_text())
+    terrain_row = hole["terrain"]["rows"][10].split()
+    terrain_row[12] = "A0"  # Out of bounds border in the middle of the fairway
+    hole["terrain"]["rows"][10] = " ".join(terrain_row)
+    greens_row = hole["greens"]["rows"][12].split()
+    greens_row[12] = "48"  # Fringe corner in the middle of the putting surface
+    hole["greens"]["rows"][12] = " ".join(greens_row)
+    hole_path.write_text(json.dumps(hole))
+
+    results = lint_course(course_dir, *validators)
+
+    bad = [result for result in results if result["terrain"] or result["greens"]]
+    assert [result["hole"] for result in bad] == [2]
+    assert (10, 12, 0xA0) in bad[0]["terrain"]
+    assert (12, 12, 0x48) in bad[0]["greens"]
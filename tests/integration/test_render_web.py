@@ -0,0 +1,91 @@
+"""
+Integration tests for the web app renderer.
+
+Tests that pooled rendering matches serial rendering and that incremental
+runs only re-render holes whose inputs changed.
+"""
+
+import json
+import shutil
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from tools import render_web
+from tools.render_web import render_all_courses
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+TILESET = str(REPO_ROOT / "data" / "chr-ram.bin")
+
+
+@pytest.fixture
+def courses_dir(tmp_path):
+    """A small copy of the Japan course (three holes)."""
+    course_dir = tmp_path / "courses" / "japan"
+    course_dir.mkdir(parents=True)
+    source = REPO_ROOT / "courses" / "japan"
+    shutil.copy(source / "course.json", course_dir)
+    for hole_file in sorted(source.glob("hole_*.json"))[:3]:
+        shutil.copy(hole_file, course_dir)
+    return tmp_path / "courses"
+
+
+def _outputs(output_dir: Path) -> dict[str, bytes]:
+    return {
+        str(path.relative_to(output_dir)): path.read_bytes()
+        for path in output_dir.rglob("*")
+        if path.is_file() and not path.name.startswith(".")
+    }
+
+
+def test_parallel_render_matches_serial(courses_dir, tmp_path):
+    """Worker processes write the same PNGs and metadata.json."""
+    render_all_courses(TILESET, courses_dir, tmp_path / "serial")
+    render_all_courses(TILESET, courses_dir, tmp_path / "parallel", jobs=2)
+
+    serial = _outputs(tmp_path / "serial")
+    assert len(serial) == 4
+    assert serial == _outputs(tmp_path / "parallel")
+
+
+def test_incremental_render_skips_unchanged_holes(courses_dir, tmp_path, capsys):
+    """Only holes whose JSON changed are rendered again."""
+    output_dir = tmp_path / "web"
+    render_all_courses(TILESET, courses_dir, output_dir, incremental=True)
+
+    hole_path = courses_dir / "japan" / "hole_02.json"
+    hole = json.loads(hole_path.read_text())
+    hole["tee"]["x"] += 8
+    hole_path.write_text(json.dumps(hole))
+
+    capsys.readouterr()
+    render_all_courses(TILESET, courses_dir, output_dir, incremental=True)
+    out = capsys.readouterr().out
+
+    assert "Rendered 1 of 3 holes" in out
+    assert "✓ hole_02" in out
+
+    render_all_courses(TILESET, courses_dir, tmp_path / "full")
+    assert _outputs(output_dir) == _outputs(tmp_path / "full")
+
+
+def test_renderer_change_rerenders_all_holes(
+    courses_dir, tmp_path, capsys, monkeypatch
+):
+    """Editing the renderer's code invalidates every incremental image."""
+    renderer_source = tmp_path / "renderer.py"
+    renderer_source.write_text("# version 1\n")
+    renderer = SimpleNamespace(__name__="renderer", __file__=str(renderer_source))
+    monkeypatch.setattr(render_web, "RENDERER_MODULES", (renderer,))
+
+    output_dir = tmp_path / "web"
+    render_all_courses(TILESET, courses_dir, output_dir, incremental=True)
+    capsys.readouterr()
+
+    render_all_courses(TILESET, courses_dir, output_dir, incremental=True)
+    assert "Rendered 0 of 3 holes" in capsys.readouterr().out
+
+    renderer_source.write_text("# version 2\n")
+    render_all_courses(TILESET, courses_dir, output_dir, incremental=True)
+    assert "Rendered 3 of 3 holes" in capsys.readouterr().out
@@ -321,3 +321,33 @@ def test_greens_decompression_matches(rom_path, japan_course_dir, tmp_path):
     assert len(decompressed_rows) == len(original_greens)
     for i, (orig_row, decomp_row) in enumerate(zip(original_greens, decompressed_rows)):
         assert orig_row == decomp_row, f"Greens row {i} mismatch"
+
+
+def test_batch_write_matches_sequential(rom_path, tmp_path):
+    """
+    Writing several courses in one batch (with worker processes) produces
+    the same ROM as writing them one at a time.
+    """
+    courses = {}
+    for course_idx, name in [(0, "japan"), (2, "uk")]:
+        holes = []
+        for hole_num in range(1, HOLES_PER_COURSE + 1):
+            hd = HoleData()
+            hd.load(f"courses/{name}/hole_{hole_num:02d}.json")
+            holes.append(hd)
+        courses[course_idx] = holes
+
+    sequential_rom = tmp_path / "sequential.nes"
+    writer = RomWriter(rom_path, str(sequential_rom))
+    sequential_stats = [
+        writer.write_course(course_idx, holes) for course_idx, holes in courses.items()
+    ]
+    writer.save()
+
+    batch_rom = tmp_path / "batch.nes"
+    writer = RomWriter(rom_path, str(batch_rom))
+    batch_stats = writer.write_courses(courses, jobs=2)
+    writer.save()
+
+    assert batch_rom.read_bytes() == sequential_rom.read_bytes()
+    assert batch_stats == sequential_stats
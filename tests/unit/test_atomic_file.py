@@ -0,0 +1,47 @@
+"""
+Tests for atomic file writes.
+
+Tests that the target is replaced only by a complete write, and that
+writers do not share temporary files.
+"""
+
+import pytest
+
+from golf.formats.atomic_file import atomic_write
+
+
+def test_write_replaces_target(tmp_path):
+    """A completed block replaces the file and leaves no temporary file."""
+    path = tmp_path / "cache.json"
+    path.write_text("old")
+
+    with atomic_write(path) as f:
+        f.write("new")
+
+    assert path.read_text() == "new"
+    assert [p.name for p in tmp_path.iterdir()] == ["cache.json"]
+
+
+def test_failed_write_keeps_target(tmp_path):
+    """An exception in the block leaves the old file and removes the temporary file."""
+    path = tmp_path / "index.npz"
+    path.write_bytes(b"old")
+
+    with pytest.raises(RuntimeError), atomic_write(path, "wb") as f:
+        f.write(b"partial")
+        raise RuntimeError("interrupted")
+
+    assert path.read_bytes() == b"old"
+    assert [p.name for p in tmp_path.iterdir()] == ["index.npz"]
+
+
+def test_concurrent_writers_use_separate_temporary_files(tmp_path):
+    """Two open writes to one path do not overwrite each other's data."""
+    path = tmp_path / "table.pickle"
+
+    with atomic_write(path, "wb") as first, atomic_write(path, "wb") as second:
+        assert first.name != second.name
+        first.write(b"first")
+        second.write(b"second")
+
+    assert path.read_bytes() == b"first"
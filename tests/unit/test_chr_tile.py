@@ -0,0 +1,65 @@
+"""Unit tests for CHR tile decoding and palette atlases."""
+
+import random
+from pathlib import Path
+
+from golf.core.chr_tile import (
+    TilesetData,
+    build_rgb_atlas,
+    decode_chr_bank,
+    decode_tile,
+    decode_tiles,
+)
+from golf.core.palettes import GREENS_PALETTE
+
+CHR_PATH = Path(__file__).parent.parent.parent / "data" / "chr-ram.bin"
+
+
+def _reference_pixel(tile: bytes, row: int, col: int) -> int:
+    """Bitplane decode of one pixel, straight from the NES CHR layout."""
+    low = (tile[row] >> (7 - col)) & 1
+    high = (tile[row + 8] >> (7 - col)) & 1
+    return low | (high << 1)
+
+
+def test_bank_decode_matches_bitplanes():
+    """Whole-bank decode agrees with per-pixel bitplane decoding."""
+    rng = random.Random(11)
+    data = bytes(rng.randrange(256) for _ in range(16 * 20))
+
+    tiles = decode_chr_bank(data)
+
+    assert tiles.shape == (20, 8, 8)
+    for tile_idx in range(20):
+        tile = data[tile_idx * 16 : tile_idx * 16 + 16]
+        for row in range(8):
+            for col in range(8):
+                assert tiles[tile_idx, row, col] == _reference_pixel(tile, row, col)
+
+
+def test_decode_tile_out_of_range_is_blank():
+    """Indices past the end of the data decode as an all-zero tile."""
+    data = bytes(range(16)) * 2
+
+    assert decode_tile(data, 1) == decode_chr_bank(data)[1].tolist()
+    assert decode_tile(data, 2) == [[0] * 8 for _ in range(8)]
+
+
+def test_decode_tiles_blanks_short_tiles():
+    """Sprite tiles shorter than 16 bytes decode as blank."""
+    tiles = decode_tiles([bytes([0xFF] * 16), b"\xff\xff"])
+
+    assert tiles[0].tolist() == [[3] * 8 for _ in range(8)]
+    assert not tiles[1].any()
+
+
+def test_rgb_atlas_applies_palette_once():
+    """Atlas pixels are palette colors; atlases are cached per palette."""
+    tileset = TilesetData(str(CHR_PATH))
+
+    atlas = tileset.rgb_atlas(GREENS_PALETTE)
+
+    assert atlas.shape == (tileset.num_tiles, 8, 8, 3)
+    assert (atlas == build_rgb_atlas(tileset.tiles, GREENS_PALETTE)).all()
+    assert tuple(atlas[0x30, 0, 0]) == GREENS_PALETTE[tileset.tiles[0x30, 0, 0]]
+    assert tileset.rgb_atlas(list(GREENS_PALETTE)) is atlas
@@ -0,0 +1,74 @@
+"""Unit tests for the per-hole compression cache."""
+
+import pytest
+
+from golf.core.compression_cache import CompressionCache
+from golf.core.rom_writer import RomWriter
+
+
+@pytest.fixture
+def fake_rom(tmp_path):
+    """Minimal iNES file; enough for RomWriter to compress holes."""
+    path = tmp_path / "fake.nes"
+    path.write_bytes(b"NES\x1a" + bytes([16, 0]) + bytes(10 + 16 * 0x4000))
+    return str(path)
+
+
+def test_key_changes_with_content(hole_04_data, tmp_path):
+    """Editing any tile, or switching encoder mode, changes the key."""
+    cache = CompressionCache(tmp_path / "cache.json")
+    key = cache.key_for(hole_04_data)
+
+    assert cache.key_for(hole_04_data) == key
+    assert cache.key_for(hole_04_data, optimal=True) != key
+
+    hole_04_data.greens[3][3] ^= 0x01
+    assert cache.key_for(hole_04_data) != key
+
+
+def test_roundtrip_through_disk(tmp_path):
+    """Stored entries survive save and reload."""
+    path = tmp_path / "cache.json"
+    cache = CompressionCache(path)
+    cache.put("abc", {"terrain": b"\x01\x02", "greens": b"", "terrain_greedy_size": 5})
+    cache.save()
+
+    reloaded = CompressionCache(path)
+    assert reloaded.get("abc") == {
+        "terrain": b"\x01\x02",
+        "greens": b"",
+        "terrain_greedy_size": 5,
+    }
+    assert reloaded.get("missing") is None
+    assert (reloaded.hits, reloaded.misses) == (1, 1)
+
+
+def test_corrupt_file_starts_empty(tmp_path):
+    """An unreadable cache file is ignored rather than raising."""
+    path = tmp_path / "cache.json"
+    path.write_text("{not json")
+
+    assert CompressionCache(path).entries == {}
+
+
+def test_writer_reuses_cached_holes(fake_rom, hole_04_data, tmp_path):
+    """A second writer sharing the cache does not recompress unchanged holes."""
+    cache_path = tmp_path / "cache.json"
+
+    cache = CompressionCache(cache_path)
+    first = RomWriter(fake_rom, str(tmp_path / "out.nes"), cache=cache)._compress_hole(
+        hole_04_data
+    )
+    cache.save()
+    assert first["cached"] is False
+
+    cache = CompressionCache(cache_path)
+    writer = RomWriter(fake_rom, str(tmp_path / "out.nes"), cache=cache)
+    second = writer._compress_hole(hole_04_data)
+
+    assert second["cached"] is True
+    for name in ["terrain", "attributes", "greens"]:
+        assert second[name] == first[name]
+
+    hole_04_data.terrain[0][0] ^= 0x01
+    assert writer._compress_hole(hole_04_data)["cached"] is False
@@ -0,0 +1,91 @@
+"""
+Tests for the course corpus scanner.
+
+Tests that packed and JSON courses scan the same and that the vectorized
+accumulators match straightforward per-tile counting.
+"""
+
+import shutil
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from golf.core.neighbor_validator import DIRECTION_STEPS, DIRECTIONS
+from golf.formats.course_pack import pack_course_dir
+from golf.formats.hole_data import HoleData
+from tools.corpus import NeighborCounts, PuttingSurfaceSizes, iter_course, scan_corpus
+from tools.find_neighbor import DIRECTION_OFFSETS, find_neighbor_matches
+
+
+@pytest.fixture
+def course_dir(tmp_path):
+    """A copy of the Japan course, without a pack."""
+    course_dir = tmp_path / "japan"
+    shutil.copytree(Path(__file__).parent.parent.parent / "courses" / "japan", course_dir)
+    (course_dir / "course.pack").unlink(missing_ok=True)
+    return course_dir
+
+
+def test_pack_and_json_scan_the_same(course_dir):
+    """A course scans identically from its pack and its hole files."""
+    from_json = list(iter_course(course_dir))
+    pack_course_dir(course_dir)
+    from_pack = list(iter_course(course_dir))
+
+    assert len(from_pack) == len(from_json) == 18
+    for a, b in zip(from_json, from_pack):
+        assert a.path == b.path
+        assert a.info == b.info
+        for name in ("terrain", "attributes", "greens"):
+            np.testing.assert_array_equal(getattr(a, name), getattr(b, name))
+
+
+def test_neighbor_counts_match_per_tile_counting(course_dir):
+    """Shifted-array counts equal counting each tile's neighbors one by one."""
+    counts = NeighborCounts("terrain")
+    assert scan_corpus([course_dir], [counts]) == 18
+
+    expected = Counter()
+    for hole_file in sorted(course_dir.glob("hole_*.json")):
+        hole = HoleData()
+        hole.load(str(hole_file))
+        terrain = hole.terrain
+        for row in range(len(terrain)):
+            for col in range(len(terrain[row])):
+                for direction, (d_row, d_col) in zip(DIRECTIONS, DIRECTION_STEPS):
+                    n_row, n_col = row + d_row, col + d_col
+                    if 0 <= n_row < len(terrain) and 0 <= n_col < len(terrain[row]):
+                        expected[(terrain[row][col], direction, terrain[n_row][n_col])] += 1
+
+    table = counts.to_json()
+    actual = Counter(
+        {
+            (int(tile, 16), direction, int(neighbor, 16)): count
+            for tile, dirs in table.items()
+            for direction, neighbors in dirs.items()
+            for neighbor, count in neighbors.items()
+        }
+    )
+    assert actual == expected
+
+
+def test_putting_surface_sizes_in_hole_order(course_dir):
+    """Each hole gets one size entry, in hole order."""
+    sizes = PuttingSurfaceSizes()
+    scan_corpus([course_dir], [sizes])
+    assert [hole["hole"] for hole in sizes.holes] == list(range(1, 19))
+    assert all(size > 0 for size in sizes.sizes)
+
+
+@pytest.mark.parametrize("direction", list(DIRECTION_OFFSETS))
+def test_find_neighbor_matches_positions(direction):
+    """Match positions refer to tile1's cell, whichever way the neighbor lies."""
+    terrain = [["00"] * 3 for _ in range(3)]
+    terrain[1][1] = "A1"
+    d_row, d_col = DIRECTION_OFFSETS[direction]
+    terrain[1 + d_row][1 + d_col] = "A4"
+    grid = np.array([[int(tile, 16) for tile in row] for row in terrain])
+
+    assert find_neighbor_matches(grid, "A1", direction, "A4") == [(1, 1)]
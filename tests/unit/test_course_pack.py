@@ -0,0 +1,133 @@
+"""Unit tests for the packed course format."""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from golf.formats import compact_json as json
+from golf.formats.course_pack import (
+    PACK_FILENAME,
+    CoursePack,
+    load_course_holes,
+    pack_course,
+    pack_course_dir,
+)
+from golf.formats.hole_data import HoleData
+
+JAPAN_DIR = Path(__file__).parent.parent.parent / "courses" / "japan"
+
+
+@pytest.fixture
+def course_dir(tmp_path):
+    """Copy of the first three Japan holes."""
+    course_dir = tmp_path / "japan"
+    course_dir.mkdir()
+    shutil.copy(JAPAN_DIR / "course.json", course_dir)
+    for hole_num in range(1, 4):
+        shutil.copy(JAPAN_DIR / f"hole_{hole_num:02d}.json", course_dir)
+    return course_dir
+
+
+def test_json_roundtrip_is_lossless(course_dir):
+    """Hole JSON rebuilt from a pack serializes to the original file text."""
+    pack = CoursePack.open(pack_course_dir(course_dir))
+
+    with open(course_dir / "course.json") as f:
+        assert pack.course == json.load(f)
+    for hole_idx, hole_file in enumerate(sorted(course_dir.glob("hole_*.json"))):
+        assert json.dumps(pack.hole_json(hole_idx), indent=2) == hole_file.read_text()
+
+
+def test_hole_data_matches_json_load(course_dir):
+    """HoleData built from a pack equals HoleData.load() of the JSON file."""
+    pack = CoursePack.open(pack_course_dir(course_dir))
+
+    expected = HoleData()
+    expected.load(str(course_dir / "hole_02.json"))
+    actual = pack.hole_data(1)
+
+    assert actual.terrain == expected.terrain
+    assert actual.terrain_height == expected.terrain_height
+    assert actual.attributes == expected.attributes
+    assert actual.greens == expected.greens
+    assert (actual.green_x, actual.green_y) == (expected.green_x, expected.green_y)
+    assert actual.metadata == expected.metadata
+    assert pack.grid(1, "greens").shape == (24, 24)
+
+
+def test_rejects_lossy_grids():
+    """Grids that would not round-trip exactly are refused."""
+    hole = {"terrain": {"rows": ["a0 a1"]}}
+    with pytest.raises(ValueError, match="canonical"):
+        pack_course([hole])
+
+    hole = {"attributes": {"rows": [[1, 2], [3]]}}
+    with pytest.raises(ValueError, match="lengths"):
+        pack_course([hole])
+
+
+def test_rejects_other_files():
+    """Data without the pack header raises ValueError."""
+    with pytest.raises(ValueError, match="packed course"):
+        CoursePack(b'{"holes": []}')
+
+
+def _mark_pack(course_dir):
+    """Pack the course, then change hole 1's par in the pack only."""
+    pack_path = course_dir / PACK_FILENAME
+    pack_course_dir(course_dir)
+
+    # Make the pack visibly different from the JSON it came from
+    pack = CoursePack.open(pack_path)
+    holes = [pack.hole_json(i) for i in range(len(pack))]
+    holes[0]["par"] = 9
+    pack_path.write_bytes(pack_course(holes, pack.course, pack.sources))
+
+
+def _uses_pack(course_dir) -> bool:
+    return load_course_holes(course_dir)[0].metadata["par"] == 9
+
+
+def test_load_prefers_fresh_pack(course_dir):
+    """An up-to-date pack is used; editing a hole JSON falls back to JSON."""
+    _mark_pack(course_dir)
+    assert _uses_pack(course_dir)
+
+    # A hole file newer than the pack means the pack is stale
+    hole_file = course_dir / "hole_01.json"
+    newer = hole_file.stat().st_mtime + 10
+    os.utime(hole_file, (newer, newer))
+
+    assert not _uses_pack(course_dir)
+
+
+def test_pack_is_stale_when_sources_change(course_dir):
+    """Older files, removed holes and course.json edits all invalidate the pack."""
+    _mark_pack(course_dir)
+
+    # Copied in with an older, preserved modification time
+    hole_file = course_dir / "hole_02.json"
+    older = hole_file.stat().st_mtime - 3600
+    os.utime(hole_file, (older, older))
+    assert not _uses_pack(course_dir)
+
+    _mark_pack(course_dir)
+    (course_dir / "hole_03.json").unlink()
+    assert not _uses_pack(course_dir)
+
+    _mark_pack(course_dir)
+    with open(course_dir / "course.json", "a") as f:
+        f.write("\n")
+    assert not _uses_pack(course_dir)
+
+
+def test_pack_without_hole_files_is_used(course_dir):
+    """A course shipped as just a pack loads from it."""
+    _mark_pack(course_dir)
+    for hole_file in course_dir.glob("hole_*.json"):
+        hole_file.unlink()
+
+    assert _uses_pack(course_dir)
+    assert len(load_course_holes(course_dir)) == 3
@@ -0,0 +1,90 @@
+"""Unit tests for the table-driven decode engine."""
+
+from pathlib import Path
+
+from golf.core.decode_engine import DecodeEngine
+from golf.core.decompressor import DecompressionStats
+
+
+def test_runs_follow_horizontal_transitions():
+    """runs[prev][n] should be the first n transitions starting after prev."""
+    horiz_table = list(range(1, 0xE0)) + [0]  # Each byte transitions to the next
+    engine = DecodeEngine(horiz_table, [0] * 224, [0x10, 2])
+
+    assert engine.runs[0x10][0] == b""
+    assert engine.runs[0x10][3] == bytes([0x11, 0x12, 0x13])
+    assert len(engine.runs[0x10][31]) == 31
+
+
+def test_runs_out_of_table_produce_zero():
+    """Bytes outside the horizontal table yield 0x00 and the chain continues from 0."""
+    horiz_table = [0x05, 0x00, 0x00, 0x00, 0x00, 0x07]
+    engine = DecodeEngine(horiz_table, [], [])
+
+    # 0xF0 is outside the table -> 0x00, then 0x00 -> 0x05, then 0x05 -> 0x07
+    assert engine.runs[0xF0][3] == bytes([0x00, 0x05, 0x07])
+
+
+def test_dict_expansion_precomputed():
+    """Dictionary codes expand to first_byte followed by repeat_count transitions."""
+    horiz_table = list(range(1, 0xE0)) + [0]
+    engine = DecodeEngine(horiz_table, [], [0x20, 0, 0x40, 2])
+
+    assert engine.dict_expansions[0] == bytes([0x20])
+    assert engine.dict_expansions[1] == bytes([0x40, 0x41, 0x42])
+    assert engine.expand(bytes([0xE1, 0x02])) == bytes([0x40, 0x41, 0x42, 0x43, 0x44])
+
+
+def test_leading_repeat_code(terrain_decompressor):
+    """A repeat code with no previous byte starts from 0x00."""
+    engine = terrain_decompressor.engine
+    horiz_table = terrain_decompressor.horiz_table
+
+    assert engine.expand(bytes([0x02])) == bytes([0x00, horiz_table[0]])
+
+
+def test_limit_stops_reading_input(greens_decompressor):
+    """Greens decoding stops consuming input once 576 tiles are produced."""
+    rows = greens_decompressor.decompress(bytes([0x25] * 700))
+
+    assert len(rows) == 24
+    assert all(len(row) == 24 for row in rows)
+
+
+def test_instrumented_path_matches_fast_path(terrain_decompressor, greens_decompressor):
+    """Decoding with and without statistics must produce the same tiles."""
+    from golf.core.compressor import GreensCompressor, TerrainCompressor
+    from golf.formats.hole_data import HoleData
+
+    terrain_compressor = TerrainCompressor()
+    greens_compressor = GreensCompressor()
+    course_dir = Path(__file__).parent.parent.parent / "courses" / "japan"
+
+    for hole_file in sorted(course_dir.glob("hole_*.json")):
+        hole = HoleData()
+        hole.load(str(hole_file))
+
+        terrain = terrain_compressor.compress(hole.terrain[: hole.terrain_height])
+        stats = DecompressionStats()
+        assert terrain_decompressor.decompress(terrain) == (
+            terrain_decompressor.decompress(terrain, stats=stats)
+        )
+        assert stats.horiz_transitions or stats.repeat_codes or stats.dict_codes
+
+        greens = greens_compressor.compress(hole.greens)
+        assert greens_decompressor.decompress(greens) == (
+            greens_decompressor.decompress(greens, stats=DecompressionStats())
+        )
+
+
+def test_engine_recompiled_when_tables_change(terrain_decompressor):
+    """Editing a table after the engine is built must be picked up."""
+    first_engine = terrain_decompressor.engine
+    assert terrain_decompressor.engine is first_engine
+
+    terrain_decompressor.horiz_table = list(terrain_decompressor.horiz_table)
+    terrain_decompressor.horiz_table[0x25] = 0x27
+
+    engine = terrain_decompressor.engine
+    assert engine is not first_engine
+    assert engine.runs[0x25][1] == bytes([0x27])
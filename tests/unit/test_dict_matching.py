@@ -63,3 +63,38 @@ def test_end_of_stream(mock_minimal_terrain_tables):
     code, length = result
     assert code == "0xE0"
     assert length == 4
+
+
+def test_trie_longest_match():
+    """DictionaryTrie returns the longest matching sequence."""
+    from golf.core.compressor import DictionaryTrie
+
+    trie = DictionaryTrie({"000000000000": ["0xE1"], "0000": ["0xE0"]})
+
+    assert trie.match([0x00] * 6 + [0x25], 0) == ("0xE1", 6)
+    assert trie.match([0x00, 0x00, 0x00, 0x25], 0) == ("0xE0", 2)
+    assert trie.match([0x25, 0x00], 0) is None
+    assert trie.match([0x25, 0x00], 1) is None
+
+
+def test_trie_matches_reference_on_real_tables(compression_tables, hole_01_data):
+    """DictionaryTrie agrees with match_dict_sequence at every stream position."""
+    from golf.core.compressor import (
+        DictionaryTrie,
+        detect_vertical_fills,
+        match_dict_sequence,
+    )
+
+    for category in ["terrain", "greens"]:
+        tables = compression_tables[category]
+        reverse_lookup = tables["reverse_dict_lookup"]
+        trie = DictionaryTrie(reverse_lookup)
+
+        rows = hole_01_data.terrain if category == "terrain" else hole_01_data.greens
+        marked = detect_vertical_fills(rows, tables["vertical_table"])
+        byte_stream = [b for row in marked for b in row]
+
+        for pos in range(len(byte_stream)):
+            assert trie.match(byte_stream, pos) == match_dict_sequence(
+                byte_stream, pos, reverse_lookup
+            )
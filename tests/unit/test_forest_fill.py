@@ -0,0 +1,77 @@
+"""
+Tests for the forest fill solver.
+
+Tests that auto-selection keeps the best orientation's fill, that
+pre-assigned forest tiles survive, and that filled edges match.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from editor.controllers.better_forest_fill import (
+    DIRECTION_DELTAS,
+    FAMILY_TILES,
+    INNER_BORDER,
+    OPPOSITE,
+    PLACEHOLDER_TILE,
+    TILE_EXERTIONS,
+    BetterForestFiller,
+    ForestFillRegion,
+    _RegionLayout,
+)
+from golf.formats.hole_data import HoleData
+
+
+@pytest.fixture
+def terrain():
+    hole_data = HoleData()
+    hole_data.load(
+        str(Path(__file__).parent.parent / "fixtures" / "hole_18_with_placeholders.json")
+    )
+    return hole_data.terrain
+
+
+def test_auto_orientation_keeps_best_fill(terrain):
+    """The auto fill is the best-ranked forced orientation's fill."""
+    filler = BetterForestFiller()
+    for region in filler.detect_regions(terrain):
+        layout = _RegionLayout(region, terrain)
+        fills = [filler._fill_with_orientation(layout, o) for o in FAMILY_TILES]
+        best = min(fills, key=lambda fill: fill.rank())
+
+        assert filler.fill_region(terrain, region) == best.assigned
+        assert filler.fill_region(terrain, region, best.orientation) == best.assigned
+
+
+def test_pre_assigned_forest_is_kept():
+    """Existing forest tiles in a region are returned unchanged."""
+    terrain = [[0x00] * 6 for _ in range(6)]
+    for row in range(1, 5):
+        for col in range(1, 5):
+            terrain[row][col] = PLACEHOLDER_TILE
+    terrain[2][2] = 0xA0
+    region = ForestFillRegion({(row, col) for row in range(1, 5) for col in range(1, 5)})
+
+    assigned = BetterForestFiller().fill_region(terrain, region)
+
+    assert set(assigned) == region.cells
+    assert assigned[(2, 2)] == 0xA0
+
+
+def test_filled_edges_match(terrain):
+    """Adjacent forest tiles in a fill exert the same trees on shared edges."""
+    filler = BetterForestFiller()
+    for region in filler.detect_regions(terrain):
+        assigned = filler.fill_region(terrain, region)
+        for (row, col), tile in assigned.items():
+            if tile == INNER_BORDER:
+                continue
+            for direction, (dr, dc) in DIRECTION_DELTAS.items():
+                neighbor = assigned.get((row + dr, col + dc))
+                if neighbor is None or neighbor == INNER_BORDER:
+                    continue
+                assert (
+                    TILE_EXERTIONS[tile][direction]
+                    == TILE_EXERTIONS[neighbor][OPPOSITE[direction]]
+                )
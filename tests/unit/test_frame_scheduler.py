@@ -0,0 +1,73 @@
+"""
+Tests for the editor frame scheduler.
+
+Tests how events mark panels dirty.
+"""
+
+import pygame
+import pytest
+from pygame import Rect
+
+from editor.controllers.frame_scheduler import PANELS, FrameScheduler
+
+
+@pytest.fixture
+def scheduler():
+    """Scheduler with a simple layout and nothing pending."""
+    scheduler = FrameScheduler()
+    scheduler.set_panel_rects(
+        {
+            "sidebar": Rect(0, 40, 400, 100),
+            "tool_picker": Rect(700, 40, 100, 100),
+            "canvas": Rect(400, 40, 300, 100),
+            "toolbar": Rect(0, 0, 800, 40),
+            "status": Rect(0, 140, 800, 30),
+        }
+    )
+    scheduler.take_dirty()
+    return scheduler
+
+
+def _motion(pos, buttons=(0, 0, 0)):
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=buttons)
+
+
+def test_starts_fully_dirty():
+    """The first frame draws everything."""
+    assert FrameScheduler().take_dirty() == list(PANELS)
+
+
+def test_no_events_is_idle(scheduler):
+    """Nothing is redrawn without events."""
+    scheduler.note_events([])
+    assert not scheduler.has_dirty
+    assert scheduler.take_dirty() == []
+
+
+def test_motion_marks_panels_under_cursor(scheduler):
+    """Moving the mouse redraws the old and new hovered panels."""
+    scheduler.note_events([_motion((750, 50))])
+    assert scheduler.take_dirty() == ["tool_picker"]
+
+    scheduler.note_events([_motion((500, 50))])
+    assert scheduler.take_dirty() == ["tool_picker", "canvas", "status"]
+
+
+def test_picker_hover_marks_canvas(scheduler):
+    """Hovering the tile picker also redraws the canvas highlights."""
+    scheduler.note_events([_motion((10, 50))])
+    assert scheduler.take_dirty() == ["sidebar", "canvas", "status"]
+
+
+@pytest.mark.parametrize(
+    "event",
+    [
+        pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a, mod=0),
+        pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(500, 50), button=1),
+        _motion((500, 50), buttons=(1, 0, 0)),
+    ],
+)
+def test_other_events_mark_everything(scheduler, event):
+    """Keys, clicks and drags redraw the whole window."""
+    scheduler.note_events([event])
+    assert scheduler.take_dirty() == list(PANELS)
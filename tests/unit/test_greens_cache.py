@@ -0,0 +1,97 @@
+"""
+Tests for the putting green overlay mask and the greens surface cache.
+
+Tests that the cached overlay and greens tiles draw the same pixels as
+drawing cell by cell, and that edits to the greens are picked up.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pygame
+import pytest
+from pygame import Rect
+
+from editor.controllers.highlight_state import HighlightState
+from editor.controllers.view_state import ViewState
+from editor.core.constants import GREEN_OVERLAY_COLOR
+from editor.core.pygame_rendering import Tileset
+from editor.rendering.greens_cache import GreensSurfaceCache
+from editor.rendering.greens_renderer import GreensRenderer
+from editor.rendering.render_context import RenderContext
+from editor.rendering.sprite_renderer import SpriteRenderer
+from editor.tools.transform_tool import TransformToolState
+from golf.formats.hole_data import HoleData
+from golf.rendering.green_overlay import green_overlay_mask, mask_bounds
+
+
+@pytest.fixture
+def hole_data():
+    hole = HoleData()
+    hole.load(str(Path(__file__).parent.parent.parent / "courses" / "japan" / "hole_01.json"))
+    return hole
+
+
+def test_mask_and_bounds():
+    """Cells at or above the threshold are marked; short rows are padded."""
+    mask = green_overlay_mask([[0x00, 0x30, 0x2F], [0x40], [0x00, 0x00, 0x00, 0x31]])
+    assert mask.tolist() == [
+        [False, True, False, False],
+        [True, False, False, False],
+        [False, False, False, True],
+    ]
+    assert mask_bounds(mask) == (0, 0, 4, 3)
+    assert mask_bounds(np.zeros((2, 2), dtype=bool)) is None
+
+
+def _reference_overlay(screen, view_state, hole_data):
+    """Draw a rect per on-green cell."""
+    scale = view_state.scale
+    origin_x = view_state.canvas_rect.x + hole_data.green_x * scale - view_state.offset_x
+    origin_y = view_state.canvas_rect.y + hole_data.green_y * scale - view_state.offset_y
+    for gy, row in enumerate(hole_data.greens):
+        for gx, value in enumerate(row):
+            if value >= 0x30:
+                x = origin_x + gx * scale
+                y = origin_y + gy * scale
+                pygame.draw.rect(screen, GREEN_OVERLAY_COLOR, (x, y, scale, scale))
+
+
+@pytest.mark.parametrize("scale", [1, 3])
+def test_overlay_matches_per_cell_drawing(display, hole_data, scale):
+    """The cached overlay covers exactly the on-green cells."""
+    offset_x = hole_data.green_x * scale - 20
+    offset_y = hole_data.green_y * scale - 20
+    view_state = ViewState(Rect(10, 10, 600, 460), offset_x, offset_y, scale)
+    cache = GreensSurfaceCache()
+
+    screen = pygame.Surface((640, 480)).convert()
+    SpriteRenderer.render_green_overlay(screen, view_state, hole_data, None, cache)
+    expected = pygame.Surface((640, 480)).convert()
+    _reference_overlay(expected, view_state, hole_data)
+    assert (pygame.surfarray.array3d(screen) == pygame.surfarray.array3d(expected)).all()
+
+
+def _render_greens(tileset, hole_data, cache, scale):
+    """Render the greens view and return the canvas pixels."""
+    screen = pygame.Surface((640, 480)).convert()
+    canvas_rect = Rect(40, 30, 560, 400)
+    view_state = ViewState(canvas_rect, 25, 60, scale)
+    render_ctx = RenderContext(tileset, {}, "greens", greens_cache=cache)
+    highlight_state = HighlightState()
+    highlight_state.transform_state = TransformToolState()
+    GreensRenderer.render(screen, view_state, hole_data, render_ctx, highlight_state)
+    return pygame.surfarray.array3d(screen.subsurface(canvas_rect))
+
+
+def test_cached_greens_match_per_tile(display, hole_data):
+    """Composited greens match blitting each tile, before and after edits."""
+    tileset = Tileset(str(Path(__file__).parent.parent.parent / "data" / "green-ram.bin"))
+    cache = GreensSurfaceCache()
+    cached = _render_greens(tileset, hole_data, cache, 2)
+    assert (cached == _render_greens(tileset, hole_data, None, 2)).all()
+
+    hole_data.set_greens_tile(5, 5, 0x29)
+    hole_data.set_greens_tile(6, 7, 0x100)
+    cached = _render_greens(tileset, hole_data, cache, 2)
+    assert (cached == _render_greens(tileset, hole_data, None, 2)).all()
@@ -0,0 +1,84 @@
+"""Unit tests for bulk hole metadata decoding and encoding."""
+
+import random
+
+import numpy as np
+import pytest
+
+from golf.core.decompressor import bcd_to_int
+from golf.core.hole_metadata import HoleMetadataTable, decode_bcd, encode_distance_bcd
+from golf.core.packing import int_to_bcd
+from golf.core.rom_reader import (
+    INES_HEADER_SIZE,
+    PRG_BANK_SIZE,
+    TABLE_DISTANCE_1,
+    TABLE_DISTANCE_10,
+    TABLE_DISTANCE_100,
+    TOTAL_HOLES,
+)
+
+
+def _fixed(cpu_addr):
+    return INES_HEADER_SIZE + 15 * PRG_BANK_SIZE + cpu_addr - 0xC000
+
+
+@pytest.fixture
+def rom_data():
+    """Random 16-bank ROM image with valid BCD distances."""
+    rng = random.Random(9)
+    data = bytearray(rng.randrange(256) for _ in range(INES_HEADER_SIZE + 16 * PRG_BANK_SIZE))
+    for table in (TABLE_DISTANCE_100, TABLE_DISTANCE_10, TABLE_DISTANCE_1):
+        for i in range(TOTAL_HOLES):
+            data[_fixed(table) + i] = rng.randrange(10)
+    return data
+
+
+def test_bcd_matches_scalar_helpers():
+    """Vectorized BCD agrees with bcd_to_int and int_to_bcd."""
+    distances = np.arange(1000)
+    hundreds, tens, ones = encode_distance_bcd(distances)
+
+    for d in [0, 7, 99, 456, 999]:
+        assert (hundreds[d], tens[d], ones[d]) == int_to_bcd(d)
+
+    bcd_bytes = np.array([0x00, 0x09, 0x12, 0x99])
+    assert decode_bcd(bcd_bytes).tolist() == [
+        bcd_to_int(0, 0, value) for value in bcd_bytes.tolist()
+    ]
+
+    with pytest.raises(ValueError, match="1000"):
+        encode_distance_bcd(np.array([5, 1000]))
+
+
+def test_write_back_is_lossless(rom_data):
+    """Decoding then writing all tables leaves the ROM unchanged."""
+    original = bytes(rom_data)
+
+    HoleMetadataTable.from_buffer(rom_data, INES_HEADER_SIZE).write_to(
+        rom_data, INES_HEADER_SIZE
+    )
+
+    assert bytes(rom_data) == original
+
+
+def test_set_hole_roundtrips_through_json(rom_data, hole_01_data):
+    """A hole set from HoleData reads back as the same JSON metadata."""
+    table = HoleMetadataTable.from_buffer(rom_data, INES_HEADER_SIZE)
+    table.set_hole(20, hole_01_data)
+    table.write_to(rom_data, INES_HEADER_SIZE)
+
+    hole = HoleMetadataTable.from_buffer(rom_data, INES_HEADER_SIZE).hole_json(20)
+
+    for key in ["par", "distance", "handicap", "scroll_limit", "tee"]:
+        assert hole[key] == hole_01_data.metadata[key]
+    assert hole["green"] == {"x": hole_01_data.green_x, "y": hole_01_data.green_y}
+    assert hole["flag_positions"] == hole_01_data.metadata["flag_positions"]
+
+
+def test_set_hole_rejects_out_of_range(rom_data, hole_01_data):
+    """Values that do not fit a table byte raise ValueError."""
+    table = HoleMetadataTable.from_buffer(rom_data, INES_HEADER_SIZE)
+    hole_01_data.metadata["par"] = 300
+
+    with pytest.raises(ValueError, match="300"):
+        table.set_hole(0, hole_01_data)
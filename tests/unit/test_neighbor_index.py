@@ -0,0 +1,101 @@
+"""
+Tests for the find_neighbor pattern index.
+
+Tests index lookups against a direct scan, and that refreshing only
+re-indexes changed hole files.
+"""
+
+import json
+import random
+import shutil
+from pathlib import Path
+
+import pytest
+
+from tools.corpus import load_hole_file
+from tools.find_neighbor import DIRECTION_OFFSETS, NeighborIndex, find_neighbor_matches
+
+
+@pytest.fixture
+def courses_dir(tmp_path):
+    """A copy of the Japan course under a courses directory."""
+    courses_dir = tmp_path / "courses"
+    shutil.copytree(Path(__file__).parent.parent.parent / "courses" / "japan", courses_dir / "japan")
+    return courses_dir
+
+
+def _scan(courses_dir, tile1, direction, tile2):
+    """Direct search, as find_neighbor did before the index."""
+    matches = {}
+    for hole_file in sorted(courses_dir.glob("*/hole_*.json")):
+        cells = find_neighbor_matches(
+            load_hole_file(hole_file).terrain, f"{tile1:02X}", direction, f"{tile2:02X}"
+        )
+        if cells:
+            matches[hole_file.relative_to(courses_dir).as_posix()] = cells
+    return matches
+
+
+def test_lookups_match_direct_scan(courses_dir):
+    """Every queried triple finds the same holes and cells as a scan."""
+    index = NeighborIndex(courses_dir)
+    index.refresh()
+
+    terrain = load_hole_file(courses_dir / "japan" / "hole_03.json").terrain
+    rng = random.Random(20)
+    for _ in range(50):
+        row = rng.randrange(1, terrain.shape[0] - 1)
+        col = rng.randrange(1, terrain.shape[1] - 1)
+        direction = rng.choice(list(DIRECTION_OFFSETS))
+        d_row, d_col = DIRECTION_OFFSETS[direction]
+        tile1, tile2 = int(terrain[row, col]), int(terrain[row + d_row, col + d_col])
+        assert index.find(tile1, direction, tile2) == _scan(courses_dir, tile1, direction, tile2)
+
+    assert index.find(0xFF, "N", 0xFF) == {}
+
+
+@pytest.mark.parametrize("tiles", [(0x1A0, 0xA4), (0xA1, 0x100), (-1, 0xA4)])
+def test_find_rejects_tiles_outside_byte_range(courses_dir, tiles):
+    """Tiles above FF would alias other (direction, tile) codes."""
+    index = NeighborIndex(courses_dir)
+    index.refresh()
+
+    with pytest.raises(ValueError, match="out of range"):
+        index.find(tiles[0], "S", tiles[1])
+
+
+def test_saved_index_is_reused(courses_dir):
+    """A second run loads the saved entries instead of re-indexing."""
+    index = NeighborIndex(courses_dir)
+    index.refresh()
+    index.save()
+    assert index.reindexed == 18
+
+    reloaded = NeighborIndex(courses_dir)
+    reloaded.refresh()
+    assert reloaded.reindexed == 0
+    assert reloaded.find(0xA1, "S", 0xA4) == index.find(0xA1, "S", 0xA4)
+
+
+def test_refresh_reindexes_changed_holes(courses_dir):
+    """Editing, adding and removing hole files updates only those entries."""
+    index = NeighborIndex(courses_dir)
+    index.refresh()
+    index.save()
+
+    hole_path = courses_dir / "japan" / "hole_02.json"
+    hole = json.loads(hole_path.read_text())
+    row = hole["terrain"]["rows"][4].split()
+    row[3], row[4] = "FE", "FF"  # Pair that appears nowhere else
+    hole["terrain"]["rows"][4] = " ".join(row)
+    hole_path.write_text(json.dumps(hole))
+    shutil.copy(courses_dir / "japan" / "hole_01.json", courses_dir / "japan" / "hole_19.json")
+    (courses_dir / "japan" / "hole_18.json").unlink()
+
+    index = NeighborIndex(courses_dir)
+    index.refresh()
+
+    assert index.reindexed == 2
+    assert index.find(0xFE, "E", 0xFF) == {"japan/hole_02.json": [(4, 3)]}
+    assert "japan/hole_18.json" not in index.holes
+    assert index.find(0xA1, "S", 0xA4) == _scan(courses_dir, 0xA1, "S", 0xA4)
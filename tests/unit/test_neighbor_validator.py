@@ -0,0 +1,92 @@
+"""
+Tests for terrain neighbor validation.
+
+Tests the dense adjacency tables and incremental re-checking against a
+straightforward per-tile check.
+"""
+
+import random
+from pathlib import Path
+
+import pytest
+
+from golf.core.neighbor_validator import (
+    DIRECTION_STEPS,
+    DIRECTIONS,
+    LiveInvalidTiles,
+    TerrainNeighborValidator,
+)
+from golf.formats.hole_data import HoleData
+
+
+@pytest.fixture(scope="module")
+def validator():
+    return TerrainNeighborValidator()
+
+
+@pytest.fixture
+def terrain():
+    hole = HoleData()
+    hole.load(str(Path(__file__).parent.parent.parent / "courses" / "japan" / "hole_05.json"))
+    return hole.terrain
+
+
+def _reference_invalid(validator, terrain):
+    """Per-tile check using the neighbor sets directly."""
+    invalid = set()
+    height, width = len(terrain), len(terrain[0])
+    for row in range(height):
+        for col in range(width):
+            tile = terrain[row][col]
+            if tile not in validator.neighbors:
+                continue
+            for direction, (d_row, d_col) in zip(DIRECTIONS, DIRECTION_STEPS):
+                n_row, n_col = row + d_row, col + d_col
+                if 0 <= n_row < height and 0 <= n_col < width:
+                    if terrain[n_row][n_col] not in validator.neighbors[tile][direction]:
+                        invalid.add((row, col))
+    return invalid
+
+
+def test_full_check_matches_neighbor_sets(validator, terrain):
+    """Whole-grid validation agrees with the neighbor sets."""
+    terrain[3][4] = 0x100  # Editor placeholder
+    terrain[7][10] = 0x00
+    assert validator.get_invalid_tiles(terrain) == _reference_invalid(validator, terrain)
+
+
+def test_is_valid_neighbor_unknown_tile_allows_everything(validator):
+    """Tiles missing from the data accept any neighbor."""
+    unknown = next(t for t in range(256) if t not in validator.neighbors)
+    assert validator.is_valid_neighbor(unknown, 0x100, "up")
+
+
+def test_live_set_tracks_random_edits(validator, terrain):
+    """Incremental updates match a full re-check after every edit."""
+    live = LiveInvalidTiles(validator)
+    live.update(terrain)
+
+    rng = random.Random(5)
+    for _ in range(200):
+        row = rng.randrange(len(terrain))
+        col = rng.randrange(len(terrain[0]))
+        terrain[row][col] = rng.choice([0x100, *range(256)])
+        assert live.update(terrain) == _reference_invalid(validator, terrain)
+
+
+def test_live_set_with_known_changed_cells(validator, terrain):
+    """Passing the changed cells skips the terrain comparison."""
+    live = LiveInvalidTiles(validator)
+    live.update(terrain)
+
+    terrain[5][5] = 0x00
+    assert live.update(terrain, [(5, 5)]) == _reference_invalid(validator, terrain)
+
+
+def test_live_set_rechecks_after_row_insert(validator, terrain):
+    """A shape change re-checks the whole grid."""
+    live = LiveInvalidTiles(validator)
+    live.update(terrain)
+
+    terrain.insert(0, [0x00] * len(terrain[0]))
+    assert live.update(terrain) == _reference_invalid(validator, terrain)
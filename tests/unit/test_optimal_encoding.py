@@ -0,0 +1,174 @@
+"""Unit tests for shortest-path (optimal) compression."""
+
+import random
+from collections import deque
+
+import pytest
+
+
+def _shortest_encoding_length(byte_stream, engine):
+    """Brute-force BFS over every possible code byte using decoder semantics."""
+    stream = bytes(byte_stream)
+    seen = {0: 0}
+    queue = deque([0])
+    while queue:
+        pos = queue.popleft()
+        if pos == len(stream):
+            return seen[pos]
+        for code in range(256):
+            if code >= 0xE0:
+                expansion = engine.dict_expansions[code - 0xE0]
+            elif code == 0x00 or code >= 0x20:
+                expansion = bytes([code])
+            elif pos:
+                expansion = engine.runs[stream[pos - 1]][code]
+            else:
+                expansion = engine.leading_runs[code]
+            end = pos + len(expansion)
+            if end not in seen and stream.startswith(expansion, pos):
+                seen[end] = seen[pos] + 1
+                queue.append(end)
+    return None
+
+
+def test_optimal_matches_brute_force(terrain_decompressor):
+    """Optimal encoding length equals a BFS over all code bytes."""
+    from golf.core.compressor import TerrainCompressor, encode_optimal
+
+    compressor = TerrainCompressor()
+    engine = terrain_decompressor.engine
+    horiz_table = compressor.horiz_table
+    rng = random.Random(4)
+
+    for _ in range(50):
+        # Mix literals, zero runs and horizontal transition chains
+        stream = []
+        while len(stream) < 40:
+            kind = rng.randrange(3)
+            if kind == 0:
+                stream.append(rng.choice([0x25, 0x27, 0xA0, 0xDF, 0x3E]))
+            elif kind == 1:
+                stream.extend([0x00] * rng.randint(1, 8))
+            else:
+                current = stream[-1] if stream else 0xA0
+                for _ in range(rng.randint(1, 6)):
+                    current = horiz_table[current] if current < len(horiz_table) else 0
+                    stream.append(current)
+
+        encoded = encode_optimal(stream, horiz_table, compressor.dict_trie)
+
+        assert len(encoded) == _shortest_encoding_length(stream, engine)
+        assert bytes(engine.expand(encoded)) == bytes(stream)
+
+
+def _shortest_grid_encoding_length(tiles, row_width, engine, vert_table):
+    """Brute-force BFS over (position, previous byte) for a grid of tiles.
+
+    A cell below row 0 may be expanded as its tile or, when the tile above
+    predicts it, as the 0x00 marker.
+    """
+    allowed = []
+    for i, tile in enumerate(tiles):
+        options = {tile}
+        if i >= row_width and vert_table[tiles[i - row_width]] == tile:
+            options.add(0x00)
+        allowed.append(options)
+
+    def fits(expansion, pos):
+        return pos + len(expansion) <= len(tiles) and all(
+            byte in allowed[pos + k] for k, byte in enumerate(expansion)
+        )
+
+    seen: dict[tuple[int, int | None], int] = {(0, None): 0}
+    queue: deque[tuple[int, int | None]] = deque([(0, None)])
+    while queue:
+        pos, prev = queue.popleft()
+        if pos == len(tiles):
+            return seen[pos, prev]
+        for code in range(256):
+            if code >= 0xE0:
+                expansion = engine.dict_expansions[code - 0xE0]
+            elif code == 0x00 or code >= 0x20:
+                expansion = bytes([code])
+            elif prev is not None:
+                expansion = engine.runs[prev][code]
+            else:
+                expansion = engine.leading_runs[code]
+            state = (pos + len(expansion), expansion[-1] if expansion else prev)
+            if expansion and state not in seen and fits(expansion, pos):
+                seen[state] = seen[pos, prev] + 1
+                queue.append(state)
+    return None
+
+
+def test_optimal_grid_matches_brute_force(terrain_decompressor):
+    """Choosing marker or tile for predicted cells is as short as a full BFS."""
+    from golf.core.compressor import TerrainCompressor
+
+    compressor = TerrainCompressor()
+    compressor.row_width = 4
+    engine = terrain_decompressor.engine
+    horiz_table = compressor.horiz_table
+    vert_table = compressor.vert_table
+    rng = random.Random(7)
+
+    for _ in range(40):
+        # Rows continue the row above, follow horizontal chains, or are literals;
+        # 0x00 never appears as a tile so it always means a vertical fill
+        rows = []
+        for row_idx in range(3):
+            row = []
+            for col in range(4):
+                choices = [rng.choice([0x25, 0x27, 0xA0, 0xA4, 0x3E])]
+                if row:
+                    choices.append(horiz_table[row[-1]])
+                if row_idx:
+                    choices.append(vert_table[rows[-1][col]])
+                tile = rng.choice(choices)
+                row.append(tile if 0x20 <= tile < 0xE0 else 0xA0)
+            rows.append(row)
+
+        encoded = compressor.compress(rows, optimal=True)
+        tiles = [tile for row in rows for tile in row]
+
+        assert terrain_decompressor.decompress(encoded, row_width=4) == rows
+        assert len(encoded) == _shortest_grid_encoding_length(
+            tiles, 4, engine, vert_table
+        )
+
+
+def test_optimal_roundtrip_never_longer(hole_01_data, terrain_decompressor):
+    """Optimal terrain output decodes to the original and is never longer."""
+    from golf.core.compressor import TerrainCompressor
+
+    rows = hole_01_data.terrain[: hole_01_data.terrain_height]
+    compressor = TerrainCompressor()
+
+    greedy = compressor.compress(rows)
+    optimal = compressor.compress(rows, optimal=True)
+
+    assert len(optimal) <= len(greedy)
+    assert terrain_decompressor.decompress(optimal) == rows
+
+
+def test_optimal_greens_roundtrip(hole_04_data, greens_decompressor):
+    """Optimal greens output decodes to the original and is never longer."""
+    from golf.core.compressor import GreensCompressor
+
+    compressor = GreensCompressor()
+
+    greedy = compressor.compress(hole_04_data.greens)
+    optimal = compressor.compress(hole_04_data.greens, optimal=True)
+
+    assert len(optimal) <= len(greedy)
+    assert greens_decompressor.decompress(optimal) == hole_04_data.greens
+
+
+def test_optimal_rejects_unencodable_byte():
+    """A byte that is neither literal nor reachable by a code raises ValueError."""
+    from golf.core.compressor import DictionaryTrie, encode_optimal
+
+    horiz_table = list(range(0xE0))  # Identity: transitions never change a byte
+
+    with pytest.raises(ValueError, match="0xE5"):
+        encode_optimal([0x25, 0xE5], horiz_table, DictionaryTrie({}))
@@ -0,0 +1,109 @@
+"""
+Tests for the cached tile picker and stamp browser surfaces.
+
+Tests that cached banks and stamp pages are reused while nothing changes,
+redrawn when the palette or stamps change, and that the highlight overlays
+draw the same pixels as a freshly built panel.
+"""
+
+import pygame
+import pytest
+from pygame import Rect
+
+from editor.controllers.stamp_library import StampLibrary
+from editor.rendering.font_cache import get_font
+from editor.ui.pickers import GreensTilePicker, TilePicker
+from editor.ui.pickers.tile_banks import TileBank
+from editor.ui.stamp_browser import StampBrowser
+
+PICKER_RECT = Rect(0, 40, 250, 600)
+
+
+def _render(panel, **kwargs):
+    """Render a panel and return its pixels."""
+    screen = pygame.Surface((640, 700)).convert()
+    panel.render(screen, **kwargs)
+    return pygame.surfarray.array3d(screen)
+
+
+@pytest.mark.parametrize("picker_class", [TilePicker, GreensTilePicker])
+def test_selection_change_matches_fresh_picker(tileset, picker_class):
+    """Moving the selection redraws only the highlight, with the same result."""
+    picker = picker_class(tileset, PICKER_RECT)
+    _render(picker, palette_idx=2)
+    surfaces = [bank._surface for bank in picker.banks]
+
+    picker.selected_tile = picker.banks[-1].tile_positions()[0][0]
+    picker.scroll_y = 40
+    pixels = _render(picker, palette_idx=2)
+
+    assert [bank._surface for bank in picker.banks] == surfaces
+    fresh = picker_class(tileset, PICKER_RECT)
+    fresh.selected_tile = picker.selected_tile
+    fresh.scroll_y = 40
+    assert (pixels == _render(fresh, palette_idx=2)).all()
+
+
+def test_palette_change_redraws_banks(tileset):
+    """Banks are redrawn for a new palette and reused otherwise."""
+    picker = TilePicker(tileset, PICKER_RECT)
+    _render(picker, palette_idx=1)
+    surface = picker.banks[1]._surface
+
+    _render(picker, palette_idx=1)
+    assert picker.banks[1]._surface is surface
+
+    _render(picker, palette_idx=3)
+    assert picker.banks[1]._surface is not surface
+
+
+def test_incomplete_bank_fails_at_construction():
+    """A bank that doesn't lay out its tiles can't be created."""
+
+    class HeightOnlyBank(TileBank):
+        def get_height(self) -> int:
+            return 0
+
+    with pytest.raises(TypeError, match="tile_positions"):
+        HeightOnlyBank("Rough", 8, 2)  # pyright: ignore[reportAbstractUsage]
+
+
+@pytest.fixture
+def stamp_library(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return StampLibrary()
+
+
+def _browser(tileset, stamp_library):
+    browser = StampBrowser(PICKER_RECT, stamp_library, get_font("monospace", 12), tileset)
+    browser.current_category = "teebox"
+    return browser
+
+
+def test_stamp_highlights_match_fresh_browser(tileset, stamp_library):
+    """Selecting and hovering stamps keeps the cached page."""
+    browser = _browser(tileset, stamp_library)
+    _render(browser, palette_idx=1)
+    page = browser._page_cache[0]
+
+    stamps = stamp_library.get_stamps_by_path("teebox")
+    browser.selected_stamp_id = stamps[0].metadata.id
+    browser.hovered_stamp_id = stamps[-1].metadata.id
+    pixels = _render(browser, palette_idx=1)
+    assert browser._page_cache[0] is page
+
+    fresh = _browser(tileset, stamp_library)
+    fresh.selected_stamp_id = browser.selected_stamp_id
+    fresh.hovered_stamp_id = browser.hovered_stamp_id
+    assert (pixels == _render(fresh, palette_idx=1)).all()
+
+
+def test_stamp_library_change_redraws_pages(tileset, stamp_library):
+    """Loading, saving or deleting stamps invalidates the pages."""
+    browser = _browser(tileset, stamp_library)
+    _render(browser, palette_idx=1)
+    page = browser._page_cache[0]
+
+    stamp_library.load_stamps()
+    _render(browser, palette_idx=1)
+    assert browser._page_cache[0] is not page
@@ -0,0 +1,55 @@
+"""Unit tests for the PIL hole renderer."""
+
+from pathlib import Path
+
+from golf.core.chr_tile import TilesetData
+from golf.core.palettes import GREEN_OVERLAY_COLOR, GREEN_TILE_THRESHOLD, PALETTES
+from golf.formats import compact_json as json
+from golf.rendering.pil_renderer import render_hole_to_image
+
+DATA_DIR = Path(__file__).parent.parent.parent / "data"
+HOLE_PATH = Path(__file__).parent.parent.parent / "courses" / "us" / "hole_07.json"
+
+
+def _reference_pixel(hole, tileset, x, y):
+    """Color of one pixel, computed straight from the hole data."""
+    tile_row, tile_col = y // 8, x // 8
+    tile_idx = int(hole["terrain"]["rows"][tile_row].split()[tile_col], 16)
+    palette = PALETTES[hole["attributes"]["rows"][tile_row // 2][tile_col // 2]]
+    color = palette[tileset.decode_tile(tile_idx)[y % 8][x % 8]]
+
+    gx, gy = x - hole["green"]["x"], y - hole["green"]["y"]
+    if 0 <= gy < len(hole["greens"]["rows"]) and 0 <= gx < 24:
+        if int(hole["greens"]["rows"][gy].split()[gx], 16) >= GREEN_TILE_THRESHOLD:
+            color = GREEN_OVERLAY_COLOR
+    return color
+
+
+def test_frame_matches_per_pixel_reference():
+    """Every pixel of the composed frame matches a per-pixel lookup."""
+    with open(HOLE_PATH) as f:
+        hole = json.load(f)
+    tileset = TilesetData(str(DATA_DIR / "chr-ram.bin"))
+
+    img = render_hole_to_image(hole, tileset, render_sprites=False)
+
+    assert img.size == (hole["terrain"]["width"] * 8, hole["terrain"]["height"] * 8)
+    pixels = img.load()
+    assert pixels is not None
+    for y in range(img.height):
+        for x in range(img.width):
+            assert pixels[x, y] == _reference_pixel(hole, tileset, x, y), (x, y)
+
+
+def test_rows_beyond_height_and_short_attributes():
+    """Hidden terrain rows are skipped and missing attributes use palette 1."""
+    tileset = TilesetData(str(DATA_DIR / "chr-ram.bin"))
+    hole = {
+        "terrain": {"width": 2, "height": 2, "rows": [[0x30, 0x31], [0x32, 0x33], [0, 0]]},
+        "attributes": {"rows": []},
+    }
+
+    img = render_hole_to_image(hole, tileset, render_sprites=False)
+
+    assert img.size == (16, 16)
+    assert img.getpixel((9, 11)) == PALETTES[1][tileset.decode_tile(0x33)[3][1]]
@@ -0,0 +1,62 @@
+"""Unit tests for the memory-mapped RomReader."""
+
+import pytest
+
+from golf.core.rom_reader import (
+    PRG_BANK_SIZE,
+    TABLE_FLAG_X_OFFSET,
+    TABLE_PAR,
+    TABLE_TERRAIN_START_PTR,
+    TOTAL_HOLES,
+    RomReader,
+)
+
+
+@pytest.fixture
+def rom_path(tmp_path):
+    """16-bank iNES file whose PRG bytes count up from 0 (mod 256)."""
+    path = tmp_path / "test.nes"
+    prg = bytes(i & 0xFF for i in range(16 * PRG_BANK_SIZE))
+    path.write_bytes(b"NES\x1a" + bytes([16, 0]) + bytes(10) + prg)
+    return str(path)
+
+
+def test_reads_are_zero_copy_views(rom_path):
+    """Bank reads are memoryviews into the mapping, not copies."""
+    with RomReader(rom_path) as rom:
+        view = rom.read_bank(2)
+        assert isinstance(view, memoryview)
+        assert len(view) == PRG_BANK_SIZE
+        assert view[:3] == bytes([0, 1, 2])
+        assert rom.read_prg(0x101, 2) == b"\x01\x02"
+        del view
+
+
+def test_word_reads_are_little_endian(rom_path):
+    """Word reads combine low then high byte."""
+    with RomReader(rom_path) as rom:
+        assert rom.read_prg_word(0x10) == 0x1110
+        assert rom.read_fixed_word(0xC0FE) == 0xFFFE
+
+
+def test_fixed_table_matches_single_reads(rom_path):
+    """Bulk table reads agree with reading each entry separately."""
+    with RomReader(rom_path) as rom:
+        assert rom.read_fixed_table(TABLE_PAR) == tuple(
+            rom.read_fixed_byte(TABLE_PAR + i) for i in range(TOTAL_HOLES)
+        )
+        assert rom.read_fixed_table(TABLE_TERRAIN_START_PTR, word=True) == tuple(
+            rom.read_fixed_word(TABLE_TERRAIN_START_PTR + i * 2)
+            for i in range(TOTAL_HOLES)
+        )
+        assert len(rom.read_fixed_table(TABLE_FLAG_X_OFFSET, TOTAL_HOLES * 4)) == 216
+
+
+@pytest.mark.parametrize("contents", [b"", b"not a rom file"])
+def test_rejects_invalid_files(tmp_path, contents):
+    """Empty files and files without an iNES header raise ValueError."""
+    path = tmp_path / "bad.nes"
+    path.write_bytes(contents)
+
+    with pytest.raises(ValueError, match="iNES"):
+        RomReader(str(path))
@@ -0,0 +1,71 @@
+"""
+Tests for editor startup helpers.
+
+Tests the parsed-table cache invalidation and deferred loading.
+"""
+
+import os
+import threading
+
+from editor.core.startup import DeferredLoad, StartupProfile, load_cached
+
+
+def test_cache_reused_until_source_changes(tmp_path):
+    """Entries are rebuilt only when a source file changes."""
+    source = tmp_path / "table.json"
+    source.write_text("[1, 2, 3]")
+    builds = []
+
+    def build():
+        builds.append(source.read_text())
+        return {"values": source.read_text()}
+
+    first = load_cached("table", [source], build, tmp_path / "cache")
+    second = load_cached("table", [source], build, tmp_path / "cache")
+    assert first == second == {"values": "[1, 2, 3]"}
+    assert len(builds) == 1
+
+    source.write_text("[1, 2, 3, 4]")
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    third = load_cached("table", [source], build, tmp_path / "cache")
+    assert third == {"values": "[1, 2, 3, 4]"}
+    assert len(builds) == 2
+
+
+def test_corrupt_cache_is_rebuilt(tmp_path):
+    """An unreadable cache entry falls back to building."""
+    source = tmp_path / "table.json"
+    source.write_text("{}")
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    (cache_dir / "table.pickle").write_bytes(b"not a pickle")
+
+    assert load_cached("table", [source], lambda: 42, cache_dir) == 42
+    assert load_cached("table", [source], lambda: 0, cache_dir) == 42
+
+
+def test_deferred_load_runs_once_in_background():
+    """A background load is shared with later get() calls."""
+    calls = []
+    ready = threading.Event()
+    deferred = DeferredLoad(lambda: calls.append(1) or "value")
+
+    assert not deferred.ready
+    deferred.start(ready.set)
+    assert ready.wait(5)
+
+    assert deferred.ready
+    assert deferred.get() == "value"
+    assert calls == [1]
+
+
+def test_profile_report_lists_phases():
+    """Each marked phase appears in the report."""
+    profile = StartupProfile()
+    profile.mark("window")
+    profile.mark("first frame")
+
+    report = profile.report("Time to first frame")
+    assert report.startswith("Time to first frame: ")
+    assert "window" in report and "first frame" in report
@@ -0,0 +1,71 @@
+"""
+Tests for the composited terrain chunk cache.
+
+Tests that chunked rendering draws the same pixels as per-tile rendering
+and that edits only re-composite the chunks they touch.
+"""
+
+from pathlib import Path
+
+import pygame
+import pytest
+from pygame import Rect
+
+from editor.controllers.highlight_state import HighlightState
+from editor.controllers.view_state import ViewState
+from editor.rendering.render_context import RenderContext
+from editor.rendering.terrain_chunks import CHUNK_ROWS, TerrainChunkCache
+from editor.rendering.terrain_renderer import TerrainRenderer
+from editor.tools.transform_tool import TransformToolState
+from golf.formats.hole_data import HoleData
+
+
+@pytest.fixture
+def hole_data():
+    hole = HoleData()
+    hole.load(str(Path(__file__).parent.parent.parent / "courses" / "japan" / "hole_01.json"))
+    return hole
+
+
+def _render(tileset, hole_data, chunks, offset_x, offset_y, scale):
+    """Render the terrain view and return its pixels."""
+    screen = pygame.Surface((640, 480)).convert()
+    view_state = ViewState(Rect(40, 30, 560, 400), offset_x, offset_y, scale)
+    render_ctx = RenderContext(tileset, {}, "terrain", terrain_chunks=chunks)
+    highlight_state = HighlightState()
+    highlight_state.transform_state = TransformToolState()
+    TerrainRenderer.render(screen, view_state, hole_data, render_ctx, highlight_state)
+    return pygame.surfarray.array3d(screen)
+
+
+@pytest.mark.parametrize("offset_x,offset_y,scale", [(0, 0, 1), (13, 77, 2), (100, 390, 4)])
+def test_chunked_render_matches_per_tile(tileset, hole_data, offset_x, offset_y, scale):
+    """Chunks draw the same pixels as blitting each tile."""
+    chunks = TerrainChunkCache(tileset)
+    expected = _render(tileset, hole_data, None, offset_x, offset_y, scale)
+    actual = _render(tileset, hole_data, chunks, offset_x, offset_y, scale)
+    assert (expected == actual).all()
+
+
+def test_edit_recomposites_only_touched_chunk(tileset, hole_data, monkeypatch):
+    """A tile edit redraws one chunk and shows up on screen."""
+    chunks = TerrainChunkCache(tileset)
+    _render(tileset, hole_data, chunks, 0, 0, 2)
+
+    composed = []
+    original = TerrainChunkCache._compose
+
+    def counting_compose(self, hole, start_row, end_row, scale):
+        composed.append(start_row)
+        return original(self, hole, start_row, end_row, scale)
+
+    monkeypatch.setattr(TerrainChunkCache, "_compose", counting_compose)
+
+    _render(tileset, hole_data, chunks, 0, 0, 2)
+    assert composed == []
+
+    row = CHUNK_ROWS + 3
+    hole_data.set_terrain_tile(row, 5, hole_data.terrain[row][5] ^ 0x01)
+    actual = _render(tileset, hole_data, chunks, 0, 0, 2)
+    assert composed == [CHUNK_ROWS]
+    assert (actual == _render(tileset, hole_data, None, 0, 0, 2)).all()
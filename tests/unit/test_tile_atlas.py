@@ -0,0 +1,59 @@
+"""
+Tests for the pygame Tileset's scaled tile atlases.
+
+Tests that tiles served from an atlas have the same pixels as the decoded
+tile data and that warm() builds atlases ahead of time.
+"""
+
+import time
+
+import numpy as np
+import pygame
+import pytest
+
+from editor.core.constants import GREENS_PALETTE_NUM
+from golf.core.palettes import GREENS_PALETTE, PALETTES
+
+
+def _expected(tileset, tile_idx, palette, scale):
+    """Tile pixels indexed [x, y], enlarged by pixel repetition."""
+    rgb = tileset.tileset_data.rgb_atlas(palette)[tile_idx]
+    return rgb.repeat(scale, axis=0).repeat(scale, axis=1).swapaxes(0, 1)
+
+
+@pytest.mark.parametrize("scale", [1, 3, 4])
+def test_atlas_tiles_match_decoded_pixels(tileset, scale):
+    """Every tile's subsurface shows its decoded pixels."""
+    for palette_idx in range(len(PALETTES)):
+        for tile_idx in range(0, tileset.num_tiles, 7):
+            surf = tileset.render_tile(tile_idx, palette_idx, scale)
+            assert surf.get_size() == (8 * scale, 8 * scale)
+            np.testing.assert_array_equal(
+                pygame.surfarray.array3d(surf),
+                _expected(tileset, tile_idx, PALETTES[palette_idx], scale),
+            )
+
+
+def test_greens_tiles_and_out_of_range(tileset):
+    """Greens tiles use the greens palette; unknown tiles are background."""
+    last = tileset.num_tiles - 1
+    np.testing.assert_array_equal(
+        pygame.surfarray.array3d(tileset.render_tile_greens(last, 2)),
+        _expected(tileset, last, GREENS_PALETTE, 2),
+    )
+
+    surf = tileset.render_tile(tileset.num_tiles + 5, 1, 2)
+    assert surf.get_size() == (16, 16)
+    assert surf.get_at((3, 3))[:3] == PALETTES[1][0]
+
+
+def test_warm_builds_atlases_in_background(tileset):
+    """warm() builds the atlases that later renders use."""
+    tileset.warm([1, GREENS_PALETTE_NUM], [0, 5])
+    deadline = time.monotonic() + 10
+    while len(tileset._atlases) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert set(tileset._atlases) == {(1, 5), (GREENS_PALETTE_NUM, 5)}
+    surf = tileset.render_tile(0x20, 1, 5)
+    assert surf.get_parent() is tileset._atlases[(1, 5)]
@@ -1,5 +1,7 @@
 """Unit tests for UndoManager functionality."""
 
+from pathlib import Path
+
 import pytest
 
 from editor.controllers.undo_manager import UndoManager
@@ -31,9 +33,10 @@ class TestUndoManagerInitialization:
     """Tests for UndoManager initialization."""
 
     def test_initialize_with_default_max_levels(self):
-        """UndoManager should initialize with default max levels."""
+        """UndoManager should initialize with default limits."""
         manager = UndoManager()
-        assert manager.max_undo_levels == 50
+        assert manager.max_undo_levels == 10000
+        assert manager.memory_budget == 32 * 1024 * 1024
         assert manager.can_undo() is False
         assert manager.can_redo() is False
 
@@ -85,7 +88,7 @@ class TestPushState:
         assert len(manager.undo_stack) == 3
 
     def test_push_snapshot_is_deep_copy(self, undo_manager, simple_hole_data):
-        """Snapshots should be independent deep copies."""
+        """Recorded state should be independent of the live hole data."""
         undo_manager.push_state(simple_hole_data)
 
         # Modify original after pushing
@@ -93,11 +96,11 @@ class TestPushState:
         simple_hole_data.green_x = 500
         simple_hole_data.metadata["par"] = 5
 
-        # Snapshot should be unchanged
-        snapshot = undo_manager.undo_stack[0]
-        assert snapshot.terrain[0][0] == 1
-        assert snapshot.green_x == 100
-        assert snapshot.metadata["par"] == 4
+        # Undo should bring back the pushed values
+        restored = undo_manager.undo(simple_hole_data)
+        assert restored.terrain[0][0] == 1
+        assert restored.green_x == 100
+        assert restored.metadata["par"] == 4
 
 
 class TestUndo:
@@ -336,24 +339,36 @@ class TestSnapshotPreservation:
 
         assert restored.metadata == {"par": 4, "distance": 350}
 
-    def test_filepath_preserved_in_snapshot(self, undo_manager, simple_hole_data):
-        """Filepath should be preserved in snapshots."""
+    def test_undo_keeps_filepath(self, undo_manager, simple_hole_data):
+        """Undo reverts document content, not where the document is saved."""
         undo_manager.push_state(simple_hole_data)
 
+        simple_hole_data.terrain[0][0] = 9
         simple_hole_data.filepath = "/different/path.json"
-        restored = undo_manager.undo(simple_hole_data)
+        undo_manager.undo(simple_hole_data)
 
-        assert restored.filepath == "/test/hole.json"
+        assert simple_hole_data.terrain[0][0] == 1
+        assert simple_hole_data.filepath == "/different/path.json"
 
-    def test_modified_flag_preserved_in_snapshot(self, undo_manager, simple_hole_data):
-        """Modified flag should be preserved in snapshots."""
-        simple_hole_data.modified = True
-        undo_manager.push_state(simple_hole_data)
+    def test_save_as_then_undo_keeps_original(self, undo_manager, tmp_path):
+        """Saving after Save As and undo writes the new file, not the original."""
+        original = tmp_path / "original.json"
+        copy = tmp_path / "copy.json"
+        hole = HoleData()
+        hole.load(str(Path(__file__).parent.parent.parent / "courses" / "japan" / "hole_01.json"))
+        hole.save(str(original))
+        original_text = original.read_text()
+        undo_manager.set_initial_state(hole)
 
-        simple_hole_data.modified = False
-        restored = undo_manager.undo(simple_hole_data)
+        undo_manager.push_state(hole)
+        hole.terrain[0][0] ^= 0x01
+        hole.save(str(copy))
+        undo_manager.undo(hole)
+        hole.save()
 
-        assert restored.modified is True
+        assert hole.filepath == str(copy)
+        assert original.read_text() == original_text
+        assert copy.read_text() == original_text
 
 
 class TestUndoRedoSequences:
@@ -414,3 +429,78 @@ class TestUndoRedoSequences:
         # Redo again
         s4 = undo_manager.redo(s3)
         assert s4 is not None
+
+
+class TestDeltaHistory:
+    """Tests for delta-based history storage."""
+
+    def test_entry_records_only_changed_cells(self, undo_manager, simple_hole_data):
+        """An undo level holds just the cells that changed."""
+        undo_manager.push_state(simple_hole_data)
+        simple_hole_data.terrain[2][1] = 42
+        simple_hole_data.greens[3][0] = 7
+        undo_manager.push_state(simple_hole_data)
+
+        entry = undo_manager.undo_stack[0]
+        assert entry.grids["terrain"].cells == [(2, 1, 2, 42)]
+        assert entry.grids["greens"].cells == [(3, 0, 4, 7)]
+        assert "attributes" not in entry.grids
+        assert entry.fields == {}
+
+    def test_undo_redo_row_insertion(self, undo_manager, simple_hole_data):
+        """Inserted and removed rows are undone and redone."""
+        undo_manager.push_state(simple_hole_data)
+        simple_hole_data.terrain.insert(0, [9, 9, 9])
+        simple_hole_data.terrain[3][2] = 8
+        simple_hole_data.terrain_height = 6
+        edited = [row[:] for row in simple_hole_data.terrain]
+
+        undo_manager.undo(simple_hole_data)
+        assert simple_hole_data.terrain == [[1, 2, 3] for _ in range(5)]
+        assert simple_hole_data.terrain_height == 0
+
+        undo_manager.redo(simple_hole_data)
+        assert simple_hole_data.terrain == edited
+        assert simple_hole_data.terrain_height == 6
+
+    def test_many_levels_round_trip(self, simple_hole_data):
+        """Undoing every level returns to the first pushed state."""
+        manager = UndoManager()
+        original = [row[:] for row in simple_hole_data.terrain]
+        states = []
+        for i in range(200):
+            manager.push_state(simple_hole_data)
+            states.append([row[:] for row in simple_hole_data.terrain])
+            simple_hole_data.terrain[i % 5][i % 3] = i
+
+        for expected in reversed(states):
+            manager.undo(simple_hole_data)
+            assert simple_hole_data.terrain == expected
+        assert simple_hole_data.terrain == original
+        assert manager.can_undo() is False
+
+    def test_edit_after_undo_is_its_own_level(self, undo_manager, simple_hole_data):
+        """Unrecorded edits made after an undo can still be undone."""
+        undo_manager.push_state(simple_hole_data)
+        simple_hole_data.terrain[0][0] = 50
+        undo_manager.push_state(simple_hole_data)
+        simple_hole_data.terrain[1][0] = 60
+        undo_manager.undo(simple_hole_data)
+
+        simple_hole_data.terrain[4][2] = 70
+        undo_manager.undo(simple_hole_data)
+        assert simple_hole_data.terrain[4][2] == 3
+        assert simple_hole_data.terrain[0][0] == 50
+
+        undo_manager.undo(simple_hole_data)
+        assert simple_hole_data.terrain[0][0] == 1
+
+    def test_memory_budget_drops_oldest_levels(self, simple_hole_data):
+        """History beyond the memory budget loses its oldest levels."""
+        manager = UndoManager(memory_budget=2000)
+        for i in range(20):
+            manager.push_state(simple_hole_data)
+            simple_hole_data.terrain[i % 5][0] = 100 + i
+
+        assert 1 < len(manager.undo_stack) < 20
+        assert manager.history_cost <= 2000
@@ -129,3 +129,51 @@ def test_bounds_safety(mock_minimal_terrain_tables):
     # But 200 >= len(vert_table), so it should be left alone (or default handled)
     assert len(result[1]) == 2
     assert result[1][1] == 200  # Out of bounds value left alone
+
+
+def test_apply_cascades_down_columns():
+    """Markers below other markers are filled from the restored tile above."""
+    import numpy as np
+
+    from golf.core.vertical_fill import apply_vertical_fills, vert_lookup_array
+
+    vert_table = list(range(1, 0xE0)) + [0]  # Each tile continues to the next
+    grid = np.array([[0x10, 0x20], [0x00, 0x00], [0x00, 0x30], [0x00, 0x00]], np.uint8)
+
+    result = apply_vertical_fills(grid, vert_lookup_array(vert_table))
+
+    assert result.tolist() == [[0x10, 0x20], [0x11, 0x21], [0x12, 0x30], [0x13, 0x31]]
+
+
+def test_apply_out_of_range_leaves_marker():
+    """A marker under a tile outside vert_table stays 0x00, then continues from 0."""
+    import numpy as np
+
+    from golf.core.vertical_fill import apply_vertical_fills, vert_lookup_array
+
+    vert_table = [0x05] + [0] * 9  # Only 10 entries; vert[0] = 0x05
+    grid = np.array([[0xC8], [0x00], [0x00]], np.uint8)
+
+    result = apply_vertical_fills(grid, vert_lookup_array(vert_table))
+
+    assert result.tolist() == [[0xC8], [0x00], [0x05]]
+
+
+def test_mark_then_apply_roundtrip(hole_01_data, terrain_tables):
+    """Marking and restoring vertical fills reproduces the original terrain."""
+    import numpy as np
+
+    from golf.core.vertical_fill import (
+        apply_vertical_fills,
+        mark_vertical_fills,
+        vert_lookup_array,
+    )
+
+    vert_table = terrain_tables["vertical_table"]
+    grid = np.asarray(hole_01_data.terrain, dtype=np.uint8)
+
+    marked = mark_vertical_fills(grid, vert_table)
+    assert (marked == 0).sum() > (grid == 0).sum()
+
+    restored = apply_vertical_fills(marked, vert_lookup_array(vert_table))
+    assert np.array_equal(restored, grid)
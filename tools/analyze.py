@@ -9,7 +9,6 @@ Examples:
     python analyze.py courses/japan/ courses/us/ courses/uk/
 """
 
-import json
 import sys
 from collections import defaultdict
 from pathlib import Path
@@ -17,7 +16,7 @@ from pathlib import Path
 import numpy as np
 
 from golf.core.palettes import GREEN_TILE_THRESHOLD
-from golf.formats.hex_utils import parse_hex_row
+from tools.corpus import CompressionRatios, CorpusHole, TileFrequencies, scan_corpus
 
 
 def percentile_stats(values):
@@ -35,22 +34,34 @@ def percentile_stats(values):
     }
 
 
-def count_on_green_tiles(greens_data):
-    """Count tiles with value >= GREEN_TILE_THRESHOLD in the greens rows."""
-    count = 0
-    for row_str in greens_data["rows"]:
-        # Each row is a space-separated string of hex values
-        hex_values = parse_hex_row(row_str)
-        for value in hex_values:
-            if value >= GREEN_TILE_THRESHOLD:
-                count += 1
-    return count
+class HoleSummary:
+    """Collects per-hole metadata statistics."""
 
+    def __init__(self):
+        self.distance_by_par = defaultdict(list)
+        self.scroll_limit_to_height = defaultdict(set)
+        self.height_to_scroll_limit = defaultdict(set)
+        self.odd_height_holes = []
+        self.on_green_counts = []
 
-def load_hole_data(filepath):
-    """Load a single hole JSON file."""
-    with open(filepath) as f:
-        return json.load(f)
+    def add(self, hole: CorpusHole):
+        info = hole.info
+
+        # Distance by par
+        self.distance_by_par[info["par"]].append(info["distance"])
+
+        # Scroll limit and terrain height
+        scroll_limit = info["scroll_limit"]
+        terrain_height = info["terrain"]["height"]
+        self.scroll_limit_to_height[scroll_limit].add(terrain_height)
+        self.height_to_scroll_limit[terrain_height].add(scroll_limit)
+
+        # Odd terrain height check
+        if terrain_height % 2 == 1:
+            self.odd_height_holes.append((hole.path.name, hole.number, terrain_height))
+
+        # On-green tile count
+        self.on_green_counts.append(int((hole.greens >= GREEN_TILE_THRESHOLD).sum()))
 
 
 def analyze_holes(directories):
@@ -75,54 +86,22 @@ def analyze_holes(directories):
     )
     print(f"Found {len(json_files)} hole files\n")
 
-    # Data collectors
-    distance_by_par = defaultdict(list)
-    scroll_limit_to_height = defaultdict(set)
-    height_to_scroll_limit = defaultdict(set)
-    odd_height_holes = []
-    on_green_counts = []
-    compression_ratios = []
-    all_holes = []
-    terrain_tiles = set()
-    greens_tiles = set()
-
-    for filepath in json_files:
-        data = load_hole_data(filepath)
-        all_holes.append((filepath.name, data))
-
-        # Distance by par
-        par = data["par"]
-        distance = data["distance"]
-        distance_by_par[par].append(distance)
-
-        # Scroll limit and terrain height
-        scroll_limit = data["scroll_limit"]
-        terrain_height = data["terrain"]["height"]
-        scroll_limit_to_height[scroll_limit].add(terrain_height)
-        height_to_scroll_limit[terrain_height].add(scroll_limit)
-
-        # Odd terrain height check
-        if terrain_height % 2 == 1:
-            odd_height_holes.append((filepath.name, data["hole"], terrain_height))
-
-        # On-green tile count
-        on_green = count_on_green_tiles(data["greens"])
-        on_green_counts.append(on_green)
-
-        # Collect unique terrain tiles
-        for row_str in data["terrain"]["rows"]:
-            terrain_tiles.update(parse_hex_row(row_str))
-
-        # Collect unique greens tiles
-        for row_str in data["greens"]["rows"]:
-            greens_tiles.update(parse_hex_row(row_str))
+    # Data collectors, filled in a single pass over the holes
+    summary = HoleSummary()
+    terrain_tiles = TileFrequencies("terrain")
+    greens_tiles = TileFrequencies("greens")
+    compression = CompressionRatios()
+    scan_corpus(
+        [Path(directory) for directory in directories],
+        [summary, terrain_tiles, greens_tiles, compression],
+    )
 
-        # Compression ratio
-        terrain_width = data["terrain"]["width"]
-        compressed_size = data["_debug"]["terrain_compressed_size"]
-        uncompressed_size = terrain_width * terrain_height
-        ratio = compressed_size / uncompressed_size
-        compression_ratios.append(ratio)
+    distance_by_par = summary.distance_by_par
+    scroll_limit_to_height = summary.scroll_limit_to_height
+    height_to_scroll_limit = summary.height_to_scroll_limit
+    odd_height_holes = summary.odd_height_holes
+    on_green_counts = summary.on_green_counts
+    compression_ratios = compression.ratios
 
     # === Report ===
     print("=" * 60)
@@ -224,7 +203,7 @@ def analyze_holes(directories):
     print("\n" + "=" * 60)
     print("UNIQUE TERRAIN TILES")
     print("=" * 60)
-    sorted_terrain = sorted(terrain_tiles)
+    sorted_terrain = terrain_tiles.unique()
     print(f"\nTotal unique tiles: {len(sorted_terrain)}")
     print("\nTiles (in hex):")
     for i in range(0, len(sorted_terrain), 16):
@@ -234,7 +213,7 @@ def analyze_holes(directories):
     print("\n" + "=" * 60)
     print("UNIQUE GREENS TILES")
     print("=" * 60)
-    sorted_greens = sorted(greens_tiles)
+    sorted_greens = greens_tiles.unique()
     print(f"\nTotal unique tiles: {len(sorted_greens)}")
     print("\nTiles (in hex):")
     for i in range(0, len(sorted_greens), 16):
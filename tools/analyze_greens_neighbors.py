@@ -8,23 +8,14 @@ Produces a JSON file mapping each tile to its valid neighbors in each direction.
 """
 
 import json
-from collections import defaultdict
 from pathlib import Path
 
-from golf.formats.hole_data import HoleData
-
-
-def is_target_tile(tile_idx: int) -> bool:
-    """
-    Check if tile is in target ranges $48-$6F or $74-$83.
-
-    Args:
-        tile_idx: Tile index to check
-
-    Returns:
-        True if tile is in target ranges, False otherwise
-    """
-    return (0x48 <= tile_idx <= 0x6F) or (0x74 <= tile_idx <= 0x83)
+from tools.corpus import (
+    NeighborCounts,
+    default_course_dirs,
+    greens_neighbor_counts,
+    scan_corpus,
+)
 
 
 def compute_interior_side(path_edges, interior_edges, exterior_edges):
@@ -122,169 +113,27 @@ def classify_tile(tile_id, neighbor_data):
     }
 
 
-def analyze_greens_neighbors() -> dict:
+def greens_neighbors_result(counts: NeighborCounts) -> dict:
     """
-    Analyze all 54 holes to extract valid greens tile neighbor relationships.
-    Only tracks relationships where BOTH tiles are in target ranges.
+    Build the greens neighbor table and tile classifications from scanned counts.
+
+    Args:
+        counts: Greens neighbor counts (from greens_neighbor_counts())
 
     Returns:
-        Dictionary with metadata and neighbor relationships:
+        Dictionary with metadata, neighbor relationships and classifications:
         {
             "metadata": {...},
             "neighbors": {
-                "0x48": {"up": [...], "down": [...], "left": [...], "right": [...]},
+                "0x48": {"up": {...}, "down": {...}, "left": {...}, "right": {...}},
                 ...
-            }
-        }
-    """
-    neighbors: dict[int, dict[str, dict[int, int]]] = defaultdict(
-        lambda: {"up": {}, "down": {}, "left": {}, "right": {}}
-    )
-
-    courses_dir = Path(__file__).parent.parent / "courses"
-    total_holes = 0
-
-    for course_name in ["japan", "us", "uk"]:
-        course_dir = courses_dir / course_name
-        print(f"\nAnalyzing {course_name.upper()} course...")
-
-        for hole_num in range(1, 19):
-            hole_file = course_dir / f"hole_{hole_num:02d}.json"
-
-            if not hole_file.exists():
-                print(f"  Warning: {hole_file} not found")
-                continue
-
-            try:
-                hole_data = HoleData()
-                hole_data.load(str(hole_file))
-
-                # Iterate through greens (24x24 grid) and record neighbor relationships
-                for row_idx, row in enumerate(hole_data.greens):
-                    for col_idx, tile_idx in enumerate(row):
-                        tile = tile_idx
-
-                        # Skip if current tile is not in target ranges
-                        if not is_target_tile(tile):
-                            continue
-
-                        # Check up
-                        if row_idx > 0:
-                            neighbor = hole_data.greens[row_idx - 1][col_idx]
-                            # Record if neighbor is in target ranges
-                            if is_target_tile(neighbor):
-                                neighbors[tile]["up"][neighbor] = (
-                                    neighbors[tile]["up"].get(neighbor, 0) + 1
-                                )
-                            # Or record as 0x00 if neighbor is:
-                            #     < 0x30 (out of range)
-                            #     or in range (0x70, 0x74)
-                            #     or in range (0x84, 0x88)
-                            elif (neighbor < 0x30 or
-                                  neighbor in range(0x70, 0x74) or
-                                  neighbor in range(0x84, 0x88)
-                            ):
-                                neighbors[tile]["up"][0x00] = (
-                                    neighbors[tile]["up"].get(0x00, 0) + 1
-                                )
-                            # Or record as 0x30 if neighbor is >= 0x30 (out of range)
-                            else:
-                                neighbors[tile]["up"][0x30] = (
-                                    neighbors[tile]["up"].get(0x30, 0) + 1
-                                )
-
-                        # Check down
-                        if row_idx < len(hole_data.greens) - 1:
-                            neighbor = hole_data.greens[row_idx + 1][col_idx]
-                            # Record if neighbor is in target ranges
-                            if is_target_tile(neighbor):
-                                neighbors[tile]["down"][neighbor] = (
-                                    neighbors[tile]["down"].get(neighbor, 0) + 1
-                                )
-                            # Or record as 0x00 if neighbor is < 0x30 (out of range)
-                            elif (neighbor < 0x30 or
-                                  neighbor in range(0x70, 0x74) or
-                                  neighbor in range(0x84, 0x88)
-                            ):
-                                neighbors[tile]["down"][0x00] = (
-                                    neighbors[tile]["down"].get(0x00, 0) + 1
-                                )
-                            # Or record as 0x30 if neighbor is >= 0x30 (out of range)
-                            else:
-                                neighbors[tile]["down"][0x30] = (
-                                    neighbors[tile]["down"].get(0x30, 0) + 1
-                                )
-
-                        # Check left
-                        if col_idx > 0:
-                            neighbor = hole_data.greens[row_idx][col_idx - 1]
-                            # Record if neighbor is in target ranges
-                            if is_target_tile(neighbor):
-                                neighbors[tile]["left"][neighbor] = (
-                                    neighbors[tile]["left"].get(neighbor, 0) + 1
-                                )
-                            # Or record as 0x00 if neighbor is < 0x30 (out of range)
-                            elif (neighbor < 0x30 or
-                                  neighbor in range(0x70, 0x74) or
-                                  neighbor in range(0x84, 0x88)
-                            ):
-                                neighbors[tile]["left"][0x00] = (
-                                    neighbors[tile]["left"].get(0x00, 0) + 1
-                                )
-                            # Or record as 0x30 if neighbor is >= 0x30 (out of range)
-                            else:
-                                neighbors[tile]["left"][0x30] = (
-                                    neighbors[tile]["left"].get(0x30, 0) + 1
-                                )
-
-                        # Check right
-                        if col_idx < len(row) - 1:
-                            neighbor = hole_data.greens[row_idx][col_idx + 1]
-                            # Record if neighbor is in target ranges
-                            if is_target_tile(neighbor):
-                                neighbors[tile]["right"][neighbor] = (
-                                    neighbors[tile]["right"].get(neighbor, 0) + 1
-                                )
-                            # Or record as 0x00 if neighbor is < 0x30 (out of range)
-                            elif (neighbor < 0x30 or
-                                  neighbor in range(0x70, 0x74) or
-                                  neighbor in range(0x84, 0x88)
-                            ):
-                                neighbors[tile]["right"][0x00] = (
-                                    neighbors[tile]["right"].get(0x00, 0) + 1
-                                )
-                            # Or record as 0x30 if neighbor is >= 0x30 (out of range)
-                            else:
-                                neighbors[tile]["right"][0x30] = (
-                                    neighbors[tile]["right"].get(0x30, 0) + 1
-                                )
-
-                total_holes += 1
-                print(f"  Hole {hole_num:2d}: OK")
-
-            except Exception as e:
-                print(f"  Error processing hole {hole_num}: {e}")
-
-    print(f"\nAnalyzed {total_holes} holes successfully")
-
-    # Convert frequency dicts to JSON format with hex keys
-    neighbors_json = {}
-    for tile_idx in sorted(neighbors.keys()):
-        tile_hex = f"0x{tile_idx:02X}"
-        neighbors_json[tile_hex] = {
-            "up": {
-                f"0x{n:02X}": count for n, count in neighbors[tile_idx]["up"].items()
-            },
-            "down": {
-                f"0x{n:02X}": count for n, count in neighbors[tile_idx]["down"].items()
-            },
-            "left": {
-                f"0x{n:02X}": count for n, count in neighbors[tile_idx]["left"].items()
-            },
-            "right": {
-                f"0x{n:02X}": count for n, count in neighbors[tile_idx]["right"].items()
             },
+            "classifications": {...},
+            "classification_index": {...}
         }
+    """
+    neighbors_json = counts.to_json()
+    total_holes = counts.holes
 
     # Calculate statistics
     total_relationships = sum(
@@ -359,6 +208,24 @@ def analyze_greens_neighbors() -> dict:
     return result
 
 
+def analyze_greens_neighbors(course_dirs: list[Path] | None = None) -> dict:
+    """
+    Analyze all holes to extract valid greens tile neighbor relationships.
+    Only tracks neighbors of tiles in the target ranges; other neighbors are
+    recorded as $00 (rough) or $30 (putting surface).
+
+    Args:
+        course_dirs: Course directories (default: the vanilla courses)
+
+    Returns:
+        Greens neighbor table (see greens_neighbors_result())
+    """
+    counts = greens_neighbor_counts()
+    total_holes = scan_corpus(course_dirs or default_course_dirs(), [counts])
+    print(f"\nAnalyzed {total_holes} holes successfully")
+    return greens_neighbors_result(counts)
+
+
 def main():
     """Command-line entry point."""
     print("NES Open Tournament Golf - Greens Neighbor Analyzer")
@@ -7,107 +7,29 @@ Produces a JSON file mapping each tile to its valid neighbors in each direction.
 """
 
 import json
-from collections import defaultdict
 from pathlib import Path
 
-from golf.formats.hole_data import HoleData
+from tools.corpus import NeighborCounts, default_course_dirs, scan_corpus
 
 
-def analyze_neighbors() -> dict:
+def neighbors_result(counts: NeighborCounts) -> dict:
     """
-    Analyze all 54 holes to extract valid terrain tile neighbor relationships.
+    Build the terrain neighbor table from scanned neighbor counts.
+
+    Args:
+        counts: Terrain neighbor counts
 
     Returns:
         Dictionary with metadata and neighbor relationships:
         {
             "metadata": {...},
             "neighbors": {
-                "0x25": {"up": [...], "down": [...], "left": [...], "right": [...]},
+                "0x25": {"up": {...}, "down": {...}, "left": {...}, "right": {...}},
                 ...
             }
         }
     """
-    neighbors: dict[int, dict[str, dict[int, int]]] = defaultdict(
-        lambda: {"up": {}, "down": {}, "left": {}, "right": {}}
-    )
-
-    courses_dir = Path(__file__).parent.parent / "courses"
-    total_holes = 0
-
-    for course_name in ["japan", "us", "uk"]:
-        course_dir = courses_dir / course_name
-        print(f"\nAnalyzing {course_name.upper()} course...")
-
-        for hole_num in range(1, 19):
-            hole_file = course_dir / f"hole_{hole_num:02d}.json"
-
-            if not hole_file.exists():
-                print(f"  Warning: {hole_file} not found")
-                continue
-
-            try:
-                hole_data = HoleData()
-                hole_data.load(str(hole_file))
-
-                # Iterate through terrain and record neighbor relationships
-                for row_idx, row in enumerate(hole_data.terrain):
-                    for col_idx, tile_idx in enumerate(row):
-                        tile = tile_idx
-
-                        # Check up
-                        if row_idx > 0:
-                            neighbor = hole_data.terrain[row_idx - 1][col_idx]
-                            neighbors[tile]["up"][neighbor] = (
-                                neighbors[tile]["up"].get(neighbor, 0) + 1
-                            )
-
-                        # Check down
-                        if row_idx < len(hole_data.terrain) - 1:
-                            neighbor = hole_data.terrain[row_idx + 1][col_idx]
-                            neighbors[tile]["down"][neighbor] = (
-                                neighbors[tile]["down"].get(neighbor, 0) + 1
-                            )
-
-                        # Check left
-                        if col_idx > 0:
-                            neighbor = hole_data.terrain[row_idx][col_idx - 1]
-                            neighbors[tile]["left"][neighbor] = (
-                                neighbors[tile]["left"].get(neighbor, 0) + 1
-                            )
-
-                        # Check right
-                        if col_idx < len(row) - 1:
-                            neighbor = hole_data.terrain[row_idx][col_idx + 1]
-                            neighbors[tile]["right"][neighbor] = (
-                                neighbors[tile]["right"].get(neighbor, 0) + 1
-                            )
-
-                total_holes += 1
-                print(f"  Hole {hole_num:2d}: OK")
-
-            except Exception as e:
-                print(f"  Error processing hole {hole_num}: {e}")
-
-    print(f"\nAnalyzed {total_holes} holes successfully")
-
-    # Convert frequency dicts to JSON format with hex keys
-    neighbors_json = {}
-    for tile_idx in sorted(neighbors.keys()):
-        tile_hex = f"0x{tile_idx:02X}"
-        neighbors_json[tile_hex] = {
-            "up": {
-                f"0x{n:02X}": count for n, count in neighbors[tile_idx]["up"].items()
-            },
-            "down": {
-                f"0x{n:02X}": count for n, count in neighbors[tile_idx]["down"].items()
-            },
-            "left": {
-                f"0x{n:02X}": count for n, count in neighbors[tile_idx]["left"].items()
-            },
-            "right": {
-                f"0x{n:02X}": count for n, count in neighbors[tile_idx]["right"].items()
-            },
-        }
+    neighbors_json = counts.to_json()
 
     # Calculate statistics
     total_relationships = sum(
@@ -115,9 +37,9 @@ def analyze_neighbors() -> dict:
         for dirs in neighbors_json.values()
     )
 
-    result = {
+    return {
         "metadata": {
-            "total_holes_analyzed": total_holes,
+            "total_holes_analyzed": counts.holes,
             "total_unique_tiles": len(neighbors_json),
             "total_relationships": total_relationships,
             "analysis_tool": "golf-analyze-neighbors",
@@ -125,7 +47,21 @@ def analyze_neighbors() -> dict:
         "neighbors": neighbors_json,
     }
 
-    return result
+
+def analyze_neighbors(course_dirs: list[Path] | None = None) -> dict:
+    """
+    Analyze all holes to extract valid terrain tile neighbor relationships.
+
+    Args:
+        course_dirs: Course directories (default: the vanilla courses)
+
+    Returns:
+        Terrain neighbor table (see neighbors_result())
+    """
+    counts = NeighborCounts("terrain")
+    total_holes = scan_corpus(course_dirs or default_course_dirs(), [counts])
+    print(f"\nAnalyzed {total_holes} holes successfully")
+    return neighbors_result(counts)
 
 
 def main():
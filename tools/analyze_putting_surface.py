@@ -10,11 +10,24 @@ import sys
 from pathlib import Path
 
 from golf.formats import compact_json as json
-from golf.formats.putting_surface import count_putting_surface_tiles
+from tools.corpus import PuttingSurfaceSizes, default_course_dirs, scan_corpus
 
 
-COURSES = ["japan", "us", "uk"]
-HOLES_PER_COURSE = 18
+def putting_surface_result(sizes: PuttingSurfaceSizes) -> dict:
+    """
+    Build the putting surface statistics file from scanned sizes.
+
+    Args:
+        sizes: Putting surface sizes
+
+    Returns:
+        Dictionary with hole data and sizes array
+    """
+    return {
+        "description": "Putting surface tile counts for vanilla holes",
+        "holes": sizes.holes,
+        "sizes": sizes.sizes,
+    }
 
 
 def analyze_courses(courses_dir: Path) -> dict:
@@ -27,51 +40,20 @@ def analyze_courses(courses_dir: Path) -> dict:
     Returns:
         Dictionary with hole data and sizes array
     """
-    holes = []
-    sizes = []
-
-    for course_name in COURSES:
-        course_dir = courses_dir / course_name
-
-        if not course_dir.exists():
+    course_dirs = []
+    for course_dir in default_course_dirs():
+        course_dir = courses_dir / course_dir.name
+        if course_dir.exists():
+            course_dirs.append(course_dir)
+        else:
             print(f"Warning: Course directory not found: {course_dir}")
-            continue
-
-        for hole_num in range(1, HOLES_PER_COURSE + 1):
-            hole_file = course_dir / f"hole_{hole_num:02d}.json"
-
-            if not hole_file.exists():
-                print(f"Warning: Hole file not found: {hole_file}")
-                continue
-
-            # Load hole data
-            with open(hole_file) as f:
-                hole_data = json.load(f)
-
-            # Parse greens data from hex strings
-            greens = []
-            greens_rows = hole_data.get("greens", {}).get("rows", [])
-            for row_hex in greens_rows:
-                row_values = [int(x, 16) for x in row_hex.split()]
-                greens.append(row_values)
 
-            # Count putting surface tiles
-            size = count_putting_surface_tiles(greens)
+    sizes = PuttingSurfaceSizes()
+    scan_corpus(course_dirs, [sizes])
+    for hole in sizes.holes:
+        print(f"{hole['course'].capitalize()} Hole {hole['hole']:2d}: {hole['size']} tiles")
 
-            holes.append({
-                "course": course_name,
-                "hole": hole_num,
-                "size": size,
-            })
-            sizes.append(size)
-
-            print(f"{course_name.capitalize()} Hole {hole_num:2d}: {size} tiles")
-
-    return {
-        "description": "Putting surface tile counts for vanilla holes",
-        "holes": holes,
-        "sizes": sizes,
-    }
+    return putting_surface_result(sizes)
 
 
 def main():
@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""
+NES Open Tournament Golf - Course Corpus Scanner
+
+Loads every hole of a set of courses once, as numpy arrays, and streams it
+through any number of accumulators. The analysis tools share this scanner,
+and running it directly regenerates all of their data files in one pass:
+
+    data/tables/terrain_neighbors.json
+    data/tables/greens_neighbors.json
+    data/statistics/putting_surface_sizes.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Protocol
+
+import numpy as np
+
+from golf.core.neighbor_validator import (
+    DIRECTION_STEPS,
+    DIRECTIONS,
+    greens_neighbor_class,
+)
+from golf.formats.course_pack import GRID_ENCODINGS, CoursePack, current_pack_path
+from golf.formats.putting_surface import PUTTING_SURFACE_TILES
+
+COURSES_DIR = Path(__file__).parent.parent / "courses"
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+# Vanilla courses, in game order
+DEFAULT_COURSES = ["japan", "us", "uk"]
+
+# Greens tiles whose neighbors are recorded ($48-$6F and $74-$83 fringe)
+GREENS_TARGET_TILES = [*range(0x48, 0x70), *range(0x74, 0x84)]
+
+
+class CorpusHole:
+    """One hole of the corpus, with its grids as uint8 arrays."""
+
+    def __init__(
+        self,
+        course: str,
+        path: Path,
+        info: dict,
+        terrain: np.ndarray,
+        attributes: np.ndarray,
+        greens: np.ndarray,
+    ):
+        """
+        Args:
+            course: Course directory name
+            path: Hole JSON file (for packed courses, where it would be)
+            info: Hole JSON document without the grid rows
+            terrain: Terrain tiles, shape (rows, columns)
+            attributes: Attribute values, shape (rows, columns)
+            greens: Greens tiles, shape (rows, columns)
+        """
+        self.course = course
+        self.path = path
+        self.info = info
+        self.terrain = terrain
+        self.attributes = attributes
+        self.greens = greens
+
+    @property
+    def number(self) -> int:
+        """Hole number within its course."""
+        return self.info.get("hole", 1)
+
+
+class Accumulator(Protocol):
+    """Anything that collects data from the holes of a scan."""
+
+    def add(self, hole: CorpusHole) -> None:
+        """Collect data from one hole."""
+        ...
+
+
+def find_course_dirs(paths: list[str]) -> list[Path]:
+    """
+    Expand command line paths to course directories.
+
+    A directory holding hole_XX.json files or a course pack is a course; any
+    other directory stands for its course subdirectories.
+
+    Args:
+        paths: Course directories or directories of courses
+
+    Returns:
+        Course directories in the order given (subdirectories sorted)
+    """
+
+    def is_course(path: Path) -> bool:
+        return any(path.glob("hole_*.json")) or any(path.glob("course.pack"))
+
+    course_dirs = []
+    for path in map(Path, paths):
+        if is_course(path):
+            course_dirs.append(path)
+        else:
+            course_dirs.extend(
+                sub for sub in sorted(path.iterdir()) if sub.is_dir() and is_course(sub)
+            )
+    return course_dirs
+
+
+def default_course_dirs() -> list[Path]:
+    """Get the vanilla course directories, in game order."""
+    return [COURSES_DIR / name for name in DEFAULT_COURSES]
+
+
+def _parse_grid(rows: list) -> np.ndarray:
+    """Parse hole JSON grid rows (hex strings or int lists) into an array."""
+    if rows and isinstance(rows[0], str):
+        data = np.frombuffer(bytes.fromhex(" ".join(rows)), dtype=np.uint8)
+        return data.reshape(len(rows), -1)
+    return np.array(rows, dtype=np.uint8).reshape(len(rows), -1)
+
+
+def _strip_rows(hole: dict) -> dict:
+    """Copy a hole document without the grid rows."""
+    info = dict(hole)
+    for name in GRID_ENCODINGS:
+        if name in info:
+            info[name] = {key: value for key, value in info[name].items() if key != "rows"}
+    return info
+
+
+def load_hole_file(hole_file: str | Path) -> CorpusHole:
+    """
+    Load one hole JSON file.
+
+    Args:
+        hole_file: Path to a hole_XX.json file
+
+    Returns:
+        The hole, with its course named after the file's directory
+    """
+    hole_file = Path(hole_file)
+    with open(hole_file) as f:
+        hole = json.load(f)
+    return CorpusHole(
+        hole_file.parent.name,
+        hole_file,
+        _strip_rows(hole),
+        *(_parse_grid(hole[name]["rows"]) for name in GRID_ENCODINGS),
+    )
+
+
+def iter_course(course_dir: str | Path) -> Iterator[CorpusHole]:
+    """
+    Load the holes of one course, from its pack when that is up to date.
+
+    Args:
+        course_dir: Course directory
+
+    Yields:
+        Holes in hole file order
+    """
+    course_dir = Path(course_dir)
+    pack_path = current_pack_path(course_dir)
+
+    if pack_path is not None:
+        pack = CoursePack.open(pack_path)
+        for hole_idx, entry in enumerate(pack.holes):
+            info = _strip_rows(entry)
+            yield CorpusHole(
+                course_dir.name,
+                course_dir / f"hole_{info.get('hole', hole_idx + 1):02d}.json",
+                info,
+                *(pack.grid(hole_idx, name) for name in GRID_ENCODINGS),
+            )
+        return
+
+    for hole_file in sorted(course_dir.glob("hole_*.json")):
+        yield load_hole_file(hole_file)
+
+
+def iter_corpus(course_dirs: Iterable[str | Path]) -> Iterator[CorpusHole]:
+    """
+    Load every hole of several courses, one at a time.
+
+    Args:
+        course_dirs: Course directories
+
+    Yields:
+        Holes, course by course
+    """
+    for course_dir in course_dirs:
+        yield from iter_course(course_dir)
+
+
+def scan_corpus(course_dirs: Iterable[str | Path], accumulators: list[Accumulator]) -> int:
+    """
+    Load every hole once and feed it to each accumulator.
+
+    Args:
+        course_dirs: Course directories
+        accumulators: Accumulators to feed, in order
+
+    Returns:
+        Number of holes scanned
+    """
+    total_holes = 0
+    for hole in iter_corpus(course_dirs):
+        for accumulator in accumulators:
+            accumulator.add(hole)
+        total_holes += 1
+    return total_holes
+
+
+def shifted_pairs(grid: np.ndarray, d_row: int, d_col: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Pair every cell with its neighbor at an offset.
+
+    Args:
+        grid: 2D array
+        d_row: Row offset of the neighbor
+        d_col: Column offset of the neighbor
+
+    Returns:
+        Tuple of (tiles, neighbors): equally shaped views of the cells that
+        have a neighbor at the offset, and of those neighbors. tiles starts
+        at (max(0, -d_row), max(0, -d_col)) in the grid.
+    """
+    rows, cols = grid.shape
+    tiles = grid[max(0, -d_row) : rows - max(0, d_row), max(0, -d_col) : cols - max(0, d_col)]
+    neighbors = grid[max(0, d_row) : rows - max(0, -d_row), max(0, d_col) : cols - max(0, -d_col)]
+    return tiles, neighbors
+
+
+class NeighborCounts:
+    """Counts how often each tile has each neighbor, per direction."""
+
+    def __init__(
+        self,
+        grid: str = "terrain",
+        tiles: Iterable[int] | None = None,
+        neighbor_class=None,
+    ):
+        """
+        Args:
+            grid: Grid to count ("terrain" or "greens")
+            tiles: Only count neighbors of these tiles (default: all)
+            neighbor_class: Function mapping a neighbor value to the value it
+                is recorded as (default: the value itself)
+        """
+        self.grid = grid
+        self.holes = 0
+        self.counts = np.zeros((len(DIRECTIONS), 256, 256), dtype=np.int64)
+        self._tiles = None
+        if tiles is not None:
+            self._tiles = np.zeros(256, dtype=bool)
+            self._tiles[list(tiles)] = True
+        self._classes = None
+        if neighbor_class is not None:
+            self._classes = np.array([neighbor_class(value) for value in range(256)])
+
+    def add(self, hole: CorpusHole):
+        grid = getattr(hole, self.grid)
+        for d, (d_row, d_col) in enumerate(DIRECTION_STEPS):
+            tiles, neighbors = shifted_pairs(grid, d_row, d_col)
+            tiles = tiles.ravel().astype(np.int64)
+            neighbors = neighbors.ravel()
+            if self._tiles is not None:
+                keep = self._tiles[tiles]
+                tiles, neighbors = tiles[keep], neighbors[keep]
+            if self._classes is not None:
+                neighbors = self._classes[neighbors]
+            self.counts[d] += np.bincount(tiles * 256 + neighbors, minlength=256 * 256).reshape(
+                256, 256
+            )
+        self.holes += 1
+
+    def to_json(self) -> dict:
+        """
+        Get the counts in the neighbor table format.
+
+        Returns:
+            {"0xTT": {"up": {"0xNN": count, ...}, "down": ..., ...}} for every
+            tile that has at least one neighbor
+        """
+        neighbors_json = {}
+        for tile in np.flatnonzero(self.counts.sum(axis=(0, 2))).tolist():
+            neighbors_json[f"0x{tile:02X}"] = {
+                direction: {
+                    f"0x{n:02X}": int(self.counts[d, tile, n])
+                    for n in np.flatnonzero(self.counts[d, tile]).tolist()
+                }
+                for d, direction in enumerate(DIRECTIONS)
+            }
+        return neighbors_json
+
+
+class TileFrequencies:
+    """Counts how often each tile value appears in a grid."""
+
+    def __init__(self, grid: str = "terrain"):
+        """
+        Args:
+            grid: Grid to count ("terrain", "attributes" or "greens")
+        """
+        self.grid = grid
+        self.counts = np.zeros(256, dtype=np.int64)
+
+    def add(self, hole: CorpusHole):
+        self.counts += np.bincount(getattr(hole, self.grid).ravel(), minlength=256)
+
+    def unique(self) -> list[int]:
+        """Tile values that appeared at least once, sorted."""
+        return np.flatnonzero(self.counts).tolist()
+
+
+class PuttingSurfaceSizes:
+    """Collects the number of putting surface tiles of each hole."""
+
+    def __init__(self):
+        self.holes: list[dict] = []
+        self._surface = np.zeros(256, dtype=bool)
+        self._surface[list(PUTTING_SURFACE_TILES)] = True
+
+    def add(self, hole: CorpusHole):
+        size = int(self._surface[hole.greens].sum())
+        self.holes.append({"course": hole.course, "hole": hole.number, "size": size})
+
+    @property
+    def sizes(self) -> list[int]:
+        return [hole["size"] for hole in self.holes]
+
+
+class CompressionRatios:
+    """Collects each hole's terrain compression ratio (compressed / raw size)."""
+
+    def __init__(self):
+        self.ratios: list[float] = []
+
+    def add(self, hole: CorpusHole):
+        terrain = hole.info["terrain"]
+        compressed_size = hole.info["_debug"]["terrain_compressed_size"]
+        self.ratios.append(compressed_size / (terrain["width"] * terrain["height"]))
+
+
+def greens_neighbor_counts() -> NeighborCounts:
+    """Neighbor counts for fringe tiles, as recorded in greens_neighbors.json."""
+    return NeighborCounts("greens", GREENS_TARGET_TILES, greens_neighbor_class)
+
+
+def _write_json(path: Path, data: dict, dump=json.dump):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        dump(data, f, indent=2)
+    print(f"✓ Saved {path}")
+
+
+def main():
+    # Imported here: the analyzers import this module for the scanner
+    from golf.formats import compact_json
+    from tools.analyze_greens_neighbors import greens_neighbors_result
+    from tools.analyze_neighbors import neighbors_result
+    from tools.analyze_putting_surface import putting_surface_result
+
+    parser = argparse.ArgumentParser(
+        description="Regenerate neighbor tables and statistics from courses in one pass"
+    )
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        help="Course directories, or directories containing course directories "
+        "(default: the vanilla courses)",
+    )
+    parser.add_argument(
+        "-o",
+        "--data-dir",
+        default=str(DATA_DIR),
+        help="Directory to write tables/ and statistics/ to (default: data/)",
+    )
+
+    args = parser.parse_args()
+
+    try:
+        course_dirs = find_course_dirs(args.paths) if args.paths else default_course_dirs()
+    except OSError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    if not course_dirs:
+        print("Error: No course directories found")
+        sys.exit(1)
+
+    terrain_counts = NeighborCounts("terrain")
+    greens_counts = greens_neighbor_counts()
+    putting_sizes = PuttingSurfaceSizes()
+
+    start = time.perf_counter()
+    try:
+        total_holes = scan_corpus(course_dirs, [terrain_counts, greens_counts, putting_sizes])
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"Scanned {total_holes} holes in {len(course_dirs)} courses ({elapsed_ms:.1f} ms)")
+
+    data_dir = Path(args.data_dir)
+    _write_json(data_dir / "tables" / "terrain_neighbors.json", neighbors_result(terrain_counts))
+    _write_json(
+        data_dir / "tables" / "greens_neighbors.json", greens_neighbors_result(greens_counts)
+    )
+    _write_json(
+        data_dir / "statistics" / "putting_surface_sizes.json",
+        putting_surface_result(putting_sizes),
+        compact_json.dump,
+    )
+
+
+if __name__ == "__main__":
+    main()
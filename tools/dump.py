@@ -5,16 +5,20 @@ NES Open Tournament Golf - Course Data Dumper
 Extracts course data from ROM and saves as human-readable JSON files.
 """
 
-import sys
+import argparse
+import contextlib
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from golf.core.decompressor import (
     DecompressionStats,
     GreensDecompressor,
     TerrainDecompressor,
-    bcd_to_int,
     unpack_attributes,
 )
+from golf.core.hole_metadata import HoleMetadataTable
 from golf.core.palettes import (
     ATTR_TOTAL_BYTES,
     TERRAIN_ROW_WIDTH,
@@ -24,32 +28,185 @@ from golf.core.rom_reader import (
     HOLES_PER_COURSE,
     TABLE_COURSE_BANK_TERRAIN,
     TABLE_COURSE_HOLE_OFFSET,
-    TABLE_DISTANCE_1,
-    TABLE_DISTANCE_10,
-    TABLE_DISTANCE_100,
-    TABLE_FLAG_X_OFFSET,
-    TABLE_FLAG_Y_OFFSET,
-    TABLE_GREEN_X,
-    TABLE_GREEN_Y,
-    TABLE_GREENS_PTR,
-    TABLE_HANDICAP,
-    TABLE_PAR,
-    TABLE_SCROLL_LIMIT,
-    TABLE_TEE_X,
-    TABLE_TEE_Y,
-    TABLE_TERRAIN_END_PTR,
-    TABLE_TERRAIN_START_PTR,
     TOTAL_HOLES,
     RomReader,
 )
 from golf.formats import compact_json as json
 from golf.formats.hex_utils import format_hex_rows
 
+# Greens use bank 3 based on the code analysis
+GREENS_BANK = 3
+
+
+def dump_hole(
+    rom: RomReader,
+    course_idx: int,
+    hole_in_course: int,
+    terrain_decomp: TerrainDecompressor,
+    greens_decomp: GreensDecompressor,
+    metadata: HoleMetadataTable,
+    collect_stats: bool = False,
+) -> dict:
+    """
+    Decode one hole and serialize it to JSON text (no file I/O).
+
+    Args:
+        rom: ROM to read from
+        course_idx: Course index (0-2)
+        hole_in_course: Hole index within the course (0-17)
+        terrain_decomp: Terrain decompressor for the ROM
+        greens_decomp: Greens decompressor for bank 3
+        metadata: Metadata tables decoded from the ROM
+        collect_stats: Record decoder statistics (decodes through the slower
+            instrumented path)
+
+    Returns:
+        Dict with "hole_num", "text" (hole JSON), "log" (progress output),
+        "terrain_stats" and "greens_stats" (DecompressionStats for this hole,
+        or None when not collected)
+    """
+    course = COURSES[course_idx]
+    hole_offset = rom.read_fixed_byte(TABLE_COURSE_HOLE_OFFSET + course_idx)
+    terrain_bank = rom.read_fixed_byte(TABLE_COURSE_BANK_TERRAIN + course_idx)
 
-def dump_course(
-    rom: RomReader, course_idx: int, output_dir: Path
-) -> tuple[DecompressionStats, DecompressionStats]:
-    """Dump all holes for a single course. Returns (terrain_stats, greens_stats)."""
+    hole_idx = hole_offset + hole_in_course  # Absolute hole index 0-53
+    hole_num = hole_in_course + 1  # Display number 1-18
+
+    # Per-hole statistics, merged by the caller in hole order
+    terrain_stats = greens_stats = None
+    if collect_stats:
+        terrain_stats = DecompressionStats()
+        greens_stats = DecompressionStats()
+        terrain_stats.set_hole_context(course["name"], hole_num)
+        greens_stats.set_hole_context(course["name"], hole_num)
+
+    log = [f"  Hole {hole_num}... "]
+
+    # Pointers from the bulk-decoded tables
+    terrain_start_ptr = int(metadata.terrain_start_ptr[hole_idx])
+    terrain_end_ptr = int(metadata.terrain_end_ptr[hole_idx])
+    greens_ptr = int(metadata.greens_ptr[hole_idx])
+
+    # Calculate compressed terrain size
+    terrain_compressed_size = terrain_end_ptr - terrain_start_ptr
+
+    # Read compressed terrain data
+    terrain_prg = rom.cpu_to_prg_switched(terrain_start_ptr, terrain_bank)
+    terrain_compressed = rom.read_prg(terrain_prg, terrain_compressed_size)
+
+    # Read attribute data (72 bytes after terrain)
+    attr_prg = rom.cpu_to_prg_switched(terrain_end_ptr, terrain_bank)
+    attr_bytes = rom.read_prg(attr_prg, ATTR_TOTAL_BYTES)
+
+    # Decompress terrain
+    terrain_rows = terrain_decomp.decompress(terrain_compressed, stats=terrain_stats)
+    terrain_height = len(terrain_rows)
+
+    # Unpack attributes
+    attr_height = (terrain_height + 1) // 2  # Supertile rows
+    attr_rows = unpack_attributes(attr_bytes, attr_height)
+
+    log.append(f"hole: {hole_num}, terrain_height: {terrain_height}, attr_height: {attr_height}, attr_rows: {len(attr_rows)}\n")
+
+    # Read and decompress greens
+    # In the game itself this routine runs until the *output* buffer is filled.
+    # So we'll grab a generous buffer to pass to the decompress function.
+    if hole_idx < TOTAL_HOLES - 1:
+        next_greens_ptr = int(metadata.greens_ptr[hole_idx + 1])
+        # Handle course boundaries where pointer table wraps
+        if next_greens_ptr > greens_ptr:
+            greens_size = next_greens_ptr - greens_ptr
+        else:
+            greens_size = 576  # (worst case: 1 byte = 1 tile)
+    else:
+        greens_size = 576  # Conservative fallback for last hole
+
+    greens_prg = rom.cpu_to_prg_switched(greens_ptr, GREENS_BANK)
+    greens_compressed = rom.read_prg(greens_prg, greens_size)
+
+    try:
+        greens_rows = greens_decomp.decompress(greens_compressed, stats=greens_stats)
+    except Exception as e:
+        log.append(f"(greens decompress error: {e})\n")
+        greens_rows = []
+
+    # Build hole JSON
+    hole_data = {
+        "hole": hole_num,
+        **metadata.hole_json(hole_idx),
+        "terrain": {
+            "width": TERRAIN_ROW_WIDTH,
+            "height": terrain_height,
+            "rows": format_hex_rows(terrain_rows),
+        },
+        "attributes": {
+            "width": len(attr_rows[0]) if attr_rows else 11,
+            "height": len(attr_rows),
+            "rows": attr_rows,
+        },
+        "greens": {
+            "width": 24,
+            "height": len(greens_rows),
+            "rows": format_hex_rows(greens_rows),
+        },
+        "_debug": {
+            "terrain_ptr": f"${terrain_start_ptr:04X}",
+            "terrain_end_ptr": f"${terrain_end_ptr:04X}",
+            "terrain_compressed_size": terrain_compressed_size,
+            "greens_ptr": f"${greens_ptr:04X}",
+            "attr_raw": " ".join(f"{b:02X}" for b in attr_bytes),
+        },
+    }
+
+    log.append(f"OK ({terrain_height} rows, {terrain_compressed_size} bytes compressed)")
+
+    return {
+        "hole_num": hole_num,
+        "text": json.dumps(hole_data, indent=2),
+        "log": "".join(log),
+        "terrain_stats": terrain_stats,
+        "greens_stats": greens_stats,
+    }
+
+
+# Per-process ROM and decompressors used by dump_hole() (built once per worker)
+_worker_state: (
+    tuple[RomReader, TerrainDecompressor, GreensDecompressor, HoleMetadataTable] | None
+) = None
+
+
+def _init_dump_worker(rom_path: str):
+    """Process pool initializer: load the ROM and decode tables once per worker."""
+    global _worker_state
+    with contextlib.redirect_stdout(io.StringIO()):
+        rom = RomReader(rom_path)
+    _worker_state = (
+        rom,
+        TerrainDecompressor(rom),
+        GreensDecompressor(rom, GREENS_BANK),
+        HoleMetadataTable.from_rom(rom),
+    )
+
+
+def _dump_hole_in_worker(
+    course_idx: int, hole_in_course: int, collect_stats: bool
+) -> dict:
+    """Decode a hole with the calling worker's ROM and decompressors."""
+    assert _worker_state is not None
+    rom, terrain_decomp, greens_decomp, metadata = _worker_state
+    return dump_hole(
+        rom,
+        course_idx,
+        hole_in_course,
+        terrain_decomp,
+        greens_decomp,
+        metadata,
+        collect_stats,
+    )
+
+
+def _write_course_meta(rom: RomReader, course_idx: int, output_dir: Path) -> Path:
+    """Create a course's directory and course.json. Returns the directory."""
     course = COURSES[course_idx]
     course_dir = output_dir / course["name"]
     course_dir.mkdir(parents=True, exist_ok=True)
@@ -58,173 +215,163 @@ def dump_course(
     hole_offset = rom.read_fixed_byte(TABLE_COURSE_HOLE_OFFSET + course_idx)
     terrain_bank = rom.read_fixed_byte(TABLE_COURSE_BANK_TERRAIN + course_idx)
 
-    # Greens use bank 3 based on the code analysis
-    greens_bank = 3
-
     # Write course metadata
     course_meta = {
         "name": course["display_name"],
         "hole_offset": hole_offset,
         "terrain_bank": terrain_bank,
-        "greens_bank": greens_bank,
+        "greens_bank": GREENS_BANK,
     }
 
     with open(course_dir / "course.json", "w") as f:
         json.dump(course_meta, f, indent=2)
 
-    print(f"\nDumping {course['display_name']} course (bank {terrain_bank})...")
+    return course_dir
 
-    # Create decompressors
-    terrain_decomp = TerrainDecompressor(rom)
-    greens_decomp = GreensDecompressor(rom, greens_bank)
 
-    # Create statistics collectors
-    terrain_stats = DecompressionStats()
-    greens_stats = DecompressionStats()
+def _save_hole(course_dir: Path, result: dict):
+    """Write a dump_hole() result to its hole file and print its progress."""
+    with open(course_dir / f"hole_{result['hole_num']:02d}.json", "w") as f:
+        f.write(result["text"])
+    print(result["log"])
 
-    # Dump each hole
-    for hole_in_course in range(HOLES_PER_COURSE):
-        hole_idx = hole_offset + hole_in_course  # Absolute hole index 0-53
-        hole_num = hole_in_course + 1  # Display number 1-18
 
-        # Set stats context
-        terrain_stats.set_hole_context(course["name"], hole_num)
-        greens_stats.set_hole_context(course["name"], hole_num)
+def _merge_hole_stats(
+    result: dict, terrain_stats: DecompressionStats, greens_stats: DecompressionStats
+):
+    """Merge a dump_hole() result's statistics, if it collected any."""
+    if result["terrain_stats"] is not None:
+        terrain_stats.merge(result["terrain_stats"])
+        greens_stats.merge(result["greens_stats"])
 
-        print(f"  Hole {hole_num}...", end=" ")
-
-        # Read metadata from fixed bank tables
-        par = rom.read_fixed_byte(TABLE_PAR + hole_idx)
-        handicap = rom.read_fixed_byte(TABLE_HANDICAP + hole_idx)
-
-        dist_100 = rom.read_fixed_byte(TABLE_DISTANCE_100 + hole_idx)
-        dist_10 = rom.read_fixed_byte(TABLE_DISTANCE_10 + hole_idx)
-        dist_1 = rom.read_fixed_byte(TABLE_DISTANCE_1 + hole_idx)
-        distance = bcd_to_int(dist_100, dist_10, dist_1)
-
-        scroll_limit = rom.read_fixed_byte(TABLE_SCROLL_LIMIT + hole_idx)
-        green_x = rom.read_fixed_byte(TABLE_GREEN_X + hole_idx)
-        green_y = rom.read_fixed_byte(TABLE_GREEN_Y + hole_idx)
-        tee_x = rom.read_fixed_byte(TABLE_TEE_X + hole_idx)
-        tee_y = rom.read_fixed_word(TABLE_TEE_Y + (hole_idx * 2))
-
-        # Read flag positions (4 per hole)
-        flag_positions = []
-        for i in range(4):
-            flag_y_off = rom.read_fixed_byte(TABLE_FLAG_Y_OFFSET + (hole_idx * 4) + i)
-            flag_x_off = rom.read_fixed_byte(TABLE_FLAG_X_OFFSET + (hole_idx * 4) + i)
-            flag_positions.append({"x_offset": flag_x_off, "y_offset": flag_y_off})
-
-        # Read pointers
-        terrain_start_ptr = rom.read_fixed_word(
-            TABLE_TERRAIN_START_PTR + (hole_idx * 2)
-        )
-        terrain_end_ptr = rom.read_fixed_word(TABLE_TERRAIN_END_PTR + (hole_idx * 2))
-        greens_ptr = rom.read_fixed_word(TABLE_GREENS_PTR + (hole_idx * 2))
 
-        # Calculate compressed terrain size
-        terrain_compressed_size = terrain_end_ptr - terrain_start_ptr
+def dump_course(
+    rom: RomReader, course_idx: int, output_dir: Path, collect_stats: bool = True
+) -> tuple[DecompressionStats, DecompressionStats]:
+    """
+    Dump all holes for a single course. Returns (terrain_stats, greens_stats).
 
-        # Read compressed terrain data
-        terrain_prg = rom.cpu_to_prg_switched(terrain_start_ptr, terrain_bank)
-        terrain_compressed = rom.read_prg(terrain_prg, terrain_compressed_size)
+    The statistics are empty unless collect_stats is set.
+    """
+    course_dir = _write_course_meta(rom, course_idx, output_dir)
+    terrain_bank = rom.read_fixed_byte(TABLE_COURSE_BANK_TERRAIN + course_idx)
 
-        # Read attribute data (72 bytes after terrain)
-        attr_prg = rom.cpu_to_prg_switched(terrain_end_ptr, terrain_bank)
-        attr_bytes = rom.read_prg(attr_prg, ATTR_TOTAL_BYTES)
+    print(f"\nDumping {COURSES[course_idx]['display_name']} course (bank {terrain_bank})...")
 
-        # Decompress terrain
-        terrain_rows = terrain_decomp.decompress(
-            terrain_compressed, stats=terrain_stats
-        )
-        terrain_height = len(terrain_rows)
+    # Create decompressors
+    terrain_decomp = TerrainDecompressor(rom)
+    greens_decomp = GreensDecompressor(rom, GREENS_BANK)
 
-        # Unpack attributes
-        attr_height = (terrain_height + 1) // 2  # Supertile rows
-        attr_rows = unpack_attributes(attr_bytes, attr_height)
+    # Decode all metadata tables once
+    metadata = HoleMetadataTable.from_rom(rom)
 
-        print(f"hole: {hole_num}, terrain_height: {terrain_height}, attr_height: {attr_height}, attr_rows: {len(attr_rows)}")
+    # Create statistics collectors
+    terrain_stats = DecompressionStats()
+    greens_stats = DecompressionStats()
 
-        # Read and decompress greens
-        # In the game itself this routine runs until the *output* buffer is filled.
-        # So we'll grab a generous buffer to pass to the decompress function.
-        if hole_idx < TOTAL_HOLES - 1:
-            next_greens_ptr = rom.read_fixed_word(
-                TABLE_GREENS_PTR + ((hole_idx + 1) * 2)
-            )
-            # Handle course boundaries where pointer table wraps
-            if next_greens_ptr > greens_ptr:
-                greens_size = next_greens_ptr - greens_ptr
-            else:
-                greens_size = 576  # (worst case: 1 byte = 1 tile)
-        else:
-            greens_size = 576  # Conservative fallback for last hole
+    # Dump each hole
+    for hole_in_course in range(HOLES_PER_COURSE):
+        result = dump_hole(
+            rom,
+            course_idx,
+            hole_in_course,
+            terrain_decomp,
+            greens_decomp,
+            metadata,
+            collect_stats,
+        )
+        _save_hole(course_dir, result)
+        _merge_hole_stats(result, terrain_stats, greens_stats)
 
-        greens_prg = rom.cpu_to_prg_switched(greens_ptr, greens_bank)
-        greens_compressed = rom.read_prg(greens_prg, greens_size)
+    return terrain_stats, greens_stats
 
-        try:
-            greens_rows = greens_decomp.decompress(
-                greens_compressed, stats=greens_stats
-            )
-        except Exception as e:
-            print(f"(greens decompress error: {e})")
-            greens_rows = []
-
-        # Build hole JSON
-        hole_data = {
-            "hole": hole_num,
-            "par": par,
-            "distance": distance,
-            "handicap": handicap,
-            "scroll_limit": scroll_limit,
-            "green": {"x": green_x, "y": green_y},
-            "tee": {"x": tee_x, "y": tee_y},
-            "flag_positions": flag_positions,
-            "terrain": {
-                "width": TERRAIN_ROW_WIDTH,
-                "height": terrain_height,
-                "rows": format_hex_rows(terrain_rows),
-            },
-            "attributes": {
-                "width": len(attr_rows[0]) if attr_rows else 11,
-                "height": len(attr_rows),
-                "rows": attr_rows,
-            },
-            "greens": {
-                "width": 24,
-                "height": len(greens_rows),
-                "rows": format_hex_rows(greens_rows),
-            },
-            "_debug": {
-                "terrain_ptr": f"${terrain_start_ptr:04X}",
-                "terrain_end_ptr": f"${terrain_end_ptr:04X}",
-                "terrain_compressed_size": terrain_compressed_size,
-                "greens_ptr": f"${greens_ptr:04X}",
-                "attr_raw": " ".join(f"{b:02X}" for b in attr_bytes),
-            },
-        }
 
-        # Write hole file
-        filename = f"hole_{hole_num:02d}.json"
-        with open(course_dir / filename, "w") as f:
-            json.dump(hole_data, f, indent=2)
+def dump_all_courses(
+    rom: RomReader,
+    rom_path: str,
+    output_dir: Path,
+    jobs: int,
+    collect_stats: bool = True,
+) -> tuple[DecompressionStats, DecompressionStats]:
+    """
+    Dump every course, decoding holes in a process pool.
+
+    Workers decode and serialize holes while this process writes the
+    finished files in hole order, so output and statistics are identical
+    to a serial dump.
+
+    Args:
+        rom: ROM (used here for course-level metadata)
+        rom_path: ROM file path (each worker loads its own copy)
+        output_dir: Output directory
+        jobs: Number of worker processes
+        collect_stats: Record decoder statistics
+
+    Returns:
+        (terrain_stats, greens_stats) merged across all holes (empty unless
+        collect_stats is set)
+    """
+    terrain_stats = DecompressionStats()
+    greens_stats = DecompressionStats()
 
-        print(f"OK ({terrain_height} rows, {terrain_compressed_size} bytes compressed)")
+    course_dirs = [
+        _write_course_meta(rom, course_idx, output_dir)
+        for course_idx in range(len(COURSES))
+    ]
+    tasks = [
+        (course_idx, hole_in_course)
+        for course_idx in range(len(COURSES))
+        for hole_in_course in range(HOLES_PER_COURSE)
+    ]
+
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_dump_worker, initargs=(rom_path,)
+    ) as executor:
+        results = executor.map(
+            _dump_hole_in_worker,
+            [course_idx for course_idx, _ in tasks],
+            [hole_in_course for _, hole_in_course in tasks],
+            [collect_stats] * len(tasks),
+        )
+        for (course_idx, hole_in_course), result in zip(tasks, results):
+            if hole_in_course == 0:
+                terrain_bank = rom.read_fixed_byte(TABLE_COURSE_BANK_TERRAIN + course_idx)
+                print(
+                    f"\nDumping {COURSES[course_idx]['display_name']} course "
+                    f"(bank {terrain_bank})..."
+                )
+            _save_hole(course_dirs[course_idx], result)
+            _merge_hole_stats(result, terrain_stats, greens_stats)
 
     return terrain_stats, greens_stats
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python dump.py <rom_file> [output_dir]")
-        print(
-            "\nDumps all course data from NES Open Tournament Golf ROM to JSON files."
-        )
-        sys.exit(1)
-
-    rom_path = sys.argv[1]
-    output_dir = Path(sys.argv[2]) if len(sys.argv) > 2 else Path("courses")
+    parser = argparse.ArgumentParser(
+        description="Dumps all course data from NES Open Tournament Golf ROM to JSON files."
+    )
+    parser.add_argument("rom_file", help="NES ROM file")
+    parser.add_argument(
+        "output_dir", nargs="?", default="courses", help="Output directory (default: courses)"
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Worker processes for decoding (default: CPU count)",
+        default=None,
+    )
+    parser.add_argument(
+        "--no-stats",
+        action="store_true",
+        help="Skip decoder statistics in meta.json (faster decoding)",
+    )
+    args = parser.parse_args()
+    collect_stats = not args.no_stats
+
+    rom_path = args.rom_file
+    output_dir = Path(args.output_dir)
+    jobs = max(1, args.jobs if args.jobs is not None else (os.cpu_count() or 1))
 
     print(f"Loading ROM: {rom_path}")
     rom = RomReader(rom_path)
@@ -232,33 +379,44 @@ def main():
     print(f"Output directory: {output_dir}")
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Create global stats collectors
-    global_terrain_stats = DecompressionStats()
-    global_greens_stats = DecompressionStats()
-
-    # Dump all three courses
-    for course_idx in range(len(COURSES)):
-        terrain_stats, greens_stats = dump_course(rom, course_idx, output_dir)
+    if jobs > 1:
+        global_terrain_stats, global_greens_stats = dump_all_courses(
+            rom, rom_path, output_dir, jobs, collect_stats
+        )
+    else:
+        # Create global stats collectors
+        global_terrain_stats = DecompressionStats()
+        global_greens_stats = DecompressionStats()
+
+        # Dump all three courses
+        for course_idx in range(len(COURSES)):
+            terrain_stats, greens_stats = dump_course(
+                rom, course_idx, output_dir, collect_stats
+            )
 
-        # Merge into global stats
-        global_terrain_stats.merge(terrain_stats)
-        global_greens_stats.merge(greens_stats)
+            # Merge into global stats
+            global_terrain_stats.merge(terrain_stats)
+            global_greens_stats.merge(greens_stats)
 
     # Write global metadata
     global_meta = {
         "rom": rom_path,
         "total_courses": len(COURSES),
         "total_holes": TOTAL_HOLES,
-        "statistics": {
+    }
+    if collect_stats:
+        global_meta["statistics"] = {
             "terrain": global_terrain_stats.to_dict(),
             "greens": global_greens_stats.to_dict(),
-        },
-    }
+        }
 
     with open(output_dir / "meta.json", "w") as f:
         json.dump(global_meta, f, indent=2)
 
-    print(f"\nWrote statistics to {output_dir}/meta.json")
+    if collect_stats:
+        print(f"\nWrote statistics to {output_dir}/meta.json")
+    else:
+        print(f"\nWrote {output_dir}/meta.json")
     print("\nDone!")
 
 
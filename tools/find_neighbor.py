@@ -3,20 +3,30 @@
 Find holes with specific terrain tile neighbor relationships.
 
 Usage:
-    python find_neighbor.py <tile1> <direction> <tile2>
+    python find_neighbor.py <tile1> <direction> <tile2> [<tile1> <direction> <tile2> ...]
 
 Examples:
     python find_neighbor.py A1 S A4    # Find A1 with A4 directly south
     python find_neighbor.py 9E E 9F    # Find 9E with 9F directly east
     python find_neighbor.py DF N 82    # Find DF with 82 directly north
+    python find_neighbor.py A1 S A4 9E E 9F    # Several queries at once
 
 Directions: N, S, E, W, NE, NW, SE, SW
+
+Queries are answered from an index of every (tile, direction, neighbor)
+triple in the courses, saved to courses/.neighbor_index.npz. Only hole
+files changed since the last run are re-indexed.
 """
 
-import json
 import sys
+import zipfile
 from pathlib import Path
 
+import numpy as np
+
+from golf.formats.atomic_file import atomic_write
+from tools.corpus import COURSES_DIR, load_hole_file, shifted_pairs
+
 
 DIRECTION_OFFSETS = {
     'N': (-1, 0),   # North (row above)
@@ -29,105 +39,290 @@ DIRECTION_OFFSETS = {
     'SW': (1, -1),  # Southwest
 }
 
+# Bump when the index layout changes
+INDEX_FORMAT_VERSION = 3
 
-def parse_terrain_rows(rows):
-    """Parse terrain rows from hex strings into 2D array."""
-    terrain = []
-    for row in rows:
-        tiles = row.split()
-        terrain.append(tiles)
-    return terrain
+# Index file name, stored in the courses directory
+INDEX_FILENAME = ".neighbor_index.npz"
 
 
 def find_neighbor_matches(terrain, tile1, direction, tile2):
     """
     Find all positions where tile1 has tile2 as a neighbor in the given direction.
 
+    Args:
+        terrain: Terrain tiles as a 2D array
+        tile1: Tile to find, as hex (e.g. "A1")
+        direction: Direction of the neighbor (see DIRECTION_OFFSETS)
+        tile2: Neighbor tile, as hex
+
     Returns list of (row, col) positions where tile1 is found with the relationship.
     """
     if direction not in DIRECTION_OFFSETS:
         raise ValueError(f"Invalid direction: {direction}. Must be one of {list(DIRECTION_OFFSETS.keys())}")
 
-    tile1 = tile1.upper()
-    tile2 = tile2.upper()
     drow, dcol = DIRECTION_OFFSETS[direction]
+    tiles, neighbors = shifted_pairs(np.asarray(terrain), drow, dcol)
+    rows, cols = np.nonzero((tiles == int(tile1, 16)) & (neighbors == int(tile2, 16)))
 
-    matches = []
-    height = len(terrain)
+    # Positions in tiles are offset from the grid when the neighbor is above/left
+    return list(zip((rows + max(0, -drow)).tolist(), (cols + max(0, -dcol)).tolist()))
 
-    for row in range(height):
-        width = len(terrain[row])
-        for col in range(width):
-            # Check if this position has tile1
-            if terrain[row][col] == tile1:
-                # Check if neighbor position exists and has tile2
-                neighbor_row = row + drow
-                neighbor_col = col + dcol
 
-                if (0 <= neighbor_row < height and
-                    0 <= neighbor_col < len(terrain[neighbor_row]) and
-                    terrain[neighbor_row][neighbor_col] == tile2):
-                    matches.append((row, col))
+def _triple_code[Tiles: (int, np.ndarray)](tile1: Tiles, direction_idx: int, tile2: Tiles) -> Tiles:
+    """Index key of a (tile, direction, neighbor) triple (or an array of them)."""
+    return (direction_idx * 256 + tile1) * 256 + tile2
 
-    return matches
 
+# Number of distinct triple codes
+TRIPLE_CODES = len(DIRECTION_OFFSETS) * 256 * 256
 
-def search_all_holes(tile1, direction, tile2):
-    """Search all course holes for the neighbor relationship."""
-    courses_dir = Path(__file__).parent.parent / "courses"
 
-    if not courses_dir.exists():
-        print(f"Error: courses directory not found at {courses_dir}")
-        return
-
-    found_any = False
-
-    for country_dir in sorted(courses_dir.iterdir()):
-        if not country_dir.is_dir():
-            continue
+def index_terrain(terrain: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    List every (tile, direction, neighbor) triple of a terrain grid.
 
-        for hole_file in sorted(country_dir.glob("hole_*.json")):
-            try:
-                with open(hole_file) as f:
-                    data = json.load(f)
+    Args:
+        terrain: Terrain tiles, shape (rows, columns)
 
-                terrain_rows = data.get("terrain", {}).get("rows", [])
-                if not terrain_rows:
-                    continue
+    Returns:
+        Tuple of (codes, cells): triple codes (int32), and the (row, col)
+        of the tile for each code (uint16, shape (n, 2))
+    """
+    codes, cells = [], []
+    for direction_idx, (d_row, d_col) in enumerate(DIRECTION_OFFSETS.values()):
+        tiles, neighbors = shifted_pairs(terrain, d_row, d_col)
+        rows, cols = np.indices(tiles.shape)
+        codes.append(
+            _triple_code(tiles.astype(np.int32), direction_idx, neighbors.astype(np.int32)).ravel()
+        )
+        cells.append(
+            np.stack([rows.ravel() + max(0, -d_row), cols.ravel() + max(0, -d_col)], axis=1)
+        )
 
-                terrain = parse_terrain_rows(terrain_rows)
-                matches = find_neighbor_matches(terrain, tile1, direction, tile2)
+    return np.concatenate(codes).astype(np.int32), np.concatenate(cells).astype(np.uint16)
 
-                if matches:
-                    found_any = True
-                    print(f"\n{country_dir.name}/{hole_file.name}:")
-                    print(f"  Found {len(matches)} occurrence(s) of {tile1} {direction} {tile2}")
-                    for row, col in matches:
-                        print(f"    Position: row {row}, col {col}")
 
-            except Exception as e:
-                print(f"Error processing {hole_file}: {e}", file=sys.stderr)
+class NeighborIndex:
+    """
+    Inverted index from (tile, direction, neighbor) to hole cells.
+
+    Every indexed cell of every hole is one row of a single table sorted by
+    triple code, then hole, row and column, with an offsets array giving
+    each code's slice (compressed sparse row layout), so a lookup costs
+    the same however many holes are indexed. Holes are tagged with their
+    file's modification time and size, so refresh() only re-indexes holes
+    that changed.
+    """
 
-    if not found_any:
+    def __init__(self, courses_dir: str | Path = COURSES_DIR, index_path: str | Path | None = None):
+        """
+        Load the saved index (a missing or unreadable file starts empty).
+
+        Call refresh() before querying to bring it up to date.
+
+        Args:
+            courses_dir: Directory of course directories to index
+            index_path: Saved index file. If None, uses courses_dir/INDEX_FILENAME.
+        """
+        self.courses_dir = Path(courses_dir)
+        self.index_path = Path(index_path) if index_path else self.courses_dir / INDEX_FILENAME
+        self.holes: dict[str, dict] = {}  # Hole file (relative path) -> mtime_ns, size
+        self.reindexed = 0
+        self._dirty = False
+
+        # Table rows, sorted by triple code: hole number (position in
+        # self.holes) and (row, col) of the tile
+        self._offsets = np.zeros(TRIPLE_CODES + 1, dtype=np.int32)
+        self._hole_ids = np.zeros(0, dtype=np.int32)
+        self._cells = np.zeros((0, 2), dtype=np.uint16)
+
+        try:
+            with np.load(self.index_path, allow_pickle=False) as data:
+                if int(data["format"]) == INDEX_FORMAT_VERSION:
+                    self.holes = {
+                        name: {"mtime_ns": mtime_ns, "size": size}
+                        for name, mtime_ns, size in zip(
+                            data["names"].tolist(),
+                            data["mtime_ns"].tolist(),
+                            data["size"].tolist(),
+                            strict=True,
+                        )
+                    }
+                    self._offsets = data["offsets"]
+                    self._hole_ids = data["hole_ids"]
+                    self._cells = data["cells"]
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+            self.holes = {}
+
+    def refresh(self):
+        """Re-index added or changed hole files and drop removed ones."""
+        hole_files = {
+            path.relative_to(self.courses_dir).as_posix(): path
+            for path in sorted(self.courses_dir.glob("*/hole_*.json"))
+        }
+
+        stale = set(self.holes) - set(hole_files)
+        added = {}
+        for name, path in hole_files.items():
+            stat = path.stat()
+            entry = self.holes.get(name)
+            if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                continue
+            if entry:
+                stale.add(name)
+            added[name] = ({"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}, path)
+
+        if not stale and not added:
+            return
+
+        # Keep the rows of unchanged holes, renumbered for the new hole order
+        old_names = list(self.holes)
+        holes = {name: entry for name, entry in self.holes.items() if name not in stale}
+        for name, (entry, _) in added.items():
+            holes[name] = entry
+        holes = dict(sorted(holes.items()))
+        new_ids = {name: i for i, name in enumerate(holes)}
+        remap = np.array([new_ids.get(name, -1) for name in old_names], dtype=np.int32)
+
+        codes = np.repeat(np.arange(TRIPLE_CODES, dtype=np.int32), np.diff(self._offsets))
+        hole_ids = remap[self._hole_ids]
+        keep = hole_ids >= 0
+        codes, hole_ids, cells = [codes[keep]], [hole_ids[keep]], [self._cells[keep]]
+
+        for name, (_, path) in added.items():
+            hole_codes, hole_cells = index_terrain(load_hole_file(path).terrain)
+            codes.append(hole_codes)
+            hole_ids.append(np.full(len(hole_codes), new_ids[name], dtype=np.int32))
+            cells.append(hole_cells)
+            self.reindexed += 1
+
+        codes = np.concatenate(codes)
+        hole_ids = np.concatenate(hole_ids)
+        cells = np.concatenate(cells)
+        order = np.lexsort((cells[:, 1], cells[:, 0], hole_ids, codes))
+
+        self.holes = holes
+        self._hole_ids = hole_ids[order]
+        self._cells = cells[order]
+        self._offsets = np.zeros(TRIPLE_CODES + 1, dtype=np.int32)
+        np.cumsum(np.bincount(codes, minlength=TRIPLE_CODES), out=self._offsets[1:])
+        self._dirty = True
+
+    def find(self, tile1: int, direction: str, tile2: int) -> dict[str, list[tuple[int, int]]]:
+        """
+        Look up every cell where tile1 has tile2 as its neighbor in a direction.
+
+        Args:
+            tile1: Tile value
+            direction: Direction of the neighbor (see DIRECTION_OFFSETS)
+            tile2: Neighbor tile value
+
+        Returns:
+            Hole file (relative to the courses directory) -> (row, col) of
+            each match, holes and cells in order
+
+        Raises:
+            ValueError: If a tile is outside 00-FF
+        """
+        for tile in (tile1, tile2):
+            if not 0 <= tile <= 0xFF:
+                raise ValueError(f"Tile out of range: {tile:#x} (expected 00-FF)")
+
+        code = _triple_code(tile1, list(DIRECTION_OFFSETS).index(direction), tile2)
+        start, stop = int(self._offsets[code]), int(self._offsets[code + 1])
+
+        names = list(self.holes)
+        matches: dict[str, list[tuple[int, int]]] = {}
+        for hole_id, (row, col) in zip(
+            self._hole_ids[start:stop].tolist(), self._cells[start:stop].tolist(), strict=True
+        ):
+            matches.setdefault(names[hole_id], []).append((row, col))
+        return matches
+
+    def save(self):
+        """Write the index to disk if it changed."""
+        if not self._dirty:
+            return
+
+        entries = list(self.holes.values())
+        arrays = {
+            "format": np.int64(INDEX_FORMAT_VERSION),
+            "names": np.array(list(self.holes), dtype=str),
+            "mtime_ns": np.array([entry["mtime_ns"] for entry in entries], dtype=np.int64),
+            "size": np.array([entry["size"] for entry in entries], dtype=np.int64),
+            "offsets": self._offsets,
+            "hole_ids": self._hole_ids,
+            "cells": self._cells,
+        }
+
+        with atomic_write(self.index_path, "wb") as f:
+            np.savez(f, **arrays)
+        self._dirty = False
+
+
+def search_all_holes(tile1, direction, tile2, index: NeighborIndex | None = None):
+    """Search all course holes for the neighbor relationship."""
+    if index is None:
+        if not COURSES_DIR.exists():
+            print(f"Error: courses directory not found at {COURSES_DIR}")
+            return
+        index = NeighborIndex()
+        index.refresh()
+        index.save()
+
+    matches = index.find(int(tile1, 16), direction, int(tile2, 16))
+
+    for name, cells in matches.items():
+        print(f"\n{name}:")
+        print(f"  Found {len(cells)} occurrence(s) of {tile1} {direction} {tile2}")
+        for row, col in cells:
+            print(f"    Position: row {row}, col {col}")
+
+    if not matches:
         print(f"\nNo holes found with {tile1} {direction} {tile2} relationship")
 
 
 def main():
-    if len(sys.argv) != 4:
+    args = sys.argv[1:]
+    if not args or len(args) % 3 != 0:
         print(__doc__)
         sys.exit(1)
 
-    tile1 = sys.argv[1]
-    direction = sys.argv[2].upper()
-    tile2 = sys.argv[3]
+    queries = []
+    for i in range(0, len(args), 3):
+        tile1, direction, tile2 = args[i], args[i + 1].upper(), args[i + 2]
 
-    if direction not in DIRECTION_OFFSETS:
-        print(f"Error: Invalid direction '{direction}'")
-        print(f"Valid directions: {', '.join(DIRECTION_OFFSETS.keys())}")
+        if direction not in DIRECTION_OFFSETS:
+            print(f"Error: Invalid direction '{direction}'")
+            print(f"Valid directions: {', '.join(DIRECTION_OFFSETS.keys())}")
+            sys.exit(1)
+
+        try:
+            tiles = int(tile1, 16), int(tile2, 16)
+        except ValueError:
+            tiles = ()
+        if len(tiles) != 2 or not all(0 <= tile <= 0xFF for tile in tiles):
+            print(f"Error: Invalid tile in '{tile1} {direction} {tile2}' (expected hex 00-FF)")
+            sys.exit(1)
+
+        queries.append((tile1, direction, tile2))
+
+    if not COURSES_DIR.exists():
+        print(f"Error: courses directory not found at {COURSES_DIR}")
+        sys.exit(1)
+
+    index = NeighborIndex()
+    try:
+        index.refresh()
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Error indexing courses: {e}", file=sys.stderr)
         sys.exit(1)
+    index.save()
 
-    print(f"Searching for {tile1} with {tile2} to the {direction}...")
-    search_all_holes(tile1, direction, tile2)
+    for tile1, direction, tile2 in queries:
+        print(f"Searching for {tile1} with {tile2} to the {direction}...")
+        search_all_holes(tile1, direction, tile2, index)
 
 
 if __name__ == "__main__":
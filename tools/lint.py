@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+NES Open Tournament Golf - Course Linter
+
+Checks every hole of one or more courses for terrain and greens tiles with
+neighbors never seen in the original game data. Each course is checked
+in a few vectorized operations over all of its holes at once. Exits with
+status 1 if anything is found, for use as a pre-commit hook or CI check.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+from golf.core.neighbor_validator import (
+    GreensNeighborValidator,
+    TerrainNeighborValidator,
+)
+from golf.formats.course_pack import load_course_holes
+from tools.corpus import find_course_dirs
+
+
+def stack_grids(grids: list[list[list[int]]]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Stack grids of different sizes into one padded array.
+
+    Args:
+        grids: Grids as lists of rows
+
+    Returns:
+        Tuple of (tiles, present): int array of shape (len(grids), rows, cols)
+        and a boolean array marking the cells that hold real tiles
+    """
+    rows = max((len(grid) for grid in grids), default=0)
+    cols = max((len(row) for grid in grids for row in grid), default=0)
+    tiles = np.zeros((len(grids), rows, cols), dtype=np.int64)
+    present = np.zeros((len(grids), rows, cols), dtype=bool)
+    for i, grid in enumerate(grids):
+        for r, row in enumerate(grid):
+            tiles[i, r, : len(row)] = row
+            present[i, r, : len(row)] = True
+    return tiles, present
+
+
+def lint_course(
+    course_dir: Path,
+    terrain_validator: TerrainNeighborValidator,
+    greens_validator: GreensNeighborValidator | None = None,
+) -> list[dict]:
+    """
+    Find tiles with invalid neighbors in every hole of a course.
+
+    Args:
+        course_dir: Course directory
+        terrain_validator: Terrain validator
+        greens_validator: Greens validator, or None to skip the greens
+
+    Returns:
+        One dict per hole: {"hole", "terrain", "greens"}, where terrain and
+        greens are lists of (row, col, tile) for each invalid tile
+    """
+    holes = load_course_holes(course_dir)
+    results = [
+        {"hole": hole.metadata.get("hole", i + 1), "terrain": [], "greens": []}
+        for i, hole in enumerate(holes)
+    ]
+
+    sections = [("terrain", terrain_validator)]
+    if greens_validator is not None:
+        sections.append(("greens", greens_validator))
+
+    for name, validator in sections:
+        tiles, present = stack_grids([getattr(hole, name) for hole in holes])
+        invalid = validator.invalid_mask(tiles, present)
+        for i, r, c in zip(*(axis.tolist() for axis in np.nonzero(invalid))):
+            results[i][name].append((r, c, int(tiles[i, r, c])))
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Check courses for tiles with neighbors not seen in the original game"
+    )
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        help="Course directories, or directories containing course directories",
+    )
+    parser.add_argument(
+        "--no-greens", action="store_true", help="Only check terrain, not putting greens"
+    )
+    parser.add_argument(
+        "-q", "--quiet", action="store_true", help="Only print the summary"
+    )
+
+    args = parser.parse_args()
+
+    try:
+        course_dirs = find_course_dirs(args.paths)
+        terrain_validator = TerrainNeighborValidator()
+        greens_validator = None if args.no_greens else GreensNeighborValidator()
+    except OSError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    if not course_dirs:
+        print("Error: No course directories found")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    total_holes = 0
+    problems = {"terrain": 0, "greens": 0}
+    bad_holes = 0
+
+    for course_dir in course_dirs:
+        results = lint_course(course_dir, terrain_validator, greens_validator)
+        total_holes += len(results)
+        for result in results:
+            if not (result["terrain"] or result["greens"]):
+                continue
+            bad_holes += 1
+            for name in problems:
+                problems[name] += len(result[name])
+                if args.quiet:
+                    continue
+                for row, col, tile in result[name]:
+                    print(
+                        f"{course_dir / f'hole_{result['hole']:02d}'}: {name} "
+                        f"row {row}, col {col}: tile ${tile:02X} has an invalid neighbor"
+                    )
+
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(
+        f"Checked {total_holes} holes in {len(course_dirs)} courses ({elapsed_ms:.1f} ms): "
+        f"{problems['terrain']} invalid terrain tiles, "
+        f"{problems['greens']} invalid greens tiles in {bad_holes} holes"
+    )
+
+    if bad_holes:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+NES Open Tournament Golf - Course Packer
+
+Converts course directories of hole_XX.json files to single-file packed
+courses (course.pack) and back.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from golf.formats.course_pack import PACK_FILENAME, pack_course_dir, unpack_course_file
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Pack course directories into binary course files, or unpack them to JSON"
+    )
+    parser.add_argument(
+        "course_dirs",
+        nargs="*",
+        help=f"Course directories to pack (each written to <course_dir>/{PACK_FILENAME})",
+    )
+    parser.add_argument(
+        "--unpack",
+        nargs=2,
+        metavar=("PACK_FILE", "OUTPUT_DIR"),
+        help="Write a packed course back out as hole_XX.json files",
+    )
+
+    args = parser.parse_args()
+
+    if not args.course_dirs and not args.unpack:
+        parser.print_usage()
+        sys.exit(1)
+
+    try:
+        for course_dir in args.course_dirs:
+            pack_path = pack_course_dir(Path(course_dir))
+            print(f"Packed {course_dir} -> {pack_path} ({pack_path.stat().st_size:,} bytes)")
+
+        if args.unpack:
+            pack_file, output_dir = args.unpack
+            paths = unpack_course_file(pack_file, output_dir)
+            print(f"Unpacked {len(paths)} holes from {pack_file} to {output_dir}")
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
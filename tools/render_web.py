@@ -7,11 +7,18 @@ Generates metadata.json with course and hole information.
 """
 
 import argparse
+import contextlib
+import hashlib
+import io
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+from golf.core import chr_tile, palettes
 from golf.core.chr_tile import TilesetData
+from golf.rendering import green_overlay, pil_renderer, pil_sprite
 from golf.rendering.pil_renderer import render_hole_to_image
 from golf.rendering.pil_sprite import PILSprite
 
@@ -19,10 +26,21 @@ from golf.rendering.pil_sprite import PILSprite
 # Course directories to process
 COURSE_NAMES = ["japan", "us", "uk"]
 
+SPRITE_DIR = Path(__file__).parent.parent / "data" / "sprites"
+
+# Records the input hash of every rendered image, for --incremental
+RENDER_MANIFEST_FILENAME = ".render_manifest.json"
+
+# Bump when rendering changes in a way that alters output images
+RENDER_MANIFEST_VERSION = 1
+
+# Modules whose code draws the images; editing any of them re-renders
+RENDERER_MODULES = (pil_renderer, pil_sprite, green_overlay, chr_tile, palettes)
+
 
 def load_sprites() -> dict[str, PILSprite]:
     """Load all terrain sprites from data/sprites/."""
-    sprite_dir = Path(__file__).parent.parent / "data" / "sprites"
+    sprite_dir = SPRITE_DIR
     sprites = {}
 
     sprite_files = {
@@ -44,13 +62,111 @@ def load_sprites() -> dict[str, PILSprite]:
     return sprites
 
 
+def input_fingerprint(tileset_path: str, flag_index: int) -> str:
+    """
+    Hash everything besides the hole JSON that affects rendered images.
+
+    Args:
+        tileset_path: Path to CHR tileset binary file
+        flag_index: Flag position being rendered
+
+    Returns:
+        Hex digest of the tileset, sprite files, renderer sources and render
+        settings
+    """
+    digest = hashlib.sha256(f"{RENDER_MANIFEST_VERSION}:{flag_index}".encode())
+    digest.update(Path(tileset_path).read_bytes())
+    for module in RENDERER_MODULES:
+        assert module.__file__ is not None
+        digest.update(module.__name__.encode())
+        digest.update(Path(module.__file__).read_bytes())
+    for sprite_path in sorted(SPRITE_DIR.glob("*.json")):
+        digest.update(sprite_path.name.encode())
+        digest.update(sprite_path.read_bytes())
+    return digest.hexdigest()
+
+
+def load_manifest(output_path: Path) -> dict:
+    """Load the incremental render manifest (empty if missing or unreadable)."""
+    try:
+        with open(output_path / RENDER_MANIFEST_FILENAME) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("format") != RENDER_MANIFEST_VERSION:
+        return {}
+    return manifest.get("images", {})
+
+
+# Per-process tileset and sprites used by render_hole_file() in pool workers
+_worker_assets: tuple[TilesetData, dict[str, PILSprite] | None] | None = None
+
+
+def _init_render_worker(tileset_path: str):
+    """Process pool initializer: load the tileset and sprites once per worker."""
+    global _worker_assets
+    with contextlib.redirect_stdout(io.StringIO()):
+        sprites = load_sprites()
+    _worker_assets = (TilesetData(tileset_path), sprites or None)
+
+
+def _render_in_worker(hole_data: dict, image_path: str, flag_index: int) -> tuple[int, int]:
+    """Render a hole with the calling worker's tileset and sprites."""
+    assert _worker_assets is not None
+    tileset, sprites = _worker_assets
+    return render_hole_file(hole_data, image_path, tileset, sprites, flag_index)
+
+
+def render_hole_file(
+    hole_data: dict,
+    image_path: str,
+    tileset: TilesetData,
+    sprites: dict[str, PILSprite] | None,
+    flag_index: int,
+) -> tuple[int, int]:
+    """
+    Render one hole and save its PNG.
+
+    Args:
+        hole_data: Hole data dictionary (from JSON)
+        image_path: Output PNG path
+        tileset: TilesetData instance with CHR tile data
+        sprites: Loaded sprites, or None to render without sprites
+        flag_index: Flag position to render
+
+    Returns:
+        (width, height) of the image
+    """
+    img = render_hole_to_image(
+        hole_data,
+        tileset,
+        sprites=sprites,
+        render_sprites=True,
+        selected_flag_index=flag_index,
+    )
+    img.save(image_path)
+    return img.width, img.height
+
+
 def render_all_courses(
     tileset_path: str,
     courses_dir: str,
     output_dir: str,
     flag_index: int = 0,
+    jobs: int = 1,
+    incremental: bool = False,
 ):
-    """Render all holes from all courses for the web app."""
+    """
+    Render all holes from all courses for the web app.
+
+    Args:
+        tileset_path: Path to CHR tileset binary file
+        courses_dir: Directory containing the course directories
+        output_dir: Output directory for web app
+        flag_index: Flag position to render (0-3)
+        jobs: Number of worker processes for rendering
+        incremental: Skip holes whose inputs match the last run's manifest
+    """
     tileset = TilesetData(tileset_path)
     sprites = load_sprites()
 
@@ -61,87 +177,129 @@ def render_all_courses(
     courses_path = Path(courses_dir)
     output_path = Path(output_dir)
 
+    # Hashes of the inputs each image was last rendered from
+    fingerprint = input_fingerprint(tileset_path, flag_index)
+    previous = load_manifest(output_path) if incremental else {}
+    manifest = {}
+    rendered = 0
+
     # Metadata structure
     metadata = {"courses": {}}
 
-    for course_name in COURSE_NAMES:
-        course_dir = courses_path / course_name
-        if not course_dir.exists():
-            print(f"Warning: Course directory not found: {course_dir}")
-            continue
-
-        # Read course metadata
-        course_json_path = course_dir / "course.json"
-        if course_json_path.exists():
-            with open(course_json_path) as f:
-                course_data = json.load(f)
-        else:
-            course_data = {"name": course_name.capitalize()}
-
-        # Create output directory for this course
-        course_output_dir = output_path / "images" / course_name
-        course_output_dir.mkdir(parents=True, exist_ok=True)
-
-        # Initialize course metadata
-        metadata["courses"][course_name] = {
-            "name": course_data.get("name", course_name.capitalize()),
-            "holes": []
-        }
-
-        # Render all holes for this course
-        hole_files = sorted(course_dir.glob("hole_*.json"))
-
-        if not hole_files:
-            print(f"Warning: No hole files found in {course_dir}")
-            continue
-
-        print(f"\nRendering {course_name.upper()} course ({len(hole_files)} holes)...")
-
-        for hole_file in hole_files:
-            hole_name = hole_file.stem  # e.g., "hole_01"
-
-            # Read hole data
-            with open(hole_file) as f:
-                hole_data = json.load(f)
-
-            # Render hole to image
-            img = render_hole_to_image(
-                hole_data,
-                tileset,
-                sprites=sprites,
-                render_sprites=True,
-                selected_flag_index=flag_index,
-            )
-
-            # Save image
-            image_filename = f"{hole_name}.png"
-            image_path = course_output_dir / image_filename
-            img.save(image_path)
-
-            # Add to metadata
-            hole_metadata = {
-                "number": hole_data.get("hole", 1),
-                "par": hole_data.get("par", 4),
-                "distance": hole_data.get("distance", 0),
-                "image": f"images/{course_name}/{image_filename}",
-                "width": img.width,
-                "height": img.height,
+    executor = None
+    if jobs > 1:
+        executor = ProcessPoolExecutor(
+            max_workers=jobs, initializer=_init_render_worker, initargs=(tileset_path,)
+        )
+
+    try:
+        for course_name in COURSE_NAMES:
+            course_dir = courses_path / course_name
+            if not course_dir.exists():
+                print(f"Warning: Course directory not found: {course_dir}")
+                continue
+
+            # Read course metadata
+            course_json_path = course_dir / "course.json"
+            if course_json_path.exists():
+                with open(course_json_path) as f:
+                    course_data = json.load(f)
+            else:
+                course_data = {"name": course_name.capitalize()}
+
+            # Create output directory for this course
+            course_output_dir = output_path / "images" / course_name
+            course_output_dir.mkdir(parents=True, exist_ok=True)
+
+            # Initialize course metadata
+            metadata["courses"][course_name] = {
+                "name": course_data.get("name", course_name.capitalize()),
+                "holes": []
             }
-            metadata["courses"][course_name]["holes"].append(hole_metadata)
 
-            print(f"  ✓ {hole_name}: {img.width}x{img.height}px")
-
-    # Write metadata.json
+            # Render all holes for this course
+            hole_files = sorted(course_dir.glob("hole_*.json"))
+
+            if not hole_files:
+                print(f"Warning: No hole files found in {course_dir}")
+                continue
+
+            print(f"\nRendering {course_name.upper()} course ({len(hole_files)} holes)...")
+
+            # Read hole data and decide which images are out of date
+            holes = []
+            for hole_file in hole_files:
+                raw = hole_file.read_bytes()
+                image_rel = f"images/{course_name}/{hole_file.stem}.png"
+                input_hash = hashlib.sha256(fingerprint.encode() + raw).hexdigest()
+                entry = previous.get(image_rel)
+                fresh = (
+                    entry is not None
+                    and entry["hash"] == input_hash
+                    and (output_path / image_rel).exists()
+                )
+                holes.append((hole_file.stem, json.loads(raw), image_rel, input_hash, fresh))
+
+            # Render out of date holes (in worker processes if enabled)
+            stale = [(hole_data, str(output_path / image_rel))
+                     for _, hole_data, image_rel, _, fresh in holes if not fresh]
+            if executor is not None:
+                sizes = executor.map(
+                    _render_in_worker,
+                    [hole_data for hole_data, _ in stale],
+                    [image_path for _, image_path in stale],
+                    [flag_index] * len(stale),
+                )
+            else:
+                sizes = (
+                    render_hole_file(hole_data, image_path, tileset, sprites, flag_index)
+                    for hole_data, image_path in stale
+                )
+            sizes = iter(sizes)
+
+            for hole_name, hole_data, image_rel, input_hash, fresh in holes:
+                if fresh:
+                    width, height = previous[image_rel]["width"], previous[image_rel]["height"]
+                    print(f"  = {hole_name}: unchanged")
+                else:
+                    width, height = next(sizes)
+                    rendered += 1
+                    print(f"  ✓ {hole_name}: {width}x{height}px")
+
+                manifest[image_rel] = {"hash": input_hash, "width": width, "height": height}
+
+                # Add to metadata
+                hole_metadata = {
+                    "number": hole_data.get("hole", 1),
+                    "par": hole_data.get("par", 4),
+                    "distance": hole_data.get("distance", 0),
+                    "image": image_rel,
+                    "width": width,
+                    "height": height,
+                }
+                metadata["courses"][course_name]["holes"].append(hole_metadata)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    # Write metadata.json (only if it changed, so unchanged sites stay untouched)
     metadata_path = output_path / "metadata.json"
-    with open(metadata_path, 'w') as f:
-        json.dump(metadata, f, indent=2)
+    metadata_text = json.dumps(metadata, indent=2)
+    if not metadata_path.exists() or metadata_path.read_text() != metadata_text:
+        metadata_path.write_text(metadata_text)
+
+    with open(output_path / RENDER_MANIFEST_FILENAME, "w") as f:
+        json.dump({"format": RENDER_MANIFEST_VERSION, "images": manifest}, f)
 
     print(f"\n✓ Metadata written to: {metadata_path}")
     print(f"✓ All images saved to: {output_path / 'images'}")
 
     # Print summary
     total_holes = sum(len(course["holes"]) for course in metadata["courses"].values())
-    print(f"\nSummary: Rendered {total_holes} holes across {len(metadata['courses'])} courses")
+    print(
+        f"\nSummary: Rendered {rendered} of {total_holes} holes "
+        f"across {len(metadata['courses'])} courses"
+    )
 
 
 def main():
@@ -170,6 +328,18 @@ This will create:
         default=0,
         help="Flag position to render (0-3, default: 0)",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for rendering (default: CPU count)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only re-render holes whose JSON, tileset or sprites changed since the last run",
+    )
 
     args = parser.parse_args()
 
@@ -190,6 +360,8 @@ This will create:
         args.courses,
         args.output,
         flag_index=args.flag_pos,
+        jobs=max(1, args.jobs if args.jobs is not None else (os.cpu_count() or 1)),
+        incremental=args.incremental,
     )
 
 
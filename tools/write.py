@@ -6,9 +6,11 @@ Writes course data from JSON files back to ROM.
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
 
+from golf.core.compression_cache import CACHE_FILENAME, CompressionCache
 from golf.core.rom_reader import COURSES, HOLES_PER_COURSE, PRG_BANK_SIZE
 from golf.core.rom_writer import BankOverflowError, RomWriter
 from golf.formats import compact_json as json
@@ -67,56 +69,158 @@ def detect_course_index(course_dir: Path) -> int:
     return 0
 
 
+def load_manifest(manifest_path: Path) -> list[Path]:
+    """
+    Read course directories from a batch manifest.
+
+    The manifest is JSON: {"courses": ["japan", "us", "uk"]}, with paths
+    relative to the manifest's own directory.
+
+    Args:
+        manifest_path: Path to manifest JSON file
+
+    Returns:
+        List of course directories
+
+    Raises:
+        ValueError: If the manifest has no "courses" list
+    """
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+
+    course_dirs = manifest.get("courses") if isinstance(manifest, dict) else None
+    if not isinstance(course_dirs, list) or not course_dirs:
+        raise ValueError(f"Manifest {manifest_path} has no \"courses\" list")
+
+    return [manifest_path.parent / course_dir for course_dir in course_dirs]
+
+
+def resolve_course_indices(
+    course_dirs: list[Path], course_override: int | None = None
+) -> dict[int, Path]:
+    """
+    Map each course directory to the course index it will be written to.
+
+    Args:
+        course_dirs: Course directories
+        course_override: Explicit course index (only valid for a single directory)
+
+    Returns:
+        Dictionary of course index to course directory, in course index order
+
+    Raises:
+        ValueError: If two directories resolve to the same course, or the
+            override is used with several directories
+    """
+    if course_override is not None:
+        if len(course_dirs) != 1:
+            raise ValueError("--course can only be used with a single course directory")
+        return {course_override: course_dirs[0]}
+
+    courses = {}
+    for course_dir in course_dirs:
+        course_idx = detect_course_index(course_dir)
+        if course_idx in courses:
+            raise ValueError(
+                f"{courses[course_idx]} and {course_dir} are both course "
+                f"{course_idx} ({COURSES[course_idx]['display_name']})"
+            )
+        courses[course_idx] = course_dir
+
+    return dict(sorted(courses.items()))
+
+
+def print_savings_report(stats: dict):
+    """
+    Print bytes saved per hole by the optimal encoder compared to greedy.
+
+    Args:
+        stats: Statistics dictionary from RomWriter.write_courses(optimal=True)
+    """
+    print("Optimal encoding savings vs greedy:")
+    total_terrain = 0
+    total_greens = 0
+    for hole in stats["holes"]:
+        total_terrain += hole["terrain_bytes_saved"]
+        total_greens += hole["greens_bytes_saved"]
+        print(
+            f"  Hole {hole['hole']:2d}: "
+            f"terrain -{hole['terrain_bytes_saved']:3d} bytes, "
+            f"greens -{hole['greens_bytes_saved']:3d} bytes"
+        )
+    print(f"  Total:   terrain -{total_terrain:3d} bytes, greens -{total_greens:3d} bytes")
+
+
 def validate_only(
-    rom_path: str, course_dir: Path, course_idx: int, verbose: bool
+    rom_path: str,
+    courses: dict[int, Path],
+    verbose: bool,
+    optimal: bool = False,
+    cache: CompressionCache | None = None,
+    jobs: int = 1,
 ) -> bool:
     """
     Validate that course data will fit without writing.
 
     Args:
         rom_path: ROM file path
-        course_dir: Course directory
-        course_idx: Course index (0-2)
+        courses: Mapping of course index (0-2) to course directory
         verbose: Show detailed statistics
+        optimal: Use the shortest-path encoder instead of greedy compression
+        cache: Optional per-hole compression cache (saved after compressing)
+        jobs: Number of worker processes for compression
 
     Returns:
         True if validation passes, False otherwise
     """
-    print(f"Validation mode: checking if course will fit...")
+    print(f"Validation mode: checking if courses will fit...")
     print(f"ROM: {rom_path}")
-    print(f"Course: {course_dir} (index {course_idx})")
+    for course_idx, course_dir in courses.items():
+        print(f"Course: {course_dir} (index {course_idx})")
     print()
 
     try:
         # Load course data
-        holes = load_course_data(course_dir)
+        holes_by_course = {
+            course_idx: load_course_data(course_dir)
+            for course_idx, course_dir in courses.items()
+        }
 
         # Create writer
-        writer = RomWriter(rom_path, "/dev/null")  # Dummy output
+        writer = RomWriter(
+            rom_path, "/dev/null", optimal=optimal, cache=cache
+        )  # Dummy output
 
         # Attempt to write (this compresses and validates)
-        stats = writer.write_course(course_idx, holes)
+        all_stats = writer.write_courses(holes_by_course, jobs=jobs)
+        if cache is not None:
+            cache.save()
 
         # Report statistics
-        print(f"Course: {stats['course']}")
-        print(
-            f"Terrain bank usage: {stats['terrain_bank_usage']:,} / {PRG_BANK_SIZE:,} bytes "
-            f"({stats['terrain_bank_usage'] / PRG_BANK_SIZE * 100:.1f}%)"
-        )
-        print(f"Greens bank usage (this course): {stats['greens_bytes']:,} bytes")
-        print()
-
-        if verbose:
-            print("Per-hole statistics:")
-            for hole in stats["holes"]:
-                print(
-                    f"  Hole {hole['hole']:2d}: "
-                    f"terrain {hole['terrain_bytes']:4d} bytes, "
-                    f"greens {hole['greens_bytes']:3d} bytes"
-                )
+        for stats in all_stats:
+            print(f"Course: {stats['course']}")
+            print(
+                f"Terrain bank usage: {stats['terrain_bank_usage']:,} / {PRG_BANK_SIZE:,} bytes "
+                f"({stats['terrain_bank_usage'] / PRG_BANK_SIZE * 100:.1f}%)"
+            )
+            print(f"Greens bank usage (this course): {stats['greens_bytes']:,} bytes")
             print()
 
-        print("Validation PASSED - course will fit in ROM")
+            if verbose:
+                print("Per-hole statistics:")
+                for hole in stats["holes"]:
+                    print(
+                        f"  Hole {hole['hole']:2d}: "
+                        f"terrain {hole['terrain_bytes']:4d} bytes, "
+                        f"greens {hole['greens_bytes']:3d} bytes"
+                    )
+                print()
+
+            if optimal:
+                print_savings_report(stats)
+                print()
+
+        print("Validation PASSED - all courses will fit in ROM")
         return True
 
     except BankOverflowError as e:
@@ -134,7 +238,14 @@ def main():
 
     parser.add_argument("rom_file", help="Source ROM file (read-only)")
     parser.add_argument(
-        "course_dir", help="Course directory containing hole_01.json through hole_18.json"
+        "course_dirs",
+        nargs="*",
+        help="Course directories containing hole_01.json through hole_18.json",
+    )
+    parser.add_argument(
+        "--manifest",
+        help='Batch manifest JSON listing course directories: {"courses": [...]}',
+        default=None,
     )
     parser.add_argument(
         "-o",
@@ -157,6 +268,23 @@ def main():
     parser.add_argument(
         "--verbose", action="store_true", help="Show detailed compression statistics"
     )
+    parser.add_argument(
+        "--optimal",
+        action="store_true",
+        help="Use shortest-path compression (smallest output) and report bytes saved",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Recompress every hole instead of reusing <course_dir>/{CACHE_FILENAME}",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Worker processes for compression (default: 1, or CPU count for batches)",
+        default=None,
+    )
 
     args = parser.parse_args()
 
@@ -166,19 +294,37 @@ def main():
         print(f"Error: ROM file not found: {rom_path}")
         sys.exit(1)
 
-    course_dir = Path(args.course_dir)
-    if not course_dir.is_dir():
-        print(f"Error: Course directory not found: {course_dir}")
+    course_dirs = [Path(d) for d in args.course_dirs]
+    if args.manifest:
+        try:
+            course_dirs.extend(load_manifest(Path(args.manifest)))
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+    if not course_dirs:
+        print("Error: No course directories given (pass directories or --manifest)")
         sys.exit(1)
 
-    # Determine course index
-    if args.course is not None:
-        course_idx = args.course
-        if not 0 <= course_idx <= 2:
-            print(f"Error: Course index must be 0-2, got {course_idx}")
+    for course_dir in course_dirs:
+        if not course_dir.is_dir():
+            print(f"Error: Course directory not found: {course_dir}")
             sys.exit(1)
+
+    # Determine course indices
+    if args.course is not None and not 0 <= args.course <= 2:
+        print(f"Error: Course index must be 0-2, got {args.course}")
+        sys.exit(1)
+    try:
+        courses = resolve_course_indices(course_dirs, args.course)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    batch = len(courses) > 1
+    if args.jobs is not None:
+        jobs = max(1, args.jobs)
     else:
-        course_idx = detect_course_index(course_dir)
+        jobs = (os.cpu_count() or 1) if batch else 1
 
     # Determine output path
     if args.output:
@@ -186,46 +332,75 @@ def main():
     else:
         output_path = str(rom_path.with_suffix("")) + ".modified.nes"
 
+    # Per-hole compression cache, reused across runs (a batch shares one
+    # cache in the courses' common parent directory)
+    if args.no_cache:
+        cache = None
+    elif batch:
+        cache_dir = Path(os.path.commonpath([d.resolve() for d in courses.values()]))
+        cache = CompressionCache.for_course_dir(cache_dir)
+    else:
+        cache = CompressionCache.for_course_dir(course_dirs[0])
+
     # Handle validation mode
     if args.validate_only:
-        success = validate_only(str(rom_path), course_dir, course_idx, args.verbose)
+        success = validate_only(
+            str(rom_path), courses, args.verbose, args.optimal, cache, jobs
+        )
         sys.exit(0 if success else 1)
 
     # Normal write mode
     try:
         print(f"Loading ROM: {rom_path}")
-        print(f"Loading course: {course_dir} ({COURSES[course_idx]['display_name']}, course index {course_idx})")
+        holes_by_course = {}
+        for course_idx, course_dir in courses.items():
+            print(f"Loading course: {course_dir} ({COURSES[course_idx]['display_name']}, course index {course_idx})")
+            holes_by_course[course_idx] = load_course_data(course_dir)
         print()
 
-        # Load course data
-        holes = load_course_data(course_dir)
-        print(f"Loaded {len(holes)} holes")
+        total_holes = sum(len(holes) for holes in holes_by_course.values())
+        print(f"Loaded {total_holes} holes")
 
         # Create writer
-        writer = RomWriter(str(rom_path), output_path)
+        writer = RomWriter(
+            str(rom_path), output_path, optimal=args.optimal, cache=cache
+        )
 
-        # Compress and write course
+        # Compress and write all courses
         print("Compressing course data...")
-        stats = writer.write_course(course_idx, holes)
+        all_stats = writer.write_courses(holes_by_course, jobs=jobs)
+        if cache is not None:
+            cache.save()
+            cached_holes = sum(stats["cached_holes"] for stats in all_stats)
+            print(f"Reused {cached_holes} of {total_holes} holes from cache")
+
+        for stats in all_stats:
+            if batch:
+                print()
+                print(f"{stats['course']}:")
+
+            if args.verbose:
+                print()
+                print("Compression statistics:")
+                for hole in stats["holes"]:
+                    print(
+                        f"  Hole {hole['hole']:2d}: "
+                        f"terrain {hole['terrain_bytes']:4d} bytes, "
+                        f"greens {hole['greens_bytes']:3d} bytes"
+                    )
+
+            if args.optimal:
+                print()
+                print_savings_report(stats)
 
-        if args.verbose:
             print()
-            print("Compression statistics:")
-            for hole in stats["holes"]:
-                print(
-                    f"  Hole {hole['hole']:2d}: "
-                    f"terrain {hole['terrain_bytes']:4d} bytes, "
-                    f"greens {hole['greens_bytes']:3d} bytes"
-                )
-
-        print()
-        print(
-            f"Total terrain bank usage: {stats['terrain_bank_usage']:,} / {PRG_BANK_SIZE:,} bytes "
-            f"({stats['terrain_bank_usage'] / PRG_BANK_SIZE * 100:.1f}%)"
-        )
-        print(
-            f"Total greens bank usage (this course): {stats['greens_bytes']:,} bytes"
-        )
+            print(
+                f"Total terrain bank usage: {stats['terrain_bank_usage']:,} / {PRG_BANK_SIZE:,} bytes "
+                f"({stats['terrain_bank_usage'] / PRG_BANK_SIZE * 100:.1f}%)"
+            )
+            print(
+                f"Total greens bank usage (this course): {stats['greens_bytes']:,} bytes"
+            )
 
         # Save ROM
         print()